@@ -9,8 +9,21 @@ Agentes:
 
 __version__ = "0.1.0"
 
-from .architectanalyst import ArchitectAnalyst
-from .codeguard import CodeGuard
-from .designreviewer import DesignReviewer
+import importlib
+
+# Los agentes se importan al usarse: el cliente liviano de `codeguard`
+# (quality_agents.codeguard.client) no paga la carga de los tres paquetes
+_AGENTS = {
+    "CodeGuard": ".codeguard",
+    "DesignReviewer": ".designreviewer",
+    "ArchitectAnalyst": ".architectanalyst",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _AGENTS:
+        return getattr(importlib.import_module(_AGENTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["CodeGuard", "DesignReviewer", "ArchitectAnalyst"]
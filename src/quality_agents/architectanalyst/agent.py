@@ -70,7 +70,9 @@ class ArchitectAnalyst:
         self._store: SnapshotStore = SnapshotStore(db_path)
         self._trend_calculator: TrendCalculator = TrendCalculator()
 
-    def run(self, files: Optional[List[Path]] = None) -> List[ArchitectureResult]:
+    def run(
+        self, files: Optional[List[Path]] = None, persist: bool = True
+    ) -> List[ArchitectureResult]:
         """
         Ejecuta análisis arquitectónico sobre el proyecto.
 
@@ -78,6 +80,8 @@ class ArchitectAnalyst:
 
         Args:
             files: Archivos a analizar. Si es None, analiza todos los Python en self.path.
+            persist: False no guarda el snapshot (ej: re-análisis de --watch,
+                que no deben contar como un sprint en el histórico).
 
         Returns:
             Lista de resultados del análisis.
@@ -98,11 +102,12 @@ class ArchitectAnalyst:
             self.results = self._trend_calculator.enrich(self.results, previous)
 
         # Persistir snapshot actual
-        self._store.save(
-            self.results,
-            sprint_id=self.sprint_id,
-            project_path=str(self.path),
-        )
+        if persist:
+            self._store.save(
+                self.results,
+                sprint_id=self.sprint_id,
+                project_path=str(self.path),
+            )
 
         return self.results
 
@@ -142,7 +147,11 @@ import time  # noqa: E402
 
 import click  # noqa: E402
 
-from quality_agents.architectanalyst.formatter import format_json, format_results  # noqa: E402
+from quality_agents.shared.watch import (  # noqa: E402
+    FileWatcher,
+    IncrementalResults,
+    format_update,
+)
 
 
 def _common_parent(paths: List[Path]) -> Path:
@@ -159,7 +168,50 @@ def _common_parent(paths: List[Path]) -> Path:
     return common if common.is_dir() else common.parent
 
 
+def _describe(result: ArchitectureResult) -> str:
+    severity = result.severity.value.upper()
+    return f"{severity:8} {result.metric_name:<6} {result.module_path}  {result.message}"
+
+
+def _watch(
+    analyst: ArchitectAnalyst, targets: List[Path], results: List[ArchitectureResult]
+) -> None:
+    """
+    Modo --watch: recalcula las métricas cuando cambian archivos, hasta Ctrl+C.
+
+    Las métricas son del sistema completo (Ca de un paquete depende de todos
+    los demás), así que cada cambio vuelve a ejecutar todas sobre el árbol
+    actual; lo incremental es la salida: solo se muestran los resultados que
+    cambiaron. Los re-análisis no se guardan como snapshot.
+    """
+    def collect() -> List[Path]:
+        return [f for target in targets for f in analyst.collect_files(target)]
+
+    state: IncrementalResults[ArchitectureResult] = IncrementalResults(
+        key=lambda r: (
+            r.analyzer_name, r.metric_name, str(r.module_path), round(r.value, 4),
+            r.severity, r.message,
+        )
+    )
+    state.update({None: results})
+    watcher = FileWatcher(targets, collect)
+    click.echo(f"\nObservando cambios ({watcher.mode}). Ctrl+C para salir.")
+    try:
+        while True:
+            changes = watcher.wait()
+            start = time.time()
+            current = analyst.run(files=collect(), persist=False)
+            added, removed = state.update({None: current})
+            for line in format_update(changes, added, removed, time.time() - start, _describe):
+                click.echo(line)
+    except KeyboardInterrupt:
+        click.echo("\nWatch detenido.")
+    finally:
+        watcher.close()
+
+
 @click.command()
+@click.version_option(package_name="quality-agents", prog_name="architectanalyst")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option(
     "--config", "-c",
@@ -178,8 +230,18 @@ def _common_parent(paths: List[Path]) -> Path:
     default=None,
     help="Identificador del sprint (ej: sprint-12, 2026-Q1)",
 )
+@click.option(
+    "--watch", "-w",
+    is_flag=True,
+    default=False,
+    help="Seguir observando PATHS y mostrar las métricas que cambian",
+)
 def main(
-    paths: tuple, config: Optional[str], output_format: str, sprint_id: Optional[str]
+    paths: tuple,
+    config: Optional[str],
+    output_format: str,
+    sprint_id: Optional[str],
+    watch: bool,
 ) -> None:
     """
     ArchitectAnalyst - Análisis arquitectónico de fin de sprint.
@@ -195,10 +257,16 @@ def main(
     ciclos de dependencias y violaciones de capas. Persiste snapshot para
     comparar tendencias entre sprints.
 
+    Con --watch, después del reporte inicial recalcula las métricas cada vez
+    que se guardan archivos y muestra solo los resultados nuevos (+) y los
+    que dejaron de aplicar (-); esos re-análisis no se guardan como snapshot.
+
     Nunca bloquea — exit code siempre 0.
     """
     targets = [Path(p) for p in paths] if paths else [Path(".")]
     config_path = Path(config) if config else None
+    if watch and output_format != "text":
+        raise click.ClickException("--watch requires --format text")
 
     project_root = _common_parent(targets)
     analyst = ArchitectAnalyst(path=project_root, config_path=config_path, sprint_id=sprint_id)
@@ -212,13 +280,19 @@ def main(
     elapsed = time.time() - start
 
     total_files = len([f for f in all_files if f.suffix == ".py"])
-    metrics_executed = len(analyst._orchestrator.metrics)
+    metrics_executed = len(analyst._orchestrator.plugins)
+
+    # rich se carga solo para reportar (no en --version/--help)
+    from quality_agents.architectanalyst.formatter import format_json, format_results
 
     if output_format == "json":
         click.echo(format_json(results, elapsed, total_files, metrics_executed, sprint_id))
     else:
         format_results(results, elapsed, total_files, metrics_executed, sprint_id)
 
+    if watch:
+        _watch(analyst, targets, results)
+
     # Exit code siempre 0 — ArchitectAnalyst es informativo, nunca bloquea
 
 
@@ -1,33 +1,32 @@
 """
 Métricas de arquitectura para ArchitectAnalyst.
 
-Cada métrica hereda de ProjectMetric y se auto-descubre via MetricOrchestrator.
+Cada métrica hereda de ProjectMetric y se registra en
+`quality_agents/architectanalyst/registry.py`; MetricOrchestrator importa solo
+las habilitadas.
 """
 
-from quality_agents.architectanalyst.metrics.abstractness_analyzer import AbstractnessAnalyzer
-from quality_agents.architectanalyst.metrics.coupling_analyzer import CouplingAnalyzer
-from quality_agents.architectanalyst.metrics.coverage_analyzer import CoverageAnalyzer
-from quality_agents.architectanalyst.metrics.dependency_cycles_analyzer import (
-    DependencyCyclesAnalyzer,
-)
-from quality_agents.architectanalyst.metrics.distance_analyzer import DistanceAnalyzer
-from quality_agents.architectanalyst.metrics.god_package_analyzer import GodPackageAnalyzer
-from quality_agents.architectanalyst.metrics.instability_analyzer import InstabilityAnalyzer
-from quality_agents.architectanalyst.metrics.layer_violations_analyzer import (
-    LayerViolationsAnalyzer,
-)
-from quality_agents.architectanalyst.metrics.relational_cohesion_analyzer import (
-    RelationalCohesionAnalyzer,
-)
+import importlib
 
-__all__ = [
-    "DependencyCyclesAnalyzer",
-    "LayerViolationsAnalyzer",
-    "CouplingAnalyzer",
-    "InstabilityAnalyzer",
-    "AbstractnessAnalyzer",
-    "DistanceAnalyzer",
-    "RelationalCohesionAnalyzer",
-    "GodPackageAnalyzer",
-    "CoverageAnalyzer",
-]
+# Las clases se importan al pedirlas: el orquestador importa solo las
+# métricas habilitadas a partir del registro
+_EXPORTS = {
+    "DependencyCyclesAnalyzer": ".dependency_cycles_analyzer",
+    "LayerViolationsAnalyzer": ".layer_violations_analyzer",
+    "CouplingAnalyzer": ".coupling_analyzer",
+    "InstabilityAnalyzer": ".instability_analyzer",
+    "AbstractnessAnalyzer": ".abstractness_analyzer",
+    "DistanceAnalyzer": ".distance_analyzer",
+    "RelationalCohesionAnalyzer": ".relational_cohesion_analyzer",
+    "GodPackageAnalyzer": ".god_package_analyzer",
+    "CoverageAnalyzer": ".coverage_analyzer",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS)
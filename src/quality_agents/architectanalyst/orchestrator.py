@@ -1,8 +1,8 @@
 """
 Orquestador de métricas para ArchitectAnalyst.
 
-Auto-descubre y ejecuta todas las métricas disponibles en el paquete
-`architectanalyst.metrics`. Mismo patrón de discovery que AnalyzerOrchestrator
+Ejecuta las métricas del registro de plugins (`architectanalyst/registry.py` y
+entry points `quality_agents.metrics`). Mismo patrón que AnalyzerOrchestrator
 de DesignReviewer, pero con ejecución project-wide en lugar de archivo por archivo.
 
 A diferencia de CodeGuard y DesignReviewer, las métricas de ArchitectAnalyst
@@ -13,14 +13,14 @@ Fecha de creación: 2026-02-28
 Ticket: 1.3
 """
 
-import importlib
-import inspect
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, List, Optional
 
 from quality_agents.architectanalyst.models import ArchitectureResult
+from quality_agents.architectanalyst.registry import BUILTIN_METRICS
+from quality_agents.shared.plugins import METRICS_GROUP, PluginSet, PluginSpec
 
 logger = logging.getLogger(__name__)
 
@@ -138,14 +138,15 @@ class MetricOrchestrator:
     Orquesta la ejecución de métricas de ArchitectAnalyst.
 
     Responsabilidades:
-    1. Auto-discovery de métricas disponibles (subclases de ProjectMetric en metrics/)
+    1. Registro de métricas disponibles (metadata estática, importación bajo demanda)
     2. Ejecución project-wide: pasa todos los archivos a cada métrica de una vez
     3. Manejo de errores: si una métrica falla, loguea y continúa
     4. Agregación de resultados
 
     Attributes:
         config: Configuración de ArchitectAnalyst con umbrales por métrica.
-        metrics: Lista de métricas descubiertas automáticamente.
+        plugins: Registro de métricas (specs e instancias ya creadas).
+        metrics: Todas las métricas registradas, instanciadas y por prioridad.
 
     Example:
         >>> orchestrator = MetricOrchestrator(config)
@@ -158,55 +159,26 @@ class MetricOrchestrator:
         """
         Inicializa el orquestador.
 
+        Las métricas no se importan acá: el registro (métricas propias y
+        entry points `quality_agents.metrics`) se lee en la primera corrida y
+        solo se importan las habilitadas en config.
+
         Args:
             config: Configuración de ArchitectAnalyst (ArchitectAnalystConfig).
         """
         self.config = config
-        self.metrics: List[ProjectMetric] = self._discover_metrics()
-        logger.info(
-            f"MetricOrchestrator inicializado con {len(self.metrics)} métricas descubiertas"
+        self.plugins: PluginSet[ProjectMetric] = PluginSet(
+            METRICS_GROUP, BUILTIN_METRICS, kind="métrica"
         )
 
-    def _discover_metrics(self) -> List[ProjectMetric]:
-        """
-        Auto-discovery de métricas en architectanalyst.metrics.
-
-        Importa el módulo `metrics`, busca todas las clases que heredan de
-        `ProjectMetric` (excluyendo la clase base), las instancia y retorna la lista
-        ordenada por prioridad.
+    @property
+    def metrics(self) -> List[ProjectMetric]:
+        """Todas las métricas registradas, ordenadas por prioridad (importa las que falten)."""
+        return sorted(self.plugins.load(), key=lambda m: m.priority)
 
-        Returns:
-            Lista de instancias de métricas descubiertas, ordenadas por priority.
-        """
-        discovered: List[ProjectMetric] = []
-
-        try:
-            module = importlib.import_module("quality_agents.architectanalyst.metrics")
-
-            for name in dir(module):
-                obj = getattr(module, name)
-
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, ProjectMetric)
-                    and obj is not ProjectMetric
-                ):
-                    try:
-                        instance = obj()
-                        discovered.append(instance)
-                        logger.debug(f"Métrica descubierta: {instance.name}")
-                    except Exception as e:
-                        logger.warning(f"Error al instanciar métrica {name}: {e}. Saltando.")
-
-        except ImportError:
-            logger.info(
-                "Módulo 'architectanalyst.metrics' no encontrado. "
-                "No hay métricas disponibles todavía."
-            )
-        except Exception as e:
-            logger.error(f"Error durante auto-discovery de métricas: {e}")
-
-        return sorted(discovered, key=lambda m: m.priority)
+    @metrics.setter
+    def metrics(self, metrics: List[ProjectMetric]) -> None:
+        self.plugins.replace(metrics)
 
     def run(self, files: List[Path]) -> List[ArchitectureResult]:
         """
@@ -232,7 +204,11 @@ class MetricOrchestrator:
         project_path = self._find_project_root(python_files[0])
         results: List[ArchitectureResult] = []
 
-        for metric in self.metrics:
+        # Las apagadas en config no se importan (should_run las descartaría)
+        metrics = self.plugins.load(
+            where=lambda p: not isinstance(p, PluginSpec) or p.is_enabled(self.config)
+        )
+        for metric in sorted(metrics, key=lambda m: m.priority):
             if not metric.should_run(self.config):
                 logger.debug(f"Métrica {metric.name} desactivada por config")
                 continue
@@ -246,7 +222,7 @@ class MetricOrchestrator:
 
         logger.info(
             f"Análisis completado: {len(results)} resultados "
-            f"de {len(self.metrics)} métricas sobre {len(python_files)} archivos"
+            f"de {len(metrics)} métricas sobre {len(python_files)} archivos"
         )
         return results
 
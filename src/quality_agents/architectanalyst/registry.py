@@ -0,0 +1,90 @@
+"""
+Registro de las métricas de ArchitectAnalyst.
+
+Metadata estática de cada métrica (ver `quality_agents.shared.plugins`), en
+orden de prioridad: el orquestador solo importa las métricas habilitadas en
+`[tool.architectanalyst.checks]`. Deben coincidir con las propiedades de cada clase.
+
+Para agregar una métrica: crear la clase en `metrics/` y registrarla acá. Las
+métricas de otros paquetes se registran con entry points en el grupo
+`quality_agents.metrics`.
+"""
+
+from quality_agents.shared.plugins import PluginSpec
+
+_METRICS = "quality_agents.architectanalyst.metrics"
+
+BUILTIN_METRICS = (
+    PluginSpec(
+        name="DependencyCyclesAnalyzer",
+        target=f"{_METRICS}.dependency_cycles_analyzer:DependencyCyclesAnalyzer",
+        category="cycles",
+        priority=1,
+        estimated_duration=5.0,
+        toggle="dependency_cycles",
+    ),
+    PluginSpec(
+        name="LayerViolationsAnalyzer",
+        target=f"{_METRICS}.layer_violations_analyzer:LayerViolationsAnalyzer",
+        category="cycles",
+        priority=2,
+        estimated_duration=3.0,
+        toggle="layer_violations",
+    ),
+    PluginSpec(
+        name="CouplingAnalyzer",
+        target=f"{_METRICS}.coupling_analyzer:CouplingAnalyzer",
+        category="martin",
+        priority=5,
+        estimated_duration=3.0,
+        toggle="coupling",
+    ),
+    PluginSpec(
+        name="InstabilityAnalyzer",
+        target=f"{_METRICS}.instability_analyzer:InstabilityAnalyzer",
+        category="martin",
+        priority=6,
+        estimated_duration=3.0,
+        toggle="instability",
+    ),
+    PluginSpec(
+        name="AbstractnessAnalyzer",
+        target=f"{_METRICS}.abstractness_analyzer:AbstractnessAnalyzer",
+        category="martin",
+        priority=7,
+        estimated_duration=2.0,
+        toggle="abstractness",
+    ),
+    PluginSpec(
+        name="DistanceAnalyzer",
+        target=f"{_METRICS}.distance_analyzer:DistanceAnalyzer",
+        category="martin",
+        priority=8,
+        estimated_duration=4.0,
+        toggle="distance",
+    ),
+    PluginSpec(
+        name="RelationalCohesionAnalyzer",
+        target=f"{_METRICS}.relational_cohesion_analyzer:RelationalCohesionAnalyzer",
+        category="martin",
+        priority=9,
+        estimated_duration=3.0,
+        toggle="relational_cohesion",
+    ),
+    PluginSpec(
+        name="GodPackageAnalyzer",
+        target=f"{_METRICS}.god_package_analyzer:GodPackageAnalyzer",
+        category="smells",
+        priority=10,
+        estimated_duration=3.0,
+        toggle="god_package",
+    ),
+    PluginSpec(
+        name="CoverageAnalyzer",
+        target=f"{_METRICS}.coverage_analyzer:CoverageAnalyzer",
+        category="quality",
+        priority=11,
+        estimated_duration=1.0,
+        toggle="coverage",
+    ),
+)
@@ -5,6 +5,14 @@ Ejecuta verificaciones rápidas (< 5 segundos) antes de cada commit.
 Solo advierte, nunca bloquea.
 """
 
-from .agent import CodeGuard
+
+def __getattr__(name: str) -> object:
+    # Import diferido: el cliente del daemon (client.py) no carga el agente
+    if name == "CodeGuard":
+        from .agent import CodeGuard
+
+        return CodeGuard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["CodeGuard"]
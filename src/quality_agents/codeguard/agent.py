@@ -6,32 +6,63 @@ Ticket: 2.5.1 - Integración con orquestador
 Ticket: 4.3 - Integración con formatter Rich
 """
 
+import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
 
+import click
+
+from quality_agents.codeguard.background import BACKGROUND_FINGERPRINT, spawn_background
+from quality_agents.codeguard.cache import ResultCache
 from quality_agents.codeguard.config import load_config
-from quality_agents.codeguard.orchestrator import CheckOrchestrator
-from quality_agents.shared.verifiable import ExecutionContext
+from quality_agents.codeguard.durations import DurationModel, count_lines
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.orchestrator import PRECOMMIT_TIME_BUDGET, CheckOrchestrator
+from quality_agents.codeguard.staged import StagedError, StagedSnapshot, repo_root
+from quality_agents.shared.concurrency import lpt_order, resolve_jobs
+from quality_agents.shared.verifiable import ExecutionContext, Verifiable
+from quality_agents.shared.watch import (
+    FileWatcher,
+    IncrementalResults,
+    format_update,
+    group_by_file,
+)
+
+# Re-exportar para compatibilidad con imports externos
+__all__ = ["CheckResult", "CodeGuard", "Severity", "main"]
+
+_T = TypeVar("_T")
 
+# Entrada del plan de ejecución: (archivo, contexto, checks seleccionados)
+PlanEntry = Tuple[Path, ExecutionContext, List[Verifiable]]
 
-class Severity(Enum):
-    """Niveles de severidad para los resultados de verificación."""
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
 
+def _run_event_loop(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Corre una corrutina en un event loop nuevo, como `asyncio.run`.
+
+    A diferencia de `asyncio.run`, al cerrar no espera a los hilos del
+    executor default: se cierra con `shutdown(wait=False, cancel_futures=True)`,
+    así que un motor in-process cancelado por el deadline termina en segundo
+    plano, su resultado se descarta y lo que no empezó no se ejecuta.
+    """
+    import asyncio
 
-@dataclass
-class CheckResult:
-    """Resultado de una verificación individual."""
-    check_name: str
-    severity: Severity
-    message: str
-    file_path: Optional[str] = None
-    line_number: Optional[int] = None
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(thread_name_prefix="codeguard-async")
+    loop.set_default_executor(executor)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            loop.close()
 
 
 class CodeGuard:
@@ -47,7 +78,14 @@ class CodeGuard:
     Attributes:
         config: Configuración cargada desde pyproject.toml o YAML
         orchestrator: Orquestador que selecciona checks según contexto
+        durations: Duraciones medidas de cada check, por líneas analizadas
         results: Lista de resultados de verificación
+        skipped: Pares (archivo, nombre del check) omitidos en la última corrida
+            por agotarse el presupuesto de tiempo
+        from_background: Pares (archivo, check) de la última corrida cuyos
+            resultados vienen de un análisis en segundo plano anterior
+        pending_background: Pares (archivo, check) que la última corrida dejó
+            para analizar en segundo plano (`start_background`)
     """
 
     def __init__(self, config_path: Optional[Path] = None, project_root: Optional[Path] = None):
@@ -64,16 +102,26 @@ class CodeGuard:
         # Cargar configuración
         self.config = load_config(config_path, self.project_root)
 
+        # Duraciones medidas de los checks (presupuesto de pre-commit)
+        self.durations = self._duration_model()
+
         # Inicializar orquestador
-        self.orchestrator = CheckOrchestrator(self.config)
+        self.orchestrator = CheckOrchestrator(self.config, durations=self.durations)
 
         self.results: List[CheckResult] = []
+        self.skipped: List[Tuple[Path, str]] = []
+        self.from_background: List[Tuple[Path, str]] = []
+        self.pending_background: List[Tuple[Path, str]] = []
+        self._line_counts: Dict[Path, int] = {}
 
     def run(
         self,
         files: List[Path],
         analysis_type: str = "pre-commit",
         time_budget: Optional[float] = None,
+        jobs: Optional[int] = None,
+        only: Optional[Set[Tuple[Path, str]]] = None,
+        deadline: Optional[float] = None,
     ) -> List[CheckResult]:
         """
         Ejecuta verificaciones sobre los archivos especificados.
@@ -85,13 +133,32 @@ class CodeGuard:
         - Prioridades de checks
         - Estado del archivo (nuevo, modificado, excluido)
 
+        El presupuesto de tiempo es además un deadline de toda la corrida
+        (pre-commit: 5 s si no se indica otro). Al vencer, las herramientas en
+        vuelo se matan, las unidades pendientes no se lanzan y los pares
+        (archivo, check) sin resultado quedan en `self.skipped`.
+
+        Con `execution.background`, los checks que el pre-commit deja afuera
+        se muestran desde la caché si un análisis en segundo plano anterior
+        ya vio el mismo contenido (`self.from_background`); los que faltan, y
+        los omitidos por el deadline, quedan en `self.pending_background`
+        para `start_background()`.
+
         Args:
             files: Lista de archivos a verificar
             analysis_type: Tipo de análisis ("pre-commit", "pr-review", "full")
-            time_budget: Presupuesto de tiempo en segundos (None = sin límite)
+            time_budget: Presupuesto de tiempo en segundos (None = sin límite;
+                en pre-commit, 5 s)
+            jobs: Workers en paralelo (None = `execution.jobs` de config; 0 = CPUs disponibles).
+                Con `execution.engine = "asyncio"` el límite es `execution.async_limit`.
+            only: Restringe la corrida a estos pares (archivo, nombre del check)
+                (None = todos los seleccionados)
+            deadline: Instante (`time.monotonic()`) en que vence la corrida, si
+                ya empezó antes (ej: `--staged` lee el índice dentro del
+                presupuesto); None = se calcula a partir de `time_budget`
 
         Returns:
-            Lista de resultados de verificación
+            Lista de resultados de verificación (orden archivo → prioridad)
 
         Example:
             >>> guard = CodeGuard()
@@ -100,21 +167,71 @@ class CodeGuard:
             >>> # Ejecuta solo checks rápidos y críticos
         """
         self.results = []
+        self.skipped = []
+        self.from_background = []
+        self.pending_background = []
+        self._line_counts = {}
+        if deadline is None:
+            deadline = self._deadline(analysis_type, time_budget)
+        cache = self._result_cache()
+        background = cache is not None and self.config.execution.background
 
         # Filtrar solo archivos Python
         python_files = [f for f in files if f.suffix == ".py"]
+        plan, deferred_plan = self._build_plan(
+            python_files, analysis_type, time_budget, deadline, only,
+            deferred=background and analysis_type == "pre-commit",
+        )
+
+        # Caché por contenido: los pares (archivo, check) sin cambios no se vuelven a ejecutar
+        cache_keys = self._cache_keys(plan) if cache else {}
+        # En modo background también se guardan los checks no cacheables (ej:
+        # TypeCheck), para mostrarlos cuando el pre-commit los deja afuera
+        store_keys = self._cache_keys(plan, background=True) if background else cache_keys
+        results_by_key, pending = self._cached_results(cache, cache_keys, deferred_plan)
+
+        # Unidades de trabajo (check, archivos), ejecutadas en paralelo
+        work_items = self._plan_work(plan, skip=set(results_by_key))
+        work_items, outputs = self._execute(work_items, jobs, deadline)
+        skipped = self._collect_outputs(work_items, outputs, results_by_key, cache, store_keys)
+
+        self._emit_results(plan, deferred_plan, results_by_key, skipped, pending, background)
+        return self.results
+
+    def _build_plan(
+        self,
+        python_files: List[Path],
+        analysis_type: str,
+        time_budget: Optional[float],
+        deadline: Optional[float],
+        only: Optional[Set[Tuple[Path, str]]],
+        deferred: bool,
+    ) -> Tuple[List[PlanEntry], List[PlanEntry]]:
+        """
+        Plan de ejecución: checks seleccionados para cada archivo.
+
+        Args:
+            deferred: Armar también el plan de los checks que la selección
+                de pre-commit dejó afuera (modo background)
 
+        Returns:
+            (plan, plan diferido), listas de (archivo, contexto, checks)
+        """
+        plan: List[PlanEntry] = []
+        deferred_plan: List[PlanEntry] = []
         for file_path in python_files:
             # Crear contexto de ejecución
             context = ExecutionContext(
                 file_path=file_path,
-                is_excluded=self._is_excluded(file_path),
+                is_excluded=self.is_excluded(file_path),
                 config=self.config,
                 analysis_type=analysis_type,
                 time_budget=time_budget,
                 is_modified=True,  # Por ahora asumir modificado
                 is_new_file=False,
                 ai_enabled=self.config.ai.enabled if self.config.ai else False,
+                project_root=self.project_root,
+                deadline=deadline,
             )
 
             # Si el archivo está excluido, saltar
@@ -122,27 +239,567 @@ class CodeGuard:
                 continue
 
             # Seleccionar checks según contexto
-            selected_checks = self.orchestrator.select_checks(context)
+            selected = self.orchestrator.select_checks(context)
+            if only is not None:
+                selected = [c for c in selected if (file_path, c.name) in only]
+            plan.append((file_path, context, selected))
+            if deferred:
+                deferred_plan.append(
+                    (file_path, context, self.orchestrator.deferred_checks(context, selected))
+                )
+        return plan, deferred_plan
+
+    def _cached_results(
+        self,
+        cache: Optional[ResultCache],
+        cache_keys: Dict[Tuple[Path, str], str],
+        deferred_plan: List[PlanEntry],
+    ) -> Tuple[Dict[Tuple[Path, str], List[CheckResult]], Set[Tuple[Path, str]]]:
+        """
+        Busca en la caché los pares del plan y los del plan diferido.
+
+        Returns:
+            (resultados encontrados por par, pares diferidos sin resultado en
+            caché, pendientes para el análisis en segundo plano)
+        """
+        results_by_key: Dict[Tuple[Path, str], List[CheckResult]] = {}
+        pending: Set[Tuple[Path, str]] = set()
+        if cache is None:
+            return results_by_key, pending
+        for pair, key in cache_keys.items():
+            cached = cache.get(key, pair[0])
+            if cached is not None:
+                results_by_key[pair] = cached
+        for pair, key in self._cache_keys(deferred_plan, background=True).items():
+            cached = cache.get(key, pair[0])
+            if cached is None:
+                pending.add(pair)
+            else:
+                results_by_key[pair] = cached
+        return results_by_key, pending
+
+    def _execute(
+        self,
+        work_items: List[Tuple[Verifiable, List[Path]]],
+        jobs: Optional[int],
+        deadline: Optional[float],
+    ) -> Tuple[
+        List[Tuple[Verifiable, List[Path]]],
+        List[Optional[Dict[Tuple[Path, str], List[CheckResult]]]],
+    ]:
+        """
+        Ejecuta las unidades de trabajo con el motor configurado.
+
+        Returns:
+            (unidades en el orden en que se despacharon, salida de cada una;
+            None = omitida por el deadline)
+        """
+        if jobs is None:
+            jobs = self.config.execution.jobs
+        n_jobs = min(resolve_jobs(jobs), len(work_items))
+        if self.config.execution.engine == "asyncio" and work_items:
+            work_items = self._schedule(work_items)
+            return work_items, self._run_async(work_items, deadline)
+        if n_jobs > 1:
+            work_items = self._schedule(work_items)
+            return work_items, self._run_threads(work_items, n_jobs, deadline)
+        if deadline is not None:
+            # Secuencial, pero en un hilo aparte para no esperar más allá del deadline
+            return work_items, self._run_threads(work_items, 1, deadline)
+        return work_items, [self._run_before_deadline(item, deadline) for item in work_items]
+
+    def _collect_outputs(
+        self,
+        work_items: List[Tuple[Verifiable, List[Path]]],
+        outputs: List[Optional[Dict[Tuple[Path, str], List[CheckResult]]]],
+        results_by_key: Dict[Tuple[Path, str], List[CheckResult]],
+        cache: Optional[ResultCache],
+        store_keys: Dict[Tuple[Path, str], str],
+    ) -> Set[Tuple[Path, str]]:
+        """
+        Incorpora las salidas a `results_by_key` y las guarda en la caché.
+
+        Returns:
+            Pares (archivo, check) sin resultado antes del deadline
+        """
+        skipped: Set[Tuple[Path, str]] = set()
+        for (check, file_paths), output in zip(work_items, outputs, strict=True):
+            if output is None:
+                # Sin resultado antes del deadline: se reporta como omitido
+                skipped.update((f, check.name) for f in file_paths)
+                continue
+            results_by_key.update(output)
+            for pair, pair_results in output.items():
+                if pair in store_keys:
+                    cache.put(store_keys[pair], pair_results)
+        if cache and work_items:
+            self._save_state(cache)
+        return skipped
+
+    def _save_state(self, cache: ResultCache) -> None:
+        """Poda la caché y guarda las duraciones medidas (solo con caché habilitada)."""
+        cache.prune()
+        if self.config.execution.learn_durations:
+            # Sin caché (--no-cache) no se escribe nada en .quality_control/
+            self.durations.save()
+
+    def _emit_results(
+        self,
+        plan: List[PlanEntry],
+        deferred_plan: List[PlanEntry],
+        results_by_key: Dict[Tuple[Path, str], List[CheckResult]],
+        skipped: Set[Tuple[Path, str]],
+        pending: Set[Tuple[Path, str]],
+        background: bool,
+    ) -> None:
+        """
+        Llena `results`, `skipped`, `from_background` y `pending_background`.
+
+        Los resultados se emiten en orden archivo → prioridad, independiente
+        del orden de finalización de las unidades.
+        """
+        deferred_by_file = {file_path: checks for file_path, _, checks in deferred_plan}
+        for file_path, _, selected_checks in plan:
+            deferred = deferred_by_file.get(file_path, [])
+            checks = selected_checks + [
+                check for check in deferred if (file_path, check.name) not in pending
+            ]
+            checks.sort(key=lambda c: c.priority)
+            for check in checks:
+                self._emit_pair(
+                    (file_path, check.name), check in selected_checks,
+                    results_by_key, skipped, background,
+                )
+            self.pending_background.extend(
+                (file_path, check.name) for check in deferred
+                if (file_path, check.name) in pending
+            )
+
+    def _emit_pair(
+        self,
+        pair: Tuple[Path, str],
+        selected: bool,
+        results_by_key: Dict[Tuple[Path, str], List[CheckResult]],
+        skipped: Set[Tuple[Path, str]],
+        background: bool,
+    ) -> None:
+        """Emite los resultados de un par (archivo, check) y registra cómo se obtuvieron."""
+        if pair in skipped:
+            self.skipped.append(pair)
+            if background:
+                self.pending_background.append(pair)
+        if pair in results_by_key and not selected:
+            self.from_background.append(pair)
+        self.results.extend(results_by_key.get(pair, []))
+
+    def start_background(self, cleanup: Optional[Path] = None) -> bool:
+        """
+        Lanza un proceso desacoplado que analiza `self.pending_background`.
+
+        El proceso sobrevive al hook: ejecuta los checks en modo "full" y
+        guarda los resultados en la caché, donde la próxima corrida los
+        encuentra si el contenido de los archivos no cambió.
+
+        Args:
+            cleanup: Directorio que el proceso elimina al terminar (ej: la
+                copia temporal de `--staged`, que ya no se puede borrar aquí)
+
+        Returns:
+            True si se lanzó el proceso (el directorio `cleanup` pasa a ser suyo)
+        """
+        if not self.pending_background or self._result_cache() is None:
+            return False
+        return spawn_background(
+            self.project_root, self.pending_background,
+            config_path=self.config_path, cleanup=cleanup,
+        ) is not None
+
+    @staticmethod
+    def _deadline(analysis_type: str, time_budget: Optional[float]) -> Optional[float]:
+        """
+        Instante (`time.monotonic()`) en que vence la corrida.
+
+        Args:
+            analysis_type: Tipo de análisis
+            time_budget: Presupuesto pedido (None = default del tipo de análisis)
 
-            # Ejecutar cada check seleccionado
+        Returns:
+            Deadline absoluto, o None si la corrida no tiene límite de tiempo
+        """
+        if time_budget is None and analysis_type == "pre-commit":
+            time_budget = PRECOMMIT_TIME_BUDGET
+        if time_budget is None:
+            return None
+        return time.monotonic() + time_budget
+
+    def _run_threads(
+        self,
+        work_items: List[Tuple[Verifiable, List[Path]]],
+        n_jobs: int,
+        deadline: Optional[float],
+    ) -> List[Optional[Dict[Tuple[Path, str], List[CheckResult]]]]:
+        """
+        Ejecuta las unidades de trabajo en un pool de hilos hasta el deadline.
+
+        Threads: el tiempo se va en esperar a las herramientas externas
+        (subprocess). Al vencer el deadline no se espera a las unidades en
+        vuelo: sus herramientas se matan (`run_tool` recorta el timeout) y un
+        motor in-process que no puede interrumpirse termina en segundo plano
+        con su resultado descartado. Con `n_jobs=1` las unidades corren en
+        orden.
+
+        Returns:
+            Salida de cada unidad en el orden de `work_items` (None = omitida)
+        """
+        pool = ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="codeguard")
+        futures = [pool.submit(self._run_before_deadline, item, deadline) for item in work_items]
+        try:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            done, _ = wait(futures, timeout=timeout)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return [future.result() if future in done else None for future in futures]
+
+    def _run_before_deadline(
+        self, item: Tuple[Verifiable, List[Path]], deadline: Optional[float]
+    ) -> Optional[Dict[Tuple[Path, str], List[CheckResult]]]:
+        """
+        Ejecuta una unidad de trabajo si todavía hay tiempo.
+
+        Returns:
+            Salida de `_run_work_item`, o None si el deadline venció antes de
+            empezar o mientras corría (resultado incompleto o cortado)
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        start = time.monotonic()
+        output = self._run_work_item(item)
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        self._record_duration(item, time.monotonic() - start)
+        return output
+
+    def _duration_model(self) -> DurationModel:
+        """
+        Modelo de duraciones del proyecto.
+
+        Las muestras dependen de cómo se ejecutan las herramientas: la firma
+        incluye las opciones de `execution` que cambian el costo de un check.
+
+        Returns:
+            DurationModel en `.quality_control/stats/codeguard_durations.json`
+        """
+        execution = self.config.execution
+        settings = json.dumps([
+            execution.in_process, execution.batch, execution.mypy_daemon,
+            execution.tool_pool, execution.pylint_jobs, execution.dead_code_scope,
+        ])
+        return DurationModel(
+            self.project_root / ".quality_control" / "stats" / "codeguard_durations.json",
+            settings=settings,
+        )
+
+    def _record_duration(self, item: Tuple[Verifiable, List[Path]], seconds: float) -> None:
+        """
+        Registra la duración de una unidad de trabajo terminada a tiempo.
+
+        Una unidad batch es una sola invocación del check: se registra con
+        las líneas de todos sus archivos (el modelo `a + b·líneas` separa el
+        costo fijo de arranque del costo por línea).
+        """
+        if not self.config.execution.learn_durations:
+            return
+        check, file_paths = item
+        self.durations.record(check.name, self._lines(file_paths), seconds)
+
+    def _schedule(
+        self, work_items: List[Tuple[Verifiable, List[Path]]]
+    ) -> List[Tuple[Verifiable, List[Path]]]:
+        """
+        Ordena las unidades de trabajo para los workers: la más cara primero.
+
+        Los pools (hilos o semáforo del event loop) despachan en orden desde
+        una cola compartida, así que el orden LPT evita que un archivo enorme
+        bajo pylint o mypy arranque último y defina la duración de la corrida.
+        El costo es el predicho por las duraciones aprendidas (o
+        `estimated_duration`); a igual costo va primero la unidad con más
+        líneas.
+
+        Returns:
+            Las mismas unidades, en orden de despacho
+        """
+        return lpt_order(
+            work_items,
+            cost=self._predicted_cost,
+            size=lambda item: self._lines(item[1]),
+        )
+
+    def _predicted_cost(self, item: Tuple[Verifiable, List[Path]]) -> float:
+        """Duración predicha de una unidad de trabajo (segundos)."""
+        check, file_paths = item
+        default = getattr(check, "estimated_duration", 1.0)
+        if not isinstance(default, (int, float)):
+            default = 1.0
+        if not self.config.execution.learn_durations:
+            return float(default)
+        return self.durations.predict(check.name, self._lines(file_paths), default=default)
+
+    def _lines(self, file_paths: List[Path]) -> int:
+        """Líneas totales de los archivos (contadas una vez por corrida)."""
+        total = 0
+        for file_path in file_paths:
+            if file_path not in self._line_counts:
+                self._line_counts[file_path] = count_lines(file_path)
+            total += self._line_counts[file_path]
+        return total
+
+    def _result_cache(self) -> Optional["ResultCache"]:
+        """
+        Caché de resultados del proyecto, o None si está deshabilitada.
+
+        Returns:
+            ResultCache en `.quality_control/cache/codeguard/` de la raíz del proyecto
+        """
+        execution = self.config.execution
+        if not execution.cache:
+            return None
+        return ResultCache(
+            self.project_root / ".quality_control" / "cache" / "codeguard",
+            max_size_mb=execution.cache_max_size_mb,
+        )
+
+    def _cache_keys(
+        self,
+        plan: List[PlanEntry],
+        background: bool = False,
+    ) -> Dict[Tuple[Path, str], str]:
+        """
+        Calcula las claves de caché de los pares (archivo, check) cacheables.
+
+        Args:
+            plan: Lista de (archivo, contexto, checks seleccionados)
+            background: Incluir los checks sin huella, con la huella de los
+                resultados en segundo plano (dependen de otros archivos: solo
+                se muestran cuando el pre-commit deja afuera el check)
+
+        Returns:
+            Diccionario {(archivo, nombre del check): clave}; los checks sin
+            huella (`cache_key` None) y los archivos ilegibles quedan fuera
+        """
+        fingerprints: Dict[str, Optional[str]] = {}
+        keys: Dict[Tuple[Path, str], str] = {}
+        for file_path, _, selected_checks in plan:
+            content_hash = ResultCache.content_hash(file_path)
+            if content_hash is None:
+                continue
             for check in selected_checks:
-                try:
-                    check_results = check.execute(file_path)
-                    self.results.extend(check_results)
-                except Exception as e:
-                    # Si un check falla, registrar error pero continuar
-                    self.results.append(
-                        CheckResult(
-                            check_name=check.name,
-                            severity=Severity.ERROR,
-                            message=f"Check failed with error: {str(e)}",
-                            file_path=str(file_path),
-                        )
+                if check.name not in fingerprints:
+                    fingerprint = check.cache_key(self.config)
+                    fingerprints[check.name] = fingerprint if isinstance(fingerprint, str) else None
+                fingerprint = fingerprints[check.name]
+                if fingerprint is None and background:
+                    fingerprint = BACKGROUND_FINGERPRINT
+                if fingerprint is not None:
+                    keys[(file_path, check.name)] = ResultCache.key(
+                        content_hash, check.name, fingerprint
                     )
+        return keys
 
-        return self.results
+    def _plan_work(
+        self,
+        plan: List[PlanEntry],
+        skip: Optional[Set[Tuple[Path, str]]] = None,
+    ) -> List[Tuple[Verifiable, List[Path]]]:
+        """
+        Arma las unidades de trabajo (check, archivos) del plan de ejecución.
 
-    def _is_excluded(self, file_path: Path) -> bool:
+        Los checks con soporte batch seleccionados para varios archivos se
+        agrupan en una unidad por bloque de `execution.max_batch_size`
+        archivos; el resto genera una unidad por (archivo, check).
+
+        Args:
+            plan: Lista de (archivo, contexto, checks seleccionados)
+            skip: Pares (archivo, nombre del check) ya resueltos (ej: desde caché)
+
+        Returns:
+            Unidades de trabajo en orden de plan
+        """
+        execution = self.config.execution
+        work_items: List[Tuple[Verifiable, List[Path]]] = []
+        chunk_size = max(execution.max_batch_size, 1)
+        for check, check_files in self._files_by_check(plan, skip):
+            # `is True` para no confundir atributos de mocks con soporte real
+            if execution.batch and check.supports_batch is True and len(check_files) > 1:
+                for start in range(0, len(check_files), chunk_size):
+                    work_items.append((check, check_files[start:start + chunk_size]))
+            else:
+                work_items.extend((check, [file_path]) for file_path in check_files)
+
+        return work_items
+
+    @staticmethod
+    def _files_by_check(
+        plan: List[PlanEntry], skip: Optional[Set[Tuple[Path, str]]]
+    ) -> List[Tuple[Verifiable, List[Path]]]:
+        """
+        Agrupa los archivos del plan por check, en orden de plan.
+
+        Returns:
+            Pares (check, archivos sin resolver en `skip`)
+        """
+        files_by_check: Dict[str, List[Path]] = {}
+        checks_by_name: Dict[str, Verifiable] = {}
+        for file_path, context, selected_checks in plan:
+            for check in selected_checks:
+                if skip and (file_path, check.name) in skip:
+                    continue
+                # Exponer el contexto al check (umbrales y modo de ejecución de config).
+                # Se asigna antes de despachar: los workers no lo modifican.
+                check._context = context
+                checks_by_name[check.name] = check
+                files_by_check.setdefault(check.name, []).append(file_path)
+        return [(checks_by_name[name], files) for name, files in files_by_check.items()]
+
+    def _run_work_item(
+        self, item: Tuple[Verifiable, List[Path]]
+    ) -> Dict[Tuple[Path, str], List[CheckResult]]:
+        """
+        Ejecuta una unidad de trabajo (check, archivos).
+
+        Con un solo archivo usa `execute`; con varios, `execute_batch`. Si el
+        check lanza una excepción se registra un ERROR por archivo y la
+        corrida continúa.
+
+        Args:
+            item: Tupla (check, archivos)
+
+        Returns:
+            Diccionario {(archivo, nombre del check): resultados}
+        """
+        check, file_paths = item
+        try:
+            if len(file_paths) == 1:
+                results_by_file = {file_paths[0]: check.execute(file_paths[0])}
+            else:
+                results_by_file = check.execute_batch(file_paths)
+        except Exception as e:
+            # Si un check falla, registrar error pero continuar
+            results_by_file = {f: [self._check_error(check, f, e)] for f in file_paths}
+
+        return {(f, check.name): results_by_file.get(f, []) for f in file_paths}
+
+    def _run_async(
+        self, work_items: List[Tuple[Verifiable, List[Path]]], deadline: Optional[float] = None
+    ) -> List[Optional[Dict[Tuple[Path, str], List[CheckResult]]]]:
+        """
+        Ejecuta las unidades de trabajo en un event loop (motor asyncio).
+
+        Todas las unidades se lanzan a la vez y un semáforo limita las que
+        están en vuelo a `execution.async_limit`. Los checks que envuelven
+        herramientas externas esperan sus subprocess sin ocupar un hilo.
+        Al vencer el deadline las unidades pendientes se cancelan (y sus
+        herramientas se matan).
+
+        Args:
+            work_items: Unidades (check, archivos) del plan
+            deadline: Instante (`time.monotonic()`) en que vence la corrida
+
+        Returns:
+            Salidas de `_run_work_item_async`, en el orden de `work_items`
+            (None = cancelada por el deadline)
+        """
+        # asyncio (~15 ms de importación) solo se carga con este motor
+        import asyncio
+
+        limit = resolve_jobs(self.config.execution.async_limit)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_event_loop(self._run_work_items_async(work_items, limit, deadline))
+        # Llamado desde código async: el event loop propio corre en otro hilo
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(
+                _run_event_loop, self._run_work_items_async(work_items, limit, deadline)
+            ).result()
+
+    async def _run_work_items_async(
+        self,
+        work_items: List[Tuple[Verifiable, List[Path]]],
+        limit: int,
+        deadline: Optional[float] = None,
+    ) -> List[Optional[Dict[Tuple[Path, str], List[CheckResult]]]]:
+        """Lanza todas las unidades de trabajo con a lo sumo `limit` en vuelo."""
+        import asyncio
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_limited(
+            item: Tuple[Verifiable, List[Path]]
+        ) -> Optional[Dict[Tuple[Path, str], List[CheckResult]]]:
+            async with semaphore:
+                start = time.monotonic()
+                output = await self._run_work_item_async(item)
+                elapsed = time.monotonic() - start
+            # Terminada después del deadline: cortada por el recorte de timeouts
+            if deadline is not None and time.monotonic() > deadline:
+                return None
+            self._record_duration(item, elapsed)
+            return output
+
+        if not work_items:
+            return []
+        tasks = [asyncio.ensure_future(run_limited(item)) for item in work_items]
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return [task.result() if task in done else None for task in tasks]
+
+    async def _run_work_item_async(
+        self, item: Tuple[Verifiable, List[Path]]
+    ) -> Dict[Tuple[Path, str], List[CheckResult]]:
+        """
+        Variante async de `_run_work_item`.
+
+        Los checks batch reciben por `execute_batch_async` también las
+        unidades de un solo archivo (su mapeo es el mismo que el de `execute`);
+        el resto usa `execute_async`.
+
+        Args:
+            item: Tupla (check, archivos)
+
+        Returns:
+            Diccionario {(archivo, nombre del check): resultados}
+        """
+        import asyncio
+
+        check, file_paths = item
+        if not isinstance(check, Verifiable):
+            return await asyncio.to_thread(self._run_work_item, item)
+
+        try:
+            if check.supports_batch is True or len(file_paths) > 1:
+                results_by_file = await check.execute_batch_async(file_paths)
+            else:
+                results_by_file = {file_paths[0]: await check.execute_async(file_paths[0])}
+        except Exception as e:
+            # Si un check falla, registrar error pero continuar
+            results_by_file = {f: [self._check_error(check, f, e)] for f in file_paths}
+
+        return {(f, check.name): results_by_file.get(f, []) for f in file_paths}
+
+    @staticmethod
+    def _check_error(check: Verifiable, file_path: Path, error: Exception) -> CheckResult:
+        """Resultado ERROR para un check que lanzó una excepción."""
+        return CheckResult(
+            check_name=check.name,
+            severity=Severity.ERROR,
+            message=f"Check failed with error: {str(error)}",
+            file_path=str(file_path),
+        )
+
+    def is_excluded(self, file_path: Path) -> bool:
         """
         Verifica si un archivo debe ser excluido del análisis.
 
@@ -181,13 +838,11 @@ class CodeGuard:
         return list(path.rglob("*.py"))
 
 
-# --- CLI --- (imports aquí para evitar importación circular con formatter.py)
-
-import os  # noqa: E402
-
-import click  # noqa: E402
+# --- CLI ---
 
-from quality_agents.codeguard.formatter import format_json, format_results  # noqa: E402
+# Crea la instancia de CodeGuard de cada invocación del CLI. `codeguard daemon`
+# lo reemplaza por instancias en memoria (config, checks y herramientas calientes).
+_guard_factory: Callable[[Optional[Path], Path], CodeGuard] = CodeGuard
 
 
 def _common_parent(paths: List[Path]) -> Path:
@@ -199,7 +854,263 @@ def _common_parent(paths: List[Path]) -> Path:
     return common if common.is_dir() else common.parent
 
 
+def _result_file(result: CheckResult) -> Optional[Path]:
+    return Path(result.file_path) if result.file_path else None
+
+
+def _describe(result: CheckResult) -> str:
+    location = result.file_path or ""
+    if result.line_number:
+        location += f":{result.line_number}"
+    return f"{result.severity.value.upper():8} {result.check_name:<12} {location}  {result.message}"
+
+
+def _watch(
+    guard: CodeGuard,
+    targets: List[Path],
+    files: List[Path],
+    results: List[CheckResult],
+    analysis_type: str,
+    time_budget: Optional[float],
+    jobs: Optional[int],
+) -> None:
+    """
+    Modo --watch: re-analiza los archivos que cambian hasta Ctrl+C.
+
+    Solo se vuelven a ejecutar los checks de los archivos modificados; los
+    resultados del resto quedan en memoria y se muestra únicamente la
+    diferencia (hallazgos nuevos y resueltos).
+    """
+    def collect() -> List[Path]:
+        return [f for target in targets for f in guard.collect_files(target)]
+
+    state: IncrementalResults[CheckResult] = IncrementalResults(
+        key=lambda r: (r.file_path, r.check_name, r.severity, r.line_number, r.message)
+    )
+    state.update(group_by_file(results, _result_file, files))
+    watcher = FileWatcher(targets, collect)
+    click.echo(f"\nObservando cambios ({watcher.mode}). Ctrl+C para salir.")
+    try:
+        while True:
+            changes = watcher.wait()
+            changed = sorted(changes.modified)
+            start_time = time.time()
+            new_results = guard.run(
+                changed, analysis_type=analysis_type, time_budget=time_budget, jobs=jobs
+            ) if changed else []
+            guard.start_background()
+            added, removed = state.update(
+                group_by_file(new_results, _result_file, changed), deleted=changes.deleted
+            )
+            for line in format_update(
+                changes, added, removed, time.time() - start_time, _describe
+            ):
+                click.echo(line)
+    except KeyboardInterrupt:
+        click.echo("\nWatch detenido.")
+    finally:
+        watcher.close()
+
+
+@dataclass(frozen=True)
+class _RunOptions:
+    """Opciones del CLI comunes a todos los modos de corrida."""
+
+    output_format: str
+    analysis_type: str
+    time_budget: Optional[float]
+    jobs: Optional[int]
+    config_path: Optional[Path]
+
+
+def _validate_modes(staged: bool, watch: bool, output_format: str) -> None:
+    """Rechaza combinaciones de modos incompatibles."""
+    if watch and staged:
+        raise click.ClickException("--watch cannot be combined with --staged")
+    if watch and output_format != "text":
+        raise click.ClickException("--watch requires --format text")
+
+
+def _project_root(staged: bool, targets: List[Path]) -> Path:
+    """Raíz del proyecto: la del repositorio con --staged, si no el padre común de PATHS."""
+    try:
+        return repo_root() if staged else _common_parent(targets)
+    except StagedError as e:
+        raise click.ClickException(f"--staged: {e}") from e
+
+
+def _configure_guard(
+    config_path: Optional[Path],
+    project_root: Path,
+    no_cache: bool,
+    engine: Optional[str],
+    background: Optional[bool],
+) -> CodeGuard:
+    """Crea la instancia de CodeGuard y aplica las opciones del CLI sobre la configuración."""
+    guard = _guard_factory(config_path, project_root)
+    if no_cache:
+        guard.config.execution.cache = False
+    if engine:
+        guard.config.execution.engine = engine
+    if background is not None:
+        guard.config.execution.background = background
+    return guard
+
+
+def _run_paths(guard: CodeGuard, targets: List[Path], options: _RunOptions) -> None:
+    """Analiza los archivos Python dentro de PATHS y reporta."""
+    files = [f for target in targets for f in guard.collect_files(target)]
+    if not files and options.output_format == "text":
+        # Corrida sin archivos: no se cargan las herramientas ni el formatter
+        _echo_no_files()
+        return
+    _print_header(guard, ", ".join(str(t.absolute()) for t in targets), len(files), options)
+    _analyze_and_report(guard, files, options)
+
+
+def _run_watch(guard: CodeGuard, targets: List[Path], options: _RunOptions) -> None:
+    """Reporte inicial de PATHS y, después, re-análisis de los archivos que cambian."""
+    files = [f for target in targets for f in guard.collect_files(target)]
+    _print_header(guard, ", ".join(str(t.absolute()) for t in targets), len(files), options)
+    results = _analyze_and_report(guard, files, options)
+    _watch(
+        guard, targets, files, results, options.analysis_type, options.time_budget, options.jobs
+    )
+
+
+def _run_staged(guard: CodeGuard, paths: tuple, options: _RunOptions) -> None:
+    """Analiza el contenido staged de los archivos Python modificados (dentro de PATHS)."""
+    # La lectura del índice cuenta dentro del presupuesto del pre-commit
+    deadline = CodeGuard._deadline(options.analysis_type, options.time_budget)
+    try:
+        snapshot = StagedSnapshot.create(
+            [Path(p) for p in paths],
+            exclude_patterns=guard.config.exclude_patterns,
+            deadline=deadline,
+        )
+    except StagedError as e:
+        raise click.ClickException(f"--staged: {e}") from e
+    if not snapshot.files and options.output_format == "text":
+        # Commit sin cambios Python: no se cargan las herramientas ni el formatter
+        snapshot.cleanup()
+        _echo_no_files()
+        return
+    _print_header(
+        guard, f"contenido staged de {guard.project_root}", len(snapshot.files), options
+    )
+    _analyze_and_report(guard, snapshot.files, options, deadline=deadline, snapshot=snapshot)
+
+
+def _echo_no_files() -> None:
+    click.echo("CodeGuard v0.2.0 (Arquitectura Modular)")
+    click.echo("Sin archivos Python para analizar.")
+
+
+def _print_header(
+    guard: CodeGuard, analyzing: str, total_files: int, options: _RunOptions
+) -> None:
+    """Muestra qué se analiza y con qué opciones (solo en formato texto)."""
+    if options.output_format != "text":
+        return
+    click.echo("CodeGuard v0.2.0 (Arquitectura Modular)")
+    click.echo(f"Analizando: {analyzing}")
+    click.echo(f"Archivos Python encontrados: {total_files}")
+    click.echo(f"Tipo de análisis: {options.analysis_type}")
+
+    if options.time_budget:
+        click.echo(f"Presupuesto de tiempo: {options.time_budget}s")
+
+    if options.config_path:
+        click.echo(f"Configuración: {options.config_path}")
+
+    click.echo(f"\nChecks disponibles: {len(guard.orchestrator.plugins)}")
+    click.echo("---")
+
+
+def _analyze_and_report(
+    guard: CodeGuard,
+    files: List[Path],
+    options: _RunOptions,
+    deadline: Optional[float] = None,
+    snapshot: Optional[StagedSnapshot] = None,
+) -> List[CheckResult]:
+    """
+    Ejecuta los checks, lanza el análisis en segundo plano y reporta.
+
+    Args:
+        deadline: Deadline ya iniciado (ej: antes de leer el índice)
+        snapshot: Copia staged de los archivos; se reportan las rutas del
+            repositorio y se elimina al terminar (o la elimina el proceso en
+            segundo plano)
+
+    Returns:
+        Resultados de la corrida (con las rutas analizadas)
+    """
+    start_time = time.time()
+    background_started = False
+    try:
+        results = guard.run(
+            files, analysis_type=options.analysis_type, time_budget=options.time_budget,
+            jobs=options.jobs, deadline=deadline,
+        )
+        reported, skipped = results, guard.skipped
+        # El proceso en segundo plano analiza la copia staged y la elimina al terminar
+        background_started = guard.start_background(
+            cleanup=snapshot.directory if snapshot is not None else None
+        )
+        if snapshot is not None:
+            # Reportar las rutas del repositorio, no las de la copia temporal
+            reported = snapshot.restore(results)
+            skipped = snapshot.restore_skipped(skipped)
+    finally:
+        if snapshot is not None and not background_started:
+            snapshot.cleanup()
+    _report(guard, reported, skipped, time.time() - start_time, len(files), options)
+    if options.output_format == "text":
+        _report_background(guard, background_started)
+    return results
+
+
+def _report(
+    guard: CodeGuard,
+    results: List[CheckResult],
+    skipped: List[Tuple[Path, str]],
+    elapsed: float,
+    total_files: int,
+    options: _RunOptions,
+) -> None:
+    """Muestra los resultados en el formato pedido."""
+    # rich se carga solo para reportar (no en --version ni sin archivos)
+    from quality_agents.codeguard.formatter import format_json, format_results
+
+    summary = {
+        "elapsed": elapsed,
+        "total_files": total_files,
+        "checks_executed": len(guard.orchestrator.plugins),
+        "skipped": skipped,
+    }
+    if options.output_format == "text":
+        format_results(results, **summary)
+    else:
+        click.echo(format_json(results, **summary))
+
+
+def _report_background(guard: CodeGuard, background_started: bool) -> None:
+    """Informa los resultados tomados del análisis en segundo plano y el que se lanzó."""
+    if guard.from_background:
+        click.echo(
+            f"Resultados del análisis en segundo plano: "
+            f"{len(guard.from_background)} verificaciones (archivos sin cambios)"
+        )
+    if background_started:
+        click.echo(
+            f"Análisis en segundo plano: {len(guard.pending_background)} verificaciones; "
+            f"los resultados se mostrarán en la próxima corrida"
+        )
+
+
 @click.command()
+@click.version_option(package_name="quality-agents", prog_name="codeguard")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option(
     "--config", "-c",
@@ -224,12 +1135,54 @@ def _common_parent(paths: List[Path]) -> Path:
     default=None,
     help="Presupuesto de tiempo en segundos (None = sin límite)"
 )
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Checks en paralelo (default: CPUs disponibles; 1 = secuencial)"
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["threads", "asyncio"]),
+    default=None,
+    help="Motor de ejecución (default: execution.engine de config)"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignorar la caché de resultados (.quality_control/cache/) y re-ejecutar todo"
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    default=False,
+    help="Analizar el contenido staged (git add) de los archivos Python modificados"
+)
+@click.option(
+    "--background/--no-background",
+    default=None,
+    help="Analizar en segundo plano los checks que el pre-commit deja afuera "
+         "(default: execution.background de config)"
+)
+@click.option(
+    "--watch", "-w",
+    is_flag=True,
+    default=False,
+    help="Seguir observando PATHS y re-analizar solo los archivos que cambian"
+)
 def main(
     paths: tuple,
     config: Optional[str],
     format: str,
     analysis_type: str,
     time_budget: Optional[float],
+    jobs: Optional[int],
+    engine: Optional[str],
+    no_cache: bool,
+    staged: bool,
+    background: Optional[bool],
+    watch: bool,
 ) -> None:
     """
     CodeGuard - Verificación de calidad de código con orquestación inteligente.
@@ -240,6 +1193,18 @@ def main(
     Ejemplos:
       codeguard src/
       codeguard entidades servicios configurador
+      codeguard --staged
+
+    Con --staged analiza solo los archivos Python staged (dentro de PATHS, si
+    se indican), tal como quedarán en el commit.
+
+    Con --background los checks que el pre-commit deja afuera (Pylint,
+    TypeCheck, DeadCode, ...) se ejecutan en un proceso en segundo plano
+    al terminar; la próxima corrida muestra sus resultados desde la caché.
+
+    Con --watch, después del reporte inicial sigue observando PATHS y, cada
+    vez que se guardan archivos, ejecuta los checks solo sobre ellos y
+    muestra los hallazgos nuevos (+) y resueltos (-).
 
     Tipos de análisis:
     - pre-commit: Checks rápidos y críticos (<5s)
@@ -247,53 +1212,23 @@ def main(
     - full: Análisis completo sin restricciones
     """
     targets = [Path(p) for p in paths] if paths else [Path(".")]
-    config_path = Path(config) if config else None
-
-    project_root = _common_parent(targets)
-    guard = CodeGuard(config_path=config_path, project_root=project_root)
-
-    all_files: List[Path] = []
-    for target in targets:
-        all_files.extend(guard.collect_files(target))
-
-    # Solo mostrar información si formato es texto
-    if format == "text":
-        click.echo("CodeGuard v0.2.0 (Arquitectura Modular)")
-        targets_str = ", ".join(str(t.absolute()) for t in targets)
-        click.echo(f"Analizando: {targets_str}")
-        click.echo(f"Archivos Python encontrados: {len(all_files)}")
-        click.echo(f"Tipo de análisis: {analysis_type}")
-
-        if time_budget:
-            click.echo(f"Presupuesto de tiempo: {time_budget}s")
-
-        if config_path:
-            click.echo(f"Configuración: {config_path}")
-
-        click.echo(f"\nChecks disponibles: {len(guard.orchestrator.checks)}")
-        click.echo("---")
-
-    # Ejecutar checks con orquestador (medir tiempo)
-    start_time = time.time()
-    results = guard.run(all_files, analysis_type=analysis_type, time_budget=time_budget)
-    elapsed = time.time() - start_time
-
-    if format == "text":
-        format_results(
-            results,
-            elapsed=elapsed,
-            total_files=len(all_files),
-            checks_executed=len(guard.orchestrator.checks),
-        )
+    _validate_modes(staged, watch, format)
+    options = _RunOptions(
+        output_format=format,
+        analysis_type=analysis_type,
+        time_budget=time_budget,
+        jobs=jobs,
+        config_path=Path(config) if config else None,
+    )
+    guard = _configure_guard(
+        options.config_path, _project_root(staged, targets), no_cache, engine, background
+    )
+    if staged:
+        _run_staged(guard, paths, options)
+    elif watch:
+        _run_watch(guard, targets, options)
     else:
-        json_output = format_json(
-            results,
-            elapsed=elapsed,
-            total_files=len(all_files),
-            checks_executed=len(guard.orchestrator.checks),
-        )
-        click.echo(json_output)
-
+        _run_paths(guard, targets, options)
 
 if __name__ == "__main__":
     main()
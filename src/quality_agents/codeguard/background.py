@@ -0,0 +1,161 @@
+"""
+Análisis en segundo plano de los checks que el pre-commit deja afuera.
+
+En pre-commit el orquestador descarta los checks de prioridad > 3 o que no
+entran en el presupuesto de 5 s (Pylint, TypeCheck, DeadCode), así que sus
+hallazgos nunca se ven al commitear. Con `execution.background` CodeGuard
+lanza, al terminar el hook, un proceso desacoplado que ejecuta esos checks
+en modo "full" y guarda los resultados en la caché de resultados. La
+próxima corrida los muestra sin ejecutarlos si el contenido de los archivos
+no cambió.
+
+Cada trabajo es un archivo JSON en `.quality_control/background/` que el
+proceso lee y elimina al arrancar. Los procesos se serializan con un lock
+de archivo: dos commits seguidos no compiten por la CPU, y el segundo
+encuentra en la caché lo que el primero ya analizó.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Huella de caché de los checks sin `cache_key` (sus resultados dependen de
+# otros archivos): solo se usa para mostrarlos cuando el pre-commit los deja afuera
+BACKGROUND_FINGERPRINT = "background"
+
+# Directorio de trabajos, lock y log, relativo a la raíz del proyecto
+_SPOOL_DIR = Path(".quality_control") / "background"
+
+# Comando del proceso (con -m, runpy advierte: el paquete ya importó este módulo)
+_WORKER_CODE = (
+    "import sys; from quality_agents.codeguard.background import main; sys.exit(main())"
+)
+
+
+def spawn_background(
+    project_root: Path,
+    pairs: Sequence[Tuple[Path, str]],
+    config_path: Optional[Path] = None,
+    cleanup: Optional[Path] = None,
+) -> Optional[Path]:
+    """
+    Lanza un proceso desacoplado que analiza los pares (archivo, check).
+
+    El proceso corre en su propia sesión (no recibe las señales de la
+    terminal ni del hook) con stdin/stdout cerrados; su stderr va a
+    `.quality_control/background/worker.log`.
+
+    El proceso hereda el directorio actual de quien lo lanza: las huellas
+    de caché (`tool_fingerprint`, `project_config_digest`) y las
+    herramientas leen setup.cfg, .codespellrc, ... desde ahí, así que las
+    claves que escribe coinciden con las que busca la próxima corrida.
+
+    Args:
+        project_root: Raíz del proyecto (ubicación de `.quality_control/`)
+        pairs: Pares (archivo, nombre del check) a analizar
+        config_path: Archivo de configuración de la corrida (None = auto)
+        cleanup: Directorio que el proceso elimina al terminar (la copia
+            staged de `--staged`, con los archivos a analizar)
+
+    Returns:
+        Ruta del archivo del trabajo, o None si no se pudo lanzar
+    """
+    spool = project_root / _SPOOL_DIR
+    job = {
+        "project_root": str(project_root.resolve()),
+        "config": str(config_path.resolve()) if config_path else None,
+        "pairs": [[str(file_path.resolve()), name] for file_path, name in pairs],
+        "cleanup": str(cleanup) if cleanup else None,
+    }
+    if os.name == "nt":
+        detach = {
+            "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+        }
+    else:
+        detach = {"start_new_session": True}
+
+    try:
+        spool.mkdir(parents=True, exist_ok=True)
+        fd, job_name = tempfile.mkstemp(dir=spool, prefix="job-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as job_file:
+            json.dump(job, job_file)
+        with open(spool / "worker.log", "ab") as log:
+            subprocess.Popen(
+                [sys.executable, "-c", _WORKER_CODE, job_name],
+                cwd=Path.cwd(),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=log,
+                close_fds=True,
+                **detach,
+            )
+    except OSError as e:
+        logger.debug(f"No se pudo lanzar el análisis en segundo plano: {e}")
+        return None
+    return Path(job_name)
+
+
+@contextmanager
+def _worker_lock(spool: Path) -> Iterator[None]:
+    """Serializa los procesos en segundo plano de un proyecto (sin lock en Windows)."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    spool.mkdir(parents=True, exist_ok=True)
+    with open(spool / "worker.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def run_job(job_path: Path) -> int:
+    """
+    Ejecuta un trabajo en segundo plano y guarda los resultados en la caché.
+
+    Args:
+        job_path: Archivo del trabajo (se elimina al leerlo)
+
+    Returns:
+        Cantidad de resultados obtenidos
+    """
+    from quality_agents.codeguard.agent import CodeGuard
+
+    job = json.loads(job_path.read_text(encoding="utf-8"))
+    job_path.unlink()
+    project_root = Path(job["project_root"])
+    pairs = {(Path(file_path), name) for file_path, name in job["pairs"]}
+    files: List[Path] = list(dict.fromkeys(Path(file_path) for file_path, _ in job["pairs"]))
+
+    try:
+        with _worker_lock(project_root / _SPOOL_DIR):
+            config_path = Path(job["config"]) if job["config"] else None
+            guard = CodeGuard(config_path=config_path, project_root=project_root)
+            # Puede venir de --background: sin esto no se guardan los checks no cacheables
+            guard.config.execution.background = True
+            return len(guard.run(files, analysis_type="full", only=pairs))
+    finally:
+        if job["cleanup"]:
+            shutil.rmtree(job["cleanup"], ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada del proceso lanzado por `spawn_background` (argumento: JOB)."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: background JOB", file=sys.stderr)
+        return 2
+    run_job(Path(args[0]))
+    return 0
@@ -0,0 +1,284 @@
+"""
+Caché de resultados de CodeGuard direccionada por contenido.
+
+Cada entrada guarda los resultados de un check sobre un archivo. La clave
+combina el hash del contenido del archivo, el nombre del check y la huella
+que declara el check (`Verifiable.cache_key`: versión de la herramienta y
+campos de configuración relevantes). Un archivo sin cambios, analizado con la
+misma herramienta y configuración, reutiliza el resultado sin invocar la
+herramienta.
+
+Las entradas son archivos JSON en `.quality_control/cache/codeguard/`. El
+tamaño total está acotado: al superarlo se eliminan las entradas usadas
+menos recientemente (LRU según la fecha de modificación, que se actualiza en
+cada acierto).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from quality_agents.codeguard.models import CheckResult, Severity
+
+logger = logging.getLogger(__name__)
+
+# Versión del formato de entrada; cambiarla invalida toda la caché
+_FORMAT_VERSION = "1"
+
+
+def tool_fingerprint(
+    tool: str,
+    config: Any,
+    *config_fields: str,
+    config_files: Sequence[str] = (),
+    pyproject_tables: Sequence[str] = (),
+) -> Optional[str]:
+    """
+    Construye la huella de caché de un check basado en una herramienta externa.
+
+    Args:
+        tool: Nombre de la distribución de la herramienta (ej: "flake8")
+        config: Configuración de CodeGuard (puede ser None)
+        config_fields: Campos de la configuración que afectan el resultado
+        config_files: Archivos de configuración propios de la herramienta
+            (ej: ".flake8", "setup.cfg"), relativos al directorio de trabajo
+        pyproject_tables: Tablas `[tool.X]` de pyproject.toml que lee la
+            herramienta (ej: "codespell")
+
+    Returns:
+        Huella "herramienta==versión|campos|config", o None si la herramienta
+        no está instalada como paquete (no se puede versionar el resultado)
+    """
+    # importlib.metadata (~15 ms) solo se carga al consultar la caché
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        tool_version = version(tool)
+    except PackageNotFoundError:
+        return None
+
+    values = {name: getattr(config, name, None) for name in config_fields} if config else {}
+    fingerprint = f"{tool}=={tool_version}|{json.dumps(values, sort_keys=True, default=str)}"
+    if config_files or pyproject_tables:
+        fingerprint += f"|{project_config_digest(config_files, pyproject_tables)}"
+    return fingerprint
+
+
+def project_config_digest(
+    config_files: Sequence[str], pyproject_tables: Sequence[str] = ()
+) -> str:
+    """
+    Hash de la configuración del proyecto que lee una herramienta.
+
+    Las herramientas buscan su configuración en el directorio de trabajo (donde
+    CodeGuard las ejecuta): editar `.flake8` o `[tool.codespell]` cambia el
+    resultado sin cambiar el archivo analizado, así que invalida la entrada.
+    De pyproject.toml solo cuentan las tablas de la herramienta: cambiar otra
+    sección no invalida la caché.
+
+    Args:
+        config_files: Archivos de configuración (los inexistentes cuentan como vacíos)
+        pyproject_tables: Tablas `[tool.X]` de pyproject.toml
+
+    Returns:
+        Hash hexadecimal
+    """
+    cwd = Path.cwd()
+    digest = hashlib.sha256()
+    for name in config_files:
+        try:
+            content = (cwd / name).read_bytes()
+        except OSError:
+            content = b""
+        digest.update(name.encode("utf-8") + b"\0" + content + b"\0")
+    if pyproject_tables:
+        tables = _pyproject_tool_tables(cwd / "pyproject.toml", pyproject_tables)
+        digest.update(json.dumps(tables, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _pyproject_tool_tables(path: Path, names: Sequence[str]) -> Dict[str, Any]:
+    """Tablas `[tool.X]` pedidas de un pyproject.toml (vacío si no se puede leer)."""
+    import tomllib
+
+    try:
+        with open(path, "rb") as f:
+            tool = tomllib.load(f).get("tool", {})
+    except (OSError, ValueError):
+        return {}
+    return {name: tool.get(name) for name in names}
+
+
+class ResultCache:
+    """
+    Caché en disco de resultados de checks.
+
+    Attributes:
+        directory: Directorio de las entradas
+        max_size_bytes: Tamaño máximo total antes de desalojar entradas
+
+    Example:
+        >>> cache = ResultCache(Path(".quality_control/cache/codeguard"))
+        >>> key = cache.key(ResultCache.content_hash(path), "PEP8", fingerprint)
+        >>> results = cache.get(key, path)  # None si no hay entrada
+    """
+
+    def __init__(self, directory: Path, max_size_mb: float = 50.0):
+        """
+        Inicializa la caché.
+
+        Args:
+            directory: Directorio de las entradas (se crea al guardar)
+            max_size_mb: Tamaño máximo total en MB
+        """
+        self.directory = directory
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+    @staticmethod
+    def content_hash(file_path: Path) -> Optional[str]:
+        """
+        Hash SHA-256 del contenido del archivo.
+
+        Returns:
+            Hash hexadecimal, o None si el archivo no se puede leer
+        """
+        try:
+            return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def key(content_hash: str, check_name: str, fingerprint: str) -> str:
+        """
+        Clave de una entrada.
+
+        Args:
+            content_hash: Hash del contenido del archivo
+            check_name: Nombre del check
+            fingerprint: Huella del check (`Verifiable.cache_key`)
+
+        Returns:
+            Clave hexadecimal
+        """
+        raw = "\0".join((_FORMAT_VERSION, content_hash, check_name, fingerprint))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, file_path: Path) -> Optional[List[CheckResult]]:
+        """
+        Busca los resultados cacheados para una clave.
+
+        Los resultados se reconstruyen con la ruta actual del archivo: el mismo
+        contenido en otra ruta reutiliza la entrada.
+
+        Args:
+            key: Clave de la entrada
+            file_path: Archivo al que corresponden los resultados
+
+        Returns:
+            Lista de resultados, o None si no hay entrada válida
+        """
+        entry = self._entry_path(key)
+        try:
+            data = json.loads(entry.read_text(encoding="utf-8"))
+            results = [
+                CheckResult(
+                    check_name=item["check_name"],
+                    severity=Severity(item["severity"]),
+                    message=item["message"],
+                    file_path=str(file_path),
+                    line_number=item["line_number"],
+                )
+                for item in data["results"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        # Marcar como usada recientemente (LRU)
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return results
+
+    def put(self, key: str, results: List[CheckResult]) -> None:
+        """
+        Guarda los resultados de una clave.
+
+        No se guardan resultados que reportan fallas de la herramienta
+        (ERROR sin número de línea: no instalada, timeout, salida ilegible),
+        para que la próxima corrida vuelva a intentarlo.
+
+        Args:
+            key: Clave de la entrada
+            results: Resultados del check sobre el archivo
+        """
+        if any(r.severity == Severity.ERROR and r.line_number is None for r in results):
+            return
+
+        payload = {
+            "results": [
+                {
+                    "check_name": r.check_name,
+                    "severity": r.severity.value,
+                    "message": r.message,
+                    "line_number": r.line_number,
+                }
+                for r in results
+            ]
+        }
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Escritura atómica: un lector concurrente nunca ve una entrada a medias
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump(payload, tmp)
+            os.replace(tmp_name, entry)
+        except OSError as e:
+            logger.debug(f"No se pudo escribir la entrada de caché {key}: {e}")
+
+    def prune(self) -> int:
+        """
+        Desaloja las entradas usadas menos recientemente hasta respetar el tamaño máximo.
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        entries: Dict[Path, os.stat_result] = {}
+        for entry in self.directory.glob("*/*.json"):
+            try:
+                entries[entry] = entry.stat()
+            except OSError:
+                continue
+
+        total = sum(stat.st_size for stat in entries.values())
+        removed = 0
+        for entry, stat in sorted(entries.items(), key=lambda item: item[1].st_mtime):
+            if total <= self.max_size_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+            removed += 1
+
+        if removed:
+            logger.debug(f"Caché: {removed} entradas desalojadas (LRU)")
+        return removed
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        for entry in self.directory.glob("*/*.json"):
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+
+    def _entry_path(self, key: str) -> Path:
+        """Ruta de la entrada (subdirectorio por prefijo para no saturar un directorio)."""
+        return self.directory / key[:2] / f"{key}.json"
@@ -2,8 +2,8 @@
 Checks modulares de CodeGuard.
 
 Este paquete contiene todos los checks de calidad implementados como clases
-que heredan de `Verifiable`. El orquestador (`CheckOrchestrator`) descubre
-automáticamente todos los checks en este paquete y los ejecuta según el contexto.
+que heredan de `Verifiable`. El orquestador (`CheckOrchestrator`) los toma del
+registro de plugins y los ejecuta según el contexto.
 
 Arquitectura Modular
 ====================
@@ -14,18 +14,21 @@ Cada check es una clase independiente que:
 3. Sobrescribe (opcionalmente): `estimated_duration`, `priority`, `should_run()`
 4. Implementa el método abstracto: `execute(file_path)`
 
-Auto-Discovery
-==============
+Registro
+========
 
-Los checks son descubiertos automáticamente por `CheckOrchestrator._discover_checks()`:
-- El orquestador importa este módulo
-- Busca todas las clases que heredan de `Verifiable`
-- Las instancia y las agrega a la lista de checks disponibles
+Los checks se registran en `quality_agents/codeguard/registry.py` con su
+metadata estática (`PluginSpec`: nombre, categoría, prioridad, duración
+estimada y toggle de config). El orquestador selecciona con esa metadata e
+importa solo los checks que va a ejecutar.
 
-No es necesario registrar manualmente los checks, solo:
+Para agregar un check:
 1. Crear la clase en un archivo dentro de `checks/`
-2. Importarla en este `__init__.py`
-3. Agregarla a `__all__`
+2. Registrarla en `registry.py` (la metadata debe coincidir con la clase)
+3. Agregarla a `_EXPORTS` en este `__init__.py`
+
+Los checks de otros paquetes se registran con entry points en el grupo
+`quality_agents.checks` (ver `quality_agents.shared.plugins`).
 
 Estructura de un Check
 ======================
@@ -36,7 +39,7 @@ from pathlib import Path
 from typing import List
 
 from quality_agents.shared.verifiable import Verifiable, ExecutionContext
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.models import CheckResult, Severity
 
 
 class EjemploCheck(Verifiable):
@@ -100,26 +103,27 @@ Fecha de creación: 2026-02-03
 Ticket: 1.5.3
 """
 
-# Imports de checks implementados
-from .complexity_check import ComplexityCheck
-from .dead_code_check import DeadCodeCheck
-from .import_check import ImportCheck
-from .maintainability_check import MaintainabilityCheck
-from .pep8_check import PEP8Check
-from .pylint_check import PylintCheck
-from .security_check import SecurityCheck
-from .spelling_check import SpellingCheck
-from .type_check import TypeCheck
-
-# Lista de checks exportados (actualizar cuando se agreguen checks)
-__all__ = [
-    "PEP8Check",
-    "PylintCheck",
-    "SecurityCheck",
-    "ComplexityCheck",
-    "TypeCheck",
-    "ImportCheck",
-    "DeadCodeCheck",
-    "MaintainabilityCheck",
-    "SpellingCheck",
-]
+import importlib
+
+# Las clases se importan al pedirlas: el orquestador importa solo las
+# seleccionadas a partir del registro
+_EXPORTS = {
+    "ComplexityCheck": ".complexity_check",
+    "DeadCodeCheck": ".dead_code_check",
+    "ImportCheck": ".import_check",
+    "MaintainabilityCheck": ".maintainability_check",
+    "PEP8Check": ".pep8_check",
+    "PylintCheck": ".pylint_check",
+    "SecurityCheck": ".security_check",
+    "SpellingCheck": ".spelling_check",
+    "TypeCheck": ".type_check",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,202 @@
+"""
+Utilidades para la ejecución batch de checks de CodeGuard.
+
+Un check en modo batch invoca su herramienta una sola vez sobre todo el
+changeset y luego reparte la salida por archivo. Estas funciones resuelven la
+parte común: timeouts, errores por archivo y asignación de líneas de salida al
+archivo que las originó (las herramientas reportan las rutas con formatos
+distintos: relativas, absolutas o con prefijo "./").
+
+`run_batch_async` es la misma invocación para el motor asyncio: los checks
+que envuelven una herramienta reutilizan su comando y su parser.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool_async
+
+# Prefijo "ruta:línea:" de las herramientas que reportan una línea por hallazgo
+_PATH_PREFIX = r"^(?P<path>.+?):\d+:"
+
+
+def batch_timeout(per_file_timeout: float, n_files: int) -> float:
+    """
+    Calcula el timeout de una invocación batch.
+
+    Args:
+        per_file_timeout: Timeout que usa el check en modo archivo por archivo
+        n_files: Cantidad de archivos de la invocación
+
+    Returns:
+        Timeout total en segundos
+    """
+    return per_file_timeout * max(n_files, 1)
+
+
+def batch_error(
+    check_name: str, file_paths: List[Path], message: str
+) -> Dict[Path, List[CheckResult]]:
+    """
+    Construye un resultado ERROR por archivo cuando la invocación batch falla.
+
+    Args:
+        check_name: Nombre del check
+        file_paths: Archivos de la invocación
+        message: Mensaje de error (mismo texto que el modo archivo por archivo)
+
+    Returns:
+        Diccionario {archivo: [CheckResult ERROR]}
+    """
+    return {
+        file_path: [
+            CheckResult(
+                check_name=check_name,
+                severity=Severity.ERROR,
+                message=message,
+                file_path=str(file_path),
+            )
+        ]
+        for file_path in file_paths
+    }
+
+
+async def run_batch_async(
+    check_name: str,
+    tool: str,
+    cmd: List[str],
+    timeout: float,
+    file_paths: List[Path],
+    parse: Callable[[List[Path], subprocess.CompletedProcess], Dict[Path, List[CheckResult]]],
+    context: Any = None,
+) -> Dict[Path, List[CheckResult]]:
+    """
+    Invoca una herramienta con `run_tool_async` y reparte su salida.
+
+    Los errores de invocación producen los mismos mensajes que el modo
+    sincrónico de los checks ("<tool> not installed", "timed out", ...).
+
+    Args:
+        check_name: Nombre del check
+        tool: Ejecutable (y paquete pip) de la herramienta
+        cmd: Comando completo
+        timeout: Timeout de la invocación (se aplica con `asyncio.wait_for`)
+        file_paths: Archivos de la invocación
+        parse: Convierte (archivos, proceso completado) en {archivo: resultados}
+        context: ExecutionContext del check (decide si usar el pool de herramientas)
+
+    Returns:
+        Diccionario {archivo: resultados}
+    """
+    try:
+        process = await run_tool_async(cmd, timeout=timeout, context=context)
+    except FileNotFoundError:
+        message = f"{tool} not installed. Run: pip install {tool}"
+        return batch_error(check_name, file_paths, message)
+    except subprocess.TimeoutExpired as e:
+        message = f"{tool} execution timed out (>{e.timeout:.0f}s)"
+        return batch_error(check_name, file_paths, message)
+    except Exception as e:
+        return batch_error(check_name, file_paths, f"Unexpected error running {tool}: {str(e)}")
+
+    return parse(file_paths, process)
+
+
+class PathIndex:
+    """
+    Resuelve rutas reportadas por una herramienta a los archivos del batch.
+
+    Compara rutas absolutas normalizadas, de modo que `./pkg/a.py`,
+    `pkg/a.py` y `/proyecto/pkg/a.py` identifican al mismo archivo.
+    """
+
+    def __init__(self, file_paths: List[Path]) -> None:
+        self._index: Dict[Path, Path] = {f.resolve(): f for f in file_paths}
+        self._cache: Dict[str, Optional[Path]] = {}
+
+    def lookup(self, reported: str) -> Optional[Path]:
+        """
+        Retorna el archivo del batch que corresponde a la ruta reportada.
+
+        Args:
+            reported: Ruta tal como la imprime la herramienta
+
+        Returns:
+            Archivo original del batch, o None si no pertenece al batch
+        """
+        if reported not in self._cache:
+            try:
+                self._cache[reported] = self._index.get(Path(reported.strip()).resolve())
+            except (OSError, ValueError):
+                self._cache[reported] = None
+        return self._cache[reported]
+
+
+def split_output_by_file(
+    output: str, file_paths: List[Path], pattern: str = _PATH_PREFIX
+) -> Dict[Path, str]:
+    """
+    Reparte la salida línea a línea de una herramienta entre los archivos del batch.
+
+    Cada línea que empieza con "ruta:línea:" se asigna al archivo correspondiente;
+    el resto (encabezados, resúmenes) se descarta. El texto resultante por archivo
+    conserva el formato original, de modo que los parsers existentes de cada
+    check pueden reutilizarse sin cambios.
+
+    Args:
+        output: Salida completa de la herramienta
+        file_paths: Archivos de la invocación
+        pattern: Regex con un grupo `path` que captura la ruta de cada línea
+
+    Returns:
+        Diccionario {archivo: salida correspondiente a ese archivo}
+    """
+    index = PathIndex(file_paths)
+    lines_by_file: Dict[Path, List[str]] = {f: [] for f in file_paths}
+
+    for line in output.splitlines():
+        match = re.match(pattern, line.strip())
+        if not match:
+            continue
+        file_path = index.lookup(match.group("path"))
+        if file_path is not None:
+            lines_by_file[file_path].append(line)
+
+    return {f: "\n".join(lines) for f, lines in lines_by_file.items()}
+
+
+def split_sections_by_header(output: str, file_paths: List[Path]) -> Dict[Path, str]:
+    """
+    Reparte una salida agrupada en secciones encabezadas por la ruta del archivo.
+
+    Formato (ej: `radon cc`)::
+
+        pkg/a.py
+            F 5:0 f - A (1)
+        pkg/b.py
+            F 3:0 g - A (1)
+
+    Args:
+        output: Salida completa de la herramienta
+        file_paths: Archivos de la invocación
+
+    Returns:
+        Diccionario {archivo: líneas de su sección}
+    """
+    index = PathIndex(file_paths)
+    lines_by_file: Dict[Path, List[str]] = {f: [] for f in file_paths}
+    current: Optional[Path] = None
+
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        if not line[0].isspace():
+            current = index.lookup(line)
+            continue
+        if current is not None:
+            lines_by_file[current].append(line)
+
+    return {f: "\n".join(lines) for f, lines in lines_by_file.items()}
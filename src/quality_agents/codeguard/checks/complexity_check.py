@@ -8,14 +8,26 @@ Fecha de creación: 2026-02-03
 Ticket: 2.4
 """
 
+import logging
 import re
 import subprocess
 from pathlib import Path
-from typing import List
-
-from quality_agents.codeguard.agent import CheckResult, Severity
+from typing import Any, Dict, List, Optional
+
+from quality_agents.codeguard.cache import tool_fingerprint
+from quality_agents.codeguard.checks._batch import (
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+    split_sections_by_header,
+)
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
+from quality_agents.shared.radon_metrics import RadonMetrics, RadonMetricsProvider, complexity_rank
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class ComplexityCheck(Verifiable):
     """
@@ -39,6 +51,8 @@ class ComplexityCheck(Verifiable):
     Configuración:
         - check_complexity: bool (habilitado por defecto)
         - max_cyclomatic_complexity: int (default: 10)
+        - execution.in_process: leer los bloques del RadonMetricsProvider
+          compartido (false = subprocess `radon cc`)
 
     Prioridad: 3 (Alta - calidad importante)
     Duración estimada: 1.0s
@@ -88,10 +102,38 @@ class ComplexityCheck(Verifiable):
 
         return True
 
+    def cache_key(self, config: Any) -> Optional[str]:
+        """Clave de caché: versión de radon y `max_cyclomatic_complexity`."""
+        return tool_fingerprint("radon", config, "max_cyclomatic_complexity")
+
+    @property
+    def supports_batch(self) -> bool:
+        """radon acepta múltiples archivos en una sola invocación."""
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
         """
         Ejecuta radon sobre el archivo.
 
+        Args:
+            file_path: Ruta al archivo Python
+
+        Returns:
+            Lista de resultados de verificación
+        """
+        if self._in_process():
+            try:
+                metrics = RadonMetricsProvider.shared().for_file(file_path)
+                return self._build_results(file_path, self._functions_from_metrics(metrics))
+            except Exception as e:
+                logger.debug(f"RadonMetricsProvider falló en {file_path}: {e}. Usando radon CLI.")
+
+        return self._execute_subprocess(file_path)
+
+    def _execute_subprocess(self, file_path: Path) -> List[CheckResult]:
+        """
+        Ejecuta radon cc como subprocess sobre el archivo.
+
         Args:
             file_path: Ruta al archivo Python
 
@@ -103,64 +145,17 @@ class ComplexityCheck(Verifiable):
         try:
             # Ejecutar radon cc con formato show_complexity (-s)
             # -s muestra el score de complejidad
-            process = subprocess.run(
+            process = run_tool(
                 ["radon", "cc", "-s", str(file_path)],
-                capture_output=True,
-                text=True,
                 timeout=5,
+                context=getattr(self, "_context", None),
             )
 
             # Parsear output
             # Formato: <tipo> <linea>:<col> <nombre> - <grade> (<CC>)
             # Ejemplo: F 10:0 complex_function - C (11)
             functions = self._parse_radon_output(process.stdout)
-
-            if not functions:
-                # Sin funciones complejas
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ No complex functions detected",
-                        file_path=str(file_path),
-                    )
-                )
-            else:
-                # Obtener max_cc de config (default: 10)
-                max_cc = 10
-                if hasattr(self, "_context") and self._context.config:
-                    max_cc = self._context.config.max_cyclomatic_complexity
-
-                # Procesar cada función con CC > max_cc
-                complex_functions = [f for f in functions if f["complexity"] > max_cc]
-
-                if not complex_functions:
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.INFO,
-                            message=f"✓ All functions below complexity threshold (≤{max_cc})",
-                            file_path=str(file_path),
-                        )
-                    )
-                else:
-                    for func in complex_functions:
-                        severity = self._map_severity(func["complexity"], max_cc)
-                        message = (
-                            f"Complexity: {func['name']} has cyclomatic complexity "
-                            f"{func['complexity']} (grade {func['grade']}). "
-                            f"Consider refactoring into smaller functions."
-                        )
-
-                        results.append(
-                            CheckResult(
-                                check_name=self.name,
-                                severity=severity,
-                                message=message,
-                                file_path=str(file_path),
-                                line_number=func["line"],
-                            )
-                        )
+            results.extend(self._build_results(file_path, functions))
 
         except FileNotFoundError:
             # radon no instalado
@@ -195,6 +190,156 @@ class ComplexityCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta radon cc una sola vez sobre todos los archivos.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+
+        Returns:
+            Diccionario {archivo: resultados}, con el mismo mapeo que `execute`
+        """
+        if self._in_process():
+            try:
+                provider = RadonMetricsProvider.shared()
+                return {
+                    f: self._build_results(f, self._functions_from_metrics(provider.for_file(f)))
+                    for f in file_paths
+                }
+            except Exception as e:
+                logger.debug(f"RadonMetricsProvider falló en modo batch: {e}. Usando radon CLI.")
+
+        try:
+            process = run_tool(
+                self._batch_command(file_paths),
+                timeout=batch_timeout(5, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(self.name, file_paths, "radon not installed. Run: pip install radon")
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"radon execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running radon: {str(e)}")
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: radon CLI sin ocupar un hilo."""
+        if self._in_process():
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "radon", self._batch_command(file_paths),
+            batch_timeout(5, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    @staticmethod
+    def _batch_command(file_paths: List[Path]) -> List[str]:
+        """Comando `radon cc` para varios archivos."""
+        return ["radon", "cc", "-s"] + [str(f) for f in file_paths]
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte la salida de `radon cc` entre los archivos del batch."""
+        sections = split_sections_by_header(process.stdout, file_paths)
+        return {
+            f: self._build_results(f, self._parse_radon_output(sections[f]))
+            for f in file_paths
+        }
+
+    def _in_process(self) -> bool:
+        """True si la config pide ejecución in-process y radon está disponible."""
+        if not (hasattr(self, "_context") and self._context and self._context.config):
+            return False
+        execution = getattr(self._context.config, "execution", None)
+        return bool(execution and execution.in_process) and RadonMetricsProvider.is_available()
+
+    def _functions_from_metrics(self, metrics: RadonMetrics) -> List[dict]:
+        """
+        Convierte los bloques del proveedor al formato de `_parse_radon_output`.
+
+        Args:
+            metrics: Métricas de radon del archivo
+
+        Returns:
+            Lista de diccionarios con info de funciones, en el orden de `radon cc`
+        """
+        return [
+            {
+                "line": block.lineno,
+                "name": block.fullname,
+                "grade": complexity_rank(block.complexity),
+                "complexity": block.complexity,
+            }
+            for block in metrics.sorted_blocks()
+        ]
+
+    def _build_results(self, file_path: Path, functions: List[dict]) -> List[CheckResult]:
+        """
+        Mapea las funciones reportadas por radon a CheckResult según max_cc.
+
+        Args:
+            file_path: Ruta al archivo Python
+            functions: Resultado de `_parse_radon_output`
+
+        Returns:
+            Un resultado por función que supera el umbral, o un INFO si ninguna lo supera
+        """
+        if not functions:
+            # Sin funciones complejas
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ No complex functions detected",
+                    file_path=str(file_path),
+                )
+            ]
+
+        # Obtener max_cc de config (default: 10)
+        max_cc = 10
+        if hasattr(self, "_context") and self._context.config:
+            max_cc = self._context.config.max_cyclomatic_complexity
+
+        # Procesar cada función con CC > max_cc
+        complex_functions = [f for f in functions if f["complexity"] > max_cc]
+
+        if not complex_functions:
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message=f"✓ All functions below complexity threshold (≤{max_cc})",
+                    file_path=str(file_path),
+                )
+            ]
+
+        results = []
+        for func in complex_functions:
+            severity = self._map_severity(func["complexity"], max_cc)
+            message = (
+                f"Complexity: {func['name']} has cyclomatic complexity "
+                f"{func['complexity']} (grade {func['grade']}). "
+                f"Consider refactoring into smaller functions."
+            )
+
+            results.append(
+                CheckResult(
+                    check_name=self.name,
+                    severity=severity,
+                    message=message,
+                    file_path=str(file_path),
+                    line_number=func["line"],
+                )
+            )
+
+        return results
+
     def _parse_radon_output(self, output: str) -> List[dict]:
         """
         Parsea el output de radon cc -s.
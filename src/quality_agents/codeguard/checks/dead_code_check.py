@@ -4,14 +4,26 @@ Check de código muerto usando vulture.
 Detecta funciones, clases y variables que están definidas pero nunca se usan.
 """
 
+import logging
 import re
 import subprocess
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Union
 
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.checks._batch import (
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+    split_output_by_file,
+)
+from quality_agents.codeguard.engines.vulture_engine import VultureEngine, VultureFinding
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class DeadCodeCheck(Verifiable):
     """
@@ -21,9 +33,20 @@ class DeadCodeCheck(Verifiable):
     definidos pero nunca se usan. El nivel de confianza de vulture indica
     qué tan seguro es el diagnóstico.
 
+    Alcance:
+        Con `execution.dead_code_scope = "project"` (default) los usos se toman
+        de todos los archivos Python del proyecto, escaneados con la API de
+        vulture en una sola pasada; el índice de definiciones y usos se guarda
+        en `.quality_control/cache/vulture/` y en las corridas siguientes solo
+        se re-escanean los archivos modificados. Con "changeset", o si el
+        check corre sin raíz de proyecto, se invoca el CLI de vulture sobre
+        los archivos recibidos.
+
     Configuración:
         - checks.dead_code: bool (habilitado por defecto)
         - min_dead_code_confidence: int (default: 60, rango 0-100)
+        - execution.dead_code_scope: "project" | "changeset"
+        - [tool.vulture] ignore_names / ignore_decorators del proyecto
 
     Severidad:
         - WARNING: confianza 60-79%
@@ -33,6 +56,14 @@ class DeadCodeCheck(Verifiable):
     Duración estimada: 1.5s
     """
 
+    def __init__(self) -> None:
+        self._engine: Optional[VultureEngine] = None
+        self._engine_key: Optional[tuple] = None
+        # Archivos del proyecto de la corrida en curso (ver `_project_files`)
+        self._files: Optional[List[Path]] = None
+        self._files_context: Optional[ExecutionContext] = None
+        self._files_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         return "DeadCode"
@@ -58,47 +89,26 @@ class DeadCodeCheck(Verifiable):
             return False
         return True
 
+    @property
+    def supports_batch(self) -> bool:
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
-        results = []
+        project_results = self._execute_project([file_path])
+        if project_results is not None:
+            return project_results[file_path]
 
-        min_confidence = 60
-        if hasattr(self, "_context") and self._context.config:
-            min_confidence = self._context.config.min_dead_code_confidence
+        results = []
+        min_confidence = self._min_confidence()
 
         try:
-            process = subprocess.run(
+            process = run_tool(
                 ["vulture", str(file_path), f"--min-confidence={min_confidence}"],
-                capture_output=True,
-                text=True,
                 timeout=10,
+                context=getattr(self, "_context", None),
             )
 
-            findings = self._parse_vulture_output(process.stdout)
-
-            if not findings:
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ No dead code detected",
-                        file_path=str(file_path),
-                    )
-                )
-            else:
-                for finding in findings:
-                    severity = Severity.ERROR if finding["confidence"] >= 80 else Severity.WARNING
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=severity,
-                            message=(
-                                f"Dead code: {finding['kind']} '{finding['name']}' "
-                                f"is never used ({finding['confidence']}% confidence)"
-                            ),
-                            file_path=str(file_path),
-                            line_number=finding["line"],
-                        )
-                    )
+            results.extend(self._build_results(file_path, process.stdout))
 
         except FileNotFoundError:
             results.append(
@@ -130,6 +140,170 @@ class DeadCodeCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta vulture una sola vez sobre todos los archivos.
+
+        Con varios archivos vulture cruza definiciones y usos entre ellos, por
+        lo que un símbolo definido en un archivo y usado en otro del mismo
+        batch deja de reportarse como código muerto. En alcance de proyecto
+        se cruzan contra los usos de todo el proyecto.
+        """
+        project_results = self._execute_project(file_paths)
+        if project_results is not None:
+            return project_results
+
+        try:
+            process = run_tool(
+                self._batch_command(file_paths),
+                timeout=batch_timeout(10, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(
+                self.name, file_paths, "vulture not installed. Run: pip install vulture"
+            )
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"vulture execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running vulture: {str(e)}")
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: vulture CLI sin ocupar un hilo."""
+        if self._project_engine() is not None:
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "vulture", self._batch_command(file_paths),
+            batch_timeout(10, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    def _batch_command(self, file_paths: List[Path]) -> List[str]:
+        """Comando `vulture` para varios archivos."""
+        return (
+            ["vulture"] + [str(f) for f in file_paths]
+            + [f"--min-confidence={self._min_confidence()}"]
+        )
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte la salida de vulture entre los archivos del batch."""
+        output_by_file = split_output_by_file(process.stdout, file_paths)
+        return {f: self._build_results(f, output_by_file[f]) for f in file_paths}
+
+    def _execute_project(self, file_paths: List[Path]) -> Optional[Dict[Path, List[CheckResult]]]:
+        """
+        Analiza los archivos contra los usos de todo el proyecto (VultureEngine).
+
+        Returns:
+            Diccionario {archivo: resultados}, o None si no corresponde el
+            alcance de proyecto (config, sin raíz de proyecto, vulture ausente)
+        """
+        engine = self._project_engine()
+        if engine is None:
+            return None
+
+        try:
+            findings = engine.check_files(
+                self._project_files(), file_paths, self._min_confidence()
+            )
+        except Exception as e:
+            logger.debug(f"VultureEngine falló: {e}. Usando el CLI de vulture.")
+            return None
+
+        return {f: self._results_from_findings(f, findings[f]) for f in file_paths}
+
+    def _project_engine(self) -> Optional[VultureEngine]:
+        """Motor de alcance de proyecto para la raíz del contexto (None si no aplica)."""
+        context = getattr(self, "_context", None)
+        if not (context and context.config and context.project_root):
+            return None
+        execution = getattr(context.config, "execution", None)
+        if not execution or execution.dead_code_scope != "project":
+            return None
+        if not VultureEngine.is_available():
+            return None
+
+        root = context.project_root
+        cache_dir = root / ".quality_control" / "cache" / "vulture" if execution.cache else None
+        if self._engine is None or self._engine_key != (root, cache_dir):
+            self._engine = VultureEngine.for_project(root, cache_dir)
+            self._engine_key = (root, cache_dir)
+        return self._engine
+
+    def _project_files(self) -> List[Path]:
+        """
+        Archivos Python del proyecto, respetando exclude_patterns (como `collect_files`).
+
+        Se recorre el proyecto una vez por corrida, no por bloque del batch:
+        el agente asigna el mismo contexto a todas las unidades de trabajo de
+        una corrida, y cada corrida crea contextos nuevos.
+        """
+        context = self._context
+        with self._files_lock:
+            if self._files is None or self._files_context is not context:
+                root = context.project_root
+                exclude = context.config.exclude_patterns
+                self._files = [
+                    f for f in root.rglob("*.py")
+                    if not any(pattern in str(f.relative_to(root)) for pattern in exclude)
+                ]
+                self._files_context = context
+            return self._files
+
+    def _min_confidence(self) -> int:
+        """Confianza mínima de vulture (config o default 60)."""
+        if hasattr(self, "_context") and self._context.config:
+            return self._context.config.min_dead_code_confidence
+        return 60
+
+    def _build_results(self, file_path: Path, output: str) -> List[CheckResult]:
+        """Convierte la salida de vulture de un archivo en CheckResult."""
+        return self._results_from_findings(file_path, self._parse_vulture_output(output))
+
+    def _results_from_findings(
+        self, file_path: Path, findings: List[Union[dict, VultureFinding]]
+    ) -> List[CheckResult]:
+        """Mapea hallazgos (de la salida del CLI o del motor) a CheckResult."""
+        findings = [
+            f if isinstance(f, dict) else {
+                "line": f.line_number, "kind": f.kind, "name": f.name, "confidence": f.confidence
+            }
+            for f in findings
+        ]
+
+        if not findings:
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ No dead code detected",
+                    file_path=str(file_path),
+                )
+            ]
+
+        results = []
+        for finding in findings:
+            severity = Severity.ERROR if finding["confidence"] >= 80 else Severity.WARNING
+            results.append(
+                CheckResult(
+                    check_name=self.name,
+                    severity=severity,
+                    message=(
+                        f"Dead code: {finding['kind']} '{finding['name']}' "
+                        f"is never used ({finding['confidence']}% confidence)"
+                    ),
+                    file_path=str(file_path),
+                    line_number=finding["line"],
+                )
+            )
+        return results
+
     def _parse_vulture_output(self, output: str) -> List[dict]:
         """
         Parsea el output de vulture.
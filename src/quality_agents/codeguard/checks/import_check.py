@@ -8,14 +8,25 @@ Fecha de creación: 2026-02-03
 Ticket: 2.6
 """
 
+import logging
 import re
 import subprocess
 from pathlib import Path
-from typing import List
-
-from quality_agents.codeguard.agent import CheckResult, Severity
+from typing import Any, Dict, List, Optional, Tuple
+
+from quality_agents.codeguard.checks._batch import (
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+    split_output_by_file,
+)
+from quality_agents.codeguard.engines.pylint_engine import PylintEngine, PylintFileReport
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class ImportCheck(Verifiable):
     """
@@ -87,10 +98,49 @@ class ImportCheck(Verifiable):
 
         return True
 
+    def cache_key(self, config: Any) -> Optional[str]:
+        """
+        No cacheable: si un import se usa o no depende de los módulos importados.
+
+        El resultado cambia cuando cambia otro archivo (ej: un re-export que
+        desaparece), así que el hash del contenido no alcanza como clave.
+        """
+        return None
+
+    @property
+    def supports_batch(self) -> bool:
+        """pylint acepta múltiples archivos en una sola invocación."""
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
         """
         Ejecuta pylint sobre el archivo para detectar imports sin uso.
 
+        Con `execution.in_process` lee los mensajes `unused-import` del
+        PylintEngine compartido con PylintCheck (una sola corrida de pylint
+        por archivo para ambos checks).
+
+        Args:
+            file_path: Ruta al archivo Python
+
+        Returns:
+            Lista de resultados de verificación
+        """
+        in_process, jobs = self._settings()
+
+        if in_process and PylintEngine.is_available():
+            try:
+                report = PylintEngine.shared().check_files([file_path], jobs)[file_path]
+                return self._build_results(file_path, self._unused_imports_from_report(report))
+            except Exception as e:
+                logger.debug(f"PylintEngine falló sobre {file_path}: {e}. Usando subprocess.")
+
+        return self._execute_subprocess(file_path)
+
+    def _execute_subprocess(self, file_path: Path) -> List[CheckResult]:
+        """
+        Ejecuta pylint como subprocess (solo `unused-import`) sobre el archivo.
+
         Args:
             file_path: Ruta al archivo Python
 
@@ -104,7 +154,7 @@ class ImportCheck(Verifiable):
             # --disable=all: desactiva todos los checks
             # --enable=unused-import: solo habilita W0611
             # --score=n: no mostrar score
-            process = subprocess.run(
+            process = run_tool(
                 [
                     "pylint",
                     "--disable=all",
@@ -112,41 +162,13 @@ class ImportCheck(Verifiable):
                     "--score=n",
                     str(file_path),
                 ],
-                capture_output=True,
-                text=True,
                 timeout=5,
+                context=getattr(self, "_context", None),
             )
 
             # Parsear output
             unused_imports = self._parse_pylint_output(process.stdout)
-
-            if not unused_imports:
-                # Sin imports sin uso
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ No unused imports detected",
-                        file_path=str(file_path),
-                    )
-                )
-            else:
-                # Reportar cada import sin uso
-                for import_info in unused_imports:
-                    message = (
-                        f"Unused import: '{import_info['module']}'. "
-                        f"Consider removing or use 'autoflake --remove-all-unused-imports' to auto-fix"
-                    )
-
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.WARNING,
-                            message=message,
-                            file_path=str(file_path),
-                            line_number=import_info["line"],
-                        )
-                    )
+            results.extend(self._build_results(file_path, unused_imports))
 
         except FileNotFoundError:
             # pylint no instalado
@@ -181,6 +203,155 @@ class ImportCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta pylint una sola vez sobre todos los archivos.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+
+        Returns:
+            Diccionario {archivo: resultados}, con el mismo mapeo que `execute`
+        """
+        in_process, jobs = self._settings()
+
+        if in_process and PylintEngine.is_available():
+            try:
+                reports = PylintEngine.shared().check_files(file_paths, jobs)
+                return {
+                    f: self._build_results(f, self._unused_imports_from_report(reports[f]))
+                    for f in file_paths
+                }
+            except Exception as e:
+                logger.debug(f"PylintEngine falló en modo batch: {e}. Usando subprocess.")
+
+        try:
+            process = run_tool(
+                self._batch_command(file_paths),
+                timeout=batch_timeout(5, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(
+                self.name, file_paths, "pylint not installed. Run: pip install pylint"
+            )
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"pylint execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running pylint: {str(e)}")
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: pylint CLI sin ocupar un hilo."""
+        in_process, _ = self._settings()
+        if in_process and PylintEngine.is_available():
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "pylint", self._batch_command(file_paths),
+            batch_timeout(5, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    @staticmethod
+    def _batch_command(file_paths: List[Path]) -> List[str]:
+        """Comando de pylint (solo unused-import) para varios archivos."""
+        return (
+            ["pylint", "--disable=all", "--enable=unused-import", "--score=n"]
+            + [str(f) for f in file_paths]
+        )
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte la salida de pylint entre los archivos del batch."""
+        outputs = split_output_by_file(process.stdout, file_paths)
+        return {
+            f: self._build_results(f, self._parse_pylint_output(outputs[f]))
+            for f in file_paths
+        }
+
+    def _settings(self) -> Tuple[bool, int]:
+        """
+        Lee de la config el modo de ejecución.
+
+        Returns:
+            Tupla (in_process, pylint_jobs). Sin contexto: (False, 1).
+        """
+        if hasattr(self, "_context") and self._context and self._context.config:
+            execution = getattr(self._context.config, "execution", None)
+            if execution:
+                return bool(execution.in_process), execution.pylint_jobs
+        return False, 1
+
+    def _unused_imports_from_report(self, report: PylintFileReport) -> List[dict]:
+        """
+        Extrae los imports sin uso de un reporte del PylintEngine.
+
+        Args:
+            report: Reporte de pylint del archivo
+
+        Returns:
+            Lista con el mismo formato que `_parse_pylint_output`
+        """
+        unused_imports = []
+        for message in report.by_symbol("unused-import"):
+            # "Unused import os" / "Unused sys imported from sys"
+            module_info = message.text.strip()
+            if module_info.startswith("Unused "):
+                module_info = module_info[len("Unused "):]
+            unused_imports.append(
+                {
+                    "line": message.line,
+                    "module": self._module_name(module_info),
+                }
+            )
+        return unused_imports
+
+    def _build_results(self, file_path: Path, unused_imports: List[dict]) -> List[CheckResult]:
+        """
+        Mapea los imports sin uso de un archivo a CheckResult.
+
+        Args:
+            file_path: Ruta al archivo Python
+            unused_imports: Resultado de `_parse_pylint_output`
+
+        Returns:
+            Un WARNING por import sin uso, o un INFO si no hay ninguno
+        """
+        if not unused_imports:
+            # Sin imports sin uso
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ No unused imports detected",
+                    file_path=str(file_path),
+                )
+            ]
+
+        # Reportar cada import sin uso
+        results = []
+        for import_info in unused_imports:
+            message = (
+                f"Unused import: '{import_info['module']}'. "
+                f"Consider removing or use 'autoflake --remove-all-unused-imports' to auto-fix"
+            )
+
+            results.append(
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.WARNING,
+                    message=message,
+                    file_path=str(file_path),
+                    line_number=import_info["line"],
+                )
+            )
+
+        return results
+
     def _parse_pylint_output(self, output: str) -> List[dict]:
         """
         Parsea el output de pylint para extraer imports sin uso.
@@ -208,19 +379,23 @@ class ImportCheck(Verifiable):
                 line_num = int(match.group(1))
                 module_info = match.group(2).strip()
 
-                # Limpiar el nombre del módulo
-                # "import os" -> "os"
-                # "sys imported from sys" -> "sys"
-                if " imported from " in module_info:
-                    module_name = module_info.split(" imported from ")[0]
-                else:
-                    module_name = module_info.replace("import ", "")
-
                 unused_imports.append(
                     {
                         "line": line_num,
-                        "module": module_name,
+                        "module": self._module_name(module_info),
                     }
                 )
 
         return unused_imports
+
+    @staticmethod
+    def _module_name(module_info: str) -> str:
+        """
+        Limpia el nombre del módulo de un mensaje W0611.
+
+        "import os" -> "os"
+        "sys imported from sys" -> "sys"
+        """
+        if " imported from " in module_info:
+            return module_info.split(" imported from ")[0]
+        return module_info.replace("import ", "")
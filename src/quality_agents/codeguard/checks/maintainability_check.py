@@ -6,13 +6,25 @@ que combina complejidad ciclomática, volumen de Halstead y líneas de código.
 """
 
 import json
+import logging
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.cache import tool_fingerprint
+from quality_agents.codeguard.checks._batch import (
+    PathIndex,
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+)
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
+from quality_agents.shared.radon_metrics import RadonMetricsProvider
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class MaintainabilityCheck(Verifiable):
     """
@@ -28,6 +40,8 @@ class MaintainabilityCheck(Verifiable):
     Configuración:
         - checks.maintainability: bool (habilitado por defecto)
         - min_maintainability_index: int (default: 20 — por debajo emite WARNING/ERROR)
+        - execution.in_process: leer el MI del RadonMetricsProvider compartido
+          (false = subprocess `radon mi`)
 
     Severidad:
         - INFO:    MI >= min_maintainability_index (grado A con umbral default)
@@ -63,54 +77,36 @@ class MaintainabilityCheck(Verifiable):
             return False
         return True
 
+    def cache_key(self, config: Any) -> Optional[str]:
+        """Clave de caché: versión de radon y `min_maintainability_index`."""
+        return tool_fingerprint("radon", config, "min_maintainability_index")
+
+    @property
+    def supports_batch(self) -> bool:
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
-        results = []
+        if self._in_process():
+            try:
+                metrics = RadonMetricsProvider.shared().for_file(file_path)
+                return self._build_results(file_path, metrics.mi, metrics.mi_rank)
+            except Exception as e:
+                logger.debug(f"RadonMetricsProvider falló en {file_path}: {e}. Usando radon CLI.")
 
-        min_mi = 20
-        if hasattr(self, "_context") and self._context.config:
-            min_mi = self._context.config.min_maintainability_index
+        return self._execute_subprocess(file_path)
+
+    def _execute_subprocess(self, file_path: Path) -> List[CheckResult]:
+        results = []
 
         try:
-            process = subprocess.run(
+            process = run_tool(
                 ["radon", "mi", "-s", "-j", str(file_path)],
-                capture_output=True,
-                text=True,
                 timeout=10,
+                context=getattr(self, "_context", None),
             )
 
             mi_value, rank = self._parse_radon_output(process.stdout, str(file_path))
-
-            if mi_value is None:
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ Maintainability index could not be calculated (file may be empty)",
-                        file_path=str(file_path),
-                    )
-                )
-            elif mi_value >= min_mi:
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message=f"✓ Maintainability index: {mi_value:.1f} (grade {rank})",
-                        file_path=str(file_path),
-                    )
-                )
-            else:
-                severity = Severity.ERROR if mi_value < 10 else Severity.WARNING
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=severity,
-                        message=(
-                            f"Low maintainability: MI={mi_value:.1f} (grade {rank}, "
-                            f"threshold={min_mi}). Consider reducing complexity or splitting the file."
-                        ),
-                        file_path=str(file_path),
-                    )
-                )
+            results.extend(self._build_results(file_path, mi_value, rank))
 
         except FileNotFoundError:
             results.append(
@@ -142,6 +138,122 @@ class MaintainabilityCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta radon mi una sola vez sobre todos los archivos.
+
+        El JSON de radon tiene una entrada por archivo, indexada por la ruta recibida.
+        En modo in-process cada archivo se lee del RadonMetricsProvider.
+        """
+        if self._in_process():
+            try:
+                provider = RadonMetricsProvider.shared()
+                metrics = {f: provider.for_file(f) for f in file_paths}
+                return {f: self._build_results(f, m.mi, m.mi_rank) for f, m in metrics.items()}
+            except Exception as e:
+                logger.debug(f"RadonMetricsProvider falló en modo batch: {e}. Usando radon CLI.")
+
+        try:
+            process = run_tool(
+                self._batch_command(file_paths),
+                timeout=batch_timeout(10, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(self.name, file_paths, "radon not installed. Run: pip install radon")
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"radon execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running radon: {str(e)}")
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: radon CLI sin ocupar un hilo."""
+        if self._in_process():
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "radon", self._batch_command(file_paths),
+            batch_timeout(10, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    @staticmethod
+    def _batch_command(file_paths: List[Path]) -> List[str]:
+        """Comando `radon mi` (JSON) para varios archivos."""
+        return ["radon", "mi", "-s", "-j"] + [str(f) for f in file_paths]
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte el JSON de `radon mi` entre los archivos del batch."""
+        try:
+            data = json.loads(process.stdout) if process.stdout.strip() else {}
+        except json.JSONDecodeError:
+            data = {}
+
+        index = PathIndex(file_paths)
+        entries: Dict[Path, dict] = {}
+        for reported, entry in data.items():
+            file_path = index.lookup(reported)
+            if file_path is not None:
+                entries[file_path] = entry
+
+        return {
+            f: self._build_results(f, entries.get(f, {}).get("mi"), entries.get(f, {}).get("rank"))
+            for f in file_paths
+        }
+
+    def _in_process(self) -> bool:
+        """True si la config pide ejecución in-process y radon está disponible."""
+        if not (hasattr(self, "_context") and self._context and self._context.config):
+            return False
+        execution = getattr(self._context.config, "execution", None)
+        return bool(execution and execution.in_process) and RadonMetricsProvider.is_available()
+
+    def _build_results(
+        self, file_path: Path, mi_value: Optional[float], rank: Optional[str]
+    ) -> List[CheckResult]:
+        """Mapea el MI de un archivo a CheckResult según min_maintainability_index."""
+        min_mi = 20
+        if hasattr(self, "_context") and self._context.config:
+            min_mi = self._context.config.min_maintainability_index
+
+        if mi_value is None:
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ Maintainability index could not be calculated (file may be empty)",
+                    file_path=str(file_path),
+                )
+            ]
+
+        if mi_value >= min_mi:
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message=f"✓ Maintainability index: {mi_value:.1f} (grade {rank})",
+                    file_path=str(file_path),
+                )
+            ]
+
+        severity = Severity.ERROR if mi_value < 10 else Severity.WARNING
+        return [
+            CheckResult(
+                check_name=self.name,
+                severity=severity,
+                message=(
+                    f"Low maintainability: MI={mi_value:.1f} (grade {rank}, "
+                    f"threshold={min_mi}). Consider reducing complexity or splitting the file."
+                ),
+                file_path=str(file_path),
+            )
+        ]
+
     def _parse_radon_output(self, output: str, file_path: str) -> tuple:
         """
         Parsea el output JSON de radon mi -s -j.
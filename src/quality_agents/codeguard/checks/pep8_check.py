@@ -8,13 +8,25 @@ Fecha de creación: 2026-02-03
 Ticket: 2.1
 """
 
+import logging
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.cache import tool_fingerprint
+from quality_agents.codeguard.checks._batch import (
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+    split_output_by_file,
+)
+from quality_agents.codeguard.engines.flake8_engine import Flake8Engine, Flake8Violation
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class PEP8Check(Verifiable):
     """
@@ -27,14 +39,25 @@ class PEP8Check(Verifiable):
     - Importaciones
     - Convenciones de nombres
 
+    Modos de ejecución:
+        - In-process (default con config): usa `Flake8Engine`, que carga flake8
+          una sola vez por corrida de CodeGuard.
+        - Subprocess (fallback): `flake8 <archivo>` por archivo. Se usa si
+          `execution.in_process = false`, si el check corre sin contexto o si
+          el motor in-process no está disponible.
+
     Configuración:
         - check_pep8: bool (habilitado por defecto)
         - max_line_length: int (default: 100)
+        - execution.in_process: bool (default: True)
 
     Prioridad: 2 (Alta - estilo es importante)
     Duración estimada: 0.5s
     """
 
+    def __init__(self) -> None:
+        self._engine: Optional[Flake8Engine] = None
+
     @property
     def name(self) -> str:
         """Nombre identificador del check."""
@@ -79,6 +102,17 @@ class PEP8Check(Verifiable):
 
         return True
 
+    def cache_key(self, config: Any) -> Optional[str]:
+        """Clave de caché: versión de flake8, `max_line_length` y config de flake8 del proyecto."""
+        return tool_fingerprint(
+            "flake8", config, "max_line_length", config_files=(".flake8", "setup.cfg", "tox.ini")
+        )
+
+    @property
+    def supports_batch(self) -> bool:
+        """flake8 acepta múltiples archivos en una sola invocación."""
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
         """
         Ejecuta flake8 sobre el archivo.
@@ -86,6 +120,176 @@ class PEP8Check(Verifiable):
         Args:
             file_path: Ruta al archivo Python
 
+        Returns:
+            Lista de resultados de verificación
+        """
+        max_line_length, in_process = self._settings()
+
+        if in_process:
+            engine = self._get_engine(max_line_length)
+            if engine is not None:
+                try:
+                    return self._execute_in_process(engine, file_path)
+                except Exception as e:
+                    logger.debug(f"Flake8Engine falló sobre {file_path}: {e}. Usando subprocess.")
+
+        return self._execute_subprocess(file_path, max_line_length)
+
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta flake8 una sola vez sobre todos los archivos.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+
+        Returns:
+            Diccionario {archivo: resultados}, con el mismo mapeo que `execute`
+        """
+        max_line_length, in_process = self._settings()
+
+        if in_process:
+            engine = self._get_engine(max_line_length)
+            if engine is not None:
+                try:
+                    violations = engine.check_files(file_paths)
+                    return {f: self._violations_to_results(f, violations[f]) for f in file_paths}
+                except Exception as e:
+                    logger.debug(f"Flake8Engine falló en modo batch: {e}. Usando subprocess.")
+
+        try:
+            process = run_tool(
+                self._batch_command(file_paths, max_line_length),
+                timeout=batch_timeout(5, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(
+                self.name, file_paths, "flake8 not installed. Run: pip install flake8"
+            )
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"flake8 execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running flake8: {str(e)}")
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: flake8 CLI sin ocupar un hilo."""
+        max_line_length, in_process = self._settings()
+        if in_process and self._get_engine(max_line_length) is not None:
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "flake8", self._batch_command(file_paths, max_line_length),
+            batch_timeout(5, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    @staticmethod
+    def _batch_command(file_paths: List[Path], max_line_length: int) -> List[str]:
+        """Comando de flake8 para varios archivos."""
+        return ["flake8", f"--max-line-length={max_line_length}"] + [str(f) for f in file_paths]
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte la salida de flake8 entre los archivos del batch."""
+        outputs = split_output_by_file(process.stdout, file_paths)
+        return {
+            f: self._parse_output(f, outputs[f]) or [self._compliant_result(f)]
+            for f in file_paths
+        }
+
+    def _settings(self) -> Tuple[int, bool]:
+        """
+        Lee de la config la longitud máxima de línea y el modo de ejecución.
+
+        Returns:
+            Tupla (max_line_length, in_process). Sin contexto: (100, False).
+        """
+        max_line_length = 100
+        in_process = False
+        if hasattr(self, "_context") and self._context and self._context.config:
+            max_line_length = self._context.config.max_line_length
+            execution = getattr(self._context.config, "execution", None)
+            in_process = bool(execution and execution.in_process)
+        return max_line_length, in_process
+
+    def _get_engine(self, max_line_length: int) -> Optional[Flake8Engine]:
+        """
+        Retorna el motor in-process, creándolo en el primer uso.
+
+        El motor se reutiliza entre archivos mientras no cambie max_line_length.
+
+        Args:
+            max_line_length: Longitud máxima de línea configurada
+
+        Returns:
+            Instancia de Flake8Engine, o None si flake8 no puede cargarse
+        """
+        if self._engine is not None and self._engine.max_line_length == max_line_length:
+            return self._engine
+
+        if not Flake8Engine.is_available():
+            return None
+
+        try:
+            self._engine = Flake8Engine(max_line_length=max_line_length)
+        except Exception as e:
+            logger.debug(f"No se pudo inicializar Flake8Engine: {e}")
+            self._engine = None
+
+        return self._engine
+
+    def _execute_in_process(self, engine: Flake8Engine, file_path: Path) -> List[CheckResult]:
+        """
+        Ejecuta flake8 in-process y mapea las violaciones a CheckResult.
+
+        Args:
+            engine: Motor de flake8 ya inicializado
+            file_path: Ruta al archivo Python
+
+        Returns:
+            Lista de resultados de verificación
+        """
+        return self._violations_to_results(file_path, engine.check_file(file_path))
+
+    def _violations_to_results(
+        self, file_path: Path, violations: List[Flake8Violation]
+    ) -> List[CheckResult]:
+        """
+        Mapea las violaciones del motor in-process a CheckResult.
+
+        Args:
+            file_path: Ruta al archivo Python
+            violations: Violaciones reportadas por Flake8Engine
+
+        Returns:
+            Lista de resultados de verificación
+        """
+        if not violations:
+            return [self._compliant_result(file_path)]
+
+        return [
+            CheckResult(
+                check_name=self.name,
+                severity=Severity.WARNING,
+                message=f"PEP8: {v.code} {v.text}",
+                file_path=str(file_path),
+                line_number=v.line_number,
+            )
+            for v in violations
+        ]
+
+    def _execute_subprocess(self, file_path: Path, max_line_length: int) -> List[CheckResult]:
+        """
+        Ejecuta flake8 como subprocess sobre el archivo.
+
+        Args:
+            file_path: Ruta al archivo Python
+            max_line_length: Longitud máxima de línea configurada
+
         Returns:
             Lista de resultados de verificación
         """
@@ -93,46 +297,18 @@ class PEP8Check(Verifiable):
 
         try:
             # Ejecutar flake8 con formato parseable
-            # --max-line-length se puede configurar desde config
-            process = subprocess.run(
-                ["flake8", "--max-line-length=100", str(file_path)],
-                capture_output=True,
-                text=True,
+            process = run_tool(
+                ["flake8", f"--max-line-length={max_line_length}", str(file_path)],
                 timeout=5,
+                context=getattr(self, "_context", None),
             )
 
             # flake8 retorna exit code 0 si no hay errores
             if process.returncode == 0 and not process.stdout.strip():
                 # Sin errores PEP8
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ PEP8 compliant",
-                        file_path=str(file_path),
-                    )
-                )
+                results.append(self._compliant_result(file_path))
             else:
-                # Parsear errores
-                for line in process.stdout.strip().split("\n"):
-                    if not line.strip():
-                        continue
-
-                    # Formato flake8: file.py:line:col: code message
-                    parts = line.split(":", 3)
-                    if len(parts) >= 4:
-                        line_num = int(parts[1])
-                        message = parts[3].strip()
-
-                        results.append(
-                            CheckResult(
-                                check_name=self.name,
-                                severity=Severity.WARNING,
-                                message=f"PEP8: {message}",
-                                file_path=str(file_path),
-                                line_number=line_num,
-                            )
-                        )
+                results.extend(self._parse_output(file_path, process.stdout))
 
         except FileNotFoundError:
             # flake8 no instalado
@@ -166,3 +342,46 @@ class PEP8Check(Verifiable):
             )
 
         return results
+
+    def _parse_output(self, file_path: Path, output: str) -> List[CheckResult]:
+        """
+        Parsea la salida de flake8 correspondiente a un archivo.
+
+        Args:
+            file_path: Ruta al archivo Python
+            output: Líneas de flake8 de ese archivo (file.py:line:col: code message)
+
+        Returns:
+            Lista de resultados WARNING, uno por violación
+        """
+        results = []
+        for line in output.strip().split("\n"):
+            if not line.strip():
+                continue
+
+            # Formato flake8: file.py:line:col: code message
+            parts = line.split(":", 3)
+            if len(parts) >= 4:
+                line_num = int(parts[1])
+                message = parts[3].strip()
+
+                results.append(
+                    CheckResult(
+                        check_name=self.name,
+                        severity=Severity.WARNING,
+                        message=f"PEP8: {message}",
+                        file_path=str(file_path),
+                        line_number=line_num,
+                    )
+                )
+
+        return results
+
+    def _compliant_result(self, file_path: Path) -> CheckResult:
+        """Resultado INFO para un archivo sin violaciones PEP8."""
+        return CheckResult(
+            check_name=self.name,
+            severity=Severity.INFO,
+            message="✓ PEP8 compliant",
+            file_path=str(file_path),
+        )
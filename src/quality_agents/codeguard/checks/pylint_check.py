@@ -8,14 +8,20 @@ Fecha de creación: 2026-02-03
 Ticket: 2.2
 """
 
+import logging
 import re
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.checks._batch import run_batch_async
+from quality_agents.codeguard.engines.pylint_engine import PylintEngine
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class PylintCheck(Verifiable):
     """
@@ -34,6 +40,8 @@ class PylintCheck(Verifiable):
     Configuración:
         - check_pylint: bool (habilitado por defecto)
         - min_pylint_score: float (default: 8.0)
+        - execution.in_process: usar el PylintEngine compartido con ImportCheck
+        - execution.pylint_jobs: procesos de pylint en modo batch (-j)
 
     Prioridad: 4 (Media - análisis profundo pero no crítico)
     Duración estimada: 2.0s (más lento que flake8)
@@ -83,10 +91,118 @@ class PylintCheck(Verifiable):
 
         return True
 
+    def cache_key(self, config: Any) -> Optional[str]:
+        """
+        No cacheable: pylint infiere sobre los módulos que importa el archivo.
+
+        El score de un archivo cambia cuando cambia otro (ej: se borra una
+        función que usa), así que el hash del contenido no alcanza como clave.
+        """
+        return None
+
+    @property
+    def supports_batch(self) -> bool:
+        """El motor in-process analiza el changeset completo en una corrida."""
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
         """
         Ejecuta pylint sobre el archivo.
 
+        Args:
+            file_path: Ruta al archivo Python
+
+        Returns:
+            Lista de resultados de verificación
+        """
+        in_process, jobs = self._settings()
+
+        if in_process and PylintEngine.is_available():
+            try:
+                report = PylintEngine.shared().check_files([file_path], jobs)[file_path]
+                # Sin score (error fatal, sin sentencias): el subprocess conserva la salida del CLI
+                if report.score is not None:
+                    return self._build_results(file_path, report.score)
+            except Exception as e:
+                logger.debug(f"PylintEngine falló sobre {file_path}: {e}. Usando subprocess.")
+
+        return self._execute_subprocess(file_path)
+
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta pylint una sola vez sobre todos los archivos (motor in-process).
+
+        El score de cada archivo sale de las estadísticas de su módulo, por lo
+        que es el mismo que al analizarlo solo. Sin motor in-process, o para
+        los archivos que el motor no pudo puntuar (error fatal, sin
+        sentencias), se usa el subprocess archivo por archivo.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+
+        Returns:
+            Diccionario {archivo: resultados}
+        """
+        in_process, jobs = self._settings()
+
+        if in_process and PylintEngine.is_available():
+            try:
+                reports = PylintEngine.shared().check_files(file_paths, jobs)
+                return {
+                    f: self._build_results(f, reports[f].score)
+                    if reports[f].score is not None
+                    else self._execute_subprocess(f)
+                    for f in file_paths
+                }
+            except Exception as e:
+                logger.debug(f"PylintEngine falló en modo batch: {e}. Usando subprocess.")
+
+        return {f: self._execute_subprocess(f) for f in file_paths}
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Variante async de `execute_batch`.
+
+        Sin motor in-process se invoca pylint una vez por archivo (para
+        obtener el score de cada uno), una invocación tras otra: la
+        concurrencia la limita el motor con `execution.async_limit`.
+        """
+        in_process, _ = self._settings()
+        if in_process and PylintEngine.is_available():
+            return await super().execute_batch_async(file_paths)
+
+        results: Dict[Path, List[CheckResult]] = {}
+        for file_path in file_paths:
+            results.update(await run_batch_async(
+                self.name, "pylint", ["pylint", "--score=y", str(file_path)], 10, [file_path],
+                self._score_results, context=getattr(self, "_context", None),
+            ))
+        return results
+
+    def _score_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Resultados de una invocación de pylint sobre un solo archivo."""
+        score = self._extract_score(process.stdout)
+        return {f: self._build_results(f, score) for f in file_paths}
+
+    def _settings(self) -> Tuple[bool, int]:
+        """
+        Lee de la config el modo de ejecución.
+
+        Returns:
+            Tupla (in_process, pylint_jobs). Sin contexto: (False, 1).
+        """
+        if hasattr(self, "_context") and self._context and self._context.config:
+            execution = getattr(self._context.config, "execution", None)
+            if execution:
+                return bool(execution.in_process), execution.pylint_jobs
+        return False, 1
+
+    def _execute_subprocess(self, file_path: Path) -> List[CheckResult]:
+        """
+        Ejecuta pylint como subprocess sobre el archivo.
+
         Args:
             file_path: Ruta al archivo Python
 
@@ -98,52 +214,15 @@ class PylintCheck(Verifiable):
         try:
             # Ejecutar pylint con score-only para obtener solo la puntuación
             # Usamos --score=y para asegurar que se muestre el score
-            process = subprocess.run(
+            process = run_tool(
                 ["pylint", "--score=y", str(file_path)],
-                capture_output=True,
-                text=True,
                 timeout=10,  # Pylint puede ser más lento
+                context=getattr(self, "_context", None),
             )
 
             # Extraer score del output
             # Formato: "Your code has been rated at X.XX/10"
-            score = self._extract_score(process.stdout)
-
-            if score is not None:
-                # Obtener min_score de config o usar default
-                min_score = 8.0
-                if hasattr(self, "_context") and self._context and self._context.config:
-                    min_score = self._context.config.min_pylint_score
-
-                if score >= min_score:
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.INFO,
-                            message=f"✓ Pylint score: {score:.2f}/10 (>= {min_score})",
-                            file_path=str(file_path),
-                        )
-                    )
-                else:
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.WARNING,
-                            message=f"⚠ Pylint score: {score:.2f}/10 (< {min_score}). "
-                            f"Run 'pylint {file_path.name}' for details.",
-                            file_path=str(file_path),
-                        )
-                    )
-            else:
-                # No se pudo extraer score
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.ERROR,
-                        message="Could not extract pylint score from output",
-                        file_path=str(file_path),
-                    )
-                )
+            results.extend(self._build_results(file_path, self._extract_score(process.stdout)))
 
         except FileNotFoundError:
             # pylint no instalado
@@ -178,6 +257,53 @@ class PylintCheck(Verifiable):
 
         return results
 
+    def _build_results(self, file_path: Path, score: Optional[float]) -> List[CheckResult]:
+        """
+        Compara el score con el umbral configurado.
+
+        Args:
+            file_path: Ruta al archivo Python
+            score: Score de pylint (0-10), o None si no se pudo obtener
+
+        Returns:
+            INFO si el score alcanza el umbral, WARNING si no, ERROR sin score
+        """
+        if score is None:
+            # No se pudo extraer score
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.ERROR,
+                    message="Could not extract pylint score from output",
+                    file_path=str(file_path),
+                )
+            ]
+
+        # Obtener min_score de config o usar default
+        min_score = 8.0
+        if hasattr(self, "_context") and self._context and self._context.config:
+            min_score = self._context.config.min_pylint_score
+
+        if score >= min_score:
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message=f"✓ Pylint score: {score:.2f}/10 (>= {min_score})",
+                    file_path=str(file_path),
+                )
+            ]
+
+        return [
+            CheckResult(
+                check_name=self.name,
+                severity=Severity.WARNING,
+                message=f"⚠ Pylint score: {score:.2f}/10 (< {min_score}). "
+                f"Run 'pylint {file_path.name}' for details.",
+                file_path=str(file_path),
+            )
+        ]
+
     def _extract_score(self, output: str) -> float | None:
         """
         Extrae el score de pylint del output.
@@ -9,13 +9,25 @@ Ticket: 2.3
 """
 
 import json
+import logging
 import subprocess
 from pathlib import Path
-from typing import List
-
-from quality_agents.codeguard.agent import CheckResult, Severity
+from typing import Any, Dict, List, Optional
+
+from quality_agents.codeguard.cache import tool_fingerprint
+from quality_agents.codeguard.checks._batch import (
+    PathIndex,
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+)
+from quality_agents.codeguard.engines.bandit_engine import BanditEngine, BanditIssue
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class SecurityCheck(Verifiable):
     """
@@ -37,6 +49,8 @@ class SecurityCheck(Verifiable):
 
     Configuración:
         - check_security: bool (habilitado por defecto)
+        - execution.in_process: escanear con el BanditEngine compartido
+          (plugins cargados una vez; false = subprocess `bandit -f json`)
 
     Prioridad: 1 (Máxima - seguridad es crítica)
     Duración estimada: 1.5s
@@ -86,10 +100,38 @@ class SecurityCheck(Verifiable):
 
         return True
 
+    def cache_key(self, config: Any) -> Optional[str]:
+        """Clave de caché: versión de bandit."""
+        return tool_fingerprint("bandit", config)
+
+    @property
+    def supports_batch(self) -> bool:
+        """bandit acepta múltiples archivos en una sola invocación."""
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
         """
         Ejecuta bandit sobre el archivo.
 
+        Args:
+            file_path: Ruta al archivo Python
+
+        Returns:
+            Lista de resultados de verificación
+        """
+        if self._in_process():
+            try:
+                issues = BanditEngine.shared().check_files([file_path])[file_path]
+                return self._build_results(file_path, [self._issue_to_dict(i) for i in issues])
+            except Exception as e:
+                logger.debug(f"BanditEngine falló en {file_path}: {e}. Usando subprocess.")
+
+        return self._execute_subprocess(file_path)
+
+    def _execute_subprocess(self, file_path: Path) -> List[CheckResult]:
+        """
+        Ejecuta bandit como subprocess sobre el archivo.
+
         Args:
             file_path: Ruta al archivo Python
 
@@ -100,50 +142,17 @@ class SecurityCheck(Verifiable):
 
         try:
             # Ejecutar bandit con formato JSON para parsear fácilmente
-            process = subprocess.run(
+            process = run_tool(
                 ["bandit", "-f", "json", str(file_path)],
-                capture_output=True,
-                text=True,
                 timeout=10,
+                context=getattr(self, "_context", None),
             )
 
             # Parsear output JSON
             try:
                 data = json.loads(process.stdout)
                 issues = data.get("results", [])
-
-                if not issues:
-                    # Sin problemas de seguridad
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.INFO,
-                            message="✓ No security issues detected",
-                            file_path=str(file_path),
-                        )
-                    )
-                else:
-                    # Procesar cada issue
-                    for issue in issues:
-                        severity = self._map_severity(issue.get("issue_severity", "LOW"))
-                        issue_text = issue.get("issue_text", "Security issue")
-                        line_number = issue.get("line_number")
-                        test_id = issue.get("test_id", "")
-
-                        # Crear mensaje descriptivo
-                        message = f"Security: {issue_text}"
-                        if test_id:
-                            message = f"Security [{test_id}]: {issue_text}"
-
-                        results.append(
-                            CheckResult(
-                                check_name=self.name,
-                                severity=severity,
-                                message=message,
-                                file_path=str(file_path),
-                                line_number=line_number,
-                            )
-                        )
+                results.extend(self._build_results(file_path, issues))
 
             except json.JSONDecodeError:
                 # Error parseando JSON
@@ -189,6 +198,147 @@ class SecurityCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta bandit una sola vez sobre todos los archivos.
+
+        Cada issue del JSON de bandit trae su `filename`, que se usa para
+        repartir los hallazgos por archivo.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+
+        Returns:
+            Diccionario {archivo: resultados}, con el mismo mapeo que `execute`
+        """
+        if self._in_process():
+            try:
+                found = BanditEngine.shared().check_files(file_paths)
+                return {
+                    f: self._build_results(f, [self._issue_to_dict(i) for i in found[f]])
+                    for f in file_paths
+                }
+            except Exception as e:
+                logger.debug(f"BanditEngine falló en modo batch: {e}. Usando subprocess.")
+
+        try:
+            process = run_tool(
+                self._batch_command(file_paths),
+                timeout=batch_timeout(10, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(
+                self.name, file_paths, "bandit not installed. Run: pip install bandit"
+            )
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"bandit execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running bandit: {str(e)}")
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: bandit CLI sin ocupar un hilo."""
+        if self._in_process():
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "bandit", self._batch_command(file_paths),
+            batch_timeout(10, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    @staticmethod
+    def _batch_command(file_paths: List[Path]) -> List[str]:
+        """Comando de bandit (JSON) para varios archivos."""
+        # -q: con más de 50 archivos bandit imprime una barra de progreso en stdout
+        return ["bandit", "-q", "-f", "json"] + [str(f) for f in file_paths]
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte los issues del JSON de bandit entre los archivos del batch."""
+        try:
+            data = json.loads(process.stdout)
+        except json.JSONDecodeError:
+            return batch_error(self.name, file_paths, "Could not parse bandit JSON output")
+
+        index = PathIndex(file_paths)
+        issues_by_file: Dict[Path, List[dict]] = {f: [] for f in file_paths}
+        for issue in data.get("results", []):
+            file_path = index.lookup(issue.get("filename", ""))
+            if file_path is not None:
+                issues_by_file[file_path].append(issue)
+
+        return {f: self._build_results(f, issues_by_file[f]) for f in file_paths}
+
+    def _in_process(self) -> bool:
+        """True si la config pide ejecución in-process y bandit está disponible."""
+        if not (hasattr(self, "_context") and self._context and self._context.config):
+            return False
+        execution = getattr(self._context.config, "execution", None)
+        return bool(execution and execution.in_process) and BanditEngine.is_available()
+
+    @staticmethod
+    def _issue_to_dict(issue: BanditIssue) -> dict:
+        """Convierte un issue del motor al formato de `results` del JSON de bandit."""
+        return {
+            "test_id": issue.test_id,
+            "issue_severity": issue.severity,
+            "issue_confidence": issue.confidence,
+            "issue_text": issue.text,
+            "line_number": issue.line_number,
+        }
+
+    def _build_results(self, file_path: Path, issues: List[dict]) -> List[CheckResult]:
+        """
+        Mapea los issues de bandit de un archivo a CheckResult.
+
+        Args:
+            file_path: Ruta al archivo Python
+            issues: Entradas de `results` del JSON de bandit para ese archivo
+
+        Returns:
+            Un resultado por issue, o un INFO si no hay problemas de seguridad
+        """
+        if not issues:
+            # Sin problemas de seguridad
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ No security issues detected",
+                    file_path=str(file_path),
+                )
+            ]
+
+        # Procesar cada issue
+        results = []
+        for issue in issues:
+            severity = self._map_severity(issue.get("issue_severity", "LOW"))
+            issue_text = issue.get("issue_text", "Security issue")
+            line_number = issue.get("line_number")
+            test_id = issue.get("test_id", "")
+
+            # Crear mensaje descriptivo
+            message = f"Security: {issue_text}"
+            if test_id:
+                message = f"Security [{test_id}]: {issue_text}"
+
+            results.append(
+                CheckResult(
+                    check_name=self.name,
+                    severity=severity,
+                    message=message,
+                    file_path=str(file_path),
+                    line_number=line_number,
+                )
+            )
+
+        return results
+
     def _map_severity(self, bandit_severity: str) -> Severity:
         """
         Mapea severidad de bandit a Severity de CodeGuard.
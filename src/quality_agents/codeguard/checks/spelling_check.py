@@ -4,14 +4,31 @@ Check de ortografía usando codespell.
 Detecta typos en nombres de variables, funciones, comentarios y strings.
 """
 
+import logging
 import re
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.cache import tool_fingerprint
+from quality_agents.codeguard.checks._batch import (
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+    split_output_by_file,
+)
+from quality_agents.codeguard.engines.codespell_engine import (
+    CONFIG_FILES,
+    PYPROJECT_TABLES,
+    CodespellEngine,
+    CodespellTypo,
+)
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
 
 class SpellingCheck(Verifiable):
     """
@@ -24,6 +41,8 @@ class SpellingCheck(Verifiable):
     Configuración:
         - checks.spelling: bool (habilitado por defecto)
         - spelling_ignore_words: List[str] (palabras a ignorar, default: [])
+        - execution.in_process: revisar con el CodespellEngine compartido
+          (diccionario cargado una vez; false = subprocess `codespell`)
 
     Prioridad: 5
     Duración estimada: 1.0s
@@ -54,49 +73,40 @@ class SpellingCheck(Verifiable):
             return False
         return True
 
-    def execute(self, file_path: Path) -> List[CheckResult]:
-        results = []
+    def cache_key(self, config: Any) -> Optional[str]:
+        """Clave de caché: versión de codespell y palabras ignoradas."""
+        return tool_fingerprint(
+            "codespell",
+            config,
+            "spelling_ignore_words",
+            config_files=CONFIG_FILES,
+            pyproject_tables=PYPROJECT_TABLES,
+        )
 
-        ignore_words: List[str] = []
-        if hasattr(self, "_context") and self._context.config:
-            ignore_words = self._context.config.spelling_ignore_words
+    @property
+    def supports_batch(self) -> bool:
+        return True
 
-        cmd = ["codespell", str(file_path)]
-        if ignore_words:
-            cmd += ["-L", ",".join(ignore_words)]
+    def execute(self, file_path: Path) -> List[CheckResult]:
+        if self._in_process():
+            try:
+                found = CodespellEngine.shared().check_files([file_path], self._ignore_words())
+                typos = self._typos_to_dicts(found[file_path])
+                return self._results_from_findings(file_path, typos)
+            except Exception as e:
+                logger.debug(f"CodespellEngine falló en {file_path}: {e}. Usando subprocess.")
+
+        results = []
+        cmd = self._build_command([file_path])
 
         try:
-            process = subprocess.run(
+            process = run_tool(
                 cmd,
-                capture_output=True,
-                text=True,
                 timeout=10,
+                context=getattr(self, "_context", None),
             )
 
-            findings = self._parse_codespell_output(process.stdout + process.stderr)
-
-            if not findings:
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ No spelling errors detected",
-                        file_path=str(file_path),
-                    )
-                )
-            else:
-                for finding in findings:
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.WARNING,
-                            message=(
-                                f"Spelling: '{finding['typo']}' should be '{finding['correction']}'"
-                            ),
-                            file_path=str(file_path),
-                            line_number=finding["line"],
-                        )
-                    )
+            results.extend(self._build_results(file_path, process.stdout + process.stderr))
 
         except FileNotFoundError:
             results.append(
@@ -128,15 +138,120 @@ class SpellingCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Ejecuta codespell una sola vez sobre todos los archivos."""
+        if self._in_process():
+            try:
+                found = CodespellEngine.shared().check_files(file_paths, self._ignore_words())
+                return {
+                    f: self._results_from_findings(f, self._typos_to_dicts(found[f]))
+                    for f in file_paths
+                }
+            except Exception as e:
+                logger.debug(f"CodespellEngine falló en modo batch: {e}. Usando subprocess.")
+
+        try:
+            process = run_tool(
+                self._build_command(file_paths),
+                timeout=batch_timeout(10, len(file_paths)),
+                context=getattr(self, "_context", None),
+            )
+        except FileNotFoundError:
+            return batch_error(
+                self.name, file_paths, "codespell not installed. Run: pip install codespell"
+            )
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"codespell execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(
+                self.name, file_paths, f"Unexpected error running codespell: {str(e)}"
+            )
+
+        return self._batch_results(file_paths, process)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """Variante async de `execute_batch`: codespell CLI sin ocupar un hilo."""
+        if self._in_process():
+            return await super().execute_batch_async(file_paths)
+        return await run_batch_async(
+            self.name, "codespell", self._build_command(file_paths),
+            batch_timeout(10, len(file_paths)), file_paths, self._batch_results,
+            context=getattr(self, "_context", None),
+        )
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """Reparte la salida de codespell (stdout y stderr) entre los archivos del batch."""
+        output_by_file = split_output_by_file(process.stdout + "\n" + process.stderr, file_paths)
+        return {f: self._build_results(f, output_by_file[f]) for f in file_paths}
+
+    def _in_process(self) -> bool:
+        """True si la config pide ejecución in-process y codespell está disponible."""
+        if not (hasattr(self, "_context") and self._context and self._context.config):
+            return False
+        execution = getattr(self._context.config, "execution", None)
+        return bool(execution and execution.in_process) and CodespellEngine.is_available()
+
+    def _ignore_words(self) -> List[str]:
+        """Palabras ignoradas de config (`spelling_ignore_words`)."""
+        if hasattr(self, "_context") and self._context.config:
+            return self._context.config.spelling_ignore_words
+        return []
+
+    @staticmethod
+    def _typos_to_dicts(typos: List[CodespellTypo]) -> List[dict]:
+        """Convierte los typos del motor al formato de `_parse_codespell_output`."""
+        return [{"line": t.line_number, "typo": t.typo, "correction": t.correction} for t in typos]
+
+    def _build_command(self, file_paths: List[Path]) -> List[str]:
+        """Arma la invocación de codespell con las palabras ignoradas de config."""
+        ignore_words = self._ignore_words()
+
+        cmd = ["codespell"] + [str(f) for f in file_paths]
+        if ignore_words:
+            cmd += ["-L", ",".join(ignore_words)]
+        return cmd
+
+    def _build_results(self, file_path: Path, output: str) -> List[CheckResult]:
+        """Convierte la salida de codespell de un archivo en CheckResult."""
+        return self._results_from_findings(file_path, self._parse_codespell_output(output))
+
+    def _results_from_findings(self, file_path: Path, findings: List[dict]) -> List[CheckResult]:
+        """Mapea los typos (de la salida del CLI o del motor) a CheckResult."""
+        if not findings:
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ No spelling errors detected",
+                    file_path=str(file_path),
+                )
+            ]
+
+        return [
+            CheckResult(
+                check_name=self.name,
+                severity=Severity.WARNING,
+                message=f"Spelling: '{finding['typo']}' should be '{finding['correction']}'",
+                file_path=str(file_path),
+                line_number=finding["line"],
+            )
+            for finding in findings
+        ]
+
     def _parse_codespell_output(self, output: str) -> List[dict]:
         """
         Parsea el output de codespell.
 
-        Formato: <file>:<line>: <typo> ==> <correction>
+        Formato: <file>:<line>: <typo> ==> <correction>[  | <motivo>]
         Ejemplo: sample.py:10: calcualte ==> calculate
+        Con varias correcciones posibles: sample.py:3: ot ==> to, of, or, not
         """
         findings = []
-        pattern = r"^.+:(\d+): (\S+) ==> (\S+)"
+        pattern = r"^.+:(\d+): (\S+) ==> (.+?)(?:  \| .*)?$"
 
         for line in output.splitlines():
             match = re.match(pattern, line)
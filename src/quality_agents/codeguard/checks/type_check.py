@@ -8,14 +8,73 @@ Fecha de creación: 2026-02-03
 Ticket: 2.5
 """
 
+import json
+import logging
+import os
 import re
 import subprocess
+import threading
 from pathlib import Path
-from typing import List
-
-from quality_agents.codeguard.agent import CheckResult, Severity
+from typing import Dict, List
+
+from quality_agents.codeguard.checks._batch import (
+    batch_error,
+    batch_timeout,
+    run_batch_async,
+    split_output_by_file,
+)
+from quality_agents.codeguard.models import CheckResult, Severity
+from quality_agents.codeguard.tool_pool import run_tool
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+logger = logging.getLogger(__name__)
+
+# Caché incremental de mypy y estado del daemon, relativos a la raíz del
+# proyecto (`ExecutionContext.project_root`; sin ella, el directorio actual)
+MYPY_CACHE_DIR = Path(".quality_control") / "mypy_cache"
+DMYPY_STATUS_FILE = Path(".quality_control") / "dmypy.json"
+
+# --no-error-summary: no mostrar resumen al final
+# --show-column-numbers: mostrar número de columna
+# --no-color-output: output sin colores ANSI
+# (+ --cache-dir absoluto, ver TypeCheck._mypy_flags)
+_MYPY_FLAGS = [
+    "--no-error-summary",
+    "--show-column-numbers",
+    "--no-color-output",
+]
+
+# El daemon se apaga solo tras una hora sin pedidos
+_DAEMON_IDLE_TIMEOUT = 3600
+
+# Duración estimada con el daemon caliente (solo re-chequea lo que cambió)
+_WARM_DAEMON_DURATION = 0.2
+
+
+class _ModuleGraphError(Exception):
+    """mypy no pudo construir el grafo de módulos del batch (exit code 2)."""
+
+
+def is_daemon_running(status_file: Path = DMYPY_STATUS_FILE) -> bool:
+    """
+    Indica si hay un daemon de mypy (dmypy) vivo para el proyecto.
+
+    Lee el archivo de estado de dmypy y verifica que el proceso exista, sin
+    lanzar `dmypy status` (que cuesta un arranque de intérprete).
+
+    Args:
+        status_file: Archivo de estado de dmypy
+
+    Returns:
+        True si el daemon está corriendo
+    """
+    try:
+        pid = json.loads(status_file.read_text(encoding="utf-8"))["pid"]
+        os.kill(int(pid), 0)
+        return True
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
 
 class TypeCheck(Verifiable):
     """
@@ -40,10 +99,22 @@ class TypeCheck(Verifiable):
     Configuración:
         - check_types: bool (habilitado por defecto)
 
+    Modo daemon (`execution.mypy_daemon`):
+    - Usa `dmypy run`, que arranca el daemon la primera vez y lo reutiliza
+    - Con el daemon caliente solo se re-chequea lo que cambió (sub-segundo),
+      y `estimated_duration` lo refleja para que entre en pre-commit
+    - Si dmypy falla, se vuelve a mypy normal
+
+    En ambos modos mypy usa su caché incremental en `.quality_control/mypy_cache`.
+
     Prioridad: 5 (Media-baja - type hints son opcionales)
-    Duración estimada: 3.0s (mypy puede ser lento)
+    Duración estimada: 3.0s (mypy puede ser lento), 0.2s con el daemon caliente
     """
 
+    def __init__(self):
+        """Inicializa el check (el lock serializa los pedidos al daemon)."""
+        self._daemon_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         """Nombre identificador del check."""
@@ -56,9 +127,16 @@ class TypeCheck(Verifiable):
 
     @property
     def estimated_duration(self) -> float:
-        """Duración estimada en segundos."""
+        """Duración estimada en segundos (menor si el daemon de mypy está caliente)."""
+        if self._daemon_enabled() and is_daemon_running(self._status_file()):
+            return _WARM_DAEMON_DURATION
         return 3.0
 
+    @property
+    def dynamic_duration(self) -> bool:
+        """La duración depende del daemon de mypy (ver `PluginSpec.dynamic_duration`)."""
+        return True
+
     @property
     def priority(self) -> int:
         """Prioridad de ejecución (1=más alta, 10=más baja)."""
@@ -74,6 +152,9 @@ class TypeCheck(Verifiable):
         Returns:
             True si debe ejecutarse, False en caso contrario
         """
+        # El modo de ejecución (daemon) determina estimated_duration
+        self._context = context
+
         # Archivo excluido
         if context.is_excluded:
             return False
@@ -93,6 +174,11 @@ class TypeCheck(Verifiable):
 
         return True
 
+    @property
+    def supports_batch(self) -> bool:
+        """mypy acepta múltiples archivos en una sola invocación."""
+        return True
+
     def execute(self, file_path: Path) -> List[CheckResult]:
         """
         Ejecuta mypy sobre el archivo.
@@ -106,61 +192,14 @@ class TypeCheck(Verifiable):
         results = []
 
         try:
-            # Ejecutar mypy
-            # --no-error-summary: no mostrar resumen al final
-            # --show-column-numbers: mostrar número de columna
-            # --no-color-output: output sin colores ANSI
-            process = subprocess.run(
-                [
-                    "mypy",
-                    "--no-error-summary",
-                    "--show-column-numbers",
-                    "--no-color-output",
-                    str(file_path),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            process = self._run_mypy([file_path], timeout=10)
 
             # mypy retorna exit code 0 si no hay errores
             # exit code 1 si hay errores de tipo
             if process.returncode == 0 and not process.stdout.strip():
-                # Sin errores de tipo
-                results.append(
-                    CheckResult(
-                        check_name=self.name,
-                        severity=Severity.INFO,
-                        message="✓ No type errors detected",
-                        file_path=str(file_path),
-                    )
-                )
+                results.append(self._compliant_result(file_path))
             else:
-                # Parsear errores
-                errors = self._parse_mypy_output(process.stdout)
-
-                if not errors:
-                    # No se encontraron errores parseables
-                    # pero mypy reportó algo (puede ser warning)
-                    results.append(
-                        CheckResult(
-                            check_name=self.name,
-                            severity=Severity.INFO,
-                            message="✓ Type checking completed",
-                            file_path=str(file_path),
-                        )
-                    )
-                else:
-                    for error in errors:
-                        results.append(
-                            CheckResult(
-                                check_name=self.name,
-                                severity=Severity.WARNING,
-                                message=f"Type: {error['message']}",
-                                file_path=str(file_path),
-                                line_number=error["line"],
-                            )
-                        )
+                results.extend(self._build_results(file_path, process.stdout))
 
         except FileNotFoundError:
             # mypy no instalado
@@ -195,6 +234,207 @@ class TypeCheck(Verifiable):
 
         return results
 
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Ejecuta mypy una sola vez sobre todos los archivos.
+
+        Además de ahorrar el arranque del intérprete, mypy analiza una sola vez
+        los módulos compartidos por los archivos del batch. Si mypy no puede
+        construir el grafo de módulos (exit code 2, ej: "Duplicate module
+        named"), se vuelve al modo archivo por archivo.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+
+        Returns:
+            Diccionario {archivo: resultados}
+        """
+        try:
+            process = self._run_mypy(file_paths, timeout=batch_timeout(10, len(file_paths)))
+        except FileNotFoundError:
+            return batch_error(self.name, file_paths, "mypy not installed. Run: pip install mypy")
+        except subprocess.TimeoutExpired as e:
+            return batch_error(
+                self.name, file_paths, f"mypy execution timed out (>{e.timeout:.0f}s)"
+            )
+        except Exception as e:
+            return batch_error(self.name, file_paths, f"Unexpected error running mypy: {str(e)}")
+
+        try:
+            return self._batch_results(file_paths, process)
+        except _ModuleGraphError:
+            # Error de invocación, no de tipos: analizar cada archivo por separado
+            return {f: self.execute(f) for f in file_paths}
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[CheckResult]]:
+        """
+        Variante async de `execute_batch`: mypy sin ocupar un hilo.
+
+        En modo daemon se usa la variante default (dmypy atiende un pedido a la vez).
+        """
+        if self._daemon_enabled():
+            return await super().execute_batch_async(file_paths)
+        try:
+            return await run_batch_async(
+                self.name, "mypy", ["mypy"] + self._mypy_flags() + [str(f) for f in file_paths],
+                batch_timeout(10, len(file_paths)), file_paths, self._batch_results,
+                context=getattr(self, "_context", None),
+            )
+        except _ModuleGraphError:
+            results: Dict[Path, List[CheckResult]] = {}
+            for file_path in file_paths:
+                results.update(await self.execute_batch_async([file_path]))
+            return results
+
+    def _batch_results(
+        self, file_paths: List[Path], process: subprocess.CompletedProcess
+    ) -> Dict[Path, List[CheckResult]]:
+        """
+        Reparte la salida de mypy entre los archivos de la invocación.
+
+        Con un solo archivo el mapeo es el de `execute`.
+
+        Raises:
+            _ModuleGraphError: Si mypy terminó con exit code 2 sobre varios archivos
+        """
+        if len(file_paths) == 1:
+            file_path = file_paths[0]
+            if process.returncode == 0 and not process.stdout.strip():
+                return {file_path: [self._compliant_result(file_path)]}
+            return {file_path: self._build_results(file_path, process.stdout)}
+
+        if process.returncode == 2:
+            raise _ModuleGraphError(process.stdout)
+
+        output_by_file = split_output_by_file(process.stdout, file_paths)
+        return {
+            f: self._build_results(f, output_by_file[f]) if output_by_file[f]
+            else [self._compliant_result(f)]
+            for f in file_paths
+        }
+
+    def _run_mypy(self, file_paths: List[Path], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Ejecuta mypy (o dmypy en modo daemon) sobre los archivos.
+
+        Args:
+            file_paths: Archivos a chequear
+            timeout: Timeout en segundos
+
+        Returns:
+            Proceso completado; la salida tiene el mismo formato en ambos modos
+
+        Raises:
+            FileNotFoundError, subprocess.TimeoutExpired: como `subprocess.run`;
+                también si vence el deadline de la corrida
+        """
+        files = [str(f) for f in file_paths]
+
+        if self._daemon_enabled():
+            # El daemon atiende un pedido a la vez
+            with self._daemon_lock:
+                try:
+                    # run_tool recorta el timeout al deadline de la corrida
+                    # (dmypy siempre va por subprocess, no por el pool)
+                    process = run_tool(
+                        [
+                            "dmypy",
+                            "--status-file",
+                            str(self._status_file()),
+                            "run",
+                            "--timeout",
+                            str(_DAEMON_IDLE_TIMEOUT),
+                            "--",
+                        ]
+                        + self._mypy_flags()
+                        + files,
+                        timeout=timeout,
+                        context=getattr(self, "_context", None),
+                    )
+                    # Exit code 2: el daemon no pudo atender el pedido
+                    if process.returncode != 2:
+                        return process
+                    logger.debug(f"dmypy falló, usando mypy: {process.stderr.strip()}")
+                except FileNotFoundError:
+                    logger.debug("dmypy no encontrado, usando mypy")
+
+        return run_tool(
+            ["mypy"] + self._mypy_flags() + files,
+            timeout=timeout,
+            context=getattr(self, "_context", None),
+        )
+
+    def _project_root(self) -> Path:
+        """
+        Raíz del proyecto: ancla la caché de mypy y el estado del daemon.
+
+        Rutas absolutas: ejecutado desde un subdirectorio (o desde el daemon de
+        herramientas, que cambia de directorio en cada pedido) se reutilizan
+        el mismo daemon y la misma caché.
+        """
+        context = getattr(self, "_context", None)
+        root = context.project_root if context and context.project_root else Path.cwd()
+        return root.resolve()
+
+    def _status_file(self) -> Path:
+        """Archivo de estado de dmypy del proyecto."""
+        return self._project_root() / DMYPY_STATUS_FILE
+
+    def _mypy_flags(self) -> List[str]:
+        """Flags de mypy, con la caché incremental del proyecto."""
+        return _MYPY_FLAGS + ["--cache-dir", str(self._project_root() / MYPY_CACHE_DIR)]
+
+    def _daemon_enabled(self) -> bool:
+        """True si la config pide el modo daemon (`execution.mypy_daemon`)."""
+        config = self._context.config if hasattr(self, "_context") and self._context else None
+        execution = getattr(config, "execution", None)
+        return getattr(execution, "mypy_daemon", False) is True
+
+    def _build_results(self, file_path: Path, output: str) -> List[CheckResult]:
+        """
+        Convierte la salida de mypy de un archivo en CheckResult.
+
+        Args:
+            file_path: Ruta al archivo Python
+            output: Líneas de mypy correspondientes al archivo
+
+        Returns:
+            Un WARNING por error de tipo, o un INFO si no hay errores parseables
+        """
+        errors = self._parse_mypy_output(output)
+
+        if not errors:
+            # No se encontraron errores parseables
+            # pero mypy reportó algo (puede ser warning)
+            return [
+                CheckResult(
+                    check_name=self.name,
+                    severity=Severity.INFO,
+                    message="✓ Type checking completed",
+                    file_path=str(file_path),
+                )
+            ]
+
+        return [
+            CheckResult(
+                check_name=self.name,
+                severity=Severity.WARNING,
+                message=f"Type: {error['message']}",
+                file_path=str(file_path),
+                line_number=error["line"],
+            )
+            for error in errors
+        ]
+
+    def _compliant_result(self, file_path: Path) -> CheckResult:
+        """Resultado INFO para un archivo sin errores de tipo."""
+        return CheckResult(
+            check_name=self.name,
+            severity=Severity.INFO,
+            message="✓ No type errors detected",
+            file_path=str(file_path),
+        )
+
     def _has_type_hints(self, file_path: Path) -> bool:
         """
         Detecta si el archivo tiene type hints.
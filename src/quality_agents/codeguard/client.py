@@ -0,0 +1,191 @@
+"""
+Cliente liviano de `codeguard` para el daemon.
+
+Cada invocación de `codeguard` importa click y todos los checks, lee la
+configuración y carga las herramientas en el primer análisis. Con un
+`codeguard daemon` corriendo en el repositorio, este cliente (el entry point
+`codeguard`) solo importa la biblioteca estándar: reenvía los argumentos al
+daemon por un socket Unix y escribe la salida que recibe. Sin daemon, ejecuta
+el CLI completo como siempre.
+
+Protocolo (una línea JSON por mensaje):
+    cliente → daemon: {"argv": [...], "cwd": "...", "env": {...}, "isatty": bool}
+                      o {"command": "status" | "stop"}
+    daemon → cliente: {"stream": "out" | "err", "data": "..."} ... {"exit": código}
+
+Este módulo no debe importar nada pesado: su costo es el del arranque del cliente.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import sys
+
+# Variables de entorno que afectan la salida (ancho y colores de rich/click)
+FORWARDED_ENV = ("COLUMNS", "LINES", "TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR")
+
+# Con esta variable en "1" el cliente no usa el daemon (ej: para depurar)
+NO_DAEMON_ENV = "CODEGUARD_NO_DAEMON"
+
+
+def find_root(start: str) -> str:
+    """
+    Raíz del repositorio que contiene `start` (el primer ancestro con `.git`).
+
+    Args:
+        start: Directorio desde el que se busca
+
+    Returns:
+        Ruta absoluta de la raíz, o `start` si no está en un repositorio
+    """
+    start = os.path.abspath(start)
+    current = start
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return start
+        current = parent
+
+
+def socket_path(root: str) -> str:
+    """
+    Socket del daemon de un repositorio.
+
+    Vive en `$XDG_RUNTIME_DIR` (o el directorio temporal) y no dentro del
+    repositorio: la ruta de un socket Unix no puede superar ~100 caracteres.
+
+    Args:
+        root: Raíz del repositorio
+
+    Returns:
+        Ruta del socket, única por usuario y raíz
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    digest = hashlib.sha256(os.path.realpath(root).encode("utf-8")).hexdigest()[:16]
+    user = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(base, f"codeguard-{user}-{digest}.sock")
+
+
+def _is_private_socket(path: str) -> bool:
+    """
+    True si `path` es un socket del usuario actual, inaccesible para el resto.
+
+    Sin `$XDG_RUNTIME_DIR` el socket vive en el directorio temporal
+    compartido: otro usuario podría crearlo antes que el daemon y recibir
+    los argumentos, el entorno y las rutas de cada invocación.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == (os.getuid() if hasattr(os, "getuid") else 0)
+        and not info.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def connect(root: str) -> socket.socket | None:
+    """
+    Conecta con el daemon del repositorio.
+
+    Solo usa sockets del usuario actual sin permisos para grupo ni otros;
+    cualquier otro se ignora con un aviso.
+
+    Returns:
+        Socket conectado, o None si no hay un daemon escuchando
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path(root)
+    if not _is_private_socket(path):
+        if os.path.lexists(path):
+            sys.stderr.write(
+                f"codeguard: ignoring daemon socket {path}: "
+                f"not owned by the current user or accessible to others\n"
+            )
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def request(root: str, message: dict) -> int | None:
+    """
+    Envía un pedido al daemon y escribe la salida a medida que llega.
+
+    Args:
+        root: Raíz del repositorio (identifica al daemon)
+        message: Pedido (ver el protocolo en el docstring del módulo)
+
+    Returns:
+        Código de salida, o None si no hay daemon
+    """
+    client = connect(root)
+    if client is None:
+        return None
+    with client, client.makefile("rwb") as channel:
+        channel.write(json.dumps(message).encode("utf-8") + b"\n")
+        channel.flush()
+        for line in channel:
+            reply = json.loads(line)
+            if "exit" in reply:
+                return int(reply["exit"])
+            stream = sys.stdout if reply.get("stream") == "out" else sys.stderr
+            stream.write(reply.get("data", ""))
+            stream.flush()
+    sys.stderr.write("codeguard: the daemon closed the connection\n")
+    return 1
+
+
+def forward(argv: list, cwd: str | None = None) -> int | None:
+    """
+    Ejecuta `codeguard ARGV` en el daemon del repositorio de `cwd`.
+
+    Args:
+        argv: Argumentos del CLI
+        cwd: Directorio de trabajo de la invocación (default: actual)
+
+    Returns:
+        Código de salida, o None si no hay daemon
+    """
+    cwd = os.path.abspath(cwd or os.getcwd())
+    return request(find_root(cwd), {
+        "argv": list(argv),
+        "cwd": cwd,
+        "env": {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+        "isatty": sys.stdout.isatty(),
+    })
+
+
+def main() -> None:
+    """
+    Entry point `codeguard`: daemon si hay uno escuchando, CLI completo si no.
+
+    `codeguard daemon ...` administra el daemon (ver `codeguard daemon --help`).
+    """
+    argv = sys.argv[1:]
+    if argv[:1] == ["daemon"]:
+        from quality_agents.codeguard.daemon import daemon
+
+        daemon.main(args=argv[1:], prog_name="codeguard daemon")
+        return
+
+    # --watch es una sesión interactiva larga: corre localmente, sin ocupar al daemon
+    watch = "--watch" in argv or "-w" in argv
+    if os.environ.get(NO_DAEMON_ENV) != "1" and not watch:
+        code = forward(argv)
+        if code is not None:
+            sys.exit(code)
+
+    from quality_agents.codeguard.agent import main as cli
+
+    cli()
@@ -9,8 +9,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
 
@@ -68,6 +66,44 @@ class ChecksConfig:
     spelling: bool = True
 
 
+@dataclass
+class ExecutionConfig:
+    """
+    Opciones del motor de ejecución de CodeGuard.
+
+    Configurable desde pyproject.toml con la sección [tool.codeguard.execution]
+    o desde YAML con la clave ``execution``.
+
+    Example::
+
+        [tool.codeguard.execution]
+        in_process = false   # forzar una invocación de subprocess por archivo
+        batch = false        # una invocación de cada herramienta por archivo
+        jobs = 4             # checks en paralelo (0 = CPUs disponibles)
+        cache = false        # no reutilizar resultados de corridas anteriores
+        mypy_daemon = true   # TypeCheck vía dmypy
+        tool_pool = true     # herramientas por subprocess en forks pre-cargados
+        engine = "asyncio"   # checks concurrentes en un event loop (async_limit a la vez)
+        learn_durations = false  # presupuesto de pre-commit con estimated_duration fijo
+        background = true    # checks que el pre-commit deja afuera, en segundo plano
+    """
+
+    in_process: bool = True  # Usar la API de la herramienta en lugar de subprocess
+    batch: bool = True  # Invocar cada herramienta una vez por changeset (execute_batch)
+    max_batch_size: int = 200  # Archivos por invocación batch (limita la línea de comandos)
+    jobs: int = 0  # Checks en paralelo (0 = CPUs disponibles, 1 = secuencial)
+    cache: bool = True  # Reutilizar resultados de archivos sin cambios (.quality_control/cache/)
+    cache_max_size_mb: float = 50.0  # Tamaño máximo de la caché (desalojo LRU)
+    mypy_daemon: bool = False  # TypeCheck usa dmypy (daemon persistente) en lugar de mypy
+    pylint_jobs: int = 1  # Procesos de pylint (-j) en el motor in-process (0 = CPUs)
+    dead_code_scope: str = "project"  # "project" (usos de todo el proyecto) | "changeset"
+    tool_pool: bool = False  # Herramientas por subprocess en forks de un servidor pre-cargado
+    engine: str = "threads"  # "threads" (pool de jobs hilos) | "asyncio" (event loop)
+    async_limit: int = 0  # Unidades en vuelo con engine = "asyncio" (0 = CPUs disponibles)
+    learn_durations: bool = True  # Presupuesto con duraciones medidas (.quality_control/stats/)
+    background: bool = False  # Analizar en segundo plano lo que el pre-commit deja afuera
+
+
 @dataclass
 class CodeGuardConfig:
     """Configuración de CodeGuard."""
@@ -93,6 +129,9 @@ class CodeGuardConfig:
     # Toggles de checks
     checks: ChecksConfig = field(default_factory=ChecksConfig)
 
+    # Motor de ejecución
+    execution: ExecutionConfig = field(default_factory=ExecutionConfig)
+
     # Configuración de IA
     ai: AIConfig = field(default_factory=AIConfig)
 
@@ -107,6 +146,8 @@ class CodeGuardConfig:
         Returns:
             Instancia de CodeGuardConfig
         """
+        import yaml  # Solo con configuración YAML (pyproject.toml es el caso común)
+
         with open(path) as f:
             data = yaml.safe_load(f)
 
@@ -116,12 +157,18 @@ class CodeGuardConfig:
         # Extraer sub-secciones antes de pasar el resto al dataclass
         ai_data = data.pop("ai", {})
         checks_data = data.pop("checks", {})
+        execution_data = data.pop("execution", {})
         ai_config = AIConfig(**_filter_fields(AIConfig, ai_data)) if ai_data else AIConfig()
         checks_config = ChecksConfig(**_filter_fields(ChecksConfig, checks_data)) if checks_data else ChecksConfig()
+        execution_config = (
+            ExecutionConfig(**_filter_fields(ExecutionConfig, execution_data))
+            if execution_data else ExecutionConfig()
+        )
 
         config = cls(**_filter_fields(cls, data))
         config.ai = ai_config
         config.checks = checks_config
+        config.execution = execution_config
 
         return config
 
@@ -164,12 +211,18 @@ class CodeGuardConfig:
         # Extraer sub-secciones antes de pasar el resto al dataclass
         ai_config_data = tool_config.pop("ai", {})
         checks_data = tool_config.pop("checks", {})
+        execution_data = tool_config.pop("execution", {})
         ai_config = AIConfig(**_filter_fields(AIConfig, ai_config_data)) if ai_config_data else AIConfig()
         checks_config = ChecksConfig(**_filter_fields(ChecksConfig, checks_data)) if checks_data else ChecksConfig()
+        execution_config = (
+            ExecutionConfig(**_filter_fields(ExecutionConfig, execution_data))
+            if execution_data else ExecutionConfig()
+        )
 
         config = cls(**_filter_fields(cls, tool_config))
         config.ai = ai_config
         config.checks = checks_config
+        config.execution = execution_config
 
         return config
 
@@ -197,6 +250,22 @@ class CodeGuardConfig:
                 "maintainability": self.checks.maintainability,
                 "spelling": self.checks.spelling,
             },
+            "execution": {
+                "in_process": self.execution.in_process,
+                "batch": self.execution.batch,
+                "max_batch_size": self.execution.max_batch_size,
+                "jobs": self.execution.jobs,
+                "cache": self.execution.cache,
+                "cache_max_size_mb": self.execution.cache_max_size_mb,
+                "mypy_daemon": self.execution.mypy_daemon,
+                "pylint_jobs": self.execution.pylint_jobs,
+                "dead_code_scope": self.execution.dead_code_scope,
+                "tool_pool": self.execution.tool_pool,
+                "engine": self.execution.engine,
+                "async_limit": self.execution.async_limit,
+                "learn_durations": self.execution.learn_durations,
+                "background": self.execution.background,
+            },
             "ai": {
                 "enabled": self.ai.enabled,
                 "explain_errors": self.ai.explain_errors,
@@ -205,6 +274,8 @@ class CodeGuardConfig:
             },
         }
 
+        import yaml
+
         with open(path, "w") as f:
             yaml.dump(data, f, default_flow_style=False)
 
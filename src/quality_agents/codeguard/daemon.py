@@ -0,0 +1,287 @@
+"""
+Daemon de CodeGuard: instancias calientes detrás de un socket Unix.
+
+`codeguard daemon` mantiene en memoria lo que cada invocación del CLI paga de
+nuevo: los imports (click, rich, yaml, checks), la configuración, los checks
+descubiertos, los motores in-process de las herramientas, las duraciones
+aprendidas. Escucha en un socket Unix por repositorio (ver
+`client.socket_path`) y ejecuta el CLI de `agent.py` con los argumentos, el
+directorio de trabajo y las variables de terminal del cliente, enviando la
+salida a medida que se produce.
+
+Los pedidos se atienden de a uno: una instancia de CodeGuard no admite dos
+corridas simultáneas, y dos commits no ganan nada compitiendo por la CPU.
+Si cambia el archivo de configuración, la instancia se vuelve a crear.
+"""
+
+import copy
+import io
+import json
+import os
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+
+import click
+
+from quality_agents.codeguard import agent
+from quality_agents.codeguard.agent import CodeGuard
+from quality_agents.codeguard.client import (
+    FORWARDED_ENV,
+    connect,
+    find_root,
+    request,
+    socket_path,
+)
+from quality_agents.codeguard.config import ExecutionConfig
+from quality_agents.codeguard.engines.pylint_engine import PylintEngine
+
+# Archivos de configuración que se buscan en la raíz (ver load_config)
+_CONFIG_FILES = ("pyproject.toml", ".codeguard.yml")
+
+
+class _ReplyStream(io.TextIOBase):
+    """Stream de texto que reenvía cada escritura al cliente como un mensaje JSON."""
+
+    def __init__(self, channel: BinaryIO, stream: str, isatty: bool) -> None:
+        self._channel = channel
+        self._stream = stream
+        self._isatty = isatty
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def write(self, data: Union[str, bytes]) -> int:
+        if isinstance(data, bytes):
+            # click.echo escribe bytes cuando el stream parece binario
+            data = data.decode("utf-8", errors="replace")
+        if data:
+            message = {"stream": self._stream, "data": data}
+            self._channel.write(json.dumps(message).encode("utf-8") + b"\n")
+            self._channel.flush()
+        return len(data)
+
+
+class CodeGuardDaemon:
+    """
+    Ejecuta pedidos del CLI con instancias de CodeGuard reutilizadas.
+
+    Attributes:
+        root: Raíz del repositorio que atiende el daemon
+        socket_path: Socket Unix en el que escucha
+
+    Example:
+        >>> daemon = CodeGuardDaemon(Path("."))
+        >>> daemon.serve_forever()
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root.resolve()
+        self.socket_path = Path(socket_path(str(self.root)))
+        # (config, raíz del proyecto) → (firma de la config, instancia, execution original)
+        self._guards: Dict[
+            Tuple[Optional[str], str], Tuple[Tuple, CodeGuard, ExecutionConfig]
+        ] = {}
+        self._stopping = False
+
+    def guard(
+        self, config_path: Optional[Path] = None, project_root: Optional[Path] = None
+    ) -> CodeGuard:
+        """
+        Instancia de CodeGuard para una corrida (reemplaza al constructor en el CLI).
+
+        Las opciones de `execution` vuelven a las de la configuración en cada
+        corrida: `--no-cache`, `--engine`, ... de un pedido no se arrastran al
+        siguiente.
+
+        Args:
+            config_path: Archivo de configuración (None = búsqueda automática)
+            project_root: Raíz del proyecto
+
+        Returns:
+            La instancia en memoria, o una nueva si cambió la configuración
+        """
+        project_root = (project_root or Path.cwd()).resolve()
+        key = (str(config_path.resolve()) if config_path else None, str(project_root))
+        stamp = self._config_stamp(config_path, project_root)
+        entry = self._guards.get(key)
+        if entry is None or entry[0] != stamp:
+            guard = CodeGuard(config_path=config_path, project_root=project_root)
+            entry = (stamp, guard, copy.deepcopy(guard.config.execution))
+            self._guards[key] = entry
+        _, guard, execution = entry
+        guard.config.execution = copy.deepcopy(execution)
+        return guard
+
+    @staticmethod
+    def _config_stamp(config_path: Optional[Path], project_root: Path) -> Tuple:
+        """Firma (ruta, mtime) de los archivos de configuración que lee load_config."""
+        paths = [config_path] if config_path else [project_root / name for name in _CONFIG_FILES]
+        stamp = []
+        for path in paths:
+            try:
+                stamp.append((str(path), path.stat().st_mtime_ns))
+            except OSError:
+                stamp.append((str(path), None))
+        return tuple(stamp)
+
+    def handle(self, message: Dict[str, Any], channel: BinaryIO) -> int:
+        """
+        Ejecuta un pedido del cliente.
+
+        Args:
+            message: Pedido decodificado (ver el protocolo en client.py)
+            channel: Conexión con el cliente (salida y código de salida)
+
+        Returns:
+            Código de salida del CLI
+        """
+        command = message.get("command")
+        if command == "status":
+            _ReplyStream(channel, "out", False).write(
+                f"codeguard daemon pid {os.getpid()} root {self.root}\n"
+            )
+            return 0
+        if command == "stop":
+            self._stopping = True
+            return 0
+        return self._run_cli(message, channel)
+
+    def _run_cli(self, message: Dict[str, Any], channel: BinaryIO) -> int:
+        """Ejecuta el CLI con el directorio, entorno y streams del cliente."""
+        isatty = bool(message.get("isatty"))
+        env = {name: message.get("env", {}).get(name) for name in FORWARDED_ENV}
+        saved_env = {name: os.environ.get(name) for name in FORWARDED_ENV}
+        saved_cwd = os.getcwd()
+        saved_factory = agent._guard_factory
+        try:
+            os.chdir(message["cwd"])
+            _set_env(env)
+            # Los reportes de pylint dependen de otros archivos del proyecto
+            PylintEngine.forget_shared()
+            agent._guard_factory = self.guard
+            stdout = _ReplyStream(channel, "out", isatty)
+            stderr = _ReplyStream(channel, "err", isatty)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                return _invoke_cli(message["argv"])
+        finally:
+            agent._guard_factory = saved_factory
+            os.chdir(saved_cwd)
+            _set_env(saved_env)
+
+    def serve_forever(self) -> None:
+        """
+        Escucha en el socket hasta recibir `stop`.
+
+        Raises:
+            click.ClickException: Si ya hay un daemon escuchando en el repositorio.
+        """
+        running = connect(str(self.root))
+        if running is not None:
+            running.close()
+            raise click.ClickException(f"a daemon is already running for {self.root}")
+        # Socket huérfano de un daemon que terminó mal
+        try:
+            self.socket_path.unlink(missing_ok=True)
+        except OSError as e:
+            raise click.ClickException(f"cannot remove stale socket {self.socket_path}: {e}") from e
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                try:
+                    code = daemon.handle(json.loads(line), self.wfile)
+                except Exception:
+                    _ReplyStream(self.wfile, "err", False).write(traceback.format_exc())
+                    code = 1
+                self.wfile.write(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+
+        # El socket se crea con permisos 0600: el cliente rechaza cualquier otro
+        previous_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(previous_umask)
+        self._stopping = False
+        try:
+            while not self._stopping:
+                server.handle_request()
+        finally:
+            server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+def _set_env(values: Dict[str, Optional[str]]) -> None:
+    for name, value in values.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def _invoke_cli(argv: list) -> int:
+    """Ejecuta `codeguard ARGV` en este proceso y retorna el código de salida."""
+    try:
+        code = agent.main.main(args=argv, prog_name="codeguard", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return code if isinstance(code, int) else 0
+
+
+@click.command()
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Raíz del repositorio (default: el repositorio del directorio actual)"
+)
+@click.option("--stop", is_flag=True, default=False, help="Detener el daemon del repositorio")
+@click.option("--status", is_flag=True, default=False, help="Indicar si hay un daemon escuchando")
+def daemon(root: Optional[str], stop: bool, status: bool) -> None:
+    """
+    Daemon de CodeGuard para el repositorio actual.
+
+    Mientras corre, `codeguard` reenvía cada invocación al daemon, que ya
+    tiene cargados la configuración, los checks y las herramientas.
+
+    Ejemplos:
+      codeguard daemon &
+      codeguard daemon --status
+      codeguard daemon --stop
+    """
+    repo = root or find_root(os.getcwd())
+    if stop or status:
+        code = request(repo, {"command": "stop" if stop else "status"})
+        if code is None:
+            click.echo(f"no daemon running for {repo}")
+            sys.exit(1)
+        if stop:
+            click.echo(f"daemon stopped ({repo})")
+        return
+
+    server = CodeGuardDaemon(Path(repo))
+    click.echo(f"codeguard daemon listening on {server.socket_path} (root {server.root})")
+    server.serve_forever()
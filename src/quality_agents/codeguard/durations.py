@@ -0,0 +1,210 @@
+"""
+Duraciones aprendidas de los checks de CodeGuard.
+
+`estimated_duration` es una constante por check: no distingue un módulo de
+50 líneas de uno de 5000, ni una laptop de un runner de CI con disco lento.
+CodeGuard mide cada invocación de un check junto con las líneas de los
+archivos que analizó y ajusta, por mínimos cuadrados, un modelo de costo
+`a + b·líneas` por check. El orquestador usa la predicción del modelo para
+decidir qué checks entran en el presupuesto de pre-commit.
+
+Las muestras (las últimas MAX_SAMPLES de cada check) se guardan en
+`.quality_control/stats/codeguard_durations.json`. Si cambia la
+configuración del motor de ejecución (in-process, daemon de mypy, ...), las
+muestras anteriores se descartan: miden otra cosa.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Versión del formato del archivo; cambiarla descarta las muestras guardadas
+_FORMAT_VERSION = 1
+
+# Muestras que se conservan por check (ventana móvil: el modelo sigue los cambios)
+MAX_SAMPLES = 50
+
+# Muestras mínimas para usar el modelo; con menos vale `estimated_duration`
+# (una sola corrida batch sobre todo el proyecto no dice nada de un archivo)
+MIN_SAMPLES = 3
+
+
+def count_lines(file_path: Path) -> int:
+    """
+    Cuenta las líneas de un archivo (0 si no se puede leer).
+
+    Args:
+        file_path: Ruta al archivo
+
+    Returns:
+        Cantidad de líneas, contando una última línea sin salto final
+    """
+    try:
+        content = file_path.read_bytes()
+    except OSError:
+        return 0
+    lines = content.count(b"\n")
+    if content and not content.endswith(b"\n"):
+        lines += 1
+    return lines
+
+
+def fit_linear(samples: List[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """
+    Ajusta `segundos = a + b·líneas` por mínimos cuadrados.
+
+    Si todas las muestras tienen las mismas líneas el modelo es constante (la
+    media). Los coeficientes nunca son negativos: un archivo más grande no
+    puede costar menos.
+
+    Args:
+        samples: Pares (líneas, segundos)
+
+    Returns:
+        Tupla (a, b), o None con menos de MIN_SAMPLES muestras
+    """
+    n = len(samples)
+    if n < MIN_SAMPLES:
+        return None
+    mean_x = sum(x for x, _ in samples) / n
+    mean_y = sum(y for _, y in samples) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in samples)
+    if var_x == 0:
+        return mean_y, 0.0
+
+    b = sum((x - mean_x) * (y - mean_y) for x, y in samples) / var_x
+    if b <= 0:
+        return mean_y, 0.0
+    a = mean_y - b * mean_x
+    if a < 0:
+        # Recta por el origen: b = Σxy / Σx²
+        return 0.0, sum(x * y for x, y in samples) / sum(x * x for x, _ in samples)
+    return a, b
+
+
+class DurationModel:
+    """
+    Modelo de costo por check a partir de duraciones medidas.
+
+    Es seguro para usar desde los workers de CodeGuard (hilos o event loop):
+    el registro de muestras y el ajuste están protegidos por un lock.
+
+    Example:
+        >>> model = DurationModel(Path(".quality_control/stats/codeguard_durations.json"))
+        >>> model.record("PEP8", lines=420, seconds=0.31)
+        >>> model.predict("PEP8", lines=1200, default=0.5)
+        >>> model.save()
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, settings: str = "", max_samples: int = MAX_SAMPLES
+    ) -> None:
+        """
+        Args:
+            path: Archivo donde persistir las muestras (None = solo en memoria)
+            settings: Firma de la configuración de ejecución; si no coincide
+                con la guardada, las muestras anteriores se descartan
+            max_samples: Muestras que se conservan por check
+        """
+        self.path = path
+        self.settings = settings
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[Tuple[float, float]]] = {}
+        self._fits: Dict[str, Optional[Tuple[float, float]]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def record(self, check_name: str, lines: int, seconds: float) -> None:
+        """
+        Registra la duración de una invocación de un check.
+
+        Args:
+            check_name: Nombre del check
+            lines: Líneas de los archivos analizados en la invocación
+            seconds: Duración medida (reloj real)
+        """
+        with self._lock:
+            self._load()
+            samples = self._samples.setdefault(check_name, [])
+            samples.append((float(lines), float(seconds)))
+            del samples[:-self.max_samples]
+            self._fits.pop(check_name, None)
+            self._dirty = True
+
+    def predict(self, check_name: str, lines: int, default: float) -> float:
+        """
+        Predice la duración de un check sobre archivos con `lines` líneas.
+
+        Args:
+            check_name: Nombre del check
+            lines: Líneas a analizar
+            default: Duración a usar sin muestras suficientes (ej: `estimated_duration`)
+
+        Returns:
+            Duración predicha en segundos
+        """
+        coefficients = self.coefficients(check_name)
+        if coefficients is None:
+            return default
+        a, b = coefficients
+        return a + b * lines
+
+    def coefficients(self, check_name: str) -> Optional[Tuple[float, float]]:
+        """
+        Coeficientes (a, b) del modelo de un check.
+
+        Returns:
+            Tupla (a, b), o None si el check no tiene muestras suficientes
+        """
+        with self._lock:
+            self._load()
+            if check_name not in self._fits:
+                self._fits[check_name] = fit_linear(self._samples.get(check_name, []))
+            return self._fits[check_name]
+
+    def save(self) -> None:
+        """Persiste las muestras con escritura atómica, si hubo muestras nuevas."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            payload = {
+                "format": _FORMAT_VERSION,
+                "settings": self.settings,
+                "checks": {
+                    name: [list(s) for s in samples] for name, samples in self._samples.items()
+                },
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    json.dump(payload, tmp)
+                os.replace(tmp_name, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"No se pudieron guardar las duraciones de checks: {e}")
+
+    def _load(self) -> None:
+        """Carga las muestras persistidas (una vez por instancia; con el lock tomado)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("format") != _FORMAT_VERSION or data.get("settings") != self.settings:
+                return
+            self._samples = {
+                name: [(float(x), float(y)) for x, y in samples][-self.max_samples:]
+                for name, samples in data["checks"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._samples = {}
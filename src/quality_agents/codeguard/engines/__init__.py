@@ -0,0 +1,39 @@
+"""
+Motores de ejecución in-process para los checks de CodeGuard.
+
+Cada motor envuelve la API Python de una herramienta externa (flake8, pylint,
+bandit, ...) y la mantiene cargada durante toda la corrida de CodeGuard, de modo
+que el costo de arranque (intérprete, plugins, diccionarios) se paga una sola vez
+en lugar de una vez por archivo.
+
+Los checks siguen siendo responsables de mapear la salida a `CheckResult` y de
+conservar la invocación por subprocess como fallback cuando el motor no está
+disponible.
+"""
+
+import importlib
+
+# Cada motor importa su herramienta al crearse; el paquete tampoco importa los
+# módulos hasta que se pide un nombre (un check importa solo su motor)
+_EXPORTS = {
+    "BanditEngine": ".bandit_engine",
+    "BanditIssue": ".bandit_engine",
+    "CodespellEngine": ".codespell_engine",
+    "CodespellTypo": ".codespell_engine",
+    "Flake8Engine": ".flake8_engine",
+    "Flake8Violation": ".flake8_engine",
+    "PylintEngine": ".pylint_engine",
+    "PylintFileReport": ".pylint_engine",
+    "PylintMessage": ".pylint_engine",
+    "VultureEngine": ".vulture_engine",
+    "VultureFinding": ".vulture_engine",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,141 @@
+"""
+Motor in-process de bandit.
+
+El arranque de `bandit` se va en descubrir y cargar sus plugins y blacklists.
+El motor los carga una sola vez (al importar `bandit.core`), junto con la
+configuración y el perfil de tests validado, y reutiliza ese estado en cada
+escaneo: por corrida solo se crea el `BanditManager`, que es el contenedor de
+resultados de bandit.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# bandit se importa al usar el motor: cargar sus plugins cuesta ~60 ms y
+# `codeguard` no debe pagarlo si SecurityCheck no se ejecuta in-process.
+# None = todavía no se intentó importar.
+_BANDIT_DISPONIBLE: Optional[bool] = None
+
+
+def _load_bandit() -> bool:
+    """Importa bandit la primera vez; retorna True si está disponible."""
+    global _BANDIT_DISPONIBLE, b_config, b_constants, extension_loader, b_manager
+    if _BANDIT_DISPONIBLE is None:
+        try:
+            from bandit.core import config as b_config
+            from bandit.core import constants as b_constants
+            from bandit.core import extension_loader
+            from bandit.core import manager as b_manager
+
+            _BANDIT_DISPONIBLE = True
+        except ImportError:
+            _BANDIT_DISPONIBLE = False
+    return _BANDIT_DISPONIBLE
+
+
+@dataclass
+class BanditIssue:
+    """Issue reportado por bandit para un archivo."""
+
+    test_id: str
+    severity: str
+    confidence: str
+    text: str
+    line_number: int
+
+
+class BanditEngine:
+    """
+    Ejecuta bandit dentro del proceso actual.
+
+    Equivale a `bandit -f json <archivos>` con la configuración por defecto:
+    todos los tests, rutas excluidas por defecto de bandit y comentarios
+    `# nosec` respetados.
+
+    Los escaneos se serializan con un lock: los plugins de bandit comparten
+    estado a nivel de módulo.
+
+    Example:
+        >>> engine = BanditEngine.shared()
+        >>> for issue in engine.check_files([Path("app.py")])[Path("app.py")]:
+        ...     print(issue.line_number, issue.test_id, issue.severity)
+    """
+
+    _shared: Optional["BanditEngine"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Prepara configuración y perfil de bandit.
+
+        Raises:
+            ImportError: Si bandit no está instalado.
+        """
+        if not _load_bandit():
+            raise ImportError("bandit not installed. Run: pip install bandit")
+
+        self._lock = threading.Lock()
+        self._config = b_config.BanditConfig()
+        # Perfil vacío = todos los tests (igual que el CLI sin --profile/-t/-s)
+        self._profile: dict = {"include": set(), "exclude": set()}
+        extension_loader.MANAGER.validate_profile(self._profile)
+        self._excluded_paths = ",".join(b_constants.EXCLUDE)
+
+        # El CLI descarta sus logs con -f json; in-process irían a stderr
+        logging.getLogger("bandit").setLevel(logging.ERROR)
+
+    @classmethod
+    def shared(cls) -> "BanditEngine":
+        """Instancia compartida por todo el proceso."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si bandit puede importarse en este entorno."""
+        return _load_bandit()
+
+    def check_files(self, file_paths: List[Path]) -> Dict[Path, List[BanditIssue]]:
+        """
+        Escanea varios archivos en una sola pasada.
+
+        Args:
+            file_paths: Rutas a los archivos Python.
+
+        Returns:
+            Diccionario {archivo: issues}, con una entrada por archivo. Un
+            archivo que bandit no puede parsear queda sin issues, como en el CLI.
+        """
+        issues: Dict[Path, List[BanditIssue]] = {f: [] for f in file_paths}
+        # bandit normaliza cada ruta explícita con os.path.join(".", ruta)
+        by_name = {os.path.normpath(str(f)): f for f in file_paths}
+
+        with self._lock:
+            manager = b_manager.BanditManager(
+                self._config, "file", profile=self._profile, quiet=True
+            )
+            manager.discover_files(list(by_name), False, self._excluded_paths)
+            manager.run_tests()
+            found = manager.get_issue_list()
+
+        for issue in found:
+            file_path = by_name.get(os.path.normpath(issue.fname))
+            if file_path is None:
+                continue
+            issues[file_path].append(
+                BanditIssue(
+                    test_id=issue.test_id,
+                    severity=issue.severity,
+                    confidence=issue.confidence,
+                    text=issue.text,
+                    line_number=issue.lineno,
+                )
+            )
+
+        return issues
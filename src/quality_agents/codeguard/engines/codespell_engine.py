@@ -0,0 +1,350 @@
+"""
+Motor in-process de codespell.
+
+Cada invocación de `codespell` vuelve a leer su diccionario de errores
+(~1.5 MB, decenas de miles de entradas) antes de mirar una sola línea. El
+motor lo carga una vez por proceso en un diccionario en memoria que no se
+modifica después: los hilos de CodeGuard lo consultan sin lock. Cada archivo
+se tokeniza dentro del proceso con las mismas expresiones regulares y reglas
+que el CLI, y las palabras ignoradas se aplican como búsqueda en un set.
+"""
+
+import argparse
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from quality_agents.codeguard.cache import project_config_digest
+
+# Configuración de codespell que se lee del directorio actual
+CONFIG_FILES = (".codespellrc", "setup.cfg")
+PYPROJECT_TABLES = ("codespell",)
+
+# Versiones de codespell (mayor, menor) cuya API interna replica el motor
+# (`parse_lines`, `FileOpener`, `QuietLevels`, `_select_builtin_dictionary`).
+# Con otra versión SpellingCheck usa el CLI. Mantener en sincronía con el
+# extra `spelling` de pyproject.toml.
+SUPPORTED_VERSIONS = ((2, 4),)
+
+# codespell se importa al usar el motor (None = todavía no se intentó)
+_CODESPELL_DISPONIBLE: Optional[bool] = None
+
+
+def _load_codespell() -> bool:
+    """Importa codespell la primera vez; retorna True si está disponible y es compatible."""
+    global _CODESPELL_DISPONIBLE, cs
+    if _CODESPELL_DISPONIBLE is None:
+        try:
+            import codespell_lib
+            from codespell_lib import _codespell as cs
+
+            version = _version_tuple(codespell_lib.__version__)
+            _CODESPELL_DISPONIBLE = version in SUPPORTED_VERSIONS
+        except (ImportError, AttributeError):
+            _CODESPELL_DISPONIBLE = False
+    return _CODESPELL_DISPONIBLE
+
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """(mayor, menor) de una versión como "2.4.3" (vacío si no se puede leer)."""
+    try:
+        return tuple(int(part) for part in version.split(".")[:2])
+    except ValueError:
+        return ()
+
+
+def _directive_words(match: Any) -> Set[str]:
+    """Palabras de un comentario `codespell:ignore` (vacío = todas)."""
+    return set(filter(None, (match.group("words") or "").split(",")))
+
+
+def _ignore_next_line_words(line: str) -> Optional[Set[str]]:
+    """Palabras de un `codespell:ignore-next-line` (None si la línea no lo tiene)."""
+    if cs.codespell_ignore_next_line_tag not in line:
+        return None
+    match = cs.ignore_next_line_regex.search(line)
+    return _directive_words(match) if match else None
+
+
+@dataclass
+class CodespellTypo:
+    """Error de ortografía reportado por codespell para un archivo."""
+
+    line_number: int
+    typo: str
+    correction: str
+
+
+class CodespellEngine:
+    """
+    Ejecuta codespell dentro del proceso actual.
+
+    Equivale a `codespell <archivos> -L <palabras>` con la configuración de
+    codespell del directorio actual (`[tool.codespell]`, setup.cfg,
+    .codespellrc): diccionarios, palabras y expresiones ignoradas, `--skip`
+    y niveles de `--quiet-level`. También respeta los comentarios
+    `codespell:ignore` y `codespell:ignore-next-line`.
+
+    Example:
+        >>> engine = CodespellEngine.shared()
+        >>> for typo in engine.check_files([Path("app.py")])[Path("app.py")]:
+        ...     print(typo.line_number, typo.typo, typo.correction)
+    """
+
+    _shared: Optional["CodespellEngine"] = None
+    _shared_key: Optional[Tuple[str, str]] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Lee la configuración de codespell y carga los diccionarios.
+
+        Raises:
+            ImportError: Si codespell no está instalado o su versión no es compatible.
+            ValueError: Si un diccionario configurado no existe.
+            configparser.Error: Si el archivo de configuración de codespell es inválido.
+        """
+        if not _load_codespell():
+            raise ImportError(
+                "codespell not installed or unsupported version. "
+                "Run: pip install 'quality-agents[spelling]'"
+            )
+
+        options, _, _ = cs.parse_options([])
+        self._options = options
+        self._ignore_words, self._ignore_words_cased = self._load_ignore_words(options)
+
+        self._word_regex = re.compile(options.regex or cs.word_regex_def)
+        self._ignore_regex = re.compile(options.ignore_regex) if options.ignore_regex else None
+        self._uri_regex = re.compile(options.uri_regex or cs.uri_regex_def)
+        self._uri_ignore_words: Set[str] = set().union(
+            *cs.parse_ignore_words_option(options.uri_ignore_words_list)
+        )
+        self._multiline_regex = (
+            re.compile(options.ignore_multiline_regex, re.DOTALL)
+            if options.ignore_multiline_regex
+            else None
+        )
+        self._glob_match = cs.GlobMatch(
+            cs.flatten_clean_comma_separated_arguments(options.skip) if options.skip else []
+        )
+        self._exclude_lines: Set[str] = set()
+        for exclude_file in cs.flatten_clean_comma_separated_arguments(options.exclude_file or []):
+            cs.build_exclude_hashes(exclude_file, self._exclude_lines)
+
+        self._misspellings = self._load_dictionaries(options)
+
+    @classmethod
+    def shared(cls) -> "CodespellEngine":
+        """
+        Instancia compartida por el proceso (el diccionario se carga una vez).
+
+        La instancia se indexa por el directorio actual y el contenido de la
+        configuración de codespell: en un proceso de larga vida (`codeguard
+        daemon`) un pedido desde otro directorio, o una edición de
+        `.codespellrc` o `[tool.codespell]`, vuelve a leer la configuración.
+        """
+        key = (os.getcwd(), project_config_digest(CONFIG_FILES, PYPROJECT_TABLES))
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared_key != key:
+                cls._shared = cls()
+                cls._shared_key = key
+            return cls._shared
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si hay una versión compatible de codespell en este entorno."""
+        return _load_codespell()
+
+    def check_files(
+        self, file_paths: List[Path], ignore_words: Iterable[str] = ()
+    ) -> Dict[Path, List[CodespellTypo]]:
+        """
+        Revisa la ortografía de varios archivos.
+
+        Args:
+            file_paths: Rutas a los archivos
+            ignore_words: Palabras a ignorar además de las de la configuración
+                de codespell (equivale a `-L`; en minúsculas ignora la palabra
+                en cualquier capitalización, con mayúsculas solo esa forma)
+
+        Returns:
+            Diccionario {archivo: typos}, con una entrada por archivo. Los
+            archivos binarios, ocultos o excluidos por `--skip` quedan sin typos.
+        """
+        extra, extra_cased = cs.parse_ignore_words_option([",".join(ignore_words)])
+        ignore = (self._ignore_words | extra, self._ignore_words_cased | extra_cased)
+        return {f: self._check_file(f, ignore) for f in file_paths}
+
+    def _check_file(
+        self, file_path: Path, ignore: Tuple[Set[str], Set[str]]
+    ) -> List[CodespellTypo]:
+        """Revisa un archivo con los mismos filtros que aplica el CLI."""
+        filename = str(file_path)
+        if cs.is_hidden(filename, self._options.check_hidden) or self._glob_match.match(filename):
+            return []
+        if not os.path.isfile(filename):
+            return []
+        try:
+            if not cs.is_text_file(filename):
+                return []
+            # Sin avisos de encoding: el CLI los escribe en stderr, que se descarta
+            opener = cs.FileOpener(
+                self._options.hard_encoding_detection,
+                self._options.quiet_level | cs.QuietLevels.ENCODING,
+                self._multiline_regex,
+            )
+            fragments, _ = opener.open(filename)
+        except (OSError, UnicodeDecodeError, LookupError):
+            return []
+
+        typos: List[CodespellTypo] = []
+        for skipped, first_line, lines in fragments:
+            if not skipped:
+                typos.extend(self._check_lines(first_line, lines, ignore))
+        return typos
+
+    def _check_lines(
+        self, first_line: int, lines: List[str], ignore: Tuple[Set[str], Set[str]]
+    ) -> List[CodespellTypo]:
+        """Versión sin salida por consola de `codespell_lib._codespell.parse_lines`."""
+        typos: List[CodespellTypo] = []
+        next_line_ignore: Optional[Set[str]] = None
+        for i, line in enumerate(lines):
+            line = line.rstrip()
+            pending_ignore = next_line_ignore
+            directive_words = _ignore_next_line_words(line)
+            next_line_ignore = directive_words
+            extra_ignore = self._line_ignore_words(line, directive_words, pending_ignore)
+            if extra_ignore is None:
+                continue
+            for match in self._line_matches(line):
+                typo = self._typo(match, line, ignore, extra_ignore)
+                if typo is not None:
+                    word, correction = typo
+                    typos.append(CodespellTypo(first_line + i + 1, word, correction))
+        return typos
+
+    def _line_ignore_words(
+        self, line: str, directive_words: Optional[Set[str]], pending_ignore: Optional[Set[str]]
+    ) -> Optional[Set[str]]:
+        """
+        Palabras ignoradas en una línea por los comentarios de codespell.
+
+        Args:
+            directive_words: Palabras de un `codespell:ignore-next-line` en esta línea
+            pending_ignore: Palabras del `codespell:ignore-next-line` de la línea anterior
+
+        Returns:
+            Palabras a ignorar, o None si la línea se ignora completa
+        """
+        if not line or line in self._exclude_lines:
+            return None
+        extra_ignore: Set[str] = set()
+        if cs.codespell_ignore_tag in line:
+            match = cs.inline_ignore_regex.search(line)
+            if match:
+                extra_ignore = _directive_words(match)
+                if not extra_ignore:
+                    return None
+        extra_ignore |= directive_words or set()
+        if pending_ignore is not None:
+            if not pending_ignore:
+                return None
+            extra_ignore |= pending_ignore
+        return extra_ignore
+
+    def _line_matches(self, line: str) -> Iterable[Any]:
+        """Palabras candidatas de una línea, sin las de URIs ignoradas."""
+        if "*" in self._uri_ignore_words:
+            line = self._uri_regex.sub(" ", line)
+            return cs.extract_words_iter(line, self._word_regex, self._ignore_regex)
+        return cs.apply_uri_ignore_words(
+            cs.extract_words_iter(line, self._word_regex, self._ignore_regex), line,
+            self._word_regex, self._ignore_regex, self._uri_regex, self._uri_ignore_words,
+        )
+
+    def _typo(
+        self,
+        match: Any,
+        line: str,
+        ignore: Tuple[Set[str], Set[str]],
+        extra_ignore: Set[str],
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Typo de una palabra, con los filtros del CLI.
+
+        Returns:
+            (palabra, corrección), o None si la palabra no se reporta
+        """
+        ignore_words, ignore_words_cased = ignore
+        word = match.group()
+        lword = word.lower()
+        if word in ignore_words_cased or lword in extra_ignore:
+            return None
+        if not self._is_misspelling(lword, ignore_words):
+            return None
+        if self._after_escape(match, line, ignore_words):
+            return None
+        if self._options.ignore_sic and cs.sic_regex.match(line, match.end()):
+            return None
+        misspelling = self._misspellings[lword]
+        if not self._reported(misspelling):
+            return None
+        return word, cs.fix_case(word, misspelling.data)
+
+    def _after_escape(self, match: Any, line: str, ignore_words: Set[str]) -> bool:
+        """True si es una palabra válida precedida por una secuencia de escape (\\n, \\t, ...)."""
+        word = match.group()
+        before = match.start() - 1
+        return (
+            before >= 0
+            and line[before] == "\\"
+            and word.startswith(("a", "b", "f", "n", "r", "t", "v"))
+            and not self._is_misspelling(word[1:].lower(), ignore_words)
+        )
+
+    def _is_misspelling(self, lword: str, ignore_words: Set[str]) -> bool:
+        return lword in self._misspellings and lword not in ignore_words
+
+    def _reported(self, misspelling: Any) -> bool:
+        """False si `--quiet-level` oculta este tipo de corrección."""
+        quiet = self._options.quiet_level
+        if misspelling.reason:
+            return not quiet & cs.QuietLevels.DISABLED_FIXES
+        return not quiet & cs.QuietLevels.NON_AUTOMATIC_FIXES
+
+    @staticmethod
+    def _load_ignore_words(options: argparse.Namespace) -> Tuple[Set[str], Set[str]]:
+        """Palabras ignoradas de `--ignore-words-list` y de los archivos de `--ignore-words`."""
+        ignore_words, ignore_words_cased = cs.parse_ignore_words_option(
+            options.ignore_words_list
+        )
+        for ignore_file in cs.flatten_clean_comma_separated_arguments(options.ignore_words or []):
+            cs.build_ignore_words(ignore_file, ignore_words, ignore_words_cased)
+        return ignore_words, ignore_words_cased
+
+    @staticmethod
+    def _load_dictionaries(options: argparse.Namespace) -> Dict[str, Any]:
+        """Carga los diccionarios configurados (los builtin por defecto: clear,rare)."""
+        paths: List[str] = []
+        for dictionary in cs.flatten_clean_comma_separated_arguments(options.dictionary or ["-"]):
+            if dictionary == "-":
+                try:
+                    paths.extend(cs._select_builtin_dictionary(options.builtin))
+                except KeyError as e:
+                    raise ValueError(f"Unknown codespell builtin dictionary: {e.args[0]}") from e
+            elif os.path.isfile(dictionary):
+                paths.append(dictionary)
+            else:
+                raise ValueError(f"Cannot find codespell dictionary: {dictionary}")
+
+        misspellings: Dict[str, Any] = {}
+        for path in paths:
+            # Las palabras ignoradas se filtran al consultar, no al cargar: el
+            # mismo diccionario sirve para cualquier `spelling_ignore_words`
+            cs.build_dict(path, misspellings, set())
+        return misspellings
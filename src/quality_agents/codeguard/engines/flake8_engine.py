@@ -0,0 +1,166 @@
+"""
+Motor in-process de flake8.
+
+Inicializa la aplicación de flake8 (descubrimiento de plugins, lectura de
+configuración y style guide) una única vez y la reutiliza para cada archivo,
+recolectando las violaciones en memoria en lugar de parsear stdout.
+"""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# flake8 se importa al crear el motor (None = todavía no se intentó)
+_FLAKE8_DISPONIBLE: Optional[bool] = None
+
+
+def _load_flake8() -> bool:
+    """Importa flake8 la primera vez; retorna True si está disponible."""
+    global _FLAKE8_DISPONIBLE, Application, parse_args, _CollectingFormatter
+    if _FLAKE8_DISPONIBLE is None:
+        try:
+            from flake8.formatting.base import BaseFormatter
+            from flake8.main.application import Application
+            from flake8.options.parse_args import parse_args
+
+            _CollectingFormatter = _collecting_formatter(BaseFormatter)
+            _FLAKE8_DISPONIBLE = True
+        except ImportError:
+            _FLAKE8_DISPONIBLE = False
+    return _FLAKE8_DISPONIBLE
+
+
+@dataclass
+class Flake8Violation:
+    """Violación reportada por flake8 para un archivo."""
+
+    code: str
+    line_number: int
+    column_number: int
+    text: str
+
+
+def _collecting_formatter(base: type) -> type:
+    """Subclase de `BaseFormatter` (se define al importar flake8)."""
+
+    class _CollectingFormatter(base):  # type: ignore[misc,valid-type]
+        """Formatter de flake8 que acumula las violaciones en lugar de imprimirlas."""
+
+        def after_init(self) -> None:
+            self.violations: List[Any] = []
+
+        def handle(self, error: Any) -> None:
+            self.violations.append(error)
+
+        def start(self) -> None:
+            pass
+
+        def stop(self) -> None:
+            pass
+
+    return _CollectingFormatter
+
+
+class Flake8Engine:
+    """
+    Ejecuta flake8 dentro del proceso actual.
+
+    Equivale a `flake8 --max-line-length=N <archivo>`: respeta la configuración
+    de flake8 del proyecto (setup.cfg, tox.ini, .flake8) y los comentarios noqa,
+    pero sin lanzar un intérprete por archivo.
+
+    La aplicación de flake8 no es thread-safe, por lo que cada chequeo se
+    serializa con un lock.
+
+    Attributes:
+        max_line_length: Longitud máxima de línea aplicada (E501).
+
+    Example:
+        >>> engine = Flake8Engine(max_line_length=100)
+        >>> for v in engine.check_file(Path("app.py")):
+        ...     print(v.line_number, v.code, v.text)
+    """
+
+    def __init__(self, max_line_length: int = 100) -> None:
+        """
+        Carga plugins y opciones de flake8.
+
+        Args:
+            max_line_length: Longitud máxima de línea (CodeGuardConfig.max_line_length).
+
+        Raises:
+            ImportError: Si flake8 no está instalado.
+        """
+        if not _load_flake8():
+            raise ImportError("flake8 not installed. Run: pip install flake8")
+
+        self.max_line_length = max_line_length
+        self._lock = threading.Lock()
+
+        # Los workers de flake8 (modo multi-archivo con spawn) re-parsean este argv
+        argv = [f"--max-line-length={max_line_length}"]
+        app = Application()
+        app.plugins, app.options = parse_args(argv)
+        app.formatter = _CollectingFormatter(app.options)
+        app.make_guide()
+        app.make_file_checker_manager(argv)
+        self._app = app
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si flake8 puede importarse en este entorno."""
+        return _load_flake8()
+
+    def check_file(self, file_path: Path) -> List[Flake8Violation]:
+        """
+        Ejecuta todos los plugins de flake8 sobre un archivo.
+
+        Args:
+            file_path: Ruta al archivo Python.
+
+        Returns:
+            Violaciones ordenadas por línea y columna (ya filtradas por noqa,
+            select/ignore y la configuración del proyecto).
+        """
+        return self.check_files([file_path])[file_path]
+
+    def check_files(self, file_paths: List[Path]) -> Dict[Path, List[Flake8Violation]]:
+        """
+        Ejecuta flake8 una sola vez sobre varios archivos.
+
+        Con más de un archivo flake8 reparte el trabajo en su propio pool de
+        procesos (respetando --jobs de la configuración del proyecto).
+
+        Args:
+            file_paths: Rutas a los archivos Python.
+
+        Returns:
+            Diccionario {archivo: violaciones}, con una entrada por archivo.
+        """
+        by_name: Dict[str, Path] = {str(f): f for f in file_paths}
+        violations: Dict[Path, List[Flake8Violation]] = {f: [] for f in file_paths}
+
+        with self._lock:
+            formatter = self._app.formatter
+            formatter.violations = []
+            self._app.options.filenames = list(by_name)
+            self._app.run_checks()
+            self._app.report_errors()
+            found = formatter.violations
+            formatter.violations = []
+
+        for v in found:
+            file_path = by_name.get(v.filename)
+            if file_path is None:
+                continue
+            violations[file_path].append(
+                Flake8Violation(
+                    code=v.code,
+                    line_number=v.line_number,
+                    column_number=v.column_number,
+                    text=v.text,
+                )
+            )
+
+        return violations
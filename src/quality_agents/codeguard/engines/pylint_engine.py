@@ -0,0 +1,294 @@
+"""
+Motor in-process de pylint compartido por PylintCheck e ImportCheck.
+
+Ambos checks analizaban el mismo archivo con dos invocaciones de pylint
+(score completo y `unused-import`), cargando astroid e infiriendo el módulo
+dos veces. El motor ejecuta pylint una sola vez por archivo, guarda el flujo
+de mensajes y el score por módulo, y cada check lee de ese mismo reporte.
+
+La caché de astroid (`astroid.MANAGER`) se mantiene entre corridas, de modo
+que los módulos importados por varios archivos del changeset se infieren una
+sola vez; antes de cada corrida se descartan los módulos modificados.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# pylint y astroid se importan al usar el motor: cuestan ~85 ms que
+# `codeguard` no debe pagar si PylintCheck/ImportCheck no se ejecutan
+# in-process. None = todavía no se intentó importar.
+_PYLINT_DISPONIBLE: Optional[bool] = None
+
+
+def _load_pylint() -> bool:
+    """Importa pylint y astroid la primera vez; retorna True si están disponibles."""
+    global _PYLINT_DISPONIBLE, astroid, Run, _CollectingReporter
+    if _PYLINT_DISPONIBLE is None:
+        try:
+            import astroid
+            from pylint.lint import Run
+            from pylint.reporters.base_reporter import BaseReporter
+
+            _CollectingReporter = _collecting_reporter(BaseReporter)
+            _PYLINT_DISPONIBLE = True
+        except ImportError:
+            _PYLINT_DISPONIBLE = False
+    return _PYLINT_DISPONIBLE
+
+
+logger = logging.getLogger(__name__)
+
+# Mensajes que dependen del conjunto de archivos analizados juntos: se
+# deshabilitan para que el score de cada archivo sea el mismo que al
+# analizarlo solo.
+_CROSS_FILE_MESSAGES = "duplicate-code,cyclic-import"
+
+# Reportes memorizados (por ruta, mtime y tamaño) antes de descartar los más viejos
+_MAX_MEMO_ENTRIES = 4096
+
+
+@dataclass
+class PylintMessage:
+    """Mensaje de pylint para un archivo."""
+
+    msg_id: str
+    symbol: str
+    line: int
+    column: int
+    text: str
+
+
+@dataclass
+class PylintFileReport:
+    """Resultado de pylint para un archivo: mensajes y score del módulo."""
+
+    messages: List[PylintMessage] = field(default_factory=list)
+    score: Optional[float] = None  # None si el módulo no tiene sentencias evaluables
+
+    def by_symbol(self, symbol: str) -> List[PylintMessage]:
+        """Mensajes con el símbolo dado (ej: "unused-import")."""
+        return [m for m in self.messages if m.symbol == symbol]
+
+
+def _collecting_reporter(base: type) -> type:
+    """Subclase de `BaseReporter` (se define al importar pylint)."""
+
+    class _CollectingReporter(base):  # type: ignore[misc,valid-type]
+        """Reporter de pylint que acumula mensajes y el mapeo módulo → archivo."""
+
+        name = "codeguard-collect"
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.messages: List[Any] = []
+            self.modules: Dict[str, str] = {}
+
+        def handle_message(self, msg: Any) -> None:
+            self.messages.append(msg)
+
+        def on_set_current_module(self, module: str, filepath: Optional[str]) -> None:
+            if filepath:
+                self.modules[module] = filepath
+
+        def display_reports(self, layout: Any) -> None:
+            pass
+
+        def display_messages(self, layout: Any) -> None:
+            pass
+
+        def _display(self, layout: Any) -> None:
+            pass
+
+    return _CollectingReporter
+
+
+class PylintEngine:
+    """
+    Ejecuta pylint dentro del proceso actual y memoriza el reporte por archivo.
+
+    Equivale a `pylint --score=y <archivos>` con la configuración de pylint
+    del proyecto (pylintrc, pyproject.toml), más `unused-import` siempre
+    habilitado para ImportCheck. El score de cada archivo se calcula con la
+    fórmula `evaluation` de pylint sobre las estadísticas de su módulo, igual
+    que al analizarlo solo.
+
+    pylint no es thread-safe: las corridas se serializan con un lock. Un
+    segundo check que pide los mismos archivos espera la corrida en curso y
+    lee el reporte memorizado.
+
+    Example:
+        >>> engine = PylintEngine.shared()
+        >>> report = engine.check_files([Path("app.py")])[Path("app.py")]
+        >>> report.score, report.by_symbol("unused-import")
+    """
+
+    _shared: Optional["PylintEngine"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Raises:
+            ImportError: Si pylint no está instalado.
+        """
+        if not _load_pylint():
+            raise ImportError("pylint not installed. Run: pip install pylint")
+
+        self._lock = threading.Lock()
+        self._memo: Dict[Tuple[str, int, int], PylintFileReport] = {}
+        self._last_run = time.time()
+
+    @classmethod
+    def shared(cls) -> "PylintEngine":
+        """Instancia compartida por todos los checks del proceso."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def forget_shared(cls) -> None:
+        """
+        Descarta los reportes memorizados de la instancia compartida (si existe).
+
+        El memo se indexa por el archivo, pero el reporte depende también de
+        los módulos que importa: un proceso de larga vida (`codeguard daemon`)
+        lo descarta en cada pedido para no mostrar resultados de otra versión
+        del proyecto. Dentro de una corrida el memo sigue compartiéndose entre
+        Pylint e ImportCheck.
+        """
+        with cls._shared_lock:
+            engine = cls._shared
+        if engine is not None:
+            with engine._lock:
+                engine._memo.clear()
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si pylint puede importarse en este entorno."""
+        return _load_pylint()
+
+    def check_files(self, file_paths: List[Path], jobs: int = 1) -> Dict[Path, PylintFileReport]:
+        """
+        Obtiene el reporte de pylint de cada archivo, analizando solo los que faltan.
+
+        Args:
+            file_paths: Rutas a los archivos Python
+            jobs: Procesos de pylint (`-j`; 0 = CPUs disponibles)
+
+        Returns:
+            Diccionario {archivo: reporte}, con una entrada por archivo
+        """
+        with self._lock:
+            keys = {f: self._memo_key(f) for f in file_paths}
+            pending = [f for f in file_paths if keys[f] not in self._memo]
+            # Un módulo tapado por un paquete homónimo (app.py junto a app/)
+            # registraría su AST bajo el nombre del paquete: se analiza en una
+            # corrida propia para no contaminar la inferencia de los demás.
+            regular = [f for f in pending if not self._is_shadowed(f)]
+            groups = ([regular] if regular else []) + [
+                [f] for f in pending if self._is_shadowed(f)
+            ]
+            for group in groups:
+                reports = self._run(group, jobs)
+                for f in group:
+                    self._remember(keys[f], reports.get(f, PylintFileReport()))
+            return {f: self._memo.get(keys[f], PylintFileReport()) for f in file_paths}
+
+    def _run(self, file_paths: List[Path], jobs: int) -> Dict[Path, PylintFileReport]:
+        """Ejecuta una corrida de pylint sobre los archivos."""
+        self._evict_stale_modules(file_paths)
+        self._last_run = time.time()
+        reporter = _CollectingReporter()
+        args = [
+            "--score=y",
+            f"--jobs={jobs}",
+            f"--disable={_CROSS_FILE_MESSAGES}",
+            "--enable=unused-import",
+            "--persistent=n",
+            "--clear-cache-post-run=n",
+        ] + [str(f) for f in file_paths]
+
+        try:
+            run = Run(args, reporter=reporter, exit=False)
+        except SystemExit as e:
+            # pylint sale con SystemExit ante errores de configuración
+            raise RuntimeError(f"pylint exited with code {e.code}") from e
+
+        linter = run.linter
+        index = {f.resolve(): f for f in file_paths}
+        reports: Dict[Path, PylintFileReport] = {f: PylintFileReport() for f in file_paths}
+
+        for module, filepath in reporter.modules.items():
+            file_path = index.get(Path(filepath).resolve())
+            if file_path is None:
+                continue
+            stats = linter.stats.by_module.get(module)
+            if stats and stats["statement"]:
+                try:
+                    # Misma fórmula configurable que usa pylint para el score global
+                    note = eval(linter.config.evaluation, {}, dict(stats))  # nosec B307
+                    reports[file_path].score = round(note, 2)
+                except Exception as e:
+                    logger.debug(f"No se pudo evaluar el score de {file_path}: {e}")
+
+        for msg in reporter.messages:
+            file_path = index.get(Path(msg.abspath).resolve()) if msg.abspath else None
+            if file_path is None:
+                continue
+            reports[file_path].messages.append(
+                PylintMessage(
+                    msg_id=msg.msg_id,
+                    symbol=msg.symbol,
+                    line=msg.line,
+                    column=msg.column,
+                    text=msg.msg,
+                )
+            )
+
+        return reports
+
+    @staticmethod
+    def _is_shadowed(file_path: Path) -> bool:
+        """True si el archivo tiene al lado un paquete con su mismo nombre."""
+        return (file_path.parent / file_path.stem / "__init__.py").is_file()
+
+    def _evict_stale_modules(self, file_paths: List[Path]) -> None:
+        """
+        Quita de la caché de astroid los módulos que no deben reutilizarse.
+
+        astroid devuelve el AST cacheado de un nombre de módulo sin mirar si el
+        archivo cambió. Se descartan los archivos a analizar, los módulos
+        tapados por un paquete y los modificados desde la corrida anterior.
+        """
+        targets = {str(f.resolve()) for f in file_paths}
+        cache = astroid.MANAGER.astroid_cache
+        for name, module in list(cache.items()):
+            if not module.file:
+                continue
+            module_file = Path(module.file)
+            try:
+                modified = module_file.stat().st_mtime >= self._last_run
+            except OSError:
+                modified = True
+            if modified or self._is_shadowed(module_file) or str(module_file.resolve()) in targets:
+                del cache[name]
+
+    @staticmethod
+    def _memo_key(file_path: Path) -> Tuple[str, int, int]:
+        """Clave de memo: ruta absoluta, mtime y tamaño (cambia si el archivo cambia)."""
+        try:
+            stat = file_path.stat()
+            return (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return (str(file_path), -1, -1)
+
+    def _remember(self, key: Tuple[str, int, int], report: PylintFileReport) -> None:
+        """Guarda un reporte, descartando los más viejos si se supera el límite."""
+        if len(self._memo) >= _MAX_MEMO_ENTRIES:
+            for old_key in list(self._memo)[: _MAX_MEMO_ENTRIES // 4]:
+                del self._memo[old_key]
+        self._memo[key] = report
@@ -0,0 +1,353 @@
+"""
+Motor in-process de vulture con alcance de proyecto.
+
+vulture decide si un nombre está sin uso cruzando las definiciones de un
+archivo con los usos de todos los demás: analizado archivo por archivo
+reporta como muerto todo lo que solo se usa desde otro módulo. El motor
+escanea cada archivo del proyecto con la API de vulture y guarda su tabla de
+definiciones y su conjunto de nombres usados. Los hallazgos de un archivo se
+calculan contra los usos de todo el proyecto.
+
+Las tablas se persisten en `.quality_control/cache/vulture/index.json`: en
+las corridas siguientes solo se vuelven a escanear los archivos que
+cambiaron.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pkgutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# vulture se importa al usar el motor (None = todavía no se intentó)
+_VULTURE_DISPONIBLE: Optional[bool] = None
+
+
+def _load_vulture() -> bool:
+    """Importa vulture la primera vez; retorna True si está disponible."""
+    global _VULTURE_DISPONIBLE, make_config, Item, _QuietVulture
+    if _VULTURE_DISPONIBLE is None:
+        try:
+            from vulture.config import make_config
+            from vulture.core import Item, Vulture
+
+            _QuietVulture = _quiet_vulture(Vulture)
+            _VULTURE_DISPONIBLE = True
+        except ImportError:
+            _VULTURE_DISPONIBLE = False
+    return _VULTURE_DISPONIBLE
+
+
+logger = logging.getLogger(__name__)
+
+# Versión del formato del índice; cambiarla invalida los índices guardados
+_INDEX_FORMAT = 1
+
+# Lista de definiciones de vulture para cada tipo de Item. El código
+# inalcanzable queda fuera, igual que en la salida que parsea DeadCodeCheck.
+_DEFINED_LISTS = {
+    "attribute": "defined_attrs",
+    "class": "defined_classes",
+    "function": "defined_funcs",
+    "import": "defined_imports",
+    "method": "defined_methods",
+    "property": "defined_props",
+    "variable": "defined_vars",
+}
+
+
+@dataclass
+class VultureFinding:
+    """Código sin uso reportado por vulture para un archivo."""
+
+    line_number: int
+    kind: str
+    name: str
+    confidence: int
+
+
+def _quiet_vulture(base: type) -> type:
+    """Subclase de `Vulture` (se define al importar vulture)."""
+
+    class _QuietVulture(base):  # type: ignore[misc,valid-type]
+        """Vulture sin salida por consola (errores de sintaxis, modo verbose)."""
+
+        def _log(self, *args: Any, file: Any = None, force: bool = False) -> None:
+            pass
+
+    return _QuietVulture
+
+
+@dataclass
+class _FileTables:
+    """Definiciones y nombres usados de un archivo, tal como los deja `Vulture.scan`."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    definitions: List[list]  # [tipo, nombre, primera línea, última línea, mensaje, confianza]
+    used_names: List[str]
+
+
+class VultureEngine:
+    """
+    Índice de definiciones y usos de vulture para todo un proyecto.
+
+    Example:
+        >>> engine = VultureEngine(Path(".quality_control/cache/vulture"))
+        >>> findings = engine.check_files(project_files, [Path("app.py")], min_confidence=60)
+        >>> for f in findings[Path("app.py")]:
+        ...     print(f.line_number, f.kind, f.name)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ignore_names: Optional[List[str]] = None,
+        ignore_decorators: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Args:
+            cache_dir: Directorio donde persistir el índice (None = solo en memoria)
+            ignore_names: Patrones de nombres a ignorar (`[tool.vulture] ignore_names`)
+            ignore_decorators: Decoradores a ignorar (`[tool.vulture] ignore_decorators`)
+
+        Raises:
+            ImportError: Si vulture no está instalado.
+        """
+        if not _load_vulture():
+            raise ImportError("vulture not installed. Run: pip install vulture")
+
+        self.cache_dir = cache_dir
+        self.ignore_names = list(ignore_names or [])
+        self.ignore_decorators = list(ignore_decorators or [])
+        self._lock = threading.Lock()
+        self._tables: Dict[str, _FileTables] = {}
+        self._whitelists: Dict[str, Set[str]] = {}
+        self._loaded = False
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            self._vulture_version = version("vulture")
+        except PackageNotFoundError:
+            self._vulture_version = "unknown"
+
+    @classmethod
+    def for_project(cls, project_root: Path, cache_dir: Optional[Path] = None) -> "VultureEngine":
+        """
+        Crea el motor con la configuración `[tool.vulture]` del proyecto.
+
+        Args:
+            project_root: Raíz del proyecto (donde buscar pyproject.toml)
+            cache_dir: Directorio donde persistir el índice (None = solo en memoria)
+        """
+        if not _load_vulture():
+            raise ImportError("vulture not installed. Run: pip install vulture")
+        pyproject = project_root / "pyproject.toml"
+        config = make_config(["--config", str(pyproject), str(project_root)])
+        return cls(cache_dir, config["ignore_names"], config["ignore_decorators"])
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si vulture puede importarse en este entorno."""
+        return _load_vulture()
+
+    def check_files(
+        self, project_files: List[Path], file_paths: List[Path], min_confidence: int = 60
+    ) -> Dict[Path, List[VultureFinding]]:
+        """
+        Reporta el código sin uso de los archivos pedidos, con alcance de proyecto.
+
+        Args:
+            project_files: Archivos Python del proyecto (definen el universo de usos)
+            file_paths: Archivos cuyos hallazgos se reportan
+            min_confidence: Confianza mínima de vulture (0-100)
+
+        Returns:
+            Diccionario {archivo: hallazgos}, con una entrada por archivo pedido
+        """
+        all_files = {self._key(f): f for f in list(project_files) + list(file_paths)}
+
+        with self._lock:
+            self._load()
+            changed = self._refresh(all_files)
+            if changed:
+                self._save()
+            vulture = self._merged_vulture({self._key(f) for f in file_paths})
+            unused = vulture.get_unused_code(min_confidence=min_confidence)
+
+        findings: Dict[Path, List[VultureFinding]] = {f: [] for f in file_paths}
+        by_key = {self._key(f): f for f in file_paths}
+        for item in unused:
+            file_path = by_key.get(str(item.filename))
+            if file_path is None:
+                continue
+            findings[file_path].append(
+                VultureFinding(
+                    line_number=item.first_lineno,
+                    kind=item.typ,
+                    name=item.name,
+                    confidence=item.confidence,
+                )
+            )
+        return findings
+
+    def _refresh(self, files: Dict[str, Path]) -> bool:
+        """
+        Escanea los archivos nuevos o modificados y olvida los que ya no están.
+
+        Returns:
+            True si el índice cambió
+        """
+        changed = False
+        for key in set(self._tables) - set(files):
+            del self._tables[key]
+            changed = True
+
+        for key, file_path in files.items():
+            try:
+                stat = file_path.stat()
+            except OSError:
+                if self._tables.pop(key, None) is not None:
+                    changed = True
+                continue
+
+            tables = self._tables.get(key)
+            if tables and (tables.mtime_ns, tables.size) == (stat.st_mtime_ns, stat.st_size):
+                continue
+
+            try:
+                content = file_path.read_bytes()
+            except OSError:
+                continue
+            content_hash = hashlib.sha256(content).hexdigest()
+            if tables and tables.content_hash == content_hash:
+                # Mismo contenido (ej: checkout): solo se actualiza la fecha
+                tables.mtime_ns, tables.size = stat.st_mtime_ns, stat.st_size
+            else:
+                self._tables[key] = self._scan(key, content, stat, content_hash)
+            changed = True
+
+        return changed
+
+    def _scan(
+        self, key: str, content: bytes, stat: os.stat_result, content_hash: str
+    ) -> _FileTables:
+        """Escanea un archivo con una instancia propia de Vulture."""
+        vulture = self._new_vulture()
+        try:
+            source = content.decode("utf-8")
+        except UnicodeDecodeError:
+            source = ""
+        vulture.scan(source, filename=key)
+
+        definitions = [
+            [
+                item.typ, item.name, item.first_lineno, item.last_lineno,
+                item.message, item.confidence,
+            ]
+            for attr in _DEFINED_LISTS.values()
+            for item in getattr(vulture, attr)
+        ]
+        return _FileTables(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash,
+            definitions=definitions,
+            used_names=sorted(vulture.used_names),
+        )
+
+    def _merged_vulture(self, targets: Set[str]) -> Any:
+        """
+        Arma una instancia de Vulture con los usos de todo el proyecto.
+
+        Solo se cargan las definiciones de los archivos pedidos: el cálculo de
+        código sin uso (`get_unused_code`) sigue siendo el de vulture.
+        """
+        vulture = self._new_vulture()
+        import_names: Set[str] = set()
+        for key, tables in self._tables.items():
+            vulture.used_names.update(tables.used_names)
+            for typ, name, first, last, message, confidence in tables.definitions:
+                if typ == "import":
+                    import_names.add(name)
+                if key in targets:
+                    item = Item(name, typ, Path(key), first, last, message, confidence)
+                    getattr(vulture, _DEFINED_LISTS[typ]).append(item)
+
+        # Whitelists incluidas en vulture para módulos importados (igual que `scavenge`)
+        for name in import_names:
+            vulture.used_names.update(self._whitelist_names(name))
+        return vulture
+
+    def _whitelist_names(self, import_name: str) -> Set[str]:
+        """Nombres usados por la whitelist de vulture para un módulo importado."""
+        if import_name not in self._whitelists:
+            names: Set[str] = set()
+            try:
+                data = pkgutil.get_data("vulture", f"whitelists/{import_name}_whitelist.py")
+            except OSError:
+                data = None
+            if data:
+                whitelist = self._new_vulture()
+                whitelist.scan(data.decode("utf-8"), filename=f"{import_name}_whitelist.py")
+                names = set(whitelist.used_names)
+            self._whitelists[import_name] = names
+        return self._whitelists[import_name]
+
+    def _new_vulture(self) -> Any:
+        return _QuietVulture(
+            ignore_names=self.ignore_names, ignore_decorators=self.ignore_decorators
+        )
+
+    def _settings(self) -> str:
+        """Firma de lo que afecta a las tablas: si cambia, se re-escanea todo."""
+        return json.dumps([self._vulture_version, self.ignore_names, self.ignore_decorators])
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        """Clave de un archivo en el índice (ruta absoluta)."""
+        return str(file_path.resolve())
+
+    def _index_path(self) -> Optional[Path]:
+        return self.cache_dir / "index.json" if self.cache_dir else None
+
+    def _load(self) -> None:
+        """Carga el índice persistido (una vez por instancia)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        index_path = self._index_path()
+        if index_path is None:
+            return
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if data.get("format") != _INDEX_FORMAT or data.get("settings") != self._settings():
+                return
+            self._tables = {key: _FileTables(**entry) for key, entry in data["files"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            self._tables = {}
+
+    def _save(self) -> None:
+        """Persiste el índice con escritura atómica."""
+        index_path = self._index_path()
+        if index_path is None:
+            return
+        payload = {
+            "format": _INDEX_FORMAT,
+            "settings": self._settings(),
+            "files": {key: tables.__dict__ for key, tables in self._tables.items()},
+        }
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump(payload, tmp)
+            os.replace(tmp_name, index_path)
+        except OSError as e:
+            logger.debug(f"No se pudo guardar el índice de vulture: {e}")
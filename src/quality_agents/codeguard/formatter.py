@@ -10,7 +10,7 @@ import json
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -18,7 +18,7 @@ from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 
-from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.models import CheckResult, Severity
 
 
 def format_results(
@@ -26,6 +26,7 @@ def format_results(
     elapsed: float,
     total_files: int = 0,
     checks_executed: int = 0,
+    skipped: Optional[Sequence[Tuple[Path, str]]] = None,
 ) -> None:
     """
     Formatea y muestra resultados usando Rich.
@@ -35,6 +36,7 @@ def format_results(
         elapsed: Tiempo de ejecución en segundos
         total_files: Número total de archivos analizados
         checks_executed: Número de checks ejecutados
+        skipped: Pares (archivo, check) omitidos por agotarse el presupuesto de tiempo
 
     Example:
         >>> results = [CheckResult(...), CheckResult(...)]
@@ -48,6 +50,10 @@ def format_results(
     # Estadísticas generales
     _print_stats(console, results, elapsed, total_files, checks_executed)
 
+    # Reporte parcial: verificaciones que no entraron en el presupuesto
+    if skipped:
+        _print_skipped(console, skipped)
+
     # Si no hay resultados, mostrar mensaje de éxito y terminar
     if not results:
         _print_success(console)
@@ -129,6 +135,25 @@ def _print_stats(
     console.print()
 
 
+def _print_skipped(console: Console, skipped: Sequence[Tuple[Path, str]]) -> None:
+    """Imprime los pares (archivo, check) omitidos por presupuesto de tiempo."""
+    checks_by_module: Dict[str, List[str]] = defaultdict(list)
+    for file_path, check_name in skipped:
+        checks_by_module[_module_name(str(file_path))].append(check_name)
+
+    lines = [
+        f"• [bold]{module}[/]: {', '.join(names)}"
+        for module, names in sorted(checks_by_module.items())
+    ]
+    console.print(Panel(
+        "\n".join(lines),
+        title=f"⏱  Presupuesto de tiempo agotado: {len(skipped)} verificaciones omitidas",
+        border_style="yellow",
+        padding=(0, 2),
+    ))
+    console.print()
+
+
 def _print_success(console: Console) -> None:
     """Imprime mensaje de éxito cuando no hay problemas."""
     success_text = Text()
@@ -269,6 +294,7 @@ def format_json(
     elapsed: float = 0.0,
     total_files: int = 0,
     checks_executed: int = 0,
+    skipped: Optional[Sequence[Tuple[Path, str]]] = None,
 ) -> str:
     """
     Formatea resultados en formato JSON estructurado.
@@ -278,6 +304,8 @@ def format_json(
         elapsed: Tiempo de ejecución en segundos
         total_files: Número total de archivos analizados
         checks_executed: Número de checks ejecutados
+        skipped: Pares (archivo, check) omitidos por agotarse el presupuesto de
+            tiempo; si hay, se agregan `summary.skipped` y la lista `skipped`
 
     Returns:
         String con JSON formateado (pretty-printed)
@@ -339,4 +367,10 @@ def format_json(
             for mod, mod_results in sorted(by_mod.items())
         }
 
+    if skipped:
+        output["summary"]["skipped"] = len(skipped)
+        output["skipped"] = [
+            {"file": str(file_path), "check": check_name} for file_path, check_name in skipped
+        ]
+
     return json.dumps(output, indent=2, ensure_ascii=False)
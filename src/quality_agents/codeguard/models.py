@@ -0,0 +1,28 @@
+"""
+Tipos de datos de CodeGuard.
+
+Define Severity y CheckResult, los resultados que producen los checks. Viven
+fuera de agent.py para que los módulos que el agente importa (caché,
+contenido staged, formatter, checks) no dependan de él.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+
+class Severity(Enum):
+    """Niveles de severidad para los resultados de verificación."""
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+@dataclass
+class CheckResult:
+    """Resultado de una verificación individual."""
+    check_name: str
+    severity: Severity
+    message: str
+    file_path: Optional[str] = None
+    line_number: Optional[int] = None
@@ -2,43 +2,57 @@
 Orquestador de checks para CodeGuard.
 
 Este módulo implementa la selección inteligente de checks basada en contexto,
-usando auto-discovery para encontrar todos los checks disponibles.
+sobre el registro de plugins (`codeguard/registry.py` y entry points
+`quality_agents.checks`): la selección usa la metadata estática y solo se
+importan los checks seleccionados.
 
 Fecha de creación: 2026-02-03
 Ticket: 1.5.2
 Basado en: docs/agentes/decision_arquitectura_checks_modulares.md
 """
 
-import importlib
-import inspect
 import logging
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 from quality_agents.codeguard.config import CodeGuardConfig
+from quality_agents.codeguard.durations import DurationModel, count_lines
+from quality_agents.codeguard.registry import BUILTIN_CHECKS
+from quality_agents.shared.plugins import CHECKS_GROUP, PluginSet, PluginSpec
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 logger = logging.getLogger(__name__)
 
+# En pre-commit, un check de prioridad baja con `dynamic_duration` entra igual
+# si es así de rápido (ej: TypeCheck con el daemon de mypy caliente)
+PRECOMMIT_INSTANT_DURATION = 0.25
+
+# Presupuesto default de pre-commit (segundos). CodeGuard.run lo aplica también
+# como deadline de toda la corrida.
+PRECOMMIT_TIME_BUDGET = 5.0
+
 
 class CheckOrchestrator:
     """
     Orquesta la ejecución de checks basándose en contexto.
 
     El orquestador es responsable de:
-    1. Auto-discovery de checks disponibles (busca clases que hereden de Verifiable)
+    1. Registro de checks disponibles (metadata estática, importación bajo demanda)
     2. Selección contextual de qué checks ejecutar según análisis type
     3. Optimización de tiempo (respeta presupuestos)
     4. Ordenamiento por prioridad
 
     Estrategias de selección:
-    - pre-commit: Solo checks rápidos (<2s) y alta prioridad (1-3)
+    - pre-commit: Solo checks rápidos (<2s) y alta prioridad (1-3), más los
+      checks casi instantáneos de cualquier prioridad
     - pr-review: Todos los checks habilitados
     - full: Todos los checks
     - ai-guided: IA sugiere checks relevantes (futuro)
 
     Attributes:
         config: Configuración de CodeGuard
-        checks: Lista de checks descubiertos automáticamente
+        plugins: Registro de checks (specs e instancias ya creadas)
+        checks: Todos los checks registrados, instanciados
+        durations: Duraciones medidas de los checks (None = `estimated_duration` fijo)
 
     Example:
         >>> config = CodeGuardConfig()
@@ -52,71 +66,35 @@ class CheckOrchestrator:
         >>> # Ejecutar checks seleccionados
     """
 
-    def __init__(self, config: CodeGuardConfig):
+    def __init__(self, config: CodeGuardConfig, durations: Optional[DurationModel] = None):
         """
         Inicializa el orquestador.
 
+        Los checks no se importan acá: el registro (checks propios y entry
+        points `quality_agents.checks`) se lee en la primera selección y cada
+        check se importa cuando se lo selecciona por primera vez.
+
         Args:
             config: Configuración de CodeGuard con umbrales y checks habilitados
+            durations: Modelo de duraciones aprendidas para el presupuesto de
+                pre-commit (None = `estimated_duration` de cada check)
         """
         self.config = config
-        self.checks = self._discover_checks()
-        logger.info(f"Orquestador inicializado con {len(self.checks)} checks descubiertos")
-
-    def _discover_checks(self) -> List[Verifiable]:
-        """
-        Auto-discovery de checks en codeguard.checks.
-
-        Busca todas las clases que heredan de Verifiable en el módulo checks,
-        las instancia y retorna la lista.
-
-        Returns:
-            Lista de instancias de checks descubiertos
-
-        Example:
-            Si codeguard/checks/ contiene:
-            - PEP8Check
-            - PylintCheck
-            - SecurityCheck
+        self.durations = durations
+        # Líneas del archivo del último contexto estimado (se cuentan una vez por archivo)
+        self._line_count: Optional[Tuple[ExecutionContext, int]] = None
+        self.plugins: PluginSet[Verifiable] = PluginSet(
+            CHECKS_GROUP, BUILTIN_CHECKS, kind="check"
+        )
 
-            Retorna: [PEP8Check(), PylintCheck(), SecurityCheck()]
-        """
-        checks = []
-
-        try:
-            # Importar el módulo checks
-            checks_module = importlib.import_module("quality_agents.codeguard.checks")
-
-            # Iterar sobre todos los atributos del módulo
-            for name in dir(checks_module):
-                obj = getattr(checks_module, name)
-
-                # Verificar que sea una clase que hereda de Verifiable
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, Verifiable)
-                    and obj is not Verifiable  # Excluir la clase base
-                ):
-                    try:
-                        # Instanciar el check
-                        check_instance = obj()
-                        checks.append(check_instance)
-                        logger.debug(f"Check descubierto: {check_instance.name}")
-                    except Exception as e:
-                        logger.warning(
-                            f"Error al instanciar check {name}: {e}. Saltando."
-                        )
-
-        except ImportError:
-            # El módulo checks aún no existe (normal en Fase 1.5)
-            logger.info(
-                "Módulo 'codeguard.checks' no encontrado. "
-                "No hay checks disponibles todavía."
-            )
-        except Exception as e:
-            logger.error(f"Error durante auto-discovery de checks: {e}")
+    @property
+    def checks(self) -> List[Verifiable]:
+        """Todos los checks registrados (importa los que falten)."""
+        return self.plugins.load()
 
-        return checks
+    @checks.setter
+    def checks(self, checks: List[Verifiable]) -> None:
+        self.plugins.replace(checks)
 
     def select_checks(self, context: ExecutionContext) -> List[Verifiable]:
         """
@@ -143,11 +121,15 @@ class CheckOrchestrator:
             >>> selected = orchestrator.select_checks(context)
             >>> # Retorna solo checks rápidos y críticos
         """
-        # Paso 1: Filtrar checks que deben ejecutarse según su lógica should_run()
-        candidates = [check for check in self.checks if check.should_run(context)]
+        # Paso 1: Descartar por metadata estática (sin importar el check) y
+        # filtrar los que deben ejecutarse según su lógica should_run()
+        candidates = [
+            check for check in self.plugins.load(where=lambda p: self._may_run(p, context))
+            if check.should_run(context)
+        ]
 
         logger.debug(
-            f"Candidatos después de should_run(): {len(candidates)}/{len(self.checks)}"
+            f"Candidatos después de should_run(): {len(candidates)}/{len(self.plugins)}"
         )
 
         # Paso 2: Aplicar estrategia según tipo de análisis
@@ -179,8 +161,11 @@ class CheckOrchestrator:
         Estrategia pre-commit: solo checks rápidos y críticos.
 
         Criterios:
-        - Prioridad: 1-3 (alta)
-        - Duración: Respeta presupuesto de tiempo (default 5s)
+        - Prioridad: 1-3 (alta), o cualquiera con `dynamic_duration` cuya
+          duración estimada no supere PRECOMMIT_INSTANT_DURATION (ej:
+          TypeCheck con el daemon de mypy caliente)
+        - Duración: Respeta presupuesto de tiempo (default 5s), con la duración
+          aprendida para el tamaño del archivo si hay mediciones
         - Selección greedy por prioridad hasta agotar presupuesto
 
         Args:
@@ -192,7 +177,7 @@ class CheckOrchestrator:
         """
         # Presupuesto default para pre-commit: 5 segundos
         if context.time_budget is None:
-            context.time_budget = 5.0
+            context.time_budget = PRECOMMIT_TIME_BUDGET
 
         selected = []
         time_used = 0.0
@@ -201,27 +186,29 @@ class CheckOrchestrator:
         sorted_candidates = sorted(candidates, key=lambda c: c.priority)
 
         for check in sorted_candidates:
-            # Solo alta prioridad (1-3)
-            if check.priority > 3:
+            duration = self.estimated_duration(check, context)
+
+            # Solo alta prioridad (1-3), salvo checks dinámicos casi instantáneos
+            if not _fits_precommit(check, duration):
                 logger.debug(
                     f"Check {check.name} saltado (prioridad {check.priority} > 3)"
                 )
                 continue
 
             # Verificar si cabe en el presupuesto
-            if time_used + check.estimated_duration <= context.time_budget:
+            if time_used + duration <= context.time_budget:
                 selected.append(check)
-                time_used += check.estimated_duration
+                time_used += duration
                 logger.debug(
                     f"Check {check.name} seleccionado "
                     f"(prioridad={check.priority}, "
-                    f"duración={check.estimated_duration}s, "
+                    f"duración={duration:.2f}s, "
                     f"tiempo usado={time_used:.1f}s)"
                 )
             else:
                 logger.debug(
                     f"Check {check.name} saltado por presupuesto "
-                    f"(necesita {check.estimated_duration}s, "
+                    f"(necesita {duration:.2f}s, "
                     f"disponible {context.time_budget - time_used:.1f}s)"
                 )
                 # Ya no hay tiempo, terminar
@@ -234,6 +221,84 @@ class CheckOrchestrator:
 
         return selected
 
+    def deferred_checks(
+        self, context: ExecutionContext, selected: List[Verifiable]
+    ) -> List[Verifiable]:
+        """
+        Checks aplicables al archivo que la selección dejó afuera.
+
+        En pre-commit son los de prioridad > 3 o fuera del presupuesto (ej:
+        Pylint, TypeCheck, DeadCode): con `execution.background` CodeGuard los
+        analiza en segundo plano.
+
+        Args:
+            context: Contexto de ejecución del archivo
+            selected: Checks seleccionados por `select_checks`
+
+        Returns:
+            Checks que pasan should_run() y no fueron seleccionados, por prioridad
+        """
+        chosen = {check.name for check in selected}
+        deferred = [
+            check for check in self.plugins.load(
+                where=lambda p: p.name not in chosen and _is_enabled(p, context)
+            )
+            if check.should_run(context)
+        ]
+        deferred.sort(key=lambda c: c.priority)
+        return deferred
+
+    def estimated_duration(self, check: Any, context: ExecutionContext) -> float:
+        """
+        Duración estimada de un check sobre el archivo del contexto.
+
+        Con mediciones previas del check (`execution.learn_durations`) usa el
+        modelo aprendido `a + b·líneas`; si no, `check.estimated_duration`.
+        Los checks con `dynamic_duration` (ej: TypeCheck, que depende de si el
+        daemon de mypy está caliente) siempre usan su propia estimación: las
+        muestras no distinguen el estado del que depende.
+
+        Args:
+            check: Check a estimar (o su `PluginSpec`, antes de importarlo)
+            context: Contexto de ejecución (archivo a analizar)
+
+        Returns:
+            Duración estimada en segundos
+        """
+        if self.durations is None or not self.config.execution.learn_durations:
+            return check.estimated_duration
+        if getattr(check, "dynamic_duration", False) is True:
+            return check.estimated_duration
+        return self.durations.predict(
+            check.name, self._lines(context), default=check.estimated_duration
+        )
+
+    def _lines(self, context: ExecutionContext) -> int:
+        """Líneas del archivo del contexto, contadas una sola vez para todos los checks."""
+        if self._line_count is None or self._line_count[0] is not context:
+            self._line_count = (context, count_lines(context.file_path))
+        return self._line_count[1]
+
+    def _may_run(self, plugin: Any, context: ExecutionContext) -> bool:
+        """
+        Filtro previo a `should_run` con la metadata del registro.
+
+        Descarta los checks apagados en config y, en pre-commit, los que no
+        pueden entrar por prioridad y duración, sin importarlos.
+
+        Args:
+            plugin: `PluginSpec` o check ya cargado (ver `PluginSet.entries`)
+            context: Contexto de ejecución
+
+        Returns:
+            False si el check seguro no se selecciona
+        """
+        if not _is_enabled(plugin, context):
+            return False
+        if context.analysis_type != "pre-commit" or getattr(plugin, "dynamic_duration", False):
+            return True
+        return _fits_precommit(plugin, self.estimated_duration(plugin, context))
+
     def _select_for_pr(
         self, candidates: List[Verifiable], context: ExecutionContext
     ) -> List[Verifiable]:
@@ -285,3 +350,23 @@ class CheckOrchestrator:
             "(IA no implementada todavía)"
         )
         return candidates
+
+
+def _is_enabled(plugin: Any, context: ExecutionContext) -> bool:
+    """Toggle del registro (los checks ya cargados lo resuelven en should_run)."""
+    return not isinstance(plugin, PluginSpec) or plugin.is_enabled(context.config)
+
+
+def _fits_precommit(check: Any, duration: float) -> bool:
+    """
+    Pre-commit: solo alta prioridad (1-3).
+
+    La excepción para checks casi instantáneos es solo para los que la piden
+    con `dynamic_duration` (ej: TypeCheck con el daemon de mypy caliente): un
+    check de prioridad baja que simplemente resulta rápido no entra.
+    """
+    if check.priority <= 3:
+        return True
+    return getattr(check, "dynamic_duration", False) is True and (
+        duration <= PRECOMMIT_INSTANT_DURATION
+    )
@@ -0,0 +1,91 @@
+"""
+Registro de los checks de CodeGuard.
+
+Metadata estática de cada check (ver `quality_agents.shared.plugins`): el
+orquestador selecciona con estos valores y solo importa los checks que van a
+ejecutarse. Deben coincidir con las propiedades de cada clase.
+
+Para agregar un check: crear la clase en `checks/` y registrarla acá. Los
+checks de otros paquetes se registran con entry points en el grupo
+`quality_agents.checks`.
+"""
+
+from quality_agents.shared.plugins import PluginSpec
+
+_CHECKS = "quality_agents.codeguard.checks"
+
+BUILTIN_CHECKS = (
+    PluginSpec(
+        name="Complexity",
+        target=f"{_CHECKS}.complexity_check:ComplexityCheck",
+        category="complexity",
+        priority=3,
+        estimated_duration=1.0,
+        toggle="complexity",
+    ),
+    PluginSpec(
+        name="DeadCode",
+        target=f"{_CHECKS}.dead_code_check:DeadCodeCheck",
+        category="quality",
+        priority=4,
+        estimated_duration=1.5,
+        toggle="dead_code",
+    ),
+    PluginSpec(
+        name="UnusedImports",
+        target=f"{_CHECKS}.import_check:ImportCheck",
+        category="quality",
+        priority=6,
+        estimated_duration=0.5,
+        toggle="imports",
+    ),
+    PluginSpec(
+        name="Maintainability",
+        target=f"{_CHECKS}.maintainability_check:MaintainabilityCheck",
+        category="complexity",
+        priority=4,
+        estimated_duration=1.0,
+        toggle="maintainability",
+    ),
+    PluginSpec(
+        name="PEP8",
+        target=f"{_CHECKS}.pep8_check:PEP8Check",
+        category="style",
+        priority=2,
+        estimated_duration=0.5,
+        toggle="pep8",
+    ),
+    PluginSpec(
+        name="Pylint",
+        target=f"{_CHECKS}.pylint_check:PylintCheck",
+        category="quality",
+        priority=4,
+        estimated_duration=2.0,
+        toggle="pylint",
+    ),
+    PluginSpec(
+        name="Security",
+        target=f"{_CHECKS}.security_check:SecurityCheck",
+        category="security",
+        priority=1,
+        estimated_duration=1.5,
+        toggle="security",
+    ),
+    PluginSpec(
+        name="Spelling",
+        target=f"{_CHECKS}.spelling_check:SpellingCheck",
+        category="style",
+        priority=5,
+        estimated_duration=1.0,
+        toggle="spelling",
+    ),
+    PluginSpec(
+        name="Types",
+        target=f"{_CHECKS}.type_check:TypeCheck",
+        category="quality",
+        priority=5,
+        estimated_duration=3.0,
+        toggle="types",
+        dynamic_duration=True,  # Sub-segundo con el daemon de mypy caliente
+    ),
+)
@@ -0,0 +1,300 @@
+"""
+Análisis del contenido staged de git (modo `--staged` del hook de pre-commit).
+
+Sin paths, el hook recorría y analizaba todo el repositorio en cada commit, y
+lo que veía era el working tree: cambios sin `git add` incluidos. En modo
+`--staged` CodeGuard toma solo los archivos Python del índice que cambiaron
+respecto de HEAD y lee su contenido staged con una sola invocación de
+`git cat-file --batch`. Los archivos se materializan en un directorio
+temporal que replica las rutas del repositorio (las herramientas externas
+necesitan archivos); el resto de las entradas de sus directorios se enlaza
+desde el working tree, para que los imports entre módulos se resuelvan. Al
+terminar, los resultados se reescriben con las rutas reales.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from quality_agents.codeguard.models import CheckResult
+
+# Modos de git de archivos regulares (se descartan symlinks y submódulos)
+_REGULAR_FILE_MODES = ("100644", "100755")
+
+# Timeout de cada comando de git (segundos)
+_GIT_TIMEOUT = 30
+
+
+class StagedError(Exception):
+    """El contenido staged no se puede leer (git ausente, fuera de un repositorio, ...)."""
+
+
+def _git(
+    args: List[str],
+    cwd: Path,
+    stdin: Optional[bytes] = None,
+    deadline: Optional[float] = None,
+) -> bytes:
+    """
+    Ejecuta un comando de git y retorna su stdout.
+
+    Args:
+        deadline: Instante (`time.monotonic()`) en que vence la corrida; acota
+            el timeout del comando (None = `_GIT_TIMEOUT`)
+
+    Raises:
+        StagedError: Si git no está instalado, el comando falla o vence el timeout.
+    """
+    timeout = float(_GIT_TIMEOUT)
+    if deadline is not None:
+        timeout = min(timeout, max(deadline - time.monotonic(), 0.0))
+    try:
+        process = subprocess.run(
+            ["git", *args], cwd=cwd, input=stdin, capture_output=True, timeout=timeout
+        )
+    except FileNotFoundError as e:
+        raise StagedError("git not installed") from e
+    except subprocess.TimeoutExpired as e:
+        raise StagedError(f"git {args[0]} timed out (>{timeout:.1f}s)") from e
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace").strip()
+        raise StagedError(stderr or f"git {args[0]} failed with exit code {process.returncode}")
+    return process.stdout
+
+
+def repo_root(cwd: Optional[Path] = None, deadline: Optional[float] = None) -> Path:
+    """
+    Raíz del repositorio git que contiene `cwd`.
+
+    Raises:
+        StagedError: Si `cwd` no está dentro de un repositorio git.
+    """
+    output = _git(["rev-parse", "--show-toplevel"], cwd or Path.cwd(), deadline=deadline)
+    return Path(output.decode("utf-8").strip())
+
+
+def staged_entries(root: Path, deadline: Optional[float] = None) -> List[Tuple[str, str]]:
+    """
+    Archivos Python agregados o modificados en el índice respecto de HEAD.
+
+    Args:
+        root: Raíz del repositorio
+        deadline: Instante en que vence la corrida (None = sin límite)
+
+    Returns:
+        Pares (ruta relativa a la raíz, id del blob staged), en el orden de git
+    """
+    output = _git(
+        ["diff", "--cached", "--raw", "-z", "--no-abbrev", "--no-renames", "--diff-filter=AMT"],
+        root,
+        deadline=deadline,
+    )
+    fields = output.decode("utf-8", errors="surrogateescape").split("\0")
+    entries: List[Tuple[str, str]] = []
+    # Formato -z: ":modo_src modo_dst blob_src blob_dst estado\0ruta\0"
+    # (el split deja un campo vacío final)
+    fields = fields[: len(fields) // 2 * 2]
+    for meta, path in zip(fields[0::2], fields[1::2], strict=True):
+        parts = meta.lstrip(":").split()
+        if len(parts) < 4 or parts[1] not in _REGULAR_FILE_MODES:
+            continue
+        if path.endswith(".py"):
+            entries.append((path, parts[3]))
+    return entries
+
+
+def read_blobs(
+    root: Path, blob_ids: Sequence[str], deadline: Optional[float] = None
+) -> Dict[str, bytes]:
+    """
+    Lee el contenido de varios blobs con una sola invocación de `git cat-file --batch`.
+
+    Args:
+        root: Raíz del repositorio
+        blob_ids: Ids de los blobs
+        deadline: Instante en que vence la corrida (None = sin límite)
+
+    Returns:
+        Diccionario {id: contenido}; los blobs inexistentes quedan fuera
+
+    Raises:
+        StagedError: Si la salida de git no tiene el formato esperado.
+    """
+    if not blob_ids:
+        return {}
+    output = _git(
+        ["cat-file", "--batch"], root,
+        stdin="\n".join(blob_ids).encode() + b"\n", deadline=deadline,
+    )
+
+    blobs: Dict[str, bytes] = {}
+    pos = 0
+    # Cada objeto: "<id> <tipo> <tamaño>\n<contenido>\n" (o "<id> missing\n")
+    while pos < len(output):
+        end = output.index(b"\n", pos)
+        header = output[pos:end].decode("utf-8").split()
+        pos = end + 1
+        if len(header) != 3:
+            continue
+        try:
+            size = int(header[2])
+        except ValueError as e:
+            raise StagedError(f"unexpected git cat-file output: {' '.join(header)}") from e
+        blobs[header[0]] = output[pos:pos + size]
+        pos += size + 1
+    return blobs
+
+
+def _within(path: Path, targets: Iterable[Path]) -> bool:
+    """True si `path` es alguno de los targets o está dentro de uno de ellos."""
+    return any(path == target or target in path.parents for target in targets)
+
+
+@dataclass
+class StagedSnapshot:
+    """
+    Contenido staged de los archivos Python, materializado en un directorio temporal.
+
+    Attributes:
+        root: Raíz del repositorio
+        directory: Directorio temporal con la copia staged (y enlaces al
+            working tree para los vecinos)
+        files: Archivos Python staged a analizar (dentro de `directory`)
+        originals: {archivo temporal: ruta a reportar (relativa al directorio actual)}
+
+    Example:
+        >>> with StagedSnapshot.create() as snapshot:
+        ...     results = guard.run(snapshot.files)
+        ...     results = snapshot.restore(results)
+    """
+
+    root: Path
+    directory: Path
+    files: List[Path] = field(default_factory=list)
+    originals: Dict[Path, Path] = field(default_factory=dict)
+
+    @classmethod
+    def create(
+        cls,
+        paths: Sequence[Path] = (),
+        cwd: Optional[Path] = None,
+        exclude_patterns: Sequence[str] = (),
+        deadline: Optional[float] = None,
+    ) -> "StagedSnapshot":
+        """
+        Lee el contenido staged y lo escribe en un directorio temporal.
+
+        Solo se escriben los archivos que cambiaron; las demás entradas de
+        sus directorios (y de los directorios ancestros) se enlazan desde el
+        working tree. El costo es proporcional a los archivos staged y a sus
+        directorios, no al tamaño del repositorio.
+
+        Args:
+            paths: Restringe a los archivos staged dentro de estos paths (ej:
+                los nombres que pasa pre-commit); vacío = todos
+            cwd: Directorio desde el que se invoca (default: actual)
+            exclude_patterns: Patrones de `exclude_patterns` de la configuración
+            deadline: Instante (`time.monotonic()`) en que vence la corrida;
+                acota los comandos de git (None = sin límite)
+
+        Raises:
+            StagedError: Si no se puede leer el índice de git a tiempo.
+        """
+        cwd = (cwd or Path.cwd()).resolve()
+        root = repo_root(cwd, deadline=deadline).resolve()
+        targets = [(cwd / p).resolve() for p in paths]
+
+        entries = []
+        for rel_path, blob_id in staged_entries(root, deadline=deadline):
+            if any(pattern in rel_path for pattern in exclude_patterns):
+                continue
+            if targets and not _within(root / rel_path, targets):
+                continue
+            entries.append((rel_path, blob_id))
+
+        blobs = read_blobs(root, sorted({blob_id for _, blob_id in entries}), deadline=deadline)
+        snapshot = cls(root=root, directory=Path(tempfile.mkdtemp(prefix="codeguard-staged-")))
+        written = []
+        for rel_path, blob_id in entries:
+            if blob_id not in blobs:
+                continue
+            temp_path = snapshot.directory / rel_path
+            temp_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(blobs[blob_id])
+            written.append(rel_path)
+            snapshot.files.append(temp_path)
+            snapshot.originals[temp_path] = Path(os.path.relpath(root / rel_path, cwd))
+        snapshot._link_worktree(written)
+        return snapshot
+
+    def restore(self, results: List[CheckResult]) -> List[CheckResult]:
+        """
+        Reescribe los resultados con las rutas del repositorio.
+
+        Returns:
+            Resultados con `file_path` (y las rutas citadas en el mensaje)
+            apuntando al archivo real en lugar de la copia temporal
+        """
+        restored = []
+        for result in results:
+            file_path = result.file_path
+            if file_path is not None and Path(file_path) in self.originals:
+                file_path = str(self.originals[Path(file_path)])
+            restored.append(
+                replace(result, file_path=file_path, message=self._restore_text(result.message))
+            )
+        return restored
+
+    def restore_skipped(self, skipped: List[Tuple[Path, str]]) -> List[Tuple[Path, str]]:
+        """Reescribe los pares (archivo, check) omitidos con las rutas del repositorio."""
+        return [(self.originals.get(file_path, file_path), name) for file_path, name in skipped]
+
+    def cleanup(self) -> None:
+        """Elimina el directorio temporal (los enlaces, no sus destinos)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _link_worktree(self, rel_paths: Sequence[str]) -> None:
+        """
+        Enlaza desde el working tree las entradas vecinas de los archivos escritos.
+
+        Así Pylint, ImportCheck o mypy resuelven los módulos del proyecto sin
+        copiar el índice completo. Los vecinos se ven como están en el working
+        tree; los archivos staged, con su contenido staged.
+        """
+        directories = {PurePosixPath(rel_path).parent for rel_path in rel_paths}
+        for directory in list(directories):
+            directories.update(directory.parents)
+        for directory in sorted(directories):
+            source = self.root / directory
+            try:
+                names = os.listdir(source)
+            except OSError:
+                continue
+            for name in names:
+                link = self.directory / directory / name
+                if name == ".git" or os.path.lexists(link):
+                    continue
+                try:
+                    os.symlink(source / name, link)
+                except OSError:
+                    # Sin soporte de symlinks (ej: Windows sin permisos)
+                    continue
+
+    def _restore_text(self, text: str) -> str:
+        prefix = str(self.directory) + os.sep
+        if prefix not in text:
+            return text
+        for temp_path, original in self.originals.items():
+            text = text.replace(str(temp_path), str(original))
+        return text
+
+    def __enter__(self) -> "StagedSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.cleanup()
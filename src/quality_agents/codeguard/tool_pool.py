@@ -0,0 +1,485 @@
+"""
+Pool de workers pre-cargados para las herramientas externas de CodeGuard.
+
+Cuando un check invoca `flake8`, `pylint`, `mypy`, ... por subprocess, la
+mayor parte del tiempo se va en arrancar el intérprete e importar la
+herramienta, no en analizar el archivo. El pool mantiene un servidor de fork
+(un proceso Python que importó los módulos de las herramientas una sola vez)
+y cada invocación es un fork de ese proceso ya cargado que ejecuta el entry
+point de consola de la herramienta (el mismo que corre el ejecutable) con el
+argv pedido.
+
+La semántica es la de `subprocess.run(cmd, capture_output=True, text=True,
+timeout=...)`: stdout y stderr se capturan a nivel de descriptor, el código
+de salida es el de la herramienta y al vencer el timeout el worker se mata y
+se lanza `subprocess.TimeoutExpired`. Así, los parsers de cada check no
+cambian. Un fork por invocación evita que el estado global de una corrida
+(cachés de astroid, plugins registrados) se filtre a la siguiente.
+
+Protocolo (socket Unix, una conexión por invocación): el cliente envía el
+pedido como una línea JSON; el servidor responde con el PID del worker y,
+cuando termina, con su código de salida.
+"""
+
+import atexit
+import importlib
+import json
+import locale
+import logging
+import os
+import select
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Módulos que el servidor importa al arrancar (los que no estén instalados se omiten)
+_PRELOAD_MODULES = [
+    "flake8.main.cli",
+    "pylint.lint",
+    "bandit.cli.main",
+    "radon.cli",
+    "vulture.core",
+    "codespell_lib",
+    "mypy.main",
+]
+
+# Clientes que lanzan o controlan procesos propios: siempre por subprocess
+_SUBPROCESS_ONLY = {"dmypy"}
+
+# Arranque del proceso servidor
+_SERVER_BOOTSTRAP = "from quality_agents.codeguard.tool_pool import _serve; _serve()"
+
+# Segundos que se espera a que el servidor termine de importar las herramientas
+_STARTUP_TIMEOUT = 60
+
+
+class ToolWorkerPool:
+    """
+    Ejecuta herramientas de consola en forks de un proceso que ya las importó.
+
+    Example:
+        >>> pool = ToolWorkerPool.shared()
+        >>> process = pool.run(["flake8", "app.py"], timeout=5)
+        >>> process.returncode, process.stdout
+    """
+
+    _shared: Optional["ToolWorkerPool"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Raises:
+            RuntimeError: Si la plataforma no soporta fork ni sockets Unix.
+        """
+        if not self.is_available():
+            raise RuntimeError("tool worker pool requires fork and Unix sockets")
+
+        self._lock = threading.Lock()
+        self._server: Optional[subprocess.Popen] = None
+        self._socket_dir: Optional[str] = None
+        self._entry_points: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def shared(cls) -> "ToolWorkerPool":
+        """Instancia compartida por todos los checks del proceso."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si la plataforma soporta fork y sockets Unix."""
+        return hasattr(os, "fork") and hasattr(socket, "AF_UNIX")
+
+    def supports(self, tool: str) -> bool:
+        """True si la herramienta tiene un entry point de consola en este entorno."""
+        return self._entry_point(tool) is not None
+
+    def run(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Ejecuta `cmd` en un worker, con la semántica de `subprocess.run`.
+
+        Args:
+            cmd: Comando; el primer elemento es el nombre de la herramienta
+            timeout: Segundos antes de matar el worker
+
+        Returns:
+            Proceso completado con stdout/stderr como texto
+
+        Raises:
+            FileNotFoundError: Si la herramienta no tiene entry point de consola
+            subprocess.TimeoutExpired: Si la herramienta no termina a tiempo
+            RuntimeError: Si el servidor de fork no arranca o se cae
+        """
+        entry_point = self._entry_point(cmd[0])
+        if entry_point is None:
+            raise FileNotFoundError(f"No console entry point for {cmd[0]!r}")
+
+        socket_path = self._ensure_server()
+        deadline = time.monotonic() + timeout
+
+        with tempfile.TemporaryDirectory(prefix="codeguard-tool-") as tmp_dir:
+            stdout_path = os.path.join(tmp_dir, "stdout")
+            stderr_path = os.path.join(tmp_dir, "stderr")
+            request = {
+                "entry_point": entry_point,
+                "argv": list(cmd),
+                "cwd": os.getcwd(),
+                "env": dict(os.environ),
+                "stdout": stdout_path,
+                "stderr": stderr_path,
+            }
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.connect(socket_path)
+                conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+                reader = _LineReader(conn)
+                pid = int(reader.readline(deadline, cmd, timeout))
+                try:
+                    returncode = int(reader.readline(deadline, cmd, timeout))
+                except subprocess.TimeoutExpired:
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    raise
+
+            return subprocess.CompletedProcess(
+                args=cmd,
+                returncode=returncode,
+                stdout=self._read_text(stdout_path),
+                stderr=self._read_text(stderr_path),
+            )
+
+    def close(self) -> None:
+        """Detiene el servidor de fork y borra su socket."""
+        with self._lock:
+            if self._server is not None:
+                if self._server.stdin:
+                    self._server.stdin.close()
+                try:
+                    self._server.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._server.kill()
+                self._server = None
+            if self._socket_dir:
+                shutil.rmtree(self._socket_dir, ignore_errors=True)
+                self._socket_dir = None
+
+    def _ensure_server(self) -> str:
+        """Arranca el servidor de fork si no está corriendo; retorna la ruta del socket."""
+        with self._lock:
+            if self._server is not None and self._server.poll() is None and self._socket_dir:
+                return os.path.join(self._socket_dir, "pool.sock")
+
+            if self._socket_dir:
+                shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = tempfile.mkdtemp(prefix="codeguard-pool-")
+            socket_path = os.path.join(self._socket_dir, "pool.sock")
+            # stdin queda abierto mientras viva este proceso: al cerrarse, el servidor termina
+            self._server = subprocess.Popen(
+                [sys.executable, "-c", _SERVER_BOOTSTRAP, socket_path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            ready, _, _ = select.select([self._server.stdout], [], [], _STARTUP_TIMEOUT)
+            if not ready or self._server.stdout.readline().strip() != b"ready":
+                self._server.kill()
+                self._server = None
+                raise RuntimeError("tool worker pool server did not start")
+            return socket_path
+
+    def _entry_point(self, tool: str) -> Optional[str]:
+        """Entry point "módulo:función" del ejecutable `tool` (None si no hay)."""
+        with self._lock:
+            if tool not in self._entry_points:
+                from importlib.metadata import entry_points
+
+                found = list(entry_points(group="console_scripts", name=tool))
+                self._entry_points[tool] = found[0].value if found else None
+            return self._entry_points[tool]
+
+    @staticmethod
+    def _read_text(path: str) -> str:
+        """Lee la salida capturada como la decodifica `subprocess.run(text=True)`."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return ""
+        return _decode(data)
+
+
+class _LineReader:
+    """Lee líneas de un socket respetando un deadline."""
+
+    def __init__(self, conn: socket.socket) -> None:
+        self._conn = conn
+        self._buffer = b""
+
+    def readline(self, deadline: float, cmd: List[str], timeout: float) -> str:
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            self._conn.settimeout(remaining)
+            try:
+                chunk = self._conn.recv(4096)
+            except socket.timeout:
+                raise subprocess.TimeoutExpired(cmd, timeout) from None
+            if not chunk:
+                raise RuntimeError("tool worker pool server closed the connection")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line.decode("utf-8")
+
+
+def run_tool(cmd: List[str], timeout: float, context: Any = None) -> subprocess.CompletedProcess:
+    """
+    Ejecuta una herramienta externa para un check.
+
+    Usa el `ToolWorkerPool` compartido si la configuración del contexto lo
+    pide (`execution.tool_pool`) y la herramienta tiene entry point de
+    consola; si no, `subprocess.run` con captura de salida.
+
+    Args:
+        cmd: Comando a ejecutar
+        timeout: Segundos antes de abortar
+        context: ExecutionContext del check (None = subprocess)
+
+    Returns:
+        Proceso completado con stdout/stderr como texto
+
+    Raises:
+        FileNotFoundError, subprocess.TimeoutExpired: como `subprocess.run`;
+            también si vence el deadline de la corrida (`context.deadline`)
+    """
+    timeout = _within_deadline(cmd, timeout, context)
+    if _pool_enabled(context) and cmd[0] not in _SUBPROCESS_ONLY:
+        try:
+            pool = ToolWorkerPool.shared()
+            if pool.supports(cmd[0]):
+                return pool.run(cmd, timeout)
+        except (RuntimeError, OSError, ValueError) as e:
+            logger.debug(f"Pool de herramientas no disponible: {e}. Usando subprocess.")
+
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+
+async def run_tool_async(
+    cmd: List[str], timeout: float, context: Any = None
+) -> subprocess.CompletedProcess:
+    """
+    Variante async de `run_tool` para el motor asyncio de CodeGuard.
+
+    Lanza la herramienta con `asyncio.create_subprocess_exec` y espera su
+    salida con `asyncio.wait_for`, de modo que muchas invocaciones comparten
+    un solo hilo. Con el pool de herramientas activo la espera del worker es
+    bloqueante y se delega a un hilo.
+
+    Args:
+        cmd: Comando a ejecutar
+        timeout: Segundos antes de abortar
+        context: ExecutionContext del check (None = subprocess)
+
+    Returns:
+        Proceso completado con stdout/stderr como texto, igual que `run_tool`
+
+    Raises:
+        FileNotFoundError, subprocess.TimeoutExpired: como `subprocess.run`
+    """
+    import asyncio
+
+    timeout = _within_deadline(cmd, timeout, context)
+    if _pool_enabled(context) and cmd[0] not in _SUBPROCESS_ONLY:
+        return await asyncio.to_thread(run_tool, cmd, timeout, context)
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError as e:
+        await _kill(process)
+        raise subprocess.TimeoutExpired(cmd, timeout) from e
+    except asyncio.CancelledError:
+        # La corrida se canceló: no dejar la herramienta huérfana
+        await _kill(process)
+        raise
+
+    return subprocess.CompletedProcess(
+        cmd, process.returncode, _decode(stdout), _decode(stderr)
+    )
+
+
+async def _kill(process: Any) -> None:
+    """Mata el proceso de una herramienta y espera su salida."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+def _decode(data: bytes) -> str:
+    """Decodifica la salida como `subprocess.run(text=True)` (universal newlines)."""
+    text = data.decode(locale.getpreferredencoding(False), errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _within_deadline(cmd: List[str], timeout: float, context: Any) -> float:
+    """
+    Recorta el timeout de una invocación al deadline de la corrida.
+
+    Así una herramienta en vuelo se mata cuando se agota el presupuesto de
+    CodeGuard, no cuando vence su propio timeout.
+
+    Raises:
+        subprocess.TimeoutExpired: Si el deadline ya venció
+    """
+    deadline = getattr(context, "deadline", None) if context else None
+    if not isinstance(deadline, (int, float)):
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise subprocess.TimeoutExpired(cmd, 0)
+    return min(timeout, remaining)
+
+
+def _pool_enabled(context: Any) -> bool:
+    """True si el contexto trae configuración con `execution.tool_pool` activo."""
+    config = getattr(context, "config", None) if context else None
+    execution = getattr(config, "execution", None) if config else None
+    return bool(execution and getattr(execution, "tool_pool", False)) and (
+        ToolWorkerPool.is_available()
+    )
+
+
+# --- Lado servidor -----------------------------------------------------------
+
+
+def _serve() -> None:
+    """
+    Proceso servidor: importa las herramientas y atiende pedidos de fork.
+
+    Termina cuando se cierra su stdin (el proceso cliente terminó).
+    """
+    # El directorio actual no debe tapar módulos de las herramientas
+    sys.path = [p for p in sys.path if p not in ("", os.getcwd())]
+    for module in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception:  # nosec B110 - herramienta no instalada: se omite
+            pass
+
+    # Los hijos directos (uno por pedido) se recolectan solos
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sys.argv[1])
+    server.listen(64)
+    sys.stdout.write("ready\n")
+    sys.stdout.flush()
+
+    while True:
+        readable, _, _ = select.select([server, sys.stdin], [], [])
+        if sys.stdin in readable and not os.read(sys.stdin.fileno(), 1024):
+            break
+        if server in readable:
+            conn, _ = server.accept()
+            if os.fork() == 0:
+                server.close()
+                _handle(conn)
+            conn.close()
+
+    server.close()
+
+
+def _handle(conn: socket.socket) -> None:
+    """
+    Hijo del servidor para un pedido: lanza el worker y reporta su salida.
+
+    Nunca retorna. El worker es un fork aparte para poder informar su código
+    de salida aunque la herramienta termine con `os._exit` (mypy lo hace).
+    """
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    try:
+        request = json.loads(conn.makefile("rb").readline())
+        pid = os.fork()
+        if pid == 0:
+            conn.close()
+            _run_worker(request)
+        conn.sendall(f"{pid}\n".encode())
+        _, status = os.waitpid(pid, 0)
+        conn.sendall(f"{os.waitstatus_to_exitcode(status)}\n".encode())
+    finally:
+        os._exit(0)
+
+
+def _run_worker(request: dict) -> None:
+    """
+    Worker: ejecuta el entry point de consola como lo haría el ejecutable.
+
+    La salida va a los archivos del cliente a nivel de descriptor, de modo que
+    también se captura lo que la herramienta escribe por `sys.stdout.buffer`
+    o por streams guardados al importarse. Nunca retorna.
+    """
+    code = 1
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+        for fd, path in ((1, request["stdout"]), (2, request["stderr"])):
+            target = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(target, fd)
+            os.close(target)
+
+        module_name, _, attr = request["entry_point"].partition(":")
+        func: Any = importlib.import_module(module_name)
+        for part in attr.split("."):
+            func = getattr(func, part)
+
+        sys.argv = list(request["argv"])
+        try:
+            result = func()
+            code = _exit_code(result)
+        except SystemExit as e:
+            code = _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:  # nosec B110 - stream cerrado por la herramienta
+                pass
+        os._exit(code)
+
+
+def _exit_code(value: Any) -> int:
+    """Código de salida para un valor de `sys.exit`, igual que el intérprete."""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value & 0xFF
+    sys.stderr.write(f"{value}\n")
+    return 1
@@ -9,11 +9,12 @@ Ticket: 1.3 - Refactorizar DesignReviewer como clase principal
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from quality_agents.designreviewer.config import DesignReviewerConfig, load_config
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
 from quality_agents.designreviewer.orchestrator import AnalyzerOrchestrator
+from quality_agents.shared.watch import IncrementalResults, group_by_file
 
 # Re-exportar para compatibilidad con imports externos
 __all__ = ["DesignReviewer", "ReviewResult", "ReviewSeverity"]
@@ -58,7 +59,9 @@ class DesignReviewer:
         )
         self._orchestrator: AnalyzerOrchestrator = AnalyzerOrchestrator(self._config)
 
-    def run(self, files: Optional[List[Path]] = None) -> List[ReviewResult]:
+    def run(
+        self, files: Optional[List[Path]] = None, jobs: Optional[int] = None
+    ) -> List[ReviewResult]:
         """
         Ejecuta análisis sobre los archivos especificados.
 
@@ -67,6 +70,7 @@ class DesignReviewer:
 
         Args:
             files: Archivos a analizar. Si es None, analiza todos los Python en self.path.
+            jobs: Procesos en paralelo (None = `jobs` de config; 0 = CPUs disponibles).
 
         Returns:
             Lista de resultados del análisis.
@@ -79,7 +83,7 @@ class DesignReviewer:
         python_files = [f for f in files if f.suffix == ".py"]
 
         if self._orchestrator is not None:
-            self.results = self._orchestrator.run(python_files)
+            self.results = self._orchestrator.run(python_files, jobs=jobs)
 
         return self.results
 
@@ -98,6 +102,66 @@ class DesignReviewer:
         """
         return self.run(files=changed_files)
 
+    def analyze_isolated(self, files: List[Path]) -> List[ReviewResult]:
+        """
+        Analiza archivos con los analyzers que no dependen de otros archivos.
+
+        Es el modo del servidor LSP: el contenido de un buffer sin guardar no
+        forma parte del proyecto en disco, así que los analyzers que declaran
+        `cross_file = True` (ej: CircularImportsAnalyzer) quedan afuera.
+
+        Args:
+            files: Archivos a analizar.
+
+        Returns:
+            Lista de resultados del análisis (no modifica `self.results`).
+        """
+        analyzers = [
+            a for a in self._orchestrator.analyzers if not getattr(a, "cross_file", False)
+        ]
+        python_files = [f for f in files if f.suffix == ".py"]
+        return self._orchestrator.run(python_files, analyzers=analyzers)
+
+    def review_changes(
+        self, changed_files: List[Path], state: IncrementalResults[ReviewResult]
+    ) -> Dict[Optional[Path], List[ReviewResult]]:
+        """
+        Re-analiza los archivos modificados de una sesión de watch.
+
+        Los analyzers corren solo sobre `changed_files`, salvo los que
+        declaran `cross_file = True` (su resultado depende de otros archivos,
+        ej: CircularImportsAnalyzer), que además se vuelven a ejecutar sobre
+        los archivos donde ya habían reportado algo: así un ciclo roto desde
+        un extremo desaparece también del otro.
+
+        Args:
+            changed_files: Archivos nuevos o modificados.
+            state: Resultados vigentes de la sesión.
+
+        Returns:
+            Resultados nuevos por archivo, para `state.update`.
+        """
+        changed = [f for f in changed_files if f.suffix == ".py"]
+        by_file = group_by_file(self._orchestrator.run(changed), lambda r: r.file_path, changed)
+
+        for analyzer in self._orchestrator.analyzers:
+            if not getattr(analyzer, "cross_file", False):
+                continue
+            flagged = [
+                f for f in state.files()
+                if f is not None and f not in by_file and f.exists()
+                and any(r.analyzer_name == analyzer.name for r in state.for_file(f))
+            ]
+            rerun = group_by_file(
+                self._orchestrator.run(flagged, analyzers=[analyzer]),
+                lambda r: r.file_path,
+                flagged,
+            )
+            for file_path in flagged:
+                kept = [r for r in state.for_file(file_path) if r.analyzer_name != analyzer.name]
+                by_file[file_path] = kept + rerun[file_path]
+        return by_file
+
     def should_block(self) -> bool:
         """
         Determina si el merge debe ser bloqueado.
@@ -137,7 +201,7 @@ import time  # noqa: E402
 
 import click  # noqa: E402
 
-from quality_agents.designreviewer.formatter import format_json, format_results  # noqa: E402
+from quality_agents.shared.watch import FileWatcher, format_update  # noqa: E402
 
 
 def _common_parent(paths: List[Path]) -> Path:
@@ -149,7 +213,51 @@ def _common_parent(paths: List[Path]) -> Path:
     return common if common.is_dir() else common.parent
 
 
+def _describe(result: ReviewResult) -> str:
+    location = str(result.file_path)
+    if result.class_name:
+        location += f"::{result.class_name}"
+    severity = result.severity.value.upper()
+    return f"{severity:8} {result.analyzer_name:<28} {location}  {result.message}"
+
+
+def _watch(
+    reviewer: DesignReviewer, targets: List[Path], files: List[Path], results: List[ReviewResult]
+) -> List[ReviewResult]:
+    """
+    Modo --watch: re-analiza los archivos que cambian hasta Ctrl+C.
+
+    Returns:
+        Resultados vigentes al salir (para el código de salida).
+    """
+    def collect() -> List[Path]:
+        return [f for target in targets for f in reviewer.collect_files(target)]
+
+    state: IncrementalResults[ReviewResult] = IncrementalResults(
+        key=lambda r: (
+            str(r.file_path), r.analyzer_name, r.class_name, r.severity, r.message
+        )
+    )
+    state.update(group_by_file(results, lambda r: r.file_path, files))
+    watcher = FileWatcher(targets, collect)
+    click.echo(f"\nObservando cambios ({watcher.mode}). Ctrl+C para salir.")
+    try:
+        while True:
+            changes = watcher.wait()
+            start = time.time()
+            by_file = reviewer.review_changes(sorted(changes.modified), state)
+            added, removed = state.update(by_file, deleted=changes.deleted)
+            for line in format_update(changes, added, removed, time.time() - start, _describe):
+                click.echo(line)
+    except KeyboardInterrupt:
+        click.echo("\nWatch detenido.")
+    finally:
+        watcher.close()
+    return state.results
+
+
 @click.command()
+@click.version_option(package_name="quality-agents", prog_name="designreviewer")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option(
     "--config", "-c",
@@ -169,7 +277,26 @@ def _common_parent(paths: List[Path]) -> Path:
     default=False,
     help="Deshabilitar sugerencias de IA",
 )
-def main(paths: tuple, config: Optional[str], output_format: str, no_ai: bool) -> None:
+@click.option(
+    "--watch", "-w",
+    is_flag=True,
+    default=False,
+    help="Seguir observando PATHS y re-analizar solo los archivos que cambian",
+)
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Archivos en paralelo, en procesos (default: jobs de config; 0 = CPUs disponibles)",
+)
+def main(
+    paths: tuple,
+    config: Optional[str],
+    output_format: str,
+    no_ai: bool,
+    watch: bool,
+    jobs: Optional[int],
+) -> None:
     """
     DesignReviewer - Análisis de calidad de diseño sobre el delta de un PR.
 
@@ -179,11 +306,21 @@ def main(paths: tuple, config: Optional[str], output_format: str, no_ai: bool) -
     Ejemplos:
       designreviewer src/
       designreviewer entidades servicios
+      designreviewer --jobs 8 src/
 
     Bloquea (exit code 1) si detecta violaciones CRITICAL.
+
+    Con --jobs N, los archivos se reparten entre N procesos. Los resultados
+    y su orden son los mismos que en la corrida secuencial.
+
+    Con --watch, después del reporte inicial sigue observando PATHS y
+    muestra los hallazgos nuevos (+) y resueltos (-) de cada guardado. El
+    código de salida refleja los resultados vigentes al salir (Ctrl+C).
     """
     targets = [Path(p) for p in paths] if paths else [Path(".")]
     config_path = Path(config) if config else None
+    if watch and output_format != "text":
+        raise click.ClickException("--watch requires --format text")
 
     project_root = _common_parent(targets)
     reviewer = DesignReviewer(path=project_root, config_path=config_path)
@@ -193,17 +330,23 @@ def main(paths: tuple, config: Optional[str], output_format: str, no_ai: bool) -
         all_files.extend(reviewer.collect_files(target))
 
     start = time.time()
-    results = reviewer.run(files=all_files)
+    results = reviewer.run(files=all_files, jobs=jobs)
     elapsed = time.time() - start
 
     total_files = len(all_files)
-    analyzers_executed = len(reviewer._orchestrator.analyzers)
+    analyzers_executed = len(reviewer._orchestrator.plugins)
+
+    # rich se carga solo para reportar (no en --version/--help)
+    from quality_agents.designreviewer.formatter import format_json, format_results
 
     if output_format == "json":
         click.echo(format_json(results, elapsed, total_files, analyzers_executed))
     else:
         format_results(results, elapsed, total_files, analyzers_executed)
 
+    if watch:
+        results = _watch(reviewer, targets, all_files, results)
+
     if any(r.is_blocking() for r in results):
         sys.exit(1)
 
@@ -2,8 +2,8 @@
 Analyzers modulares de DesignReviewer.
 
 Este paquete contiene todos los analyzers de calidad de diseño implementados como clases
-que heredan de `Verifiable`. El orquestador (`AnalyzerOrchestrator`) descubre
-automáticamente todos los analyzers en este paquete y los ejecuta sobre el changeset.
+que heredan de `Verifiable`. El orquestador (`AnalyzerOrchestrator`) los toma
+del registro de plugins y los ejecuta sobre el changeset.
 
 Arquitectura Modular
 ====================
@@ -14,18 +14,20 @@ Cada analyzer es una clase independiente que:
 3. Sobrescribe (opcionalmente): `estimated_duration`, `priority`, `should_run()`
 4. Implementa el método abstracto: `execute(file_path)`
 
-Auto-Discovery
-==============
+Registro
+========
 
-Los analyzers son descubiertos automáticamente por `AnalyzerOrchestrator._discover_analyzers()`:
-- El orquestador importa este módulo
-- Busca todas las clases que heredan de `Verifiable`
-- Las instancia y las agrega a la lista de analyzers disponibles
+Los analyzers se registran en `quality_agents/designreviewer/registry.py` con
+su metadata estática (`PluginSpec`: nombre, categoría, prioridad, duración
+estimada y toggle de config). El orquestador importa solo los habilitados.
 
-No es necesario registrar manualmente los analyzers, solo:
+Para agregar un analyzer:
 1. Crear la clase en un archivo dentro de `analyzers/`
-2. Importarla en este `__init__.py`
-3. Agregarla a `__all__`
+2. Registrarla en `registry.py` (la metadata debe coincidir con la clase)
+3. Agregarla a `_EXPORTS` en este `__init__.py`
+
+Los analyzers de otros paquetes se registran con entry points en el grupo
+`quality_agents.analyzers` (ver `quality_agents.shared.plugins`).
 
 Estructura de un Analyzer
 ==========================
@@ -34,6 +36,7 @@ Estructura de un Analyzer
 # analyzers/ejemplo_analyzer.py
 from pathlib import Path
 
+from quality_agents.shared.parsed_modules import parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
 
@@ -41,6 +44,9 @@ from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
 class EjemploAnalyzer(Verifiable):
     '''Descripción del analyzer.'''
 
+    def __init__(self) -> None:
+        self._modules = None
+
     @property
     def name(self) -> str:
         return "EjemploAnalyzer"
@@ -59,15 +65,30 @@ class EjemploAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         '''Decide si debe ejecutarse en este contexto.'''
+        self._modules = context.modules  # módulos ya parseados de la corrida
         return context.file_path.suffix == ".py"
 
     def execute(self, file_path: Path) -> list[ReviewResult]:
         '''Ejecuta el analyzer y retorna resultados.'''
         results = []
+        try:
+            tree = parsed_module(file_path, self._modules).tree  # no modificarlo
+        except (OSError, SyntaxError):
+            return results
         # Implementar lógica del analyzer aquí
         return results
 ```
 
+Recorrido compartido
+====================
+
+Un analyzer que recorre el AST del archivo puede implementar además
+`quality_agents.shared.ast_dispatch.TreeListener`: en lugar de su propio
+`ast.walk`, registra callbacks por tipo de nodo en `begin_module` y arma sus
+resultados en `end_module`. El orquestador recorre el árbol una sola vez por
+archivo para todos los TreeListener; `execute` sigue funcionando igual fuera
+del orquestador (`return self.analyze_tree(tree, file_path)`).
+
 Analyzers Implementados
 ========================
 
@@ -101,35 +122,32 @@ Fecha de creación: 2026-02-19
 Ticket: 1.1
 """
 
-# Imports de analyzers implementados
-from .cbo_analyzer import CBOAnalyzer
-from .circular_imports_analyzer import CircularImportsAnalyzer
-from .data_clumps_analyzer import DataClumpsAnalyzer
-from .dit_analyzer import DITAnalyzer
-from .fan_out_analyzer import FanOutAnalyzer
-from .feature_envy_analyzer import FeatureEnvyAnalyzer
-from .god_object_analyzer import GodObjectAnalyzer
-from .law_of_demeter_analyzer import LawOfDemeterAnalyzer
-from .lcom_analyzer import LCOMAnalyzer
-from .long_method_analyzer import LongMethodAnalyzer
-from .long_parameter_list_analyzer import LongParameterListAnalyzer
-from .nop_analyzer import NOPAnalyzer
-from .primitive_obsession_analyzer import PrimitiveObsessionAnalyzer
-from .wmc_analyzer import WMCAnalyzer
-
-__all__ = [
-    "CBOAnalyzer",
-    "CircularImportsAnalyzer",
-    "DataClumpsAnalyzer",
-    "DITAnalyzer",
-    "FeatureEnvyAnalyzer",
-    "FanOutAnalyzer",
-    "GodObjectAnalyzer",
-    "LawOfDemeterAnalyzer",
-    "LCOMAnalyzer",
-    "PrimitiveObsessionAnalyzer",
-    "LongMethodAnalyzer",
-    "LongParameterListAnalyzer",
-    "NOPAnalyzer",
-    "WMCAnalyzer",
-]
+import importlib
+
+# Las clases se importan al pedirlas: el orquestador importa solo los
+# analyzers habilitados a partir del registro
+_EXPORTS = {
+    "CBOAnalyzer": ".cbo_analyzer",
+    "CircularImportsAnalyzer": ".circular_imports_analyzer",
+    "DataClumpsAnalyzer": ".data_clumps_analyzer",
+    "DITAnalyzer": ".dit_analyzer",
+    "FanOutAnalyzer": ".fan_out_analyzer",
+    "FeatureEnvyAnalyzer": ".feature_envy_analyzer",
+    "GodObjectAnalyzer": ".god_object_analyzer",
+    "LawOfDemeterAnalyzer": ".law_of_demeter_analyzer",
+    "LCOMAnalyzer": ".lcom_analyzer",
+    "LongMethodAnalyzer": ".long_method_analyzer",
+    "LongParameterListAnalyzer": ".long_parameter_list_analyzer",
+    "NOPAnalyzer": ".nop_analyzer",
+    "PrimitiveObsessionAnalyzer": ".primitive_obsession_analyzer",
+    "WMCAnalyzer": ".wmc_analyzer",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS)
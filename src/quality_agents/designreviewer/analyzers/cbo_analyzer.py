@@ -10,9 +10,11 @@ Ticket: 2.1 + 2.4
 
 import ast
 from pathlib import Path
-from typing import Any, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 # Tipos que no cuentan como acoplamiento externo
@@ -39,8 +41,10 @@ _TIPOS_EXCLUIDOS: Set[str] = {
     "self", "cls",
 }
 
+_Funcion = Union[ast.FunctionDef, ast.AsyncFunctionDef]
 
-class CBOAnalyzer(Verifiable):
+
+class CBOAnalyzer(TreeListener, Verifiable):
     """
     Detecta clases con acoplamiento excesivo (CBO alto).
 
@@ -50,12 +54,16 @@ class CBOAnalyzer(Verifiable):
       - Type hints en parámetros, retornos y atributos de instancia
       - Instanciaciones directas: SomeClass(...)
 
+    Las referencias se recolectan en el recorrido compartido del AST
+    (`TreeListener`): cada nodo suma en las clases que lo contienen.
+
     Umbral por defecto: 5 (configurable vía max_cbo en pyproject.toml).
     Severidad: CRITICAL.
     """
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -75,6 +83,7 @@ class CBOAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "cbo", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -89,20 +98,77 @@ class CBOAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (puede ser vacía si no hay violaciones).
         """
-        threshold = self._config.max_cbo if self._config else 5
-        results: List[ReviewResult] = []
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
-
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ClassDef):
-                continue
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        # Clases en orden de aparición, cada una con los tipos que referencia
+        self._clases: List[Tuple[ast.ClassDef, Set[str]]] = []
+        self._tipos_por_clase: Dict[int, Set[str]] = {}
+        return {
+            ast.ClassDef: self._on_class,
+            ast.AnnAssign: self._on_ann_assign,
+            (ast.FunctionDef, ast.AsyncFunctionDef): self._on_function,
+            ast.Call: self._on_call,
+        }
+
+    def _on_class(self, class_node: ast.ClassDef, scopes: Scopes) -> None:
+        """Registra la clase con sus clases base (herencia)."""
+        tipos: Set[str] = set()
+        for base in class_node.bases:
+            nombre = self._extraer_nombre(base)
+            if nombre and nombre not in _TIPOS_EXCLUIDOS:
+                tipos.add(nombre)
+        self._clases.append((class_node, tipos))
+        self._tipos_por_clase[id(class_node)] = tipos
+
+    def _agregar_tipos(self, scopes: Scopes, tipos: Set[str]) -> None:
+        """Suma los tipos a todas las clases que contienen al nodo (anidadas incluidas)."""
+        if not tipos:
+            return
+        for scope in scopes:
+            tipos_clase = self._tipos_por_clase.get(id(scope))
+            if tipos_clase is not None:
+                tipos_clase.update(tipos)
+
+    def _on_ann_assign(self, nodo: ast.AnnAssign, scopes: Scopes) -> None:
+        """Anotaciones de variables: attr: Tipo = ..."""
+        self._agregar_tipos(scopes, self._nombres_de_anotacion(nodo.annotation))
+
+    def _on_function(self, nodo: _Funcion, scopes: Scopes) -> None:
+        """Anotaciones de funciones (params + retorno)."""
+        tipos: Set[str] = set()
+        for arg in nodo.args.args + nodo.args.posonlyargs + nodo.args.kwonlyargs:
+            if arg.annotation:
+                tipos.update(self._nombres_de_anotacion(arg.annotation))
+        if nodo.returns:
+            tipos.update(self._nombres_de_anotacion(nodo.returns))
+        self._agregar_tipos(scopes, tipos)
+
+    def _on_call(self, nodo: ast.Call, scopes: Scopes) -> None:
+        """Instanciaciones: AlgunaClase(...)."""
+        nombre = self._extraer_nombre(nodo.func)
+        if (
+            nombre
+            and nombre not in _TIPOS_EXCLUIDOS
+            and nombre[0].isupper()  # convencion: clases empiezan con mayúscula
+        ):
+            self._agregar_tipos(scopes, {nombre})
+
+    def end_module(self) -> List[ReviewResult]:
+        threshold = self._config.max_cbo if self._config else 5
+        results: List[ReviewResult] = []
 
-            tipos_acoplados = self._calcular_cbo(node)
+        for node, tipos_acoplados in self._clases:
             cbo = len(tipos_acoplados)
 
             if cbo > threshold:
@@ -119,7 +185,7 @@ class CBOAnalyzer(Verifiable):
                         f"(umbral: {threshold}). "
                         f"Clases acopladas: {', '.join(sorted(tipos_acoplados))}."
                     ),
-                    file_path=file_path,
+                    file_path=self._file_path,
                     class_name=node.name,
                     suggestion=(
                         f"Reducir dependencias directas aplicando Dependency Inversion: "
@@ -130,46 +196,6 @@ class CBOAnalyzer(Verifiable):
 
         return results
 
-    def _calcular_cbo(self, class_node: ast.ClassDef) -> Set[str]:
-        """Recolecta el conjunto de tipos externos que referencia la clase."""
-        tipos: Set[str] = set()
-
-        # 1. Clases base (herencia)
-        for base in class_node.bases:
-            nombre = self._extraer_nombre(base)
-            if nombre and nombre not in _TIPOS_EXCLUIDOS:
-                tipos.add(nombre)
-
-        # 2. Recorrer el cuerpo de la clase
-        for nodo in ast.walk(class_node):
-            # 2a. Anotaciones de variables: attr: Tipo = ...
-            if isinstance(nodo, ast.AnnAssign):
-                tipos.update(self._nombres_de_anotacion(nodo.annotation))
-
-            # 2b. Anotaciones de funciones (params + retorno)
-            elif isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                for arg in (
-                    nodo.args.args
-                    + nodo.args.posonlyargs
-                    + nodo.args.kwonlyargs
-                ):
-                    if arg.annotation:
-                        tipos.update(self._nombres_de_anotacion(arg.annotation))
-                if nodo.returns:
-                    tipos.update(self._nombres_de_anotacion(nodo.returns))
-
-            # 2c. Instanciaciones: AlgunaClase(...)
-            elif isinstance(nodo, ast.Call):
-                nombre = self._extraer_nombre(nodo.func)
-                if (
-                    nombre
-                    and nombre not in _TIPOS_EXCLUIDOS
-                    and nombre[0].isupper()  # convencion: clases empiezan con mayúscula
-                ):
-                    tipos.add(nombre)
-
-        return tipos
-
     def _nombres_de_anotacion(self, nodo: ast.expr) -> Set[str]:
         """Extrae nombres de tipos de un nodo de anotación."""
         nombres: Set[str] = set()
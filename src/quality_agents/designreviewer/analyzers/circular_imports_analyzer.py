@@ -11,13 +11,15 @@ Ticket: 2.3 + 2.4
 
 import ast
 from pathlib import Path
-from typing import Any, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 
-class CircularImportsAnalyzer(Verifiable):
+class CircularImportsAnalyzer(TreeListener, Verifiable):
     """
     Detecta importaciones circulares directas entre módulos del proyecto.
 
@@ -30,12 +32,19 @@ class CircularImportsAnalyzer(Verifiable):
         3. Verificar si ese archivo importa de vuelta al módulo original
 
     Solo analiza archivos dentro del mismo proyecto (no librerías externas).
+    Los imports del archivo analizado se recolectan en el recorrido compartido
+    del AST (`TreeListener`); los de los módulos importados, leyendo cada uno.
     Severidad: CRITICAL.
     estimated_effort: 2.0 horas por ciclo (fijo).
     """
 
+    # El resultado de un archivo depende de otros (los que importa): en modo
+    # --watch se vuelve a ejecutar también sobre los archivos que ya reportó.
+    cross_file = True
+
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -55,6 +64,7 @@ class CircularImportsAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "circular_imports", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -69,11 +79,32 @@ class CircularImportsAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (un resultado por ciclo).
         """
+        try:
+            tree = parsed_module(file_path, self._modules).tree
+        except (OSError, SyntaxError):
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        self._imports: Set[str] = set()
+        return {(ast.Import, ast.ImportFrom): self._on_import}
+
+    def _on_import(self, nodo: ast.stmt, scopes: Scopes) -> None:
+        self._agregar_import(nodo, self._imports)
+
+    def end_module(self) -> List[ReviewResult]:
+        file_path = self._file_path
         results: List[ReviewResult] = []
 
         root = self._encontrar_raiz_proyecto(file_path)
         modulo_actual = self._archivo_a_modulo(file_path, root)
-        imports_actuales = self._obtener_imports(file_path)
+        imports_actuales = self._imports
 
         for modulo_importado in imports_actuales:
             archivo_importado = self._modulo_a_archivo(modulo_importado, root)
@@ -178,23 +209,27 @@ class CircularImportsAnalyzer(Verifiable):
             Conjunto de nombres de módulos importados.
         """
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
             return set()
 
         imports: Set[str] = set()
 
         for nodo in ast.walk(tree):
-            if isinstance(nodo, ast.Import):
-                for alias in nodo.names:
-                    imports.add(alias.name)
-            elif isinstance(nodo, ast.ImportFrom):
-                if nodo.level == 0 and nodo.module:
-                    imports.add(nodo.module)
+            self._agregar_import(nodo, imports)
 
         return imports
 
+    @staticmethod
+    def _agregar_import(nodo: ast.AST, imports: Set[str]) -> None:
+        """Agrega a `imports` el módulo de un nodo `import`/`from ... import` absoluto."""
+        if isinstance(nodo, ast.Import):
+            for alias in nodo.names:
+                imports.add(alias.name)
+        elif isinstance(nodo, ast.ImportFrom):
+            if nodo.level == 0 and nodo.module:
+                imports.add(nodo.module)
+
     def _modulo_a_archivo(self, modulo: str, root: Path) -> Optional[Path]:
         """
         Intenta encontrar el archivo .py correspondiente a un nombre de módulo.
@@ -20,13 +20,15 @@ Ticket: 3.3 + 3.5
 
 import ast
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 
-class DITAnalyzer(Verifiable):
+class DITAnalyzer(TreeListener, Verifiable):
     """
     Detecta clases con árbol de herencia excesivamente profundo (DIT alto).
 
@@ -40,6 +42,7 @@ class DITAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -59,6 +62,7 @@ class DITAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "dit", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -73,18 +77,29 @@ class DITAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (puede ser vacía si no hay violaciones).
         """
-        threshold = self._config.max_dit if self._config else 5
-        results: List[ReviewResult] = []
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
 
-        clases_locales = self._extraer_clases(tree)
-        if not clases_locales:
-            return results
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        self._clases: Dict[str, List[str]] = {}
+        return {ast.ClassDef: self._on_class}
+
+    def _on_class(self, nodo: ast.ClassDef, scopes: Scopes) -> None:
+        self._clases[nodo.name] = self._bases_locales(nodo)
+
+    def end_module(self) -> List[ReviewResult]:
+        threshold = self._config.max_dit if self._config else 5
+        results: List[ReviewResult] = []
+        clases_locales = self._clases
 
         memo: Dict[str, int] = {}
         for nombre in clases_locales:
@@ -103,7 +118,7 @@ class DITAnalyzer(Verifiable):
                         f"Clase '{nombre}' tiene DIT={dit} "
                         f"(umbral: {threshold}): jerarquía de herencia excesivamente profunda."
                     ),
-                    file_path=file_path,
+                    file_path=self._file_path,
                     class_name=nombre,
                     suggestion=(
                         f"Reemplazar los {exceso} nivel(es) extra de herencia por composición: "
@@ -125,14 +140,16 @@ class DITAnalyzer(Verifiable):
         clases: Dict[str, List[str]] = {}
 
         for nodo in ast.walk(tree):
-            if not isinstance(nodo, ast.ClassDef):
-                continue
-            bases = [self._nombre_base(b) for b in nodo.bases]
-            bases_filtradas = [b for b in bases if b and b != "object"]
-            clases[nodo.name] = bases_filtradas
+            if isinstance(nodo, ast.ClassDef):
+                clases[nodo.name] = self._bases_locales(nodo)
 
         return clases
 
+    def _bases_locales(self, nodo: ast.ClassDef) -> List[str]:
+        """Nombres de las bases de la clase, sin `object`."""
+        bases = [self._nombre_base(b) for b in nodo.bases]
+        return [b for b in bases if b and b != "object"]
+
     def _nombre_base(self, nodo: ast.expr) -> str:
         """Extrae el nombre simple de un nodo base de herencia."""
         if isinstance(nodo, ast.Name):
@@ -11,13 +11,15 @@ Ticket: 2.2 + 2.4
 
 import ast
 from pathlib import Path
-from typing import Any, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 
-class FanOutAnalyzer(Verifiable):
+class FanOutAnalyzer(TreeListener, Verifiable):
     """
     Detecta archivos con demasiadas dependencias de módulos externos (Fan-Out alto).
 
@@ -31,6 +33,7 @@ class FanOutAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -50,6 +53,7 @@ class FanOutAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "fan_out", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -64,16 +68,42 @@ class FanOutAnalyzer(Verifiable):
         Returns:
             Lista con un ReviewResult si hay violación, vacía si no.
         """
-        threshold = self._config.max_fan_out if self._config else 7
-        results: List[ReviewResult] = []
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
+            return []
+
+        return self.analyze_tree(tree, file_path)
 
-        modulos = self._recolectar_modulos(tree)
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        self._modulos: Set[str] = set()
+        return {ast.Import: self._on_import, ast.ImportFrom: self._on_import_from}
+
+    def _on_import(self, nodo: ast.Import, scopes: Scopes) -> None:
+        """
+        Registra los módulos raíz de `import X.Y` (ej: `import os.path` → `os`).
+
+        Se cuentan dependencias a nivel de paquete raíz, no de submódulo.
+        """
+        for alias in nodo.names:
+            self._modulos.add(alias.name.split(".")[0])
+
+    def _on_import_from(self, nodo: ast.ImportFrom, scopes: Scopes) -> None:
+        """Registra el módulo raíz de `from X.Y import Z`; ignora los relativos."""
+        # level > 0 indica import relativo (from . import X)
+        if nodo.level == 0 and nodo.module:
+            self._modulos.add(nodo.module.split(".")[0])
+
+    def end_module(self) -> List[ReviewResult]:
+        threshold = self._config.max_fan_out if self._config else 7
+        results: List[ReviewResult] = []
+
+        modulos = self._modulos
         fan_out = len(modulos)
 
         if fan_out > threshold:
@@ -86,11 +116,11 @@ class FanOutAnalyzer(Verifiable):
                 current_value=fan_out,
                 threshold=threshold,
                 message=(
-                    f"'{file_path.name}' importa {fan_out} módulos externos "
+                    f"'{self._file_path.name}' importa {fan_out} módulos externos "
                     f"(umbral: {threshold}). "
                     f"Módulos: {', '.join(sorted(modulos))}."
                 ),
-                file_path=file_path,
+                file_path=self._file_path,
                 suggestion=(
                     f"Reducir las {exceso} dependencia(s) extra aplicando Dependency Inversion: "
                     f"agrupar imports relacionados en un módulo facade o usar inyección."
@@ -99,33 +129,3 @@ class FanOutAnalyzer(Verifiable):
             ))
 
         return results
-
-    def _recolectar_modulos(self, tree: ast.AST) -> Set[str]:
-        """
-        Recolecta los módulos raíz externos únicos del árbol AST.
-
-        Extrae el primer segmento del nombre de módulo para contar dependencias
-        a nivel de paquete raíz (ej: `from os.path import join` → `os`).
-        Los imports relativos (level > 0) se ignoran.
-
-        Args:
-            tree: AST del archivo a analizar.
-
-        Returns:
-            Conjunto de nombres de módulos raíz externos únicos.
-        """
-        modulos: Set[str] = set()
-
-        for nodo in ast.walk(tree):
-            if isinstance(nodo, ast.Import):
-                for alias in nodo.names:
-                    raiz = alias.name.split(".")[0]
-                    modulos.add(raiz)
-
-            elif isinstance(nodo, ast.ImportFrom):
-                # level > 0 indica import relativo (from . import X)
-                if nodo.level == 0 and nodo.module:
-                    raiz = nodo.module.split(".")[0]
-                    modulos.add(raiz)
-
-        return modulos
@@ -22,9 +22,11 @@ Ticket: 4.4
 
 import ast
 from pathlib import Path
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity, SolidPrinciple
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 # Mínimo de accesos externos para considerar Feature Envy (evita falsos positivos)
@@ -33,8 +35,10 @@ _MIN_ACCESOS_EXTERNOS = 3
 # Parámetros implícitos que se excluyen del análisis de Feature Envy
 _PARAMS_IMPLICITOS: Set[str] = {"self", "cls"}
 
+_Funcion = Union[ast.FunctionDef, ast.AsyncFunctionDef]
 
-class FeatureEnvyAnalyzer(Verifiable):
+
+class FeatureEnvyAnalyzer(TreeListener, Verifiable):
     """
     Detecta métodos de clase con Feature Envy.
 
@@ -50,11 +54,16 @@ class FeatureEnvyAnalyzer(Verifiable):
     Umbral mínimo de 3 accesos externos para filtrar métodos triviales donde
     una sola llamada como `other.run()` generaría ruido innecesario.
 
+    Los accesos se cuentan en el recorrido compartido del AST (`TreeListener`):
+    cada `nombre.algo` suma en los métodos que lo contienen, sin recorrer
+    cada método una vez por parámetro.
+
     Severidad: WARNING (viola SRP).
     """
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -74,6 +83,7 @@ class FeatureEnvyAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "feature_envy", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -90,27 +100,26 @@ class FeatureEnvyAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (puede ser vacía si no hay violaciones).
         """
-        results: List[ReviewResult] = []
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
+            return []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                self._analizar_clase(node, file_path, results)
+        return self.analyze_tree(tree, file_path)
 
-        return results
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
 
-    def _analizar_clase(
-        self,
-        class_node: ast.ClassDef,
-        file_path: Path,
-        results: List[ReviewResult],
-    ) -> None:
-        """Analiza todos los métodos de instancia de una clase."""
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        # Métodos candidatos en orden de aparición: (clase, método, accesos por nombre)
+        self._metodos: List[Tuple[ast.ClassDef, _Funcion, Dict[str, int]]] = []
+        self._accesos_por_metodo: Dict[int, Dict[str, int]] = {}
+        return {ast.ClassDef: self._on_class, ast.Attribute: self._on_attribute}
+
+    def _on_class(self, class_node: ast.ClassDef, scopes: Scopes) -> None:
+        """Registra los métodos de instancia de la clase que reciben parámetros."""
         for nodo in class_node.body:
             if not isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 continue
@@ -121,13 +130,30 @@ class FeatureEnvyAnalyzer(Verifiable):
             if not params_externos:
                 continue  # Sin parámetros que envidiar
 
-            accesos_self = self._contar_accesos(nodo, "self")
-            accesos_por_param: Dict[str, int] = {
-                p: self._contar_accesos(nodo, p) for p in params_externos
-            }
+            accesos = dict.fromkeys(["self", *params_externos], 0)
+            self._metodos.append((class_node, nodo, accesos))
+            self._accesos_por_metodo[id(nodo)] = accesos
 
-            param_max = max(accesos_por_param, key=lambda p: accesos_por_param[p])
-            max_accesos = accesos_por_param[param_max]
+    def _on_attribute(self, nodo: ast.Attribute, scopes: Scopes) -> None:
+        """
+        Cuenta `nombre.algo` en cada método registrado que contiene al nodo.
+
+        Detecta tanto acceso a atributos (`param.x`) como llamadas a métodos
+        (`param.method()`) ya que ambos representan uso de la interfaz del objeto.
+        """
+        if not isinstance(nodo.value, ast.Name):
+            return
+        for scope in scopes:
+            accesos = self._accesos_por_metodo.get(id(scope))
+            if accesos is not None and nodo.value.id in accesos:
+                accesos[nodo.value.id] += 1
+
+    def end_module(self) -> List[ReviewResult]:
+        results: List[ReviewResult] = []
+        for class_node, nodo, accesos in self._metodos:
+            accesos_self = accesos.pop("self")
+            param_max = max(accesos, key=lambda p: accesos[p])
+            max_accesos = accesos[param_max]
 
             if max_accesos > accesos_self and max_accesos >= _MIN_ACCESOS_EXTERNOS:
                 nombre_metodo = f"{class_node.name}.{nodo.name}"
@@ -141,7 +167,7 @@ class FeatureEnvyAnalyzer(Verifiable):
                         f"'{param_max}' vs {accesos_self} veces a self. "
                         f"Posible Feature Envy."
                     ),
-                    file_path=file_path,
+                    file_path=self._file_path,
                     class_name=class_node.name,
                     suggestion=(
                         f"Mover '{nodo.name}' a la clase de '{param_max}', "
@@ -151,6 +177,7 @@ class FeatureEnvyAnalyzer(Verifiable):
                     solid_principle=SolidPrinciple.SRP,
                     smell_type="FeatureEnvy",
                 ))
+        return results
 
     def _obtener_params_externos(self, func_node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> List[str]:
         """
@@ -162,20 +189,3 @@ class FeatureEnvyAnalyzer(Verifiable):
         args = func_node.args
         todos = list(args.posonlyargs) + list(args.args) + list(args.kwonlyargs)
         return [a.arg for a in todos if a.arg not in _PARAMS_IMPLICITOS]
-
-    def _contar_accesos(self, func_node: Union[ast.FunctionDef, ast.AsyncFunctionDef], nombre: str) -> int:
-        """
-        Cuenta las ocurrencias de `nombre.algo` en el cuerpo del método.
-
-        Detecta tanto acceso a atributos (`param.x`) como llamadas a métodos
-        (`param.method()`) ya que ambos representan uso de la interfaz del objeto.
-        """
-        count = 0
-        for nodo in ast.walk(func_node):
-            if (
-                isinstance(nodo, ast.Attribute)
-                and isinstance(nodo.value, ast.Name)
-                and nodo.value.id == nombre
-            ):
-                count += 1
-        return count
@@ -14,13 +14,15 @@ Ticket: 4.2
 
 import ast
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity, SolidPrinciple
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 
-class GodObjectAnalyzer(Verifiable):
+class GodObjectAnalyzer(TreeListener, Verifiable):
     """
     Detecta clases con demasiadas responsabilidades (God Object).
 
@@ -37,6 +39,7 @@ class GodObjectAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -56,6 +59,7 @@ class GodObjectAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "god_object", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -70,64 +74,71 @@ class GodObjectAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (puede ser vacía si no hay violaciones).
         """
+        try:
+            tree = parsed_module(file_path, self._modules).tree
+        except (OSError, SyntaxError):
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        self._results: List[ReviewResult] = []
+        return {ast.ClassDef: self._on_class}
+
+    def _on_class(self, node: ast.ClassDef, scopes: Scopes) -> None:
         max_methods = self._config.max_god_object_methods if self._config else 20
         max_lines = self._config.max_god_object_lines if self._config else 300
-        results: List[ReviewResult] = []
 
-        try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-        except (OSError, SyntaxError):
-            return results
-
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ClassDef):
-                continue
-
-            n_metodos = self._contar_metodos_publicos(node)
-            n_lineas = (node.end_lineno or node.lineno) - node.lineno + 1
-
-            excede_metodos = n_metodos > max_methods
-            excede_lineas = n_lineas > max_lines
-
-            if not (excede_metodos or excede_lineas):
-                continue
-
-            # Valor reportado: métodos tiene prioridad sobre líneas
-            current_value = n_metodos if excede_metodos else n_lineas
-            threshold = max_methods if excede_metodos else max_lines
-
-            exceso_metodos = max(0, n_metodos - max_methods)
-            exceso_bloques = max(0, n_lineas - max_lines) // 50
-            estimated_effort = round(3.0 + (exceso_metodos + exceso_bloques) * 0.5, 1)
-
-            partes = []
-            if excede_metodos:
-                partes.append(f"{n_metodos} métodos (umbral: {max_methods})")
-            if excede_lineas:
-                partes.append(f"{n_lineas} líneas (umbral: {max_lines})")
-
-            results.append(ReviewResult(
-                analyzer_name=self.name,
-                severity=ReviewSeverity.CRITICAL,
-                current_value=current_value,
-                threshold=threshold,
-                message=(
-                    f"Clase '{node.name}' tiene {', '.join(partes)}. "
-                    f"Clase dios: acumula demasiadas responsabilidades."
-                ),
-                file_path=file_path,
-                class_name=node.name,
-                suggestion=(
-                    f"Dividir '{node.name}' aplicando SRP: extraer responsabilidades "
-                    f"en clases separadas. Esfuerzo estimado: {estimated_effort}h."
-                ),
-                estimated_effort=estimated_effort,
-                solid_principle=SolidPrinciple.SRP,
-                smell_type="GodObject",
-            ))
-
-        return results
+        n_metodos = self._contar_metodos_publicos(node)
+        n_lineas = (node.end_lineno or node.lineno) - node.lineno + 1
+
+        excede_metodos = n_metodos > max_methods
+        excede_lineas = n_lineas > max_lines
+
+        if not (excede_metodos or excede_lineas):
+            return
+
+        # Valor reportado: métodos tiene prioridad sobre líneas
+        current_value = n_metodos if excede_metodos else n_lineas
+        threshold = max_methods if excede_metodos else max_lines
+
+        exceso_metodos = max(0, n_metodos - max_methods)
+        exceso_bloques = max(0, n_lineas - max_lines) // 50
+        estimated_effort = round(3.0 + (exceso_metodos + exceso_bloques) * 0.5, 1)
+
+        partes = []
+        if excede_metodos:
+            partes.append(f"{n_metodos} métodos (umbral: {max_methods})")
+        if excede_lineas:
+            partes.append(f"{n_lineas} líneas (umbral: {max_lines})")
+
+        self._results.append(ReviewResult(
+            analyzer_name=self.name,
+            severity=ReviewSeverity.CRITICAL,
+            current_value=current_value,
+            threshold=threshold,
+            message=(
+                f"Clase '{node.name}' tiene {', '.join(partes)}. "
+                f"Clase dios: acumula demasiadas responsabilidades."
+            ),
+            file_path=self._file_path,
+            class_name=node.name,
+            suggestion=(
+                f"Dividir '{node.name}' aplicando SRP: extraer responsabilidades "
+                f"en clases separadas. Esfuerzo estimado: {estimated_effort}h."
+            ),
+            estimated_effort=estimated_effort,
+            solid_principle=SolidPrinciple.SRP,
+            smell_type="GodObject",
+        ))
+
+    def end_module(self) -> List[ReviewResult]:
+        return self._results
 
     def _contar_metodos_publicos(self, class_node: ast.ClassDef) -> int:
         """
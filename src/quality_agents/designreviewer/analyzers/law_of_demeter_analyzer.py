@@ -22,13 +22,17 @@ Exclusiones:
 
 import ast
 from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity, SolidPrinciple
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
+_Funcion = Union[ast.FunctionDef, ast.AsyncFunctionDef]
 
-class LawOfDemeterAnalyzer(Verifiable):
+
+class LawOfDemeterAnalyzer(TreeListener, Verifiable):
     """
     Detecta cadenas de acceso a atributos que violan la Ley de Demeter.
 
@@ -36,11 +40,15 @@ class LawOfDemeterAnalyzer(Verifiable):
     supere `max_demeter_depth`. Las cadenas que comienzan con `self` se excluyen
     porque representan acceso legítimo al estado propio del objeto.
 
+    Las cadenas de cada función se recolectan en el recorrido compartido del
+    AST (`TreeListener`), sin volver a recorrer cada función.
+
     Severidad: WARNING.
     """
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -60,33 +68,60 @@ class LawOfDemeterAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks"):
             if not getattr(context.config.checks, "law_of_demeter", True):
                 return False
         return not context.is_excluded and context.file_path.suffix == ".py"
 
     def execute(self, file_path: Path) -> List[ReviewResult]:
-        results: List[ReviewResult] = []
-
+        try:
+            tree = parsed_module(file_path, self._modules).tree
+        except (OSError, SyntaxError):
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        # Funciones en orden de aparición, cada una con los Attribute que contiene
+        self._funciones: List[Tuple[_Funcion, List[ast.Attribute]]] = []
+        self._atributos_por_funcion: Dict[int, List[ast.Attribute]] = {}
+        return {
+            (ast.FunctionDef, ast.AsyncFunctionDef): self._on_function,
+            ast.Attribute: self._on_attribute,
+        }
+
+    def _on_function(self, func_node: _Funcion, scopes: Scopes) -> None:
+        atributos: List[ast.Attribute] = []
+        self._funciones.append((func_node, atributos))
+        self._atributos_por_funcion[id(func_node)] = atributos
+
+    def _on_attribute(self, nodo: ast.Attribute, scopes: Scopes) -> None:
+        """Agrega el nodo a todas las funciones que lo contienen (anidadas incluidas)."""
+        for scope in scopes:
+            atributos = self._atributos_por_funcion.get(id(scope))
+            if atributos is not None:
+                atributos.append(nodo)
+
+    def end_module(self) -> List[ReviewResult]:
         max_depth = 1
         if self._config is not None:
             max_depth = getattr(self._config, "max_demeter_depth", 1)
 
-        try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-        except (OSError, SyntaxError):
-            return results
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                self._analizar_funcion(node, file_path, max_depth, results)
-
+        results: List[ReviewResult] = []
+        for func_node, atributos in self._funciones:
+            self._analizar_funcion(func_node, atributos, self._file_path, max_depth, results)
         return results
 
     def _analizar_funcion(
         self,
-        func_node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        func_node: _Funcion,
+        atributos: List[ast.Attribute],
         file_path: Path,
         max_depth: int,
         results: List[ReviewResult],
@@ -94,7 +129,7 @@ class LawOfDemeterAnalyzer(Verifiable):
         """Busca cadenas de acceso que superan max_depth en el cuerpo de la función."""
         # Recolectar todos los nodos Attribute que son raíz de cadena
         # (es decir, cuyo padre NO es también un Attribute)
-        cadenas_raiz = self._obtener_cadenas_raiz(func_node)
+        cadenas_raiz = self._obtener_cadenas_raiz(atributos)
 
         for nodo in cadenas_raiz:
             cadena, depth = self._desplegar_cadena(nodo)
@@ -130,18 +165,17 @@ class LawOfDemeterAnalyzer(Verifiable):
                 smell_type="LawOfDemeter",
             ))
 
-    def _obtener_cadenas_raiz(
-        self,
-        func_node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
-    ) -> List[ast.Attribute]:
+    def _obtener_cadenas_raiz(self, todos: List[ast.Attribute]) -> List[ast.Attribute]:
         """
         Retorna los nodos Attribute más externos de cada cadena.
 
         Un nodo Attribute es raíz si NO es el .value de otro Attribute,
         es decir, no hay ningún otro Attribute que lo use como base.
         Así se evita contar el mismo acceso múltiples veces al caminar el árbol.
+
+        Args:
+            todos: Nodos Attribute de la función, en el orden de `ast.walk`
         """
-        todos = [n for n in ast.walk(func_node) if isinstance(n, ast.Attribute)]
         # IDs de nodos que son base (.value) de otro Attribute — son internos
         internos = {id(n.value) for n in todos if isinstance(n.value, ast.Attribute)}
         return [n for n in todos if id(n) not in internos]
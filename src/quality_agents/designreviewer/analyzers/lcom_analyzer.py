@@ -15,16 +15,18 @@ Ticket: 3.1 + 3.5
 
 import ast
 from pathlib import Path
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 # Decoradores que indican que el método no es de instancia
 _DECORADORES_NO_INSTANCIA: Set[str] = {"staticmethod", "classmethod", "abstractmethod"}
 
 
-class LCOMAnalyzer(Verifiable):
+class LCOMAnalyzer(TreeListener, Verifiable):
     """
     Detecta clases con baja cohesión (LCOM alto).
 
@@ -37,6 +39,7 @@ class LCOMAnalyzer(Verifiable):
 
     Solo se consideran métodos que acceden al menos un self.X. Los métodos sin
     acceso a atributos de instancia (utilities puras) se excluyen del cálculo.
+    Los accesos se recolectan en el recorrido compartido del AST (`TreeListener`).
 
     Umbral por defecto: 1 (configurable vía max_lcom en pyproject.toml).
     Severidad: WARNING.
@@ -44,6 +47,7 @@ class LCOMAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -63,6 +67,7 @@ class LCOMAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "lcom", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -77,20 +82,52 @@ class LCOMAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (puede ser vacía si no hay violaciones).
         """
-        threshold = self._config.max_lcom if self._config else 1
-        results: List[ReviewResult] = []
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
+            return []
+
+        return self.analyze_tree(tree, file_path)
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ClassDef):
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        # Clases en orden de aparición: (clase, [(método, atributos self.X)])
+        self._clases: List[Tuple[ast.ClassDef, List[Tuple[str, Set[str]]]]] = []
+        self._atributos_por_metodo: Dict[int, Set[str]] = {}
+        return {ast.ClassDef: self._on_class, ast.Attribute: self._on_attribute}
+
+    def _on_class(self, class_node: ast.ClassDef, scopes: Scopes) -> None:
+        """Registra los métodos de instancia de la clase."""
+        metodos: List[Tuple[str, Set[str]]] = []
+        for nodo in class_node.body:
+            if not isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if self._es_no_instancia(nodo):
                 continue
+            atributos: Set[str] = set()
+            metodos.append((nodo.name, atributos))
+            self._atributos_por_metodo[id(nodo)] = atributos
+        self._clases.append((class_node, metodos))
+
+    def _on_attribute(self, nodo: ast.Attribute, scopes: Scopes) -> None:
+        """Agrega `self.X` a los métodos registrados que contienen al nodo."""
+        if not (isinstance(nodo.value, ast.Name) and nodo.value.id == "self"):
+            return
+        for scope in scopes:
+            atributos = self._atributos_por_metodo.get(id(scope))
+            if atributos is not None:
+                atributos.add(nodo.attr)
+
+    def end_module(self) -> List[ReviewResult]:
+        threshold = self._config.max_lcom if self._config else 1
+        results: List[ReviewResult] = []
 
-            lcom = self._calcular_lcom(node)
+        for node, metodos in self._clases:
+            lcom = self._calcular_lcom(metodos)
 
             if lcom > threshold:
                 exceso = lcom - threshold
@@ -106,7 +143,7 @@ class LCOMAnalyzer(Verifiable):
                         f"(umbral: {threshold}): {lcom} grupos de métodos "
                         f"sin atributos compartidos."
                     ),
-                    file_path=file_path,
+                    file_path=self._file_path,
                     class_name=node.name,
                     suggestion=(
                         f"Dividir '{node.name}' en {lcom} clases con responsabilidades "
@@ -117,29 +154,26 @@ class LCOMAnalyzer(Verifiable):
 
         return results
 
-    def _calcular_lcom(self, class_node: ast.ClassDef) -> int:
+    def _calcular_lcom(self, metodos: List[Tuple[str, Set[str]]]) -> int:
         """
-        Calcula LCOM4 para la clase dada.
+        Calcula LCOM4 para una clase.
 
-        1. Extrae el conjunto de atributos de instancia (self.X) que accede cada método.
+        1. Toma el conjunto de atributos de instancia (self.X) que accede cada método.
         2. Considera solo métodos con al menos un atributo de instancia accedido.
         3. Construye el grafo de conectividad y cuenta las componentes conexas.
 
+        Args:
+            metodos: Métodos de instancia de la clase con los atributos que acceden.
+
         Returns:
             Número de componentes conexas (LCOM4). Retorna 0 si la clase no tiene
             métodos de instancia con acceso a atributos.
         """
         atributos_por_metodo: Dict[str, Set[str]] = {}
 
-        for nodo in class_node.body:
-            if not isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            if self._es_no_instancia(nodo):
-                continue
-
-            atributos = self._atributos_de_instancia(nodo)
+        for nombre, atributos in metodos:
             if atributos:  # Solo incluir métodos que acceden al menos un self.X
-                atributos_por_metodo[nodo.name] = atributos
+                atributos_por_metodo[nombre] = atributos
 
         if len(atributos_por_metodo) <= 1:
             return 0  # 0 o 1 métodos con atributos → cohesivo por definición
@@ -158,23 +192,6 @@ class LCOMAnalyzer(Verifiable):
                 return True
         return False
 
-    def _atributos_de_instancia(self, func_node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> Set[str]:
-        """
-        Extrae el conjunto de nombres de atributos de instancia (self.X) accedidos
-        en el cuerpo del método.
-        """
-        atributos: Set[str] = set()
-
-        for nodo in ast.walk(func_node):
-            if (
-                isinstance(nodo, ast.Attribute)
-                and isinstance(nodo.value, ast.Name)
-                and nodo.value.id == "self"
-            ):
-                atributos.add(nodo.attr)
-
-        return atributos
-
     def _contar_componentes(self, atributos_por_metodo: Dict[str, Set[str]]) -> int:
         """
         Cuenta componentes conexas usando Union-Find.
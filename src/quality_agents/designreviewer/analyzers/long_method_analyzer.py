@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any, List, Optional, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity, SolidPrinciple
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 
@@ -36,6 +37,7 @@ class LongMethodAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -55,6 +57,7 @@ class LongMethodAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "long_method", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -73,8 +76,7 @@ class LongMethodAnalyzer(Verifiable):
         results: List[ReviewResult] = []
 
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
             return results
 
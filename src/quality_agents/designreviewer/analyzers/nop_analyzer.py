@@ -15,16 +15,18 @@ Ticket: 3.4 + 3.5
 
 import ast
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 # Bases que no cuentan como "padre real" porque son abstractas/protocolo por convención
 _BASES_EXCLUIDAS = {"object", "ABC", "Protocol"}
 
 
-class NOPAnalyzer(Verifiable):
+class NOPAnalyzer(TreeListener, Verifiable):
     """
     Detecta clases con herencia múltiple excesiva (NOP alto).
 
@@ -40,6 +42,7 @@ class NOPAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -59,6 +62,7 @@ class NOPAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not getattr(context.config.checks, "nop", True):
             return False
         return not context.is_excluded and context.file_path.suffix == ".py"
@@ -73,46 +77,53 @@ class NOPAnalyzer(Verifiable):
         Returns:
             Lista de ReviewResult (puede ser vacía si no hay violaciones).
         """
-        threshold = self._config.max_nop if self._config else 1
-        results: List[ReviewResult] = []
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
-
-        for nodo in ast.walk(tree):
-            if not isinstance(nodo, ast.ClassDef):
-                continue
-
-            padres = self._extraer_padres(nodo)
-            nop = len(padres)
-
-            if nop > threshold:
-                exceso = nop - threshold
-                estimated_effort = round(exceso * 1.0, 1)
-
-                results.append(ReviewResult(
-                    analyzer_name=self.name,
-                    severity=ReviewSeverity.CRITICAL,
-                    current_value=nop,
-                    threshold=threshold,
-                    message=(
-                        f"Clase '{nodo.name}' hereda de {nop} clases directas "
-                        f"(umbral: {threshold}): {', '.join(padres)}."
-                    ),
-                    file_path=file_path,
-                    class_name=nodo.name,
-                    suggestion=(
-                        f"Reemplazar los {exceso} padre(s) extra por composición: "
-                        f"convertir las clases adicionales en atributos inyectados "
-                        f"o en mixins con una única responsabilidad bien delimitada."
-                    ),
-                    estimated_effort=estimated_effort,
-                ))
-
-        return results
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        self._results: List[ReviewResult] = []
+        return {ast.ClassDef: self._on_class}
+
+    def _on_class(self, nodo: ast.ClassDef, scopes: Scopes) -> None:
+        threshold = self._config.max_nop if self._config else 1
+
+        padres = self._extraer_padres(nodo)
+        nop = len(padres)
+
+        if nop > threshold:
+            exceso = nop - threshold
+            estimated_effort = round(exceso * 1.0, 1)
+
+            self._results.append(ReviewResult(
+                analyzer_name=self.name,
+                severity=ReviewSeverity.CRITICAL,
+                current_value=nop,
+                threshold=threshold,
+                message=(
+                    f"Clase '{nodo.name}' hereda de {nop} clases directas "
+                    f"(umbral: {threshold}): {', '.join(padres)}."
+                ),
+                file_path=self._file_path,
+                class_name=nodo.name,
+                suggestion=(
+                    f"Reemplazar los {exceso} padre(s) extra por composición: "
+                    f"convertir las clases adicionales en atributos inyectados "
+                    f"o en mixins con una única responsabilidad bien delimitada."
+                ),
+                estimated_effort=estimated_effort,
+            ))
+
+    def end_module(self) -> List[ReviewResult]:
+        return self._results
 
     def _extraer_padres(self, class_node: ast.ClassDef) -> List[str]:
         """
@@ -21,16 +21,18 @@ Exclusiones:
 
 import ast
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity, SolidPrinciple
+from quality_agents.shared.ast_dispatch import Handler, NodeTypes, Scopes, TreeListener
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 _PRIMITIVOS = {"str", "int", "float", "bool", "bytes"}
 _DICT_TIPOS = {"dict", "Dict"}
 
 
-class PrimitiveObsessionAnalyzer(Verifiable):
+class PrimitiveObsessionAnalyzer(TreeListener, Verifiable):
     """
     Detecta métodos que usan primitivos donde deberían usarse Value Objects.
 
@@ -43,6 +45,7 @@ class PrimitiveObsessionAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -62,29 +65,37 @@ class PrimitiveObsessionAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks"):
             if not getattr(context.config.checks, "primitive_obsession", True):
                 return False
         return not context.is_excluded and context.file_path.suffix == ".py"
 
     def execute(self, file_path: Path) -> List[ReviewResult]:
-        results: List[ReviewResult] = []
-
-        max_primitive_params = 3
-        if self._config is not None:
-            max_primitive_params = getattr(self._config, "max_primitive_params", 3)
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parsed_module(file_path, self._modules).tree
         except (OSError, SyntaxError):
-            return results
+            return []
+
+        return self.analyze_tree(tree, file_path)
+
+    # -------------------------------------------------------------------------
+    # Recorrido compartido (TreeListener)
+    # -------------------------------------------------------------------------
+
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        self._file_path = file_path
+        self._results: List[ReviewResult] = []
+        self._max_primitive_params = 3
+        if self._config is not None:
+            self._max_primitive_params = getattr(self._config, "max_primitive_params", 3)
+        return {ast.ClassDef: self._on_class}
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                self._analizar_clase(node, file_path, max_primitive_params, results)
+    def _on_class(self, node: ast.ClassDef, scopes: Scopes) -> None:
+        self._analizar_clase(node, self._file_path, self._max_primitive_params, self._results)
 
-        return results
+    def end_module(self) -> List[ReviewResult]:
+        return self._results
 
     def _analizar_clase(
         self,
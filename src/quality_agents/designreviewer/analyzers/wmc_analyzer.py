@@ -5,26 +5,21 @@ Detecta clases con complejidad ciclomática total excesiva sumando la CC de
 todos sus métodos (WMC = ∑ CC(método)). Una clase con WMC alto acumula
 demasiada lógica, violando el Principio de Responsabilidad Única (SRP).
 
-Usa radon para calcular la complejidad ciclomática de cada método.
+Usa radon para calcular la complejidad ciclomática de cada método, a través
+del RadonMetricsProvider compartido con los checks de CodeGuard.
 
 Fecha de creación: 2026-02-20
 Ticket: 3.2 + 3.5
 """
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.shared.parsed_modules import ModuleStore, parsed_module
+from quality_agents.shared.radon_metrics import RadonMetrics, RadonMetricsProvider
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
-try:
-    from radon.complexity import cc_visit  # type: ignore[import-untyped]
-    from radon.visitors import Class as RadonClass  # type: ignore[import-untyped]
-
-    _RADON_DISPONIBLE = True
-except ImportError:
-    _RADON_DISPONIBLE = False
-
 
 class WMCAnalyzer(Verifiable):
     """
@@ -43,6 +38,7 @@ class WMCAnalyzer(Verifiable):
 
     def __init__(self) -> None:
         self._config: Any = None
+        self._modules: Optional[ModuleStore] = None
 
     @property
     def name(self) -> str:
@@ -62,10 +58,11 @@ class WMCAnalyzer(Verifiable):
 
     def should_run(self, context: ExecutionContext) -> bool:
         self._config = context.config
+        self._modules = context.modules
         if context.config and hasattr(context.config, "checks") and not context.config.checks.wmc:
             return False
         return (
-            _RADON_DISPONIBLE
+            RadonMetricsProvider.is_available()
             and not context.is_excluded
             and context.file_path.suffix == ".py"
         )
@@ -84,11 +81,11 @@ class WMCAnalyzer(Verifiable):
         results: List[ReviewResult] = []
 
         try:
-            source = file_path.read_text(encoding="utf-8")
+            metricas = parsed_module(file_path, self._modules).radon
         except OSError:
             return results
 
-        wmc_por_clase = self._calcular_wmc(source)
+        wmc_por_clase = self._calcular_wmc(metricas)
 
         for clase, wmc in wmc_por_clase.items():
             if wmc > threshold:
@@ -116,27 +113,24 @@ class WMCAnalyzer(Verifiable):
 
         return results
 
-    def _calcular_wmc(self, source: str) -> Dict[str, int]:
+    def _calcular_wmc(self, metricas: RadonMetrics) -> Dict[str, int]:
         """
-        Calcula el WMC de cada clase en el código fuente.
+        Calcula el WMC de cada clase del archivo.
 
-        Usa radon para obtener la complejidad ciclomática de cada método
-        y la agrupa por clase (classname del bloque Function).
+        Usa los bloques de radon del RadonMetricsProvider (memorizados por
+        contenido) y suma la complejidad de los métodos de cada clase.
 
         Args:
-            source: Código fuente Python como string.
+            metricas: Métricas de radon del archivo.
 
         Returns:
             Diccionario {nombre_clase: wmc_total}.
         """
-        wmc: Dict[str, int] = {}
+        from radon.visitors import Class as RadonClass  # type: ignore[import-untyped]
 
-        try:
-            bloques = cc_visit(source)
-        except Exception:
-            return wmc
+        wmc: Dict[str, int] = {}
 
-        for bloque in bloques:
+        for bloque in metricas.blocks:
             if isinstance(bloque, RadonClass):
                 wmc[bloque.name] = sum(m.complexity for m in bloque.methods)
 
@@ -112,6 +112,9 @@ class DesignReviewerConfig:
     max_demeter_depth: int = 1         # Profundidad máxima de cadena de acceso (Law of Demeter)
     max_primitive_params: int = 3      # Máximo de parámetros primitivos del mismo tipo (Primitive Obsession)
 
+    # Ejecución
+    jobs: int = 1  # Archivos en paralelo, en procesos (0 = CPUs disponibles, 1 = secuencial)
+
     # Exclusiones
     exclude_patterns: List[str] = field(default_factory=lambda: [
         "__pycache__",
@@ -1,20 +1,24 @@
 """
 Orquestador de analyzers para DesignReviewer.
 
-Auto-descubre y ejecuta todos los analyzers disponibles en el paquete
-`designreviewer.analyzers`. Mismo patrón que CheckOrchestrator de CodeGuard.
+Ejecuta los analyzers del registro de plugins (`designreviewer/registry.py` y
+entry points `quality_agents.analyzers`). Mismo patrón que CheckOrchestrator
+de CodeGuard.
 
 Fecha de creación: 2026-02-19
 Ticket: 1.4
 """
 
-import importlib
-import inspect
 import logging
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+from quality_agents.designreviewer.registry import BUILTIN_ANALYZERS
+from quality_agents.shared.ast_dispatch import TreeListener, dispatch
+from quality_agents.shared.concurrency import lpt_order, resolve_jobs
+from quality_agents.shared.parsed_modules import ModuleStore
+from quality_agents.shared.plugins import ANALYZERS_GROUP, PluginSet, PluginSpec
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 logger = logging.getLogger(__name__)
@@ -25,14 +29,15 @@ class AnalyzerOrchestrator:
     Orquesta la ejecución de analyzers de DesignReviewer.
 
     Responsabilidades:
-    1. Auto-discovery de analyzers disponibles (subclases de Verifiable en analyzers/)
+    1. Registro de analyzers disponibles (metadata estática, importación bajo demanda)
     2. Ejecución de todos los analyzers sobre el conjunto de archivos
     3. Manejo de errores: si un analyzer falla, loguea y continúa
     4. Agregación de resultados
 
     Attributes:
         config: Configuración de DesignReviewer con umbrales por métrica.
-        analyzers: Lista de analyzers descubiertos automáticamente.
+        plugins: Registro de analyzers (specs e instancias ya creadas).
+        analyzers: Todos los analyzers registrados, instanciados.
 
     Example:
         >>> orchestrator = AnalyzerOrchestrator(config)
@@ -45,57 +50,34 @@ class AnalyzerOrchestrator:
         """
         Inicializa el orquestador.
 
+        Los analyzers no se importan acá: el registro (analyzers propios y
+        entry points `quality_agents.analyzers`) se lee en la primera corrida
+        y solo se importan los habilitados en config.
+
         Args:
             config: Configuración de DesignReviewer (DesignReviewerConfig una vez
                     implementado el ticket 1.5).
         """
         self.config = config
-        self.analyzers: List[Verifiable] = self._discover_analyzers()
-        logger.info(
-            f"AnalyzerOrchestrator inicializado con {len(self.analyzers)} analyzers descubiertos"
+        self.plugins: PluginSet[Verifiable] = PluginSet(
+            ANALYZERS_GROUP, BUILTIN_ANALYZERS, kind="analyzer"
         )
 
-    def _discover_analyzers(self) -> List[Verifiable]:
-        """
-        Auto-discovery de analyzers en designreviewer.analyzers.
-
-        Importa el módulo `analyzers`, busca todas las clases que heredan de
-        `Verifiable` (excluyendo la clase base), las instancia y retorna la lista.
-
-        Returns:
-            Lista de instancias de analyzers descubiertos.
-        """
-        analyzers = []
-
-        try:
-            module = importlib.import_module("quality_agents.designreviewer.analyzers")
-
-            for name in dir(module):
-                obj = getattr(module, name)
-
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, Verifiable)
-                    and obj is not Verifiable
-                ):
-                    try:
-                        instance = obj()
-                        analyzers.append(instance)
-                        logger.debug(f"Analyzer descubierto: {instance.name}")
-                    except Exception as e:
-                        logger.warning(f"Error al instanciar analyzer {name}: {e}. Saltando.")
-
-        except ImportError:
-            logger.info(
-                "Módulo 'designreviewer.analyzers' no encontrado. "
-                "No hay analyzers disponibles todavía."
-            )
-        except Exception as e:
-            logger.error(f"Error durante auto-discovery de analyzers: {e}")
+    @property
+    def analyzers(self) -> List[Verifiable]:
+        """Todos los analyzers registrados (importa los que falten)."""
+        return self.plugins.load()
 
-        return analyzers
+    @analyzers.setter
+    def analyzers(self, analyzers: List[Verifiable]) -> None:
+        self.plugins.replace(analyzers)
 
-    def run(self, files: List[Path]) -> List[ReviewResult]:
+    def run(
+        self,
+        files: List[Path],
+        analyzers: Optional[List[Verifiable]] = None,
+        jobs: Optional[int] = None,
+    ) -> List[ReviewResult]:
         """
         Ejecuta todos los analyzers sobre los archivos dados.
 
@@ -103,8 +85,19 @@ class AnalyzerOrchestrator:
         que decidan correr (según su método should_run). Si un analyzer falla,
         registra el error y continúa con los demás.
 
+        Los analyzers comparten un ModuleStore de la corrida (en
+        `context.modules`): cada archivo se lee y se parsea una sola vez. Los
+        que implementan `TreeListener` comparten además un solo recorrido del
+        AST por archivo (`shared.ast_dispatch`).
+
+        Con más de un job, los archivos se reparten entre un pool de procesos
+        (ver `_run_processes`); los resultados son los mismos y en el mismo
+        orden que en la corrida secuencial.
+
         Args:
             files: Lista de archivos Python a analizar.
+            analyzers: Subconjunto de self.analyzers a ejecutar (None = todos).
+            jobs: Procesos en paralelo (None = `jobs` de config; 0 = CPUs disponibles).
 
         Returns:
             Lista agregada de resultados de todos los analyzers.
@@ -112,45 +105,202 @@ class AnalyzerOrchestrator:
         if not files:
             return []
 
-        results: List[ReviewResult] = []
         python_files = [f for f in files if f.suffix == ".py"]
-
-        for file_path in python_files:
-            context = ExecutionContext(
-                file_path=file_path,
-                analysis_type="pr-review",
-                config=self.config,
+        if analyzers is None:
+            # Los apagados en config no se importan (should_run los descartaría)
+            analyzers = self.plugins.load(
+                where=lambda p: not isinstance(p, PluginSpec) or p.is_enabled(self.config)
             )
 
-            for analyzer in self.analyzers:
-                if not analyzer.should_run(context):
-                    logger.debug(f"Analyzer {analyzer.name} saltado para {file_path.name}")
-                    continue
-
-                try:
-                    analyzer_results = analyzer.execute(file_path)
-                    results.extend(analyzer_results)
-                    logger.debug(
-                        f"Analyzer {analyzer.name}: {len(analyzer_results)} resultados "
-                        f"en {file_path.name}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error en analyzer {analyzer.name} sobre {file_path}: {e}"
-                    )
-                    results.append(
-                        ReviewResult(
-                            analyzer_name=analyzer.name,
-                            severity=ReviewSeverity.INFO,
-                            current_value=0,
-                            threshold=0,
-                            message=f"Analyzer falló con error: {e}",
-                            file_path=file_path,
-                        )
-                    )
+        if jobs is None:
+            jobs = getattr(self.config, "jobs", 1)
+        n_jobs = min(resolve_jobs(jobs), len(python_files))
+        if n_jobs > 1:
+            results = self._run_processes(python_files, analyzers, n_jobs)
+        else:
+            per_file = self._run_sequential(python_files, analyzers)
+            results = [result for file_results in per_file for result in file_results]
 
         logger.info(
             f"Análisis completado: {len(results)} resultados "
             f"en {len(python_files)} archivos"
         )
         return results
+
+    def _run_processes(
+        self, files: List[Path], analyzers: List[Verifiable], n_jobs: int
+    ) -> List[ReviewResult]:
+        """
+        Reparte los archivos entre un pool de procesos.
+
+        Los analyzers son CPU-bound (recorren el AST en Python): con hilos el
+        GIL los serializaría. Cada proceso recibe una copia de los analyzers y
+        de la config, y usa un ModuleStore por archivo. Los archivos se despachan
+        del más grande al más chico (LPT) y los resultados se reúnen en el
+        orden de `files`, así que la salida no depende de qué proceso terminó
+        primero. Un analyzer que falla se reporta dentro del proceso como
+        siempre (`ReviewResult` INFO); si falla el proceso (ej: un analyzer
+        que no se puede serializar), sus archivos se analizan en este.
+
+        Returns:
+            Resultados en orden archivo → analyzer, como en la corrida secuencial
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        by_file: Dict[Path, List[ReviewResult]] = {}
+        pending = lpt_order(dict.fromkeys(files), cost=_file_size)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(self.config, analyzers),
+            ) as pool:
+                futures = [(f, pool.submit(_review_file, f)) for f in pending]
+                for file_path, future in futures:
+                    try:
+                        by_file[file_path] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Worker falló sobre {file_path}: {e}")
+        except OSError as e:
+            logger.warning(f"No se pudo crear el pool de procesos: {e}")
+
+        missing = [f for f in pending if f not in by_file]
+        if missing:
+            logger.warning(f"{len(missing)} archivos se analizan sin el pool de procesos")
+            sequential = self._run_sequential(missing, analyzers)
+            for file_path, file_results in zip(missing, sequential, strict=True):
+                by_file[file_path] = file_results
+
+        return [result for file_path in files for result in by_file[file_path]]
+
+    def _run_sequential(
+        self, files: List[Path], analyzers: List[Verifiable]
+    ) -> List[List[ReviewResult]]:
+        """Ejecuta los analyzers sobre los archivos en este proceso (resultados por archivo)."""
+        modules = ModuleStore()
+        per_file: List[List[ReviewResult]] = []
+        try:
+            for file_path in files:
+                file_results: List[ReviewResult] = []
+                self._run_file(file_path, analyzers, modules, file_results)
+                per_file.append(file_results)
+        finally:
+            modules.clear()
+        return per_file
+
+    def _run_file(
+        self,
+        file_path: Path,
+        analyzers: List[Verifiable],
+        modules: ModuleStore,
+        results: List[ReviewResult],
+    ) -> None:
+        """Ejecuta los analyzers sobre un archivo y agrega sus resultados."""
+        context = ExecutionContext(
+            file_path=file_path,
+            analysis_type="pr-review",
+            config=self.config,
+            modules=modules,
+        )
+
+        runnable: List[Verifiable] = []
+        for analyzer in analyzers:
+            if not analyzer.should_run(context):
+                logger.debug(f"Analyzer {analyzer.name} saltado para {file_path.name}")
+                continue
+            runnable.append(analyzer)
+
+        # Los TreeListener comparten un solo recorrido del AST del archivo
+        listeners = [a for a in runnable if isinstance(a, TreeListener)]
+        outcomes = self._dispatch_listeners(file_path, listeners, modules)
+
+        for analyzer in runnable:
+            try:
+                if analyzer in outcomes:
+                    analyzer_results = self._unwrap(outcomes[analyzer])
+                else:
+                    analyzer_results = analyzer.execute(file_path)
+                results.extend(analyzer_results)
+                logger.debug(
+                    f"Analyzer {analyzer.name}: {len(analyzer_results)} resultados "
+                    f"en {file_path.name}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error en analyzer {analyzer.name} sobre {file_path}: {e}"
+                )
+                results.append(
+                    ReviewResult(
+                        analyzer_name=analyzer.name,
+                        severity=ReviewSeverity.INFO,
+                        current_value=0,
+                        threshold=0,
+                        message=f"Analyzer falló con error: {e}",
+                        file_path=file_path,
+                    )
+                )
+
+    def _dispatch_listeners(
+        self, file_path: Path, listeners: List[TreeListener], modules: ModuleStore
+    ) -> Dict[TreeListener, Union[List[ReviewResult], Exception]]:
+        """
+        Recorre una vez el AST del archivo para todos los TreeListener.
+
+        Un archivo que no se puede leer o parsear no produce resultados (como
+        en `execute`); cualquier otro error se reporta en cada listener.
+        """
+        if not listeners:
+            return {}
+        try:
+            tree = modules.get(file_path).tree
+        except (OSError, SyntaxError):
+            # Una lista propia por listener (dict.fromkeys compartiría la misma)
+            return {listener: [] for listener in listeners}  # noqa: C420
+        except Exception as e:
+            return dict.fromkeys(listeners, e)
+        return dict(zip(listeners, dispatch(tree, file_path, listeners), strict=True))
+
+    @staticmethod
+    def _unwrap(outcome: Union[List[ReviewResult], Exception]) -> List[ReviewResult]:
+        """Resultados de un listener (o la excepción con la que falló)."""
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+# --- Workers del pool de procesos (--jobs) ---
+
+# Estado de cada proceso del pool: orquestador y analyzers
+_worker: Optional[Tuple[AnalyzerOrchestrator, List[Verifiable]]] = None
+
+
+def _init_worker(config: Any, analyzers: List[Verifiable]) -> None:
+    """Inicializa un proceso del pool con su copia de la config y los analyzers."""
+    global _worker
+    _worker = (AnalyzerOrchestrator(config), analyzers)
+
+
+def _review_file(file_path: Path) -> List[ReviewResult]:
+    """
+    Analiza un archivo en un proceso del pool.
+
+    Los módulos parseados se descartan al terminar, como en `_run_sequential`:
+    el proceso vive toda la corrida y no debe acumular ASTs de archivo en archivo.
+    """
+    assert _worker is not None, "proceso del pool sin inicializar"
+    orchestrator, analyzers = _worker
+    results: List[ReviewResult] = []
+    modules = ModuleStore()
+    try:
+        orchestrator._run_file(file_path, analyzers, modules, results)
+    finally:
+        modules.clear()
+    return results
+
+
+def _file_size(file_path: Path) -> int:
+    """Costo estimado de analizar un archivo: su tamaño en bytes."""
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
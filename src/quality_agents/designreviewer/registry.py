@@ -0,0 +1,130 @@
+"""
+Registro de los analyzers de DesignReviewer.
+
+Metadata estática de cada analyzer (ver `quality_agents.shared.plugins`): el
+orquestador solo importa los analyzers habilitados en `[tool.designreviewer.checks]`.
+Deben coincidir con las propiedades de cada clase.
+
+Para agregar un analyzer: crear la clase en `analyzers/` y registrarla acá. Los
+analyzers de otros paquetes se registran con entry points en el grupo
+`quality_agents.analyzers`.
+"""
+
+from quality_agents.shared.plugins import PluginSpec
+
+_ANALYZERS = "quality_agents.designreviewer.analyzers"
+
+BUILTIN_ANALYZERS = (
+    PluginSpec(
+        name="CBOAnalyzer",
+        target=f"{_ANALYZERS}.cbo_analyzer:CBOAnalyzer",
+        category="coupling",
+        priority=2,
+        estimated_duration=0.5,
+        toggle="cbo",
+    ),
+    PluginSpec(
+        name="CircularImportsAnalyzer",
+        target=f"{_ANALYZERS}.circular_imports_analyzer:CircularImportsAnalyzer",
+        category="coupling",
+        priority=1,
+        estimated_duration=1.0,
+        toggle="circular_imports",
+    ),
+    PluginSpec(
+        name="DITAnalyzer",
+        target=f"{_ANALYZERS}.dit_analyzer:DITAnalyzer",
+        category="inheritance",
+        priority=2,
+        estimated_duration=0.5,
+        toggle="dit",
+    ),
+    PluginSpec(
+        name="DataClumpsAnalyzer",
+        target=f"{_ANALYZERS}.data_clumps_analyzer:DataClumpsAnalyzer",
+        category="smells",
+        priority=3,
+        estimated_duration=0.8,
+        toggle="data_clumps",
+    ),
+    PluginSpec(
+        name="FanOutAnalyzer",
+        target=f"{_ANALYZERS}.fan_out_analyzer:FanOutAnalyzer",
+        category="coupling",
+        priority=3,
+        estimated_duration=0.3,
+        toggle="fan_out",
+    ),
+    PluginSpec(
+        name="FeatureEnvyAnalyzer",
+        target=f"{_ANALYZERS}.feature_envy_analyzer:FeatureEnvyAnalyzer",
+        category="smells",
+        priority=3,
+        estimated_duration=0.8,
+        toggle="feature_envy",
+    ),
+    PluginSpec(
+        name="GodObjectAnalyzer",
+        target=f"{_ANALYZERS}.god_object_analyzer:GodObjectAnalyzer",
+        category="smells",
+        priority=1,
+        estimated_duration=0.5,
+        toggle="god_object",
+    ),
+    PluginSpec(
+        name="LCOMAnalyzer",
+        target=f"{_ANALYZERS}.lcom_analyzer:LCOMAnalyzer",
+        category="cohesion",
+        priority=3,
+        estimated_duration=0.5,
+        toggle="lcom",
+    ),
+    PluginSpec(
+        name="LawOfDemeterAnalyzer",
+        target=f"{_ANALYZERS}.law_of_demeter_analyzer:LawOfDemeterAnalyzer",
+        category="smells",
+        priority=4,
+        estimated_duration=0.8,
+        toggle="law_of_demeter",
+    ),
+    PluginSpec(
+        name="LongMethodAnalyzer",
+        target=f"{_ANALYZERS}.long_method_analyzer:LongMethodAnalyzer",
+        category="smells",
+        priority=2,
+        estimated_duration=0.5,
+        toggle="long_method",
+    ),
+    PluginSpec(
+        name="LongParameterListAnalyzer",
+        target=f"{_ANALYZERS}.long_parameter_list_analyzer:LongParameterListAnalyzer",
+        category="smells",
+        priority=2,
+        estimated_duration=0.5,
+        toggle="long_parameter_list",
+    ),
+    PluginSpec(
+        name="NOPAnalyzer",
+        target=f"{_ANALYZERS}.nop_analyzer:NOPAnalyzer",
+        category="inheritance",
+        priority=2,
+        estimated_duration=0.3,
+        toggle="nop",
+    ),
+    PluginSpec(
+        name="PrimitiveObsessionAnalyzer",
+        target=f"{_ANALYZERS}.primitive_obsession_analyzer:PrimitiveObsessionAnalyzer",
+        category="smells",
+        priority=4,
+        estimated_duration=0.8,
+        toggle="primitive_obsession",
+    ),
+    PluginSpec(
+        name="WMCAnalyzer",
+        target=f"{_ANALYZERS}.wmc_analyzer:WMCAnalyzer",
+        category="cohesion",
+        priority=2,
+        estimated_duration=1.0,
+        toggle="wmc",
+    ),
+)
@@ -0,0 +1,4 @@
+"""
+Servidor LSP de quality_agents: diagnósticos de CodeGuard y DesignReviewer
+sobre los buffers del editor (`quality-agents-lsp`).
+"""
@@ -0,0 +1,273 @@
+"""
+Diagnósticos de un buffer del editor (contenido en memoria, sin guardar).
+
+`BufferAnalyzer` ejecuta sobre el texto del buffer:
+    - los checks rápidos de CodeGuard (la selección de pre-commit) y
+    - los analyzers de DesignReviewer que solo miran el AST del archivo
+      (se excluyen los `cross_file`, que leen otros archivos del disco).
+
+Las herramientas necesitan un archivo, así que el buffer se escribe en un
+directorio temporal que replica su ruta relativa al proyecto (como `--staged`).
+Por buffer se guarda el último parseo (AST y definiciones, para ubicar los
+resultados de DesignReviewer) y los diagnósticos de las últimas versiones del
+contenido: deshacer un cambio no vuelve a ejecutar nada.
+"""
+
+import ast
+import hashlib
+import logging
+import re
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from quality_agents.codeguard.agent import CheckResult, CodeGuard, Severity
+from quality_agents.designreviewer.agent import DesignReviewer
+from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
+
+logger = logging.getLogger(__name__)
+
+# DiagnosticSeverity de LSP
+ERROR = 1
+WARNING = 2
+INFORMATION = 3
+
+# Versiones de contenido con diagnósticos en memoria por buffer (deshacer/rehacer)
+_CACHED_VERSIONS = 8
+
+# "(línea N)" en los mensajes de los analyzers que informan la línea
+_LINE_IN_MESSAGE = re.compile(r"\(línea (\d+)\)")
+
+# Nombres entre comillas en los mensajes ("Método 'Clase.metodo' tiene ...")
+_NAME_IN_MESSAGE = re.compile(r"'([A-Za-z_][\w.]*)'")
+
+_CODEGUARD_SEVERITY = {Severity.ERROR: ERROR, Severity.WARNING: WARNING}
+_REVIEW_SEVERITY = {ReviewSeverity.CRITICAL: ERROR, ReviewSeverity.WARNING: WARNING}
+
+
+@dataclass
+class ParsedBuffer:
+    """
+    Parseo de una versión del contenido de un buffer.
+
+    Attributes:
+        digest: SHA-256 del contenido
+        lines: Líneas del contenido
+        tree: AST (None si hay error de sintaxis)
+        error: Error de sintaxis (None si parsea)
+        definitions: Nombre de clase/función → línea (0-based); los métodos
+            también como "Clase.metodo"
+    """
+
+    digest: str
+    lines: List[str]
+    tree: Optional[ast.Module] = None
+    error: Optional[SyntaxError] = None
+    definitions: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, text: str, digest: Optional[str] = None) -> "ParsedBuffer":
+        parsed = cls(
+            digest=digest or hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            lines=text.splitlines(),
+        )
+        try:
+            parsed.tree = ast.parse(text)
+        except (SyntaxError, ValueError) as e:
+            parsed.error = e if isinstance(e, SyntaxError) else SyntaxError(str(e))
+            return parsed
+        parsed.definitions = _definitions(parsed.tree)
+        return parsed
+
+
+def _definitions(tree: ast.Module) -> Dict[str, int]:
+    definitions: Dict[str, int] = {}
+
+    def visit(body: List[ast.stmt], prefix: str) -> None:
+        for node in body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                line = node.lineno - 1
+                definitions.setdefault(node.name, line)
+                if prefix:
+                    definitions.setdefault(f"{prefix}.{node.name}", line)
+                if isinstance(node, ast.ClassDef):
+                    visit(node.body, node.name)
+
+    visit(tree.body, "")
+    return definitions
+
+
+class BufferAnalyzer:
+    """
+    Calcula los diagnósticos LSP de buffers de un proyecto.
+
+    Example:
+        >>> analyzer = BufferAnalyzer(Path("."))
+        >>> analyzer.analyze("file:///p/mod.py", Path("/p/mod.py"), "import os\\n")
+        [{'range': ..., 'severity': 2, 'source': 'codeguard', 'code': 'PEP8', ...}]
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Args:
+            root: Raíz del proyecto (configuración de los agentes)
+        """
+        self.root = root.resolve()
+        self.guard = CodeGuard(project_root=self.root)
+        execution = self.guard.config.execution
+        # Contenido efímero: ni caché en disco, ni aprendizaje, ni segundo plano
+        execution.cache = False
+        execution.learn_durations = False
+        execution.background = False
+        self.reviewer = DesignReviewer(path=self.root)
+        self._mirror = Path(tempfile.mkdtemp(prefix="quality-agents-lsp-"))
+        self._parsed: Dict[str, ParsedBuffer] = {}
+        self._diagnostics: Dict[str, "OrderedDict[str, List[Dict[str, Any]]]"] = {}
+
+    def analyze(
+        self,
+        uri: str,
+        path: Path,
+        text: str,
+        is_stale: Callable[[], bool] = lambda: False,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Diagnósticos del contenido de un buffer.
+
+        Args:
+            uri: Identificador del buffer (clave de las cachés)
+            path: Ruta del archivo en el proyecto
+            text: Contenido actual del buffer
+            is_stale: True si llegó una versión más nueva; se consulta entre
+                etapas para abandonar el análisis
+
+        Returns:
+            Diagnósticos LSP, o None si el análisis se abandonó
+        """
+        parsed = self._parse(uri, text)
+        versions = self._diagnostics.setdefault(uri, OrderedDict())
+        if parsed.digest in versions:
+            versions.move_to_end(parsed.digest)
+            return versions[parsed.digest]
+
+        if parsed.error is not None:
+            diagnostics = [_syntax_diagnostic(parsed)]
+        elif self.guard.is_excluded(self._relative(path)):
+            diagnostics = []
+        else:
+            mirror = self._write_mirror(path, text)
+            if is_stale():
+                return None
+            diagnostics = [
+                self._from_check(result, parsed)
+                for result in self.guard.run([mirror], analysis_type="pre-commit", jobs=1)
+                if result.severity in _CODEGUARD_SEVERITY
+            ]
+            if is_stale():
+                return None
+            diagnostics.extend(
+                self._from_review(result, parsed)
+                for result in self.reviewer.analyze_isolated([mirror])
+                if result.severity in _REVIEW_SEVERITY
+            )
+
+        versions[parsed.digest] = diagnostics
+        while len(versions) > _CACHED_VERSIONS:
+            versions.popitem(last=False)
+        return diagnostics
+
+    def forget(self, uri: str) -> None:
+        """Descarta las cachés de un buffer cerrado."""
+        self._parsed.pop(uri, None)
+        self._diagnostics.pop(uri, None)
+
+    def close(self) -> None:
+        """Elimina el directorio temporal de los buffers."""
+        shutil.rmtree(self._mirror, ignore_errors=True)
+
+    def _parse(self, uri: str, text: str) -> ParsedBuffer:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        parsed = self._parsed.get(uri)
+        if parsed is None or parsed.digest != digest:
+            parsed = ParsedBuffer.parse(text, digest)
+            self._parsed[uri] = parsed
+        return parsed
+
+    def _relative(self, path: Path) -> Path:
+        try:
+            return path.resolve().relative_to(self.root)
+        except ValueError:
+            return Path(path.name)
+
+    def _write_mirror(self, path: Path, text: str) -> Path:
+        mirror = self._mirror / self._relative(path)
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        mirror.write_text(text, encoding="utf-8")
+        return mirror
+
+    @staticmethod
+    def _from_check(result: CheckResult, parsed: ParsedBuffer) -> Dict[str, Any]:
+        line = (result.line_number or 1) - 1
+        return _diagnostic(
+            parsed, line, _CODEGUARD_SEVERITY[result.severity], "codeguard",
+            result.check_name, result.message,
+        )
+
+    @staticmethod
+    def _from_review(result: ReviewResult, parsed: ParsedBuffer) -> Dict[str, Any]:
+        match = _LINE_IN_MESSAGE.search(result.message)
+        if match:
+            line = int(match.group(1)) - 1
+        else:
+            # El método nombrado en el mensaje es más preciso que la clase
+            names = [
+                name for name in _NAME_IN_MESSAGE.findall(result.message)
+                if name in parsed.definitions
+            ]
+            name = names[0] if names else result.class_name or ""
+            line = parsed.definitions.get(name, 0)
+        message = result.message
+        if result.suggestion:
+            message += f"\n{result.suggestion}"
+        return _diagnostic(
+            parsed, line, _REVIEW_SEVERITY[result.severity], "designreviewer",
+            result.analyzer_name, message,
+        )
+
+
+def _diagnostic(
+    parsed: ParsedBuffer, line: int, severity: int, source: str, code: str, message: str
+) -> Dict[str, Any]:
+    """Diagnóstico LSP que cubre la línea indicada (sin la indentación)."""
+    line = min(max(line, 0), max(len(parsed.lines) - 1, 0))
+    text = parsed.lines[line] if parsed.lines else ""
+    start = len(text) - len(text.lstrip())
+    return {
+        "range": {
+            "start": {"line": line, "character": start},
+            "end": {"line": line, "character": len(text)},
+        },
+        "severity": severity,
+        "source": source,
+        "code": code,
+        "message": message,
+    }
+
+
+def _syntax_diagnostic(parsed: ParsedBuffer) -> Dict[str, Any]:
+    error = parsed.error
+    line = (error.lineno or 1) - 1
+    column = max((error.offset or 1) - 1, 0)
+    return {
+        "range": {
+            "start": {"line": line, "character": column},
+            "end": {"line": line, "character": column + 1},
+        },
+        "severity": ERROR,
+        "source": "python",
+        "code": "SyntaxError",
+        "message": error.msg or str(error),
+    }
@@ -0,0 +1,84 @@
+"""
+Transporte JSON-RPC 2.0 del Language Server Protocol (stdio).
+
+Cada mensaje es un encabezado `Content-Length: N` seguido de una línea en
+blanco y N bytes de JSON en UTF-8. Solo biblioteca estándar: el servidor no
+depende de pygls.
+"""
+
+import json
+import threading
+from typing import Any, BinaryIO, Dict, Optional
+
+# Códigos de error de JSON-RPC / LSP (INVALID_REQUEST: mensaje mal formado;
+# INTERNAL_ERROR: falla al atender un request válido)
+METHOD_NOT_FOUND = -32601
+INVALID_REQUEST = -32600
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+REQUEST_CANCELLED = -32800
+
+
+class ProtocolError(Exception):
+    """El stream no contiene un mensaje LSP válido."""
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Lee un mensaje del stream.
+
+    Returns:
+        Mensaje decodificado, o None si el stream terminó
+
+    Raises:
+        ProtocolError: Si falta `Content-Length` o el cuerpo no es JSON.
+    """
+    length: Optional[int] = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii", errors="replace").partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                length = int(value.strip())
+            except ValueError as e:
+                raise ProtocolError(f"invalid Content-Length: {value.strip()}") from e
+    if length is None:
+        raise ProtocolError("missing Content-Length header")
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    try:
+        return json.loads(body.decode("utf-8"))
+    except ValueError as e:
+        raise ProtocolError(f"invalid JSON body: {e}") from e
+
+
+class MessageWriter:
+    """Escribe mensajes en el stream; seguro entre threads (lector y worker)."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def send(self, message: Dict[str, Any]) -> None:
+        body = json.dumps({"jsonrpc": "2.0", **message}, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self._stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+            self._stream.flush()
+
+    def notify(self, method: str, params: Any) -> None:
+        """Envía una notificación (sin id)."""
+        self.send({"method": method, "params": params})
+
+    def respond(self, request_id: Any, result: Any = None) -> None:
+        """Responde un request con éxito."""
+        self.send({"id": request_id, "result": result})
+
+    def error(self, request_id: Any, code: int, message: str) -> None:
+        """Responde un request con error."""
+        self.send({"id": request_id, "error": {"code": code, "message": message}})
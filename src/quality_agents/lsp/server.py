@@ -0,0 +1,365 @@
+"""
+Servidor LSP `quality-agents-lsp`.
+
+Publica como diagnósticos (`textDocument/publishDiagnostics`) los resultados
+de los checks rápidos de CodeGuard y de los analyzers AST de DesignReviewer
+sobre el contenido de los buffers abiertos, guardado o no.
+
+Flujo:
+    - El thread principal lee los mensajes de stdin y mantiene el texto y la
+      versión de cada documento (sincronización completa).
+    - Cada cambio programa un análisis con debounce: una ráfaga de teclas
+      produce un solo análisis; guardar o abrir lo programa sin espera.
+    - Un worker ejecuta los análisis de a uno. Si el documento cambió mientras
+      tanto, el análisis se abandona entre etapas y el resultado no se publica.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from quality_agents.lsp.protocol import (
+    INTERNAL_ERROR,
+    METHOD_NOT_FOUND,
+    SERVER_NOT_INITIALIZED,
+    MessageWriter,
+    ProtocolError,
+    read_message,
+)
+
+logger = logging.getLogger(__name__)
+
+SERVER_NAME = "quality-agents-lsp"
+
+# Espera tras la última tecla antes de analizar (segundos)
+DEFAULT_DEBOUNCE = 0.25
+
+# TextDocumentSyncKind.Full
+_SYNC_FULL = 1
+
+
+@dataclass
+class Document:
+    """Buffer abierto en el editor."""
+
+    uri: str
+    path: Path
+    text: str
+    version: int
+
+
+def uri_to_path(uri: str, root: Path) -> Path:
+    """
+    Ruta de un documento (los buffers sin archivo se ubican en la raíz).
+
+    Args:
+        uri: URI del documento (`file:///...`, `untitled:...`)
+        root: Raíz del proyecto
+
+    Returns:
+        Ruta del archivo
+    """
+    parsed = urlparse(uri)
+    if parsed.scheme == "file":
+        return Path(url2pathname(unquote(parsed.path)))
+    name = Path(unquote(parsed.path)).name or "untitled"
+    return root / (name if name.endswith(".py") else f"{name}.py")
+
+
+class QualityLanguageServer:
+    """
+    Servidor LSP sobre un par de streams binarios.
+
+    Example:
+        >>> server = QualityLanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+        >>> server.serve()
+    """
+
+    def __init__(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        analyzer_factory: Optional[Callable[[Path], Any]] = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        """
+        Args:
+            reader: Stream de entrada (mensajes del cliente)
+            writer: Stream de salida
+            analyzer_factory: Crea el analizador de buffers para la raíz del
+                workspace (default: BufferAnalyzer)
+            debounce: Espera tras un cambio antes de analizar (segundos)
+        """
+        self._reader = reader
+        self.writer = MessageWriter(writer)
+        self._analyzer_factory = analyzer_factory
+        self.debounce = debounce
+        self.root = Path.cwd()
+        self.analyzer: Any = None
+        self.documents: Dict[str, Document] = {}
+        self._due: Dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = False  # el worker debe terminar
+        self._shutdown = False  # el cliente envió `shutdown`
+        self._exit = False
+
+    # --- Bucle principal ---
+
+    def serve(self) -> int:
+        """
+        Atiende mensajes hasta `exit` o el fin del stream.
+
+        Returns:
+            Código de salida (0 si hubo `shutdown` antes de `exit`)
+        """
+        try:
+            while not self._exit:
+                try:
+                    message = read_message(self._reader)
+                except ProtocolError as e:
+                    logger.error(f"Mensaje inválido: {e}")
+                    continue
+                if message is None:
+                    break
+                self.handle(message)
+        finally:
+            self._stop_worker()
+            if self.analyzer is not None:
+                self.analyzer.close()
+        return 0 if self._shutdown else 1
+
+    def handle(self, message: Dict[str, Any]) -> None:
+        """Despacha un request o una notificación."""
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+        is_request = "id" in message
+        if method is None:
+            return  # Respuesta a un request del servidor (no se envían)
+
+        if self.analyzer is None and method not in ("initialize", "exit"):
+            if is_request:
+                self.writer.error(request_id, SERVER_NOT_INITIALIZED, "server not initialized")
+            return
+
+        handler = self._handlers().get(method)
+        if handler is None:
+            if is_request:
+                self.writer.error(request_id, METHOD_NOT_FOUND, f"unknown method: {method}")
+            return
+        try:
+            result = handler(params)
+        except Exception as e:
+            logger.exception(f"Error atendiendo {method}")
+            if is_request:
+                self.writer.error(request_id, INTERNAL_ERROR, str(e))
+            return
+        if is_request:
+            self.writer.respond(request_id, result)
+
+    def _handlers(self) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+        return {
+            "initialize": self._initialize,
+            "initialized": lambda params: None,
+            "shutdown": self._on_shutdown,
+            "exit": self._on_exit,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didSave": self._did_save,
+            "textDocument/didClose": self._did_close,
+            # Los análisis obsoletos se descartan por versión; no hay requests largos
+            "$/cancelRequest": lambda params: None,
+            "$/setTrace": lambda params: None,
+        }
+
+    # --- Ciclo de vida ---
+
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.root = self._workspace_root(params)
+        if self._analyzer_factory is None:
+            from quality_agents.lsp.diagnostics import BufferAnalyzer
+
+            self._analyzer_factory = BufferAnalyzer
+        self.analyzer = self._analyzer_factory(self.root)
+        self._worker = threading.Thread(target=self._work, name="lsp-analysis", daemon=True)
+        self._worker.start()
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": _SYNC_FULL,
+                    "save": {"includeText": True},
+                },
+            },
+            "serverInfo": {"name": SERVER_NAME},
+        }
+
+    @staticmethod
+    def _workspace_root(params: Dict[str, Any]) -> Path:
+        folders = params.get("workspaceFolders") or []
+        uri = folders[0]["uri"] if folders else params.get("rootUri")
+        if uri:
+            return Path(url2pathname(unquote(urlparse(uri).path)))
+        if params.get("rootPath"):
+            return Path(params["rootPath"])
+        return Path.cwd()
+
+    def _on_shutdown(self, params: Dict[str, Any]) -> None:
+        self._shutdown = True
+        self._stop_worker()
+
+    def _on_exit(self, params: Dict[str, Any]) -> None:
+        self._exit = True
+
+    # --- Sincronización de documentos ---
+
+    def _did_open(self, params: Dict[str, Any]) -> None:
+        item = params["textDocument"]
+        uri = item["uri"]
+        path = uri_to_path(uri, self.root)
+        if item.get("languageId", "python") != "python" and path.suffix != ".py":
+            return
+        with self._condition:
+            self.documents[uri] = Document(uri, path, item["text"], item.get("version", 0))
+        self._schedule(uri, delay=0.0)
+
+    def _did_change(self, params: Dict[str, Any]) -> None:
+        identifier = params["textDocument"]
+        changes = params.get("contentChanges") or []
+        with self._condition:
+            document = self.documents.get(identifier["uri"])
+            if document is None or not changes:
+                return
+            # Sincronización completa: el último cambio trae el texto entero
+            document.text = changes[-1]["text"]
+            document.version = identifier.get("version", document.version + 1)
+        self._schedule(identifier["uri"], delay=self.debounce)
+
+    def _did_save(self, params: Dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        with self._condition:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            if params.get("text") is not None:
+                document.text = params["text"]
+        self._schedule(uri, delay=0.0)
+
+    def _did_close(self, params: Dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        with self._condition:
+            self.documents.pop(uri, None)
+            self._due.pop(uri, None)
+        self.analyzer.forget(uri)
+        self.writer.notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    # --- Análisis ---
+
+    def _schedule(self, uri: str, delay: float) -> None:
+        with self._condition:
+            self._due[uri] = time.monotonic() + delay
+            self._condition.notify()
+
+    def _stop_worker(self) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=5)
+            self._worker = None
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    timeout = self._next_timeout()
+                    if timeout == 0.0:
+                        break
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+            self.run_pending()
+
+    def _next_timeout(self) -> Optional[float]:
+        """Segundos hasta el próximo análisis (0 = hay uno vencido, None = ninguno)."""
+        if not self._due:
+            return None
+        return max(min(self._due.values()) - time.monotonic(), 0.0)
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """
+        Analiza los documentos cuyo debounce venció y publica sus diagnósticos.
+
+        Args:
+            now: Instante de referencia (default: ahora; float("inf") = todos)
+
+        Returns:
+            Cantidad de documentos publicados
+        """
+        published = 0
+        while True:
+            with self._condition:
+                current = time.monotonic() if now is None else now
+                ready = [uri for uri, due in self._due.items() if due <= current]
+                if not ready:
+                    return published
+                uri = min(ready, key=self._due.__getitem__)
+                del self._due[uri]
+                document = self.documents.get(uri)
+                if document is None:
+                    continue
+                version, path, text = document.version, document.path, document.text
+
+            is_stale = self._staleness_check(uri, version, text)
+            try:
+                diagnostics = self.analyzer.analyze(uri, path, text, is_stale=is_stale)
+            except Exception:
+                logger.exception(f"Error analizando {uri}")
+                continue
+            if diagnostics is None or is_stale():
+                continue  # Llegó una versión más nueva: se publicará la suya
+            self.writer.notify(
+                "textDocument/publishDiagnostics",
+                {"uri": uri, "version": version, "diagnostics": diagnostics},
+            )
+            published += 1
+
+    def _staleness_check(self, uri: str, version: int, text: str) -> Callable[[], bool]:
+        """
+        Predicado: ¿el documento cambió (o se cerró) desde esta versión?
+
+        Se consulta desde el hilo de análisis mientras el de lectura actualiza
+        `self.documents`, así que lee bajo el lock.
+        """
+
+        def is_stale() -> bool:
+            with self._condition:
+                latest = self.documents.get(uri)
+            return latest is None or latest.version != version or latest.text != text
+
+        return is_stale
+
+
+def main() -> None:
+    """Entry point `quality-agents-lsp`: servidor LSP sobre stdin/stdout."""
+    # stdout es el canal del protocolo: lo que impriman las herramientas
+    # analizadas va a stderr
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    server = QualityLanguageServer(sys.stdin.buffer, protocol_out)
+    sys.exit(server.serve())
+
+
+if __name__ == "__main__":
+    main()
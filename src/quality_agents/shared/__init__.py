@@ -2,15 +2,31 @@
 Módulo compartido entre agentes.
 """
 
-from .config import QualityConfig, load_config
-from .reporting import format_result, generate_summary
-from .verifiable import ExecutionContext, Verifiable
+import importlib
 
-__all__ = [
-    "load_config",
-    "QualityConfig",
-    "format_result",
-    "generate_summary",
-    "ExecutionContext",
-    "Verifiable",
-]
+# Los submódulos se importan al pedir un nombre: `shared.verifiable` (que
+# importan todos los checks) no arrastra rich, yaml ni radon
+_EXPORTS = {
+    "load_config": ".config",
+    "QualityConfig": ".config",
+    "format_result": ".reporting",
+    "generate_summary": ".reporting",
+    "ExecutionContext": ".verifiable",
+    "Verifiable": ".verifiable",
+    "available_cpus": ".concurrency",
+    "resolve_jobs": ".concurrency",
+    "lpt_order": ".concurrency",
+    "RadonMetrics": ".radon_metrics",
+    "RadonMetricsProvider": ".radon_metrics",
+    "ModuleStore": ".parsed_modules",
+    "ParsedModule": ".parsed_modules",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS)
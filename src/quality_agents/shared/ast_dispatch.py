@@ -0,0 +1,141 @@
+"""
+Recorrido único del AST compartido por varios analyzers.
+
+Cada analyzer de DesignReviewer recorría el módulo completo con su propio
+`ast.walk`, y algunos volvían a recorrer los subárboles de cada clase o
+método (FeatureEnvyAnalyzer una vez por parámetro). Los analyzers que
+implementan `TreeListener` registran callbacks por tipo de nodo y
+`dispatch` recorre el árbol una sola vez por archivo alimentándolos a todos:
+el costo por archivo pasa a ser O(nodos) en lugar de O(analyzers × nodos).
+
+El recorrido es en anchura, en el mismo orden que `ast.walk`. Cada callback
+recibe el nodo y sus scopes: las clases y funciones que lo contienen, de la
+más externa a la más interna. Con los scopes, lo que antes era un
+`ast.walk(metodo)` por método se resuelve acumulando en los métodos
+contenedores a medida que pasan los nodos.
+"""
+
+import ast
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Tuple, Union
+
+# Clases y funciones que contienen al nodo, de la más externa a la más interna
+Scopes = Tuple[ast.AST, ...]
+
+# Callback de un tipo de nodo: (nodo, scopes)
+Handler = Callable[[Any, Scopes], None]
+
+# Tipo de nodo (o tupla de tipos) de cada callback
+NodeTypes = Union[type, Tuple[type, ...]]
+
+_SCOPE_TYPES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class TreeListener(ABC):
+    """
+    Participante del recorrido compartido del AST (opt-in para analyzers).
+
+    El orquestador de DesignReviewer agrupa a los analyzers que lo
+    implementan y recorre el árbol de cada archivo una sola vez. Un archivo
+    que no se puede leer o parsear no produce resultados, igual que en
+    `execute`.
+
+    Example:
+        >>> class ImportCounter(TreeListener):
+        ...     def begin_module(self, file_path):
+        ...         self._count = 0
+        ...         return {(ast.Import, ast.ImportFrom): self._on_import}
+        ...
+        ...     def _on_import(self, node, scopes):
+        ...         self._count += 1
+        ...
+        ...     def end_module(self):
+        ...         return [self._count]
+    """
+
+    @abstractmethod
+    def begin_module(self, file_path: Path) -> Dict[NodeTypes, Handler]:
+        """
+        Prepara el análisis de un archivo.
+
+        Args:
+            file_path: Archivo cuyo árbol se va a recorrer
+
+        Returns:
+            Callbacks por tipo de nodo (un tipo o una tupla de tipos)
+        """
+
+    @abstractmethod
+    def end_module(self) -> List[Any]:
+        """Resultados del archivo, una vez recorrido todo el árbol."""
+
+    def analyze_tree(self, tree: ast.AST, file_path: Path) -> List[Any]:
+        """
+        Recorre `tree` solo para este listener (ej: desde `execute`).
+
+        Raises:
+            La excepción del callback que falló.
+        """
+        outcome = dispatch(tree, file_path, [self])[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def dispatch(
+    tree: ast.AST, file_path: Path, listeners: List[TreeListener]
+) -> List[Union[List[Any], Exception]]:
+    """
+    Recorre `tree` una vez y alimenta a todos los listeners.
+
+    Si un listener falla, deja de recibir nodos y los demás siguen.
+
+    Args:
+        tree: AST del archivo
+        file_path: Archivo analizado
+        listeners: Participantes del recorrido
+
+    Returns:
+        Por cada listener (en el mismo orden), sus resultados o la excepción
+        con la que falló
+    """
+    failed: Dict[int, Exception] = {}
+    table: Dict[type, List[Tuple[int, Handler]]] = {}
+    for index, listener in enumerate(listeners):
+        try:
+            handlers = listener.begin_module(file_path)
+        except Exception as e:
+            failed[index] = e
+            continue
+        for node_types, handler in handlers.items():
+            if not isinstance(node_types, tuple):
+                node_types = (node_types,)
+            for node_type in node_types:
+                table.setdefault(node_type, []).append((index, handler))
+
+    todo: Deque[Tuple[ast.AST, Scopes]] = deque([(tree, ())])
+    while todo:
+        node, scopes = todo.popleft()
+        for index, handler in table.get(type(node), ()):
+            if index in failed:
+                continue
+            try:
+                handler(node, scopes)
+            except Exception as e:
+                failed[index] = e
+        if isinstance(node, _SCOPE_TYPES):
+            scopes = scopes + (node,)
+        todo.extend((child, scopes) for child in ast.iter_child_nodes(node))
+
+    outcomes: List[Union[List[Any], Exception]] = []
+    for index, listener in enumerate(listeners):
+        if index in failed:
+            outcomes.append(failed[index])
+            continue
+        try:
+            outcomes.append(listener.end_module())
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
@@ -0,0 +1,74 @@
+"""
+Utilidades de concurrencia compartidas entre agentes.
+
+Resuelve cuántos workers usar en las ejecuciones paralelas (`--jobs N`) y en
+qué orden despacharles el trabajo.
+"""
+
+import os
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+def available_cpus() -> int:
+    """
+    Cantidad de CPUs disponibles para este proceso.
+
+    Respeta la afinidad de CPU (`os.sched_getaffinity`) cuando la plataforma
+    la soporta, de modo que en contenedores o runners de CI con CPUs
+    restringidas no se lanzan más workers que núcleos asignados.
+
+    Returns:
+        Cantidad de CPUs utilizables (mínimo 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(len(os.sched_getaffinity(0)), 1)
+        except OSError:
+            pass
+    return os.cpu_count() or 1
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normaliza el valor de `--jobs`.
+
+    Args:
+        jobs: Workers pedidos; None o 0 = CPUs disponibles
+
+    Returns:
+        Cantidad de workers a usar (mínimo 1)
+    """
+    if not jobs:
+        return available_cpus()
+    return max(jobs, 1)
+
+
+def lpt_order(
+    items: Iterable[_T],
+    cost: Callable[[_T], float],
+    size: Optional[Callable[[_T], float]] = None,
+) -> List[_T]:
+    """
+    Ordena unidades de trabajo para un pool: la más cara primero (LPT).
+
+    Los pools de los agentes reparten desde una cola compartida: cada worker
+    libre toma la siguiente unidad. Con las unidades en orden de costo
+    descendente eso es la planificación LPT (longest processing time first):
+    un archivo enorme no queda para el final, alargando la corrida mientras
+    los demás workers esperan sin trabajo.
+
+    Args:
+        items: Unidades de trabajo
+        cost: Costo estimado de una unidad (ej: segundos predichos)
+        size: Desempate entre unidades de igual costo (ej: líneas); la más
+            grande primero
+
+    Returns:
+        Unidades ordenadas; las de igual costo y tamaño conservan su orden
+    """
+    if size is None:
+        return sorted(items, key=cost, reverse=True)
+    return sorted(items, key=lambda item: (cost(item), size(item)), reverse=True)
+
@@ -6,8 +6,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Optional
 
-import yaml
-
 
 @dataclass
 class QualityConfig:
@@ -46,6 +44,8 @@ class QualityConfig:
         if not path.exists():
             return cls()
 
+        import yaml
+
         with open(path) as f:
             data = yaml.safe_load(f) or {}
 
@@ -0,0 +1,175 @@
+"""
+Módulos parseados compartidos por los analyzers de una corrida.
+
+Los analyzers de DesignReviewer leían y parseaban cada archivo por su cuenta:
+una corrida con 14 analyzers parseaba cada archivo 14 veces (15 con el de
+radon del WMCAnalyzer). El orquestador crea un `ModuleStore` por corrida y lo
+pasa en `ExecutionContext.modules`; cada artefacto de un archivo (bytes,
+texto, AST, líneas, métricas de radon) se calcula la primera vez que se pide
+y lo reutilizan los demás analyzers.
+
+Los errores también se memorizan: un archivo con error de sintaxis se parsea
+una sola vez y cada analyzer recibe la misma excepción (`OSError`,
+`SyntaxError`, `UnicodeDecodeError`) que antes obtenía con `read_text` y
+`ast.parse`.
+"""
+
+import ast
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Módulos retenidos antes de descartar los usados menos recientemente: los
+# archivos se analizan de a uno, así que alcanza con cubrir los que un
+# analyzer lee además del analizado (ej: los importados)
+_MAX_MODULES = 256
+
+
+class ParsedModule:
+    """
+    Un archivo Python y sus artefactos derivados, calculados bajo demanda.
+
+    Example:
+        >>> module = ParsedModule(Path("app.py"))
+        >>> classes = [n for n in ast.walk(module.tree) if isinstance(n, ast.ClassDef)]
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path: Ruta al archivo Python
+        """
+        self.path = path
+        self._memo: Dict[str, Tuple[bool, Any]] = {}
+
+    def _derive(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Valor memorizado de `compute` (si falló, vuelve a lanzar la misma excepción)."""
+        if key not in self._memo:
+            try:
+                self._memo[key] = (True, compute())
+            except Exception as e:
+                self._memo[key] = (False, e)
+        ok, value = self._memo[key]
+        if not ok:
+            raise value
+        return value
+
+    @property
+    def source_bytes(self) -> bytes:
+        """
+        Contenido del archivo.
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+        """
+        return self._derive("bytes", self.path.read_bytes)
+
+    @property
+    def text(self) -> str:
+        """
+        Código fuente decodificado (como `Path.read_text(encoding="utf-8")`).
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+            UnicodeDecodeError: Si el archivo no es UTF-8
+        """
+        return self._derive(
+            "text",
+            lambda: self.source_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"),
+        )
+
+    @property
+    def tree(self) -> ast.Module:
+        """
+        AST del módulo.
+
+        Los analyzers no deben modificarlo: lo comparten todos.
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+            SyntaxError: Si el código no es Python válido
+        """
+        return self._derive("tree", lambda: ast.parse(self.text, filename=str(self.path)))
+
+    @property
+    def lines(self) -> List[str]:
+        """Líneas del código fuente, sin fin de línea (`lines[n - 1]` = línea n)."""
+        return self._derive("lines", self.text.splitlines)
+
+    @property
+    def radon(self) -> Any:
+        """
+        Métricas de radon del archivo (`RadonMetrics`), sobre el AST ya parseado.
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+            ImportError: Si radon no está instalado
+        """
+        return self._derive("radon", self._radon_metrics)
+
+    def _radon_metrics(self) -> Any:
+        from quality_agents.shared.radon_metrics import RadonMetricsProvider
+
+        try:
+            tree: Optional[ast.Module] = self.tree
+        except (SyntaxError, ValueError):
+            tree = None  # radon reporta el error en RadonMetrics.error
+        return RadonMetricsProvider.shared().for_bytes(self.source_bytes, tree=tree)
+
+
+class ModuleStore:
+    """
+    Módulos parseados de una corrida, uno por ruta.
+
+    No detecta cambios en los archivos: vive lo que dura una corrida del
+    orquestador. Retiene hasta `max_modules` módulos (desalojo LRU) para que
+    una corrida sobre miles de archivos no mantenga todos los AST en memoria.
+
+    Example:
+        >>> store = ModuleStore()
+        >>> store.get(Path("app.py")).tree is store.get(Path("app.py")).tree
+        True
+    """
+
+    def __init__(self, max_modules: int = _MAX_MODULES) -> None:
+        """
+        Args:
+            max_modules: Módulos retenidos como máximo
+        """
+        self._max_modules = max_modules
+        self._modules: "OrderedDict[Path, ParsedModule]" = OrderedDict()
+
+    def get(self, path: Path) -> ParsedModule:
+        """Módulo parseado de `path` (lo crea la primera vez)."""
+        module = self._modules.get(path)
+        if module is not None:
+            self._modules.move_to_end(path)
+            return module
+        module = self._modules[path] = ParsedModule(path)
+        while len(self._modules) > self._max_modules:
+            self._modules.popitem(last=False)
+        return module
+
+    def clear(self) -> None:
+        """Descarta los módulos (al terminar la corrida)."""
+        self._modules.clear()
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
+def parsed_module(path: Path, store: Optional[ModuleStore] = None) -> ParsedModule:
+    """
+    Módulo parseado de `path` desde el store de la corrida.
+
+    Sin store (ej: un analyzer ejecutado fuera del orquestador) se parsea
+    de nuevo.
+
+    Args:
+        path: Ruta al archivo Python
+        store: Store de la corrida (`ExecutionContext.modules`)
+
+    Returns:
+        Módulo parseado
+    """
+    return store.get(path) if store is not None else ParsedModule(path)
@@ -0,0 +1,223 @@
+"""
+Registro de plugins de los agentes (checks, analyzers y métricas).
+
+Cada plugin se describe con un `PluginSpec`: nombre, clase ("modulo:Clase")
+y la metadata estática que usa la selección (categoría, prioridad, duración
+estimada y el toggle de `[tool.<agente>.checks]`). Con esa metadata los
+orquestadores descartan plugins sin importar su código; solo se importan y
+crean los que se van a ejecutar.
+
+Los plugins propios de cada agente se declaran en su `registry.py`. Otros
+paquetes agregan plugins con entry points en el grupo del agente:
+
+    [project.entry-points."quality_agents.checks"]
+    mis_checks = "mis_checks.registry:CHECKS"
+
+El entry point apunta a un `PluginSpec` o a una secuencia de ellos, definidos
+en un módulo liviano (sin importar las clases de los plugins).
+"""
+
+import importlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, Set, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Grupos de entry points de cada agente
+CHECKS_GROUP = "quality_agents.checks"
+ANALYZERS_GROUP = "quality_agents.analyzers"
+METRICS_GROUP = "quality_agents.metrics"
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """
+    Metadata estática de un plugin (se lee sin importar su código).
+
+    Attributes:
+        name: Nombre del plugin (el mismo que su propiedad `name`)
+        target: Clase del plugin como "paquete.modulo:Clase"
+        category: Categoría del plugin
+        priority: Prioridad de ejecución (1 = más alta)
+        estimated_duration: Duración estimada en segundos
+        toggle: Campo de `config.checks` que lo habilita (None = siempre)
+        dynamic_duration: True si la duración real depende del estado (ej:
+            daemon de mypy caliente); la selección no lo descarta por la
+            duración estática
+    """
+
+    name: str
+    target: str
+    category: str
+    priority: int = 5
+    estimated_duration: float = 1.0
+    toggle: Optional[str] = None
+    dynamic_duration: bool = False
+
+    def is_enabled(self, config: Any) -> bool:
+        """True si el toggle del plugin no está apagado en la configuración."""
+        if self.toggle is None or config is None:
+            return True
+        checks = getattr(config, "checks", None)
+        return checks is None or bool(getattr(checks, self.toggle, True))
+
+    def load(self) -> type:
+        """
+        Importa la clase del plugin.
+
+        Raises:
+            ImportError: Si el módulo no se puede importar.
+            AttributeError: Si el módulo no define la clase.
+        """
+        module_name, _, class_name = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+def discover_plugins(group: str, builtin: Sequence[PluginSpec] = ()) -> List[PluginSpec]:
+    """
+    Plugins propios más los registrados por entry points en `group`.
+
+    Un entry point que no carga o no apunta a `PluginSpec` se ignora con un
+    warning. Si dos plugins tienen el mismo nombre, gana el primero (los
+    propios del agente antes que los externos).
+
+    Args:
+        group: Grupo de entry points (ej: "quality_agents.checks")
+        builtin: Plugins propios del agente
+
+    Returns:
+        Specs de los plugins, sin importar ninguno
+    """
+    # importlib.metadata solo se carga cuando se necesitan los plugins
+    from importlib.metadata import entry_points
+
+    specs = list(builtin)
+    for entry_point in entry_points(group=group):
+        try:
+            loaded = entry_point.load()
+        except Exception as e:
+            logger.warning(f"Error al cargar el entry point {entry_point.name} ({group}): {e}")
+            continue
+        candidates = list(loaded) if isinstance(loaded, (list, tuple)) else [loaded]
+        for spec in candidates:
+            if not isinstance(spec, PluginSpec):
+                logger.warning(
+                    f"El entry point {entry_point.name} ({group}) no define un PluginSpec. "
+                    f"Saltando."
+                )
+                continue
+            specs.append(spec)
+
+    unique: List[PluginSpec] = []
+    names: Set[str] = set()
+    for spec in specs:
+        if spec.name in names:
+            logger.warning(f"Plugin {spec.name} duplicado ({spec.target}). Saltando.")
+            continue
+        names.add(spec.name)
+        unique.append(spec)
+    return unique
+
+
+class PluginSet(Generic[_T]):
+    """
+    Plugins de un agente: specs estáticos e instancias creadas bajo demanda.
+
+    Los entry points se leen la primera vez que se consultan los plugins, y
+    cada plugin se importa e instancia la primera vez que se lo pide.
+
+    Example:
+        >>> plugins = PluginSet(CHECKS_GROUP, BUILTIN_CHECKS, kind="check")
+        >>> fast = plugins.load(where=lambda p: p.priority <= 3)  # importa solo esos
+    """
+
+    def __init__(
+        self, group: str, builtin: Sequence[PluginSpec] = (), kind: str = "plugin"
+    ) -> None:
+        """
+        Args:
+            group: Grupo de entry points de los plugins externos
+            builtin: Plugins propios del agente
+            kind: Nombre del tipo de plugin para los mensajes ("check", ...)
+        """
+        self.group = group
+        self.kind = kind
+        self._builtin = tuple(builtin)
+        self._specs: Optional[List[PluginSpec]] = None
+        self._instances: Dict[int, _T] = {}
+        self._failed: Set[int] = set()
+
+    @property
+    def specs(self) -> List[PluginSpec]:
+        """Specs de todos los plugins registrados."""
+        if self._specs is None:
+            self._specs = discover_plugins(self.group, self._builtin)
+        return self._specs
+
+    def __len__(self) -> int:
+        return len(self.specs) - len(self._failed)
+
+    def entries(self) -> List[Any]:
+        """
+        Un elemento por plugin: la instancia si ya se creó, si no su spec.
+
+        Ambos exponen `name`, `category`, `priority` y `estimated_duration`:
+        la selección usa los valores reales de los plugins ya creados.
+        """
+        return [
+            self._instances.get(index, spec)
+            for index, spec in enumerate(self.specs)
+            if index not in self._failed
+        ]
+
+    def load(self, where: Optional[Callable[[Any], bool]] = None) -> List[_T]:
+        """
+        Instancias de los plugins, importando y creando las que falten.
+
+        Un plugin que no se puede importar o instanciar se loguea y se descarta.
+
+        Args:
+            where: Filtro sobre `entries()`; solo se cargan los que pasan
+                (None = todos)
+
+        Returns:
+            Instancias en el orden de registro
+        """
+        loaded: List[_T] = []
+        for index, spec in enumerate(self.specs):
+            if index in self._failed:
+                continue
+            entry = self._instances.get(index, spec)
+            if where is not None and not where(entry):
+                continue
+            if index not in self._instances:
+                try:
+                    self._instances[index] = spec.load()()
+                    logger.debug(f"{self.kind.capitalize()} cargado: {spec.name}")
+                except Exception as e:
+                    logger.warning(f"Error al instanciar {self.kind} {spec.name}: {e}. Saltando.")
+                    self._failed.add(index)
+                    continue
+            loaded.append(self._instances[index])
+        return loaded
+
+    def replace(self, instances: Iterable[_T]) -> None:
+        """Reemplaza los plugins por instancias ya creadas (ej: en tests)."""
+        instances = list(instances)
+        self._specs = [_spec_of(instance) for instance in instances]
+        self._instances = dict(enumerate(instances))
+        self._failed = set()
+
+
+def _spec_of(instance: Any) -> PluginSpec:
+    """Spec de un plugin ya instanciado (su metadata se lee de la instancia)."""
+    cls = type(instance)
+    return PluginSpec(
+        name=getattr(instance, "name", cls.__name__),
+        target=f"{cls.__module__}:{cls.__qualname__}",
+        category=getattr(instance, "category", ""),
+        dynamic_duration=getattr(instance, "dynamic_duration", False) is True,
+    )
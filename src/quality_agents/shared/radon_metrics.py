@@ -0,0 +1,201 @@
+"""
+Métricas de radon compartidas entre agentes.
+
+ComplexityCheck (`radon cc`), MaintainabilityCheck (`radon mi`) y el
+WMCAnalyzer de DesignReviewer (`cc_visit`) calculaban la complejidad
+ciclomática del mismo archivo tres veces. El proveedor parsea el código una
+sola vez, calcula bloques de complejidad, Maintainability Index y métricas
+raw, y memoriza el resultado por hash del contenido: cualquier consumidor que
+pida el mismo contenido reutiliza el cálculo.
+
+Los valores son los mismos que reporta el CLI de radon con sus opciones por
+defecto (`radon cc`, `radon mi` con multilínea como comentario).
+"""
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional
+
+# radon se importa al calcular la primera métrica (None = todavía no se intentó)
+_RADON_DISPONIBLE: Optional[bool] = None
+
+
+def _load_radon() -> bool:
+    """Importa radon la primera vez; retorna True si está disponible."""
+    global _RADON_DISPONIBLE, cc_rank, sorted_results, h_visit_ast, mi_compute, mi_rank
+    global analyze, ComplexityVisitor
+    if _RADON_DISPONIBLE is None:
+        try:
+            from radon.complexity import cc_rank, sorted_results  # type: ignore[import-untyped]
+            from radon.metrics import (  # type: ignore[import-untyped]
+                h_visit_ast,
+                mi_compute,
+                mi_rank,
+            )
+            from radon.raw import analyze  # type: ignore[import-untyped]
+            from radon.visitors import ComplexityVisitor  # type: ignore[import-untyped]
+
+            _RADON_DISPONIBLE = True
+        except ImportError:
+            _RADON_DISPONIBLE = False
+    return _RADON_DISPONIBLE
+
+
+# Contenidos memorizados antes de descartar los usados menos recientemente
+_MAX_MEMO_ENTRIES = 2048
+
+
+@dataclass
+class RadonMetrics:
+    """
+    Métricas de radon de un contenido.
+
+    Attributes:
+        blocks: Bloques de complejidad (funciones, clases y sus métodos), sin ordenar
+        total_complexity: Complejidad ciclomática total del módulo
+        mi: Maintainability Index (None si no se pudo calcular)
+        mi_rank: Grado del MI ("A", "B" o "C")
+        raw: Métricas raw de radon (loc, lloc, sloc, comments, multi, blank)
+        error: Motivo por el que no se pudo analizar el contenido
+    """
+
+    blocks: List[Any] = field(default_factory=list)
+    total_complexity: int = 0
+    mi: Optional[float] = None
+    mi_rank: Optional[str] = None
+    raw: Optional[Any] = None
+    error: Optional[str] = None
+
+    def sorted_blocks(self) -> List[Any]:
+        """Bloques ordenados por complejidad descendente (orden de `radon cc`)."""
+        _load_radon()
+        return sorted_results(self.blocks)
+
+
+def complexity_rank(complexity: int) -> str:
+    """Grado de radon (A-F) para una complejidad ciclomática."""
+    _load_radon()
+    return cc_rank(complexity)
+
+
+class RadonMetricsProvider:
+    """
+    Calcula y memoriza las métricas de radon por hash de contenido.
+
+    Es thread-safe: CodeGuard ejecuta checks en paralelo (`--jobs`).
+
+    Example:
+        >>> provider = RadonMetricsProvider.shared()
+        >>> metrics = provider.for_file(Path("app.py"))
+        >>> metrics.mi, [b.complexity for b in metrics.sorted_blocks()]
+    """
+
+    _shared: Optional["RadonMetricsProvider"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = _MAX_MEMO_ENTRIES) -> None:
+        """
+        Args:
+            max_entries: Contenidos memorizados como máximo (desalojo LRU)
+
+        Raises:
+            ImportError: Si radon no está instalado.
+        """
+        if not _load_radon():
+            raise ImportError("radon not installed. Run: pip install radon")
+
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[str, RadonMetrics]" = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> "RadonMetricsProvider":
+        """Instancia compartida por todos los consumidores del proceso."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def is_available() -> bool:
+        """Retorna True si radon puede importarse en este entorno."""
+        return _load_radon()
+
+    def for_file(self, file_path: Path) -> RadonMetrics:
+        """
+        Métricas del contenido actual de un archivo.
+
+        Args:
+            file_path: Ruta al archivo Python
+
+        Returns:
+            Métricas del archivo
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+        """
+        return self.for_bytes(file_path.read_bytes())
+
+    def for_source(self, source: str) -> RadonMetrics:
+        """Métricas de código fuente ya leído."""
+        return self.for_bytes(source.encode("utf-8"))
+
+    def for_bytes(self, content: bytes, tree: Optional[ast.Module] = None) -> RadonMetrics:
+        """
+        Métricas de un contenido, calculadas una sola vez por hash.
+
+        Args:
+            content: Bytes del archivo
+            tree: AST ya parseado de `content` (None = parsearlo). Los visitors
+                de radon lo recorren sin modificarlo.
+
+        Returns:
+            Métricas del contenido
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            metrics = self._memo.get(digest)
+            if metrics is not None:
+                self._memo.move_to_end(digest)
+                return metrics
+
+        # El cálculo va fuera del lock: contenidos distintos se analizan en paralelo
+        metrics = self._compute(content, tree)
+
+        with self._lock:
+            self._memo[digest] = metrics
+            while len(self._memo) > self._max_entries:
+                self._memo.popitem(last=False)
+        return metrics
+
+    @staticmethod
+    def _compute(content: bytes, tree: Optional[ast.Module] = None) -> RadonMetrics:
+        """Parsea el contenido una vez y deriva todas las métricas del mismo AST."""
+        try:
+            source = content.decode("utf-8")
+            if tree is None:
+                tree = ast.parse(source)
+            visitor = ComplexityVisitor.from_ast(tree)
+            raw = analyze(source)
+            # Mismos parámetros que radon.metrics.mi_parameters (multi=True)
+            comment_lines = raw.comments + raw.multi
+            comments = comment_lines / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+            volume = h_visit_ast(tree).total.volume
+            mi = mi_compute(volume, visitor.total_complexity, raw.lloc, comments)
+        except (SyntaxError, ValueError) as e:
+            return RadonMetrics(error=str(e))
+        except Exception as e:
+            # tokenize/radon pueden fallar con código inusual: se reporta sin métricas
+            return RadonMetrics(error=f"radon failed: {e}")
+
+        return RadonMetrics(
+            blocks=visitor.blocks,
+            total_complexity=visitor.total_complexity,
+            mi=mi,
+            mi_rank=mi_rank(mi),
+            raw=raw,
+        )
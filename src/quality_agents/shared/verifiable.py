@@ -11,7 +11,7 @@ Basado en: docs/agentes/decision_arquitectura_checks_modulares.md
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -33,6 +33,12 @@ class ExecutionContext:
         is_excluded: True si el archivo está en patrones de exclusión
         ai_enabled: True si IA está habilitada para explicaciones/sugerencias
         ai_suggestions: Sugerencias previas de IA (opcional)
+        project_root: Raíz del proyecto analizado (None = desconocida)
+        deadline: Instante (`time.monotonic()`) en que vence la corrida completa
+            (None = sin límite). Las herramientas externas se cortan al vencer.
+        modules: Módulos parseados de la corrida (`shared.parsed_modules.ModuleStore`),
+            compartidos por los verificables que analizan el AST (None = cada
+            uno parsea el archivo)
     """
 
     file_path: Path
@@ -44,6 +50,9 @@ class ExecutionContext:
     is_excluded: bool = False
     ai_enabled: bool = False
     ai_suggestions: Optional[List[str]] = field(default_factory=lambda: None)
+    project_root: Optional[Path] = None
+    deadline: Optional[float] = None
+    modules: Any = None
 
 
 class Verifiable(ABC):
@@ -68,6 +77,9 @@ class Verifiable(ABC):
         - estimated_duration: Duración estimada (default: 1.0s)
         - priority: Prioridad de ejecución (default: 5)
         - should_run: Lógica de decisión contextual (default: not context.is_excluded)
+        - supports_batch / execute_batch: Ejecución sobre varios archivos a la vez
+        - execute_async / execute_batch_async: Variantes para el motor asyncio
+        - cache_key: Huella para cachear resultados por contenido (default: no cacheable)
 
     Example:
         >>> class PEP8Check(Verifiable):
@@ -213,3 +225,87 @@ class Verifiable(ABC):
             ...     return results
         """
         pass
+
+    @property
+    def supports_batch(self) -> bool:
+        """
+        Indica si el verificable implementa una ejecución batch eficiente.
+
+        Cuando es True, el orquestador puede preferir `execute_batch` con todos
+        los archivos del changeset en lugar de llamar a `execute` una vez por
+        archivo (ej: una sola invocación de la herramienta externa).
+
+        Returns:
+            True si `execute_batch` está optimizado (default: False)
+        """
+        return False
+
+    def execute_batch(self, file_paths: List[Path]) -> Dict[Path, List[Any]]:
+        """
+        Ejecuta la verificación sobre varios archivos y reparte los resultados.
+
+        La implementación default llama a `execute` archivo por archivo.
+        Los verificables que declaran `supports_batch` la sobrescriben para
+        procesar todo el conjunto de una vez.
+
+        Args:
+            file_paths: Archivos a verificar/analizar
+
+        Returns:
+            Diccionario {archivo: lista de resultados de ese archivo}, con una
+            entrada por cada archivo recibido (aunque su lista esté vacía)
+
+        Raises:
+            Igual que `execute`; el orquestador es responsable de manejarlas.
+        """
+        return {file_path: self.execute(file_path) for file_path in file_paths}
+
+    async def execute_async(self, file_path: Path) -> List[Any]:
+        """
+        Variante async de `execute` para los motores basados en asyncio.
+
+        La implementación default corre `execute` en un hilo. Los verificables
+        que invocan herramientas externas pueden sobrescribirla para esperar
+        el subprocess sin ocupar un hilo.
+
+        Args:
+            file_path: Archivo a verificar/analizar
+
+        Returns:
+            Lo mismo que `execute`
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.execute, file_path)
+
+    async def execute_batch_async(self, file_paths: List[Path]) -> Dict[Path, List[Any]]:
+        """
+        Variante async de `execute_batch` (default: `execute_batch` en un hilo).
+
+        Args:
+            file_paths: Archivos a verificar/analizar
+
+        Returns:
+            Lo mismo que `execute_batch`
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.execute_batch, file_paths)
+
+    def cache_key(self, config: Any) -> Optional[str]:
+        """
+        Huella de lo que, además del contenido del archivo, determina el resultado.
+
+        Los agentes con caché de resultados combinan esta huella con el hash
+        del archivo y el nombre del verificable. Debe cambiar cuando cambia la
+        versión de la herramienta externa o algún campo de configuración que
+        afecte el resultado.
+
+        Args:
+            config: Configuración del agente (CodeGuardConfig, etc.)
+
+        Returns:
+            Huella estable, o None si el resultado no es cacheable (default),
+            por ejemplo porque depende de otros archivos además del analizado
+        """
+        return None
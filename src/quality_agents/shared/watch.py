@@ -0,0 +1,372 @@
+"""
+Modo `--watch` de los agentes: detección de cambios y resultados incrementales.
+
+`FileWatcher` espera a que cambien los archivos Python de los targets. En
+Linux se despierta con inotify (vía ctypes, sin dependencias); en otras
+plataformas, o si inotify no está disponible, revisa el árbol cada
+`poll_interval` segundos. En ambos casos el conjunto de cambios se calcula
+comparando (mtime, tamaño) de cada archivo con la pasada anterior, y las
+ráfagas de guardados se agrupan (debounce) en un solo `ChangeSet`.
+
+`IncrementalResults` mantiene en memoria los resultados por archivo: cada
+iteración reemplaza solo los archivos re-analizados y devuelve la diferencia
+(resultados nuevos y resueltos), que es lo único que se vuelve a mostrar.
+"""
+
+import logging
+import os
+import select
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Eventos de inotify que indican un cambio de contenido o de estructura
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE
+)
+_IN_NONBLOCK = getattr(os, "O_NONBLOCK", 0o4000)
+_IN_CLOEXEC = 0o2000000
+
+# Directorios que nunca se observan (cachés y entornos virtuales)
+_IGNORED_DIRS = {
+    ".git", "__pycache__", ".quality_control", ".venv", "venv", ".tox", "node_modules",
+}
+
+
+@dataclass
+class ChangeSet:
+    """
+    Archivos Python que cambiaron desde la última pasada.
+
+    Attributes:
+        modified: Archivos nuevos o con contenido modificado
+        deleted: Archivos eliminados
+    """
+
+    modified: Set[Path] = field(default_factory=set)
+    deleted: Set[Path] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.modified or self.deleted)
+
+    def merge(self, other: "ChangeSet") -> None:
+        """Acumula los cambios de una pasada posterior (el último estado gana)."""
+        self.modified = (self.modified - other.deleted) | other.modified
+        self.deleted = (self.deleted - other.modified) | other.deleted
+
+
+class _Inotify:
+    """Notificaciones de inotify sobre un conjunto de directorios (solo Linux)."""
+
+    def __init__(self) -> None:
+        import ctypes  # Solo en modo --watch
+        import ctypes.util
+
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or libc_name is None:
+            raise OSError("inotify not available")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+        self._watched: Set[str] = set()
+
+    def add(self, directory: Path) -> None:
+        """Observa un directorio (ignora los que ya se observan o no existen)."""
+        path = str(directory)
+        if path in self._watched:
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), _IN_MASK)
+        if wd >= 0:
+            self._watched.add(path)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Espera eventos y los descarta (el contenido se compara por stat).
+
+        Returns:
+            True si hubo al menos un evento antes del timeout
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        while True:
+            try:
+                if not os.read(self.fd, 64 * 1024):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    Espera cambios en los archivos Python de uno o más targets.
+
+    Example:
+        >>> watcher = FileWatcher([Path("src")], collect=lambda: agent.collect_files(Path("src")))
+        >>> changes = watcher.wait()   # bloquea hasta que se guarde un archivo
+        >>> results = agent.run(sorted(changes.modified))
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[Path],
+        collect: Callable[[], Iterable[Path]],
+        debounce: float = 0.3,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Args:
+            targets: Archivos o directorios observados
+            collect: Archivos a analizar (respetando exclude_patterns); se
+                invoca en cada pasada, así que ve archivos nuevos
+            debounce: Segundos sin cambios nuevos antes de entregar un ChangeSet
+            poll_interval: Intervalo de revisión sin inotify (y timeout de espera)
+            use_inotify: False fuerza el modo polling
+        """
+        self.targets = [Path(t) for t in targets]
+        self.collect = collect
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify no disponible, se usa polling: {e}")
+        self._snapshot = self._scan()
+
+    @property
+    def mode(self) -> str:
+        """Mecanismo de detección: "inotify" o "polling"."""
+        return "inotify" if self._inotify is not None else "polling"
+
+    def wait(self, timeout: Optional[float] = None) -> ChangeSet:
+        """
+        Bloquea hasta que haya cambios y la ráfaga de guardados termine.
+
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite)
+
+        Returns:
+            Cambios acumulados (vacío solo si venció el timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changes = ChangeSet()
+        while not changes:
+            remaining = self.poll_interval
+            if deadline is not None:
+                remaining = min(remaining, deadline - time.monotonic())
+                if remaining <= 0:
+                    return changes
+            if self._inotify is not None:
+                if not self._inotify.wait(remaining):
+                    continue
+            else:
+                time.sleep(remaining)
+            changes = self.poll()
+
+        # Debounce: seguir acumulando mientras sigan llegando cambios
+        while True:
+            time.sleep(self.debounce)
+            more = self.poll()
+            if not more:
+                return changes
+            changes.merge(more)
+
+    def poll(self) -> ChangeSet:
+        """Compara el árbol con la pasada anterior (sin esperar)."""
+        current = self._scan()
+        changes = ChangeSet(
+            modified={p for p, stat in current.items() if self._snapshot.get(p) != stat},
+            deleted=set(self._snapshot) - set(current),
+        )
+        self._snapshot = current
+        return changes
+
+    def close(self) -> None:
+        """Libera el descriptor de inotify."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime_ns, tamaño) de cada archivo; registra los directorios nuevos en inotify."""
+        if self._inotify is not None:
+            for directory in self._directories():
+                self._inotify.add(directory)
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for path in self.collect():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _directories(self) -> Iterable[Path]:
+        for target in self.targets:
+            if target.is_file():
+                yield target.parent
+                continue
+            for root, dirs, _ in os.walk(target):
+                dirs[:] = [d for d in dirs if d not in _IGNORED_DIRS]
+                yield Path(root)
+
+
+class IncrementalResults(Generic[T]):
+    """
+    Resultados por archivo de una sesión de watch.
+
+    Example:
+        >>> state = IncrementalResults(key=lambda r: (r.check_name, r.message))
+        >>> state.update(group_by_file(results))            # corrida inicial
+        >>> added, removed = state.update(group_by_file(new), deleted=changes.deleted)
+    """
+
+    def __init__(self, key: Callable[[T], Hashable]) -> None:
+        """
+        Args:
+            key: Identidad de un resultado para calcular la diferencia
+        """
+        self.key = key
+        self._by_file: Dict[Optional[Path], List[T]] = {}
+
+    @property
+    def results(self) -> List[T]:
+        """Todos los resultados vigentes, en orden de archivo."""
+        ordered = sorted(self._by_file.items(), key=lambda item: str(item[0] or ""))
+        return [result for _, results in ordered for result in results]
+
+    def for_file(self, file_path: Optional[Path]) -> List[T]:
+        """Resultados vigentes de un archivo."""
+        return list(self._by_file.get(file_path, []))
+
+    def files(self) -> List[Optional[Path]]:
+        """Archivos con resultados vigentes."""
+        return list(self._by_file)
+
+    def update(
+        self,
+        results_by_file: Dict[Optional[Path], List[T]],
+        deleted: Iterable[Path] = (),
+    ) -> Tuple[List[T], List[T]]:
+        """
+        Reemplaza los resultados de los archivos re-analizados.
+
+        Args:
+            results_by_file: Resultados nuevos de cada archivo re-analizado
+                (una lista vacía borra los anteriores)
+            deleted: Archivos eliminados
+
+        Returns:
+            Tupla (nuevos, resueltos) respecto de los resultados anteriores
+        """
+        previous: List[T] = []
+        current: List[T] = []
+        for file_path in deleted:
+            previous.extend(self._by_file.pop(file_path, []))
+        for file_path, results in results_by_file.items():
+            previous.extend(self._by_file.get(file_path, []))
+            current.extend(results)
+            if results:
+                self._by_file[file_path] = list(results)
+            else:
+                self._by_file.pop(file_path, None)
+        return _difference(current, previous, self.key), _difference(previous, current, self.key)
+
+
+def group_by_file(
+    results: Iterable[T], file_of: Callable[[T], Optional[Path]], files: Iterable[Path] = ()
+) -> Dict[Optional[Path], List[T]]:
+    """
+    Agrupa resultados por archivo.
+
+    Args:
+        results: Resultados de una corrida
+        file_of: Archivo de un resultado (None = resultado sin archivo)
+        files: Archivos analizados; los que no tienen resultados quedan con
+            lista vacía (para que `IncrementalResults.update` borre los anteriores)
+
+    Returns:
+        Diccionario {archivo: resultados}
+    """
+    grouped: Dict[Optional[Path], List[T]] = {Path(f): [] for f in files}
+    for result in results:
+        grouped.setdefault(file_of(result), []).append(result)
+    return grouped
+
+
+def format_update(
+    changes: ChangeSet,
+    added: List[T],
+    removed: List[T],
+    elapsed: float,
+    describe: Callable[[T], str],
+) -> List[str]:
+    """
+    Líneas que muestran una iteración del watch: solo la diferencia.
+
+    Args:
+        changes: Archivos que dispararon la iteración
+        added: Resultados nuevos
+        removed: Resultados resueltos
+        elapsed: Duración del re-análisis (segundos)
+        describe: Representación de una línea de un resultado
+
+    Returns:
+        Encabezado con hora y conteos, y una línea `+`/`-` por resultado
+    """
+    lines = [
+        f"[{time.strftime('%H:%M:%S')}] {len(changes.modified)} modificados, "
+        f"{len(changes.deleted)} eliminados · {elapsed:.2f}s · "
+        f"+{len(added)} nuevos, -{len(removed)} resueltos"
+    ]
+    lines.extend(f"  + {describe(result)}" for result in added)
+    lines.extend(f"  - {describe(result)}" for result in removed)
+    return lines
+
+
+def _difference(items: List[T], others: List[T], key: Callable[[T], Hashable]) -> List[T]:
+    """Elementos de `items` que no están en `others` (multiconjunto por clave)."""
+    remaining = Counter(key(item) for item in others)
+    difference = []
+    for item in items:
+        item_key = key(item)
+        if remaining[item_key]:
+            remaining[item_key] -= 1
+        else:
+            difference.append(item)
+    return difference
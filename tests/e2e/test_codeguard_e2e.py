@@ -13,6 +13,7 @@ Ticket: 2.5.2
 """
 
 import json
+import shutil
 import tempfile
 from pathlib import Path
 from textwrap import dedent
@@ -471,15 +472,17 @@ class TestCodeGuardWithExampleProject:
     """Tests end-to-end con el proyecto de ejemplo real."""
 
     @pytest.fixture
-    def example_project(self):
-        """Retorna la ruta al proyecto de ejemplo si existe."""
+    def example_project(self, tmp_path):
+        """Copia del proyecto de ejemplo (CodeGuard escribe en su .quality_control/)."""
         project_root = Path(__file__).parent.parent.parent
         example = project_root / "examples" / "sample_project"
 
         if not example.exists():
             pytest.skip("Proyecto de ejemplo no encontrado")
 
-        return example
+        copy = tmp_path / "sample_project"
+        shutil.copytree(example, copy, ignore=shutil.ignore_patterns(".quality_control"))
+        return copy
 
     def test_analyze_example_project(self, example_project):
         """Verifica que CodeGuard puede analizar el proyecto de ejemplo."""
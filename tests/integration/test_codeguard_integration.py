@@ -15,6 +15,12 @@ from quality_agents.codeguard.agent import CheckResult, CodeGuard, Severity
 from quality_agents.codeguard.config import CodeGuardConfig
 
 
+@pytest.fixture(autouse=True)
+def _project_root_temporal(tmp_path, monkeypatch):
+    """CodeGuard() usa el directorio actual: sus caché y estadísticas van a tmp_path."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestCodeGuardOrchestration:
     """Tests para la orquestación de checks en CodeGuard."""
 
@@ -162,18 +168,18 @@ class TestCodeGuardOrchestration:
             assert len(check_names) >= 1
 
     def test_is_excluded_with_pattern(self):
-        """Verifica que _is_excluded funciona correctamente."""
+        """Verifica que is_excluded funciona correctamente."""
         config = CodeGuardConfig(exclude_patterns=["__pycache__", "*.pyc", "venv"])
         guard = CodeGuard()
         guard.config = config
 
         # Archivos que deben ser excluidos
-        assert guard._is_excluded(Path("src/__pycache__/test.py")) is True
-        assert guard._is_excluded(Path("venv/lib/python.py")) is True
+        assert guard.is_excluded(Path("src/__pycache__/test.py")) is True
+        assert guard.is_excluded(Path("venv/lib/python.py")) is True
 
         # Archivos que NO deben ser excluidos
-        assert guard._is_excluded(Path("src/app.py")) is False
-        assert guard._is_excluded(Path("tests/test_app.py")) is False
+        assert guard.is_excluded(Path("src/app.py")) is False
+        assert guard.is_excluded(Path("tests/test_app.py")) is False
 
 
 class TestCodeGuardCLIIntegration:
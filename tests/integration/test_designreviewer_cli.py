@@ -86,6 +86,19 @@ class TestDesignReviewerCLI:
         result = runner.invoke(main, ["/ruta/que/no/existe/archivo.py"])
         assert result.exit_code != 0
 
+    def test_jobs_se_pasa_al_run(self, runner, temp_python_file):
+        with patch(
+            "quality_agents.designreviewer.agent.DesignReviewer.run", return_value=[]
+        ) as run:
+            result = runner.invoke(main, [str(temp_python_file), "--jobs", "4"])
+
+        assert result.exit_code == 0
+        assert run.call_args.kwargs["jobs"] == 4
+
+    def test_jobs_negativo_falla(self, runner, temp_python_file):
+        result = runner.invoke(main, [str(temp_python_file), "--jobs", "-1"])
+        assert result.exit_code == 2
+
 
 # --- Tests de exit code ---
 
@@ -76,6 +76,14 @@ class TestPreCommitHooksConfiguration:
         assert "--analysis-type" in args
         assert "pre-commit" in args
 
+    def test_codeguard_hook_analiza_contenido_staged(self):
+        """El hook 'codeguard' analiza solo el contenido staged, no todo el repositorio."""
+        with open(HOOKS_FILE) as f:
+            hooks = yaml.safe_load(f)
+
+        codeguard_hook = next(h for h in hooks if h["id"] == "codeguard")
+        assert "--staged" in codeguard_hook.get("args", [])
+
     def test_all_hooks_valid_language(self):
         """Todos los hooks deben usar lenguajes válidos."""
         with open(HOOKS_FILE) as f:
@@ -14,6 +14,7 @@ from quality_agents.architectanalyst.agent import ArchitectAnalyst
 from quality_agents.architectanalyst.config import ArchitectAnalystConfig
 from quality_agents.architectanalyst.models import ArchitectureResult, ArchitectureSeverity
 from quality_agents.architectanalyst.orchestrator import MetricOrchestrator, ProjectMetric
+from quality_agents.shared.plugins import PluginSpec
 
 # ========== Métricas mock para tests ==========
 
@@ -189,70 +190,64 @@ class TestMetricOrchestratorInit:
         assert prioridades == sorted(prioridades)
 
 
-# ========== Tests de MetricOrchestrator auto-discovery ==========
+# ========== Tests de MetricOrchestrator: registro de métricas ==========
 
 
-class TestMetricOrchestratorDiscovery:
-    """Tests para el auto-discovery de métricas."""
-
-    @patch("quality_agents.architectanalyst.orchestrator.importlib.import_module")
-    def test_discovery_encuentra_subclases_de_project_metric(self, mock_import):
-        """Debe descubrir y instanciar todas las subclases de ProjectMetric."""
-        from unittest.mock import Mock
-
-        mock_module = Mock()
-        mock_module.MockMetricSinResultados = MockMetricSinResultados
-        mock_module.MockConViolacion = MockMetricConViolacion
-        mock_module.ProjectMetric = ProjectMetric  # Clase base — debe ser excluida
-
-        with patch("quality_agents.architectanalyst.orchestrator.dir") as mock_dir:
-            mock_dir.return_value = [
-                "MockMetricSinResultados",
-                "MockConViolacion",
-                "ProjectMetric",
-                "alguna_funcion",
-            ]
-            mock_import.return_value = mock_module
+class MetricQueNoInstancia(ProjectMetric):
+    """Métrica cuyo constructor falla."""
 
-            orch = MetricOrchestrator(config=None)
+    def __init__(self):
+        raise ValueError("Error al instanciar")
 
-        assert len(orch.metrics) == 2
-        nombres = {m.name for m in orch.metrics}
-        assert "MockSinResultados" in nombres
-        assert "MockConViolacion" in nombres
+    @property
+    def name(self) -> str:
+        return "X"
 
-    @patch("quality_agents.architectanalyst.orchestrator.importlib.import_module")
-    def test_discovery_maneja_error_instanciacion(self, mock_import):
-        """Si una métrica no puede instanciarse, debe loguear y continuar."""
-        from unittest.mock import Mock
+    @property
+    def category(self) -> str:
+        return "martin"
 
-        class MetricQueNoInstancia(ProjectMetric):
-            def __init__(self):
-                raise ValueError("Error al instanciar")
+    def analyze(self, p, f):
+        return []
 
-            @property
-            def name(self) -> str:
-                return "X"
 
-            @property
-            def category(self) -> str:
-                return "martin"
+def _spec(nombre: str, clase: str, prioridad: int = 5) -> PluginSpec:
+    return PluginSpec(nombre, f"{__name__}:{clase}", "martin", priority=prioridad)
 
-            def analyze(self, p, f):
-                return []
 
-        mock_module = Mock()
-        mock_module.MetricQueNoInstancia = MetricQueNoInstancia
-        mock_module.MockMetricSinResultados = MockMetricSinResultados
+class TestMetricOrchestratorDiscovery:
+    """Tests para la carga de métricas desde el registro."""
+
+    def test_discovery_instancia_las_metricas_registradas(self):
+        """Debe instanciar las métricas del registro, ordenadas por prioridad."""
+        registro = (
+            _spec("MockSinResultados", "MockMetricSinResultados"),
+            _spec("MockConViolacion", "MockMetricConViolacion", prioridad=1),
+        )
+        with patch("quality_agents.architectanalyst.orchestrator.BUILTIN_METRICS", registro):
+            orch = MetricOrchestrator(config=None)
 
-        with patch("quality_agents.architectanalyst.orchestrator.dir") as mock_dir:
-            mock_dir.return_value = ["MetricQueNoInstancia", "MockMetricSinResultados"]
-            mock_import.return_value = mock_module
+        assert [m.name for m in orch.metrics] == ["MockConViolacion", "MockSinResultados"]
 
+    def test_discovery_maneja_error_instanciacion(self):
+        """Si una métrica no puede instanciarse, debe loguear y continuar."""
+        registro = (
+            _spec("X", "MetricQueNoInstancia"),
+            _spec("MockSinResultados", "MockMetricSinResultados"),
+        )
+        with patch("quality_agents.architectanalyst.orchestrator.BUILTIN_METRICS", registro):
             orch = MetricOrchestrator(config=None)
 
         assert len(orch.metrics) == 1
         assert orch.metrics[0].name == "MockSinResultados"
+        assert len(orch.plugins) == 1
+
+    def test_registro_incluye_todas_las_metricas(self):
+        """Sin parches, el registro trae las métricas del agente."""
+        orch = MetricOrchestrator(config=None)
+
+        assert len(orch.metrics) == 9
+        assert orch.metrics[0].name == "DependencyCyclesAnalyzer"
 
 
 # ========== Tests de MetricOrchestrator.run() ==========
@@ -2,6 +2,9 @@
 Tests unitarios para CodeGuard.
 """
 
+import asyncio
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -28,9 +31,9 @@ class TestCodeGuard:
         guard = CodeGuard(config_path=config_path)
         assert guard.config_path == config_path
 
-    def test_run_returns_list(self, sample_python_file):
+    def test_run_returns_list(self, sample_python_file, temp_project):
         """run() debe retornar lista de resultados."""
-        guard = CodeGuard()
+        guard = CodeGuard(project_root=temp_project)
         results = guard.run([sample_python_file])
 
         assert isinstance(results, list)
@@ -40,7 +43,7 @@ class TestCodeGuard:
         txt_file = temp_project / "readme.txt"
         txt_file.write_text("Not Python")
 
-        guard = CodeGuard()
+        guard = CodeGuard(project_root=temp_project)
         results = guard.run([txt_file])
 
         assert results == []
@@ -143,6 +146,12 @@ class TestSeverity:
         assert Severity.WARNING.value == "warning"
         assert Severity.ERROR.value == "error"
 
+    def test_reexportados_desde_models(self):
+        from quality_agents.codeguard import models
+
+        assert Severity is models.Severity
+        assert CheckResult is models.CheckResult
+
 
 class TestCodeGuardCLI:
     """Tests del CLI de CodeGuard (fix #38)."""
@@ -178,3 +187,557 @@ class TestCodeGuardCLI:
     def test_path_inexistente_falla(self, runner):
         result = runner.invoke(main, ["/ruta/que/no/existe/"])
         assert result.exit_code != 0
+
+    def test_agente_como_modulo(self):
+        # Sin import circular entre agent.py y los módulos que importa
+        completed = subprocess.run(
+            [sys.executable, "-m", "quality_agents.codeguard.agent", "--help"],
+            capture_output=True, text=True,
+        )
+        assert completed.returncode == 0, completed.stderr
+        assert "CodeGuard" in completed.stdout
+
+
+class _FakeCheck:
+    """Check mínimo para probar la ejecución batch de CodeGuard.run()."""
+
+    def __init__(self, name, priority, batch, fingerprint=None):
+        self.name = name
+        self.priority = priority
+        self.supports_batch = batch
+        self.fingerprint = fingerprint
+        self.batch_calls = []
+        self.execute_calls = []
+
+    def cache_key(self, config):
+        return self.fingerprint
+
+    def execute(self, file_path):
+        self.execute_calls.append(file_path)
+        return [CheckResult(self.name, Severity.INFO, "single", str(file_path))]
+
+    def execute_batch(self, file_paths):
+        self.batch_calls.append(list(file_paths))
+        return {
+            f: [CheckResult(self.name, Severity.INFO, "batch", str(f))] for f in file_paths
+        }
+
+
+class TestCodeGuardBatch:
+    """Tests de la ejecución batch en CodeGuard.run()."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for name in ("a.py", "b.py", "c.py"):
+            path = tmp_path / name
+            path.write_text("x = 1\n")
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        return guard
+
+    def test_batch_check_invocado_una_vez(self, tmp_path, files):
+        batch = _FakeCheck("Batch", 1, True)
+        guard = self._guard(tmp_path, [batch])
+
+        results = guard.run(files)
+
+        assert batch.batch_calls == [files]
+        assert batch.execute_calls == []
+        assert [r.message for r in results] == ["batch"] * 3
+
+    def test_orden_de_resultados_archivo_y_prioridad(self, tmp_path, files):
+        batch = _FakeCheck("Batch", 1, True)
+        single = _FakeCheck("Single", 2, False)
+        guard = self._guard(tmp_path, [batch, single])
+
+        results = guard.run(files)
+
+        assert [(r.file_path, r.check_name) for r in results] == [
+            (str(f), name) for f in files for name in ("Batch", "Single")
+        ]
+        assert sorted(single.execute_calls) == files
+
+    def test_batch_deshabilitado_en_config(self, tmp_path, files):
+        batch = _FakeCheck("Batch", 1, True)
+        guard = self._guard(tmp_path, [batch])
+        guard.config.execution.batch = False
+
+        guard.run(files)
+
+        assert batch.batch_calls == []
+        assert sorted(batch.execute_calls) == files
+
+    def test_max_batch_size_divide_invocaciones(self, tmp_path, files):
+        batch = _FakeCheck("Batch", 1, True)
+        guard = self._guard(tmp_path, [batch])
+        guard.config.execution.max_batch_size = 2
+
+        guard.run(files)
+
+        assert batch.batch_calls == [files[:2]]
+        # Un bloque de un solo archivo se ejecuta con execute()
+        assert batch.execute_calls == files[2:]
+
+    def test_un_solo_archivo_usa_execute(self, tmp_path, files):
+        batch = _FakeCheck("Batch", 1, True)
+        guard = self._guard(tmp_path, [batch])
+
+        guard.run(files[:1])
+
+        assert batch.batch_calls == []
+        assert batch.execute_calls == files[:1]
+
+    def test_error_en_batch_reporta_error_por_archivo(self, tmp_path, files):
+        batch = _FakeCheck("Batch", 1, True)
+        batch.execute_batch = lambda file_paths: 1 / 0
+        guard = self._guard(tmp_path, [batch])
+
+        results = guard.run(files)
+
+        assert len(results) == 3
+        assert all(r.severity == Severity.ERROR for r in results)
+        assert all("Check failed with error" in r.message for r in results)
+
+
+class TestCodeGuardParallel:
+    """Tests de la ejecución paralela (--jobs) en CodeGuard.run()."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"m{i}.py"
+            path.write_text("x = 1\n")
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        return guard
+
+    def test_orden_deterministico_con_workers(self, tmp_path, files):
+        import time as _time
+
+        class SlowCheck(_FakeCheck):
+            def execute(self, file_path):
+                # Los primeros archivos terminan últimos
+                _time.sleep(0.01 * (10 - int(file_path.stem[1:])))
+                return super().execute(file_path)
+
+        checks = [SlowCheck("A", 1, False), SlowCheck("B", 2, False)]
+        sequential = self._guard(tmp_path, checks).run(files, jobs=1)
+        parallel = self._guard(tmp_path, checks).run(files, jobs=4)
+
+        assert parallel == sequential
+        assert [(r.file_path, r.check_name) for r in parallel] == [
+            (str(f), name) for f in files for name in ("A", "B")
+        ]
+
+    def test_workers_ejecutan_en_paralelo(self, tmp_path, files):
+        import threading
+
+        threads = set()
+
+        class ThreadCheck(_FakeCheck):
+            def execute(self, file_path):
+                threads.add(threading.get_ident())
+                threading.Event().wait(0.02)
+                return super().execute(file_path)
+
+        self._guard(tmp_path, [ThreadCheck("A", 1, False)]).run(files, jobs=3)
+
+        assert len(threads) > 1
+
+    def test_error_de_check_en_worker(self, tmp_path, files):
+        failing = _FakeCheck("Falla", 1, False)
+        failing.execute = lambda file_path: 1 / 0
+        guard = self._guard(tmp_path, [failing, _FakeCheck("Ok", 2, False)])
+
+        results = guard.run(files, jobs=4)
+
+        assert [r.check_name for r in results] == ["Falla", "Ok"] * len(files)
+        assert all(r.severity == Severity.ERROR for r in results if r.check_name == "Falla")
+
+    def test_jobs_desde_config(self, tmp_path, files):
+        guard = self._guard(tmp_path, [_FakeCheck("A", 1, False)])
+        guard.config.execution.jobs = 1
+
+        # Sin deadline (full): con un worker no se crea ningún pool
+        with patch("quality_agents.codeguard.agent.ThreadPoolExecutor") as pool:
+            guard.run(files, analysis_type="full")
+
+        pool.assert_not_called()
+
+    def test_cli_pasa_jobs(self, tmp_path):
+        (tmp_path / "modulo.py").write_text("x = 1")
+        with patch("quality_agents.codeguard.agent.CodeGuard.run", return_value=[]) as run:
+            result = CliRunner().invoke(main, [str(tmp_path), "--jobs", "3"])
+        assert result.exit_code == 0
+        assert run.call_args.kwargs["jobs"] == 3
+
+
+class TestCodeGuardCache:
+    """Tests de la caché de resultados en CodeGuard.run()."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for name in ("a.py", "b.py"):
+            path = tmp_path / name
+            path.write_text(f"# {name}\nx = 1\n")
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        return guard
+
+    def test_segunda_corrida_usa_cache(self, tmp_path, files):
+        check = _FakeCheck("Cacheable", 1, False, fingerprint="tool==1.0")
+        guard = self._guard(tmp_path, [check])
+
+        first = guard.run(files, jobs=1)
+        second = guard.run(files, jobs=1)
+
+        assert check.execute_calls == files
+        assert second == first
+        assert (tmp_path / ".quality_control" / "cache" / "codeguard").is_dir()
+
+    def test_archivo_modificado_se_reanaliza(self, tmp_path, files):
+        check = _FakeCheck("Cacheable", 1, False, fingerprint="tool==1.0")
+        guard = self._guard(tmp_path, [check])
+
+        guard.run(files, jobs=1)
+        files[1].write_text("x = 2\n")
+        guard.run(files, jobs=1)
+
+        assert check.execute_calls == files + [files[1]]
+
+    def test_cambio_de_huella_invalida(self, tmp_path, files):
+        check = _FakeCheck("Cacheable", 1, False, fingerprint="tool==1.0")
+        guard = self._guard(tmp_path, [check])
+
+        guard.run(files, jobs=1)
+        check.fingerprint = "tool==2.0"
+        guard.run(files, jobs=1)
+
+        assert len(check.execute_calls) == 4
+
+    def test_check_sin_huella_no_se_cachea(self, tmp_path, files):
+        check = _FakeCheck("NoCacheable", 1, False)
+        guard = self._guard(tmp_path, [check])
+
+        guard.run(files, jobs=1)
+        guard.run(files, jobs=1)
+
+        assert len(check.execute_calls) == 4
+
+    def test_cache_deshabilitada(self, tmp_path, files):
+        check = _FakeCheck("Cacheable", 1, False, fingerprint="tool==1.0")
+        guard = self._guard(tmp_path, [check])
+        guard.config.execution.cache = False
+
+        guard.run(files, jobs=1)
+        guard.run(files, jobs=1)
+
+        assert len(check.execute_calls) == 4
+        assert not (tmp_path / ".quality_control").exists()
+
+    def test_cli_no_cache(self, tmp_path):
+        (tmp_path / "modulo.py").write_text("x = 1")
+        seen = {}
+
+        def fake_run(self, *args, **kwargs):
+            seen["cache"] = self.config.execution.cache
+            return []
+
+        with patch("quality_agents.codeguard.agent.CodeGuard.run", fake_run):
+            result = CliRunner().invoke(main, [str(tmp_path), "--no-cache"])
+        assert result.exit_code == 0
+        assert seen["cache"] is False
+
+
+class TestCodeGuardAsync:
+    """Tests del motor asyncio (execution.engine = "asyncio") en CodeGuard.run()."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"m{i}.py"
+            path.write_text("x = 1\n")
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks, limit=0):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        guard.config.execution.engine = "asyncio"
+        guard.config.execution.async_limit = limit
+        return guard
+
+    @staticmethod
+    def _async_check(name, priority, in_flight):
+        from quality_agents.shared.verifiable import Verifiable
+
+        class AsyncCheck(Verifiable):
+            @property
+            def name(self):
+                return name
+
+            @property
+            def category(self):
+                return "test"
+
+            @property
+            def priority(self):
+                return priority
+
+            def execute(self, file_path):
+                raise AssertionError("el motor asyncio debe usar execute_async")
+
+            async def execute_async(self, file_path):
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+                # Los primeros archivos terminan últimos
+                await asyncio.sleep(0.005 * (10 - int(file_path.stem[1:])))
+                in_flight["now"] -= 1
+                return [CheckResult(name, Severity.INFO, "async", str(file_path))]
+
+        return AsyncCheck()
+
+    def test_respeta_async_limit(self, tmp_path, files):
+        in_flight = {"now": 0, "max": 0}
+        check = self._async_check("A", 1, in_flight)
+
+        self._guard(tmp_path, [check], limit=3).run(files)
+
+        assert in_flight["max"] == 3
+
+    def test_orden_deterministico(self, tmp_path, files):
+        in_flight = {"now": 0, "max": 0}
+        checks = [self._async_check("A", 1, in_flight), self._async_check("B", 2, in_flight)]
+
+        results = self._guard(tmp_path, checks, limit=8).run(files)
+
+        assert [(r.file_path, r.check_name) for r in results] == [
+            (str(f), name) for f in files for name in ("A", "B")
+        ]
+
+    def test_mismos_resultados_que_threads(self, tmp_path, files):
+        checks = [_FakeCheck("Batch", 1, True), _FakeCheck("Single", 2, False)]
+        threaded = CodeGuard(project_root=tmp_path)
+        threaded.orchestrator.select_checks = lambda context: list(checks)
+
+        assert self._guard(tmp_path, checks).run(files) == threaded.run(files)
+
+    def test_error_de_check_reporta_error_por_archivo(self, tmp_path, files):
+        in_flight = {"now": 0, "max": 0}
+        failing = self._async_check("Falla", 1, in_flight)
+
+        async def boom(file_path):
+            raise RuntimeError("boom")
+
+        failing.execute_async = boom
+        results = self._guard(tmp_path, [failing]).run(files)
+
+        assert len(results) == len(files)
+        assert all(r.severity == Severity.ERROR for r in results)
+
+    def test_desde_codigo_async(self, tmp_path, files):
+        checks = [_FakeCheck("A", 1, False)]
+        guard = self._guard(tmp_path, checks)
+
+        async def caller():
+            return guard.run(files)
+
+        assert len(asyncio.run(caller())) == len(files)
+
+    def test_cli_pasa_engine(self, tmp_path):
+        (tmp_path / "modulo.py").write_text("x = 1")
+        seen = {}
+
+        def fake_run(self, *args, **kwargs):
+            seen["engine"] = self.config.execution.engine
+            return []
+
+        with patch("quality_agents.codeguard.agent.CodeGuard.run", fake_run):
+            result = CliRunner().invoke(main, [str(tmp_path), "--engine", "asyncio"])
+        assert result.exit_code == 0
+        assert seen["engine"] == "asyncio"
+
+
+class TestCodeGuardDeadline:
+    """Tests del deadline de toda la corrida (presupuesto de tiempo)."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"m{i}.py"
+            path.write_text("x = 1\n")
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks, engine="threads", jobs=1):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        guard.config.execution.cache = False
+        guard.config.execution.engine = engine
+        guard.config.execution.jobs = jobs
+        guard.config.execution.async_limit = jobs
+        return guard
+
+    @staticmethod
+    def _slow_check(name, priority, seconds):
+        class SlowCheck(_FakeCheck):
+            def execute(self, file_path):
+                import time as _time
+
+                _time.sleep(seconds)
+                return super().execute(file_path)
+
+        return SlowCheck(name, priority, False)
+
+    @pytest.mark.parametrize("engine,jobs", [("threads", 1), ("threads", 2), ("asyncio", 2)])
+    def test_corta_al_vencer_y_reporta_omitidos(self, tmp_path, files, engine, jobs):
+        import time as _time
+
+        fast = _FakeCheck("Rapido", 1, False)
+        slow = self._slow_check("Lento", 2, 0.4)
+        guard = self._guard(tmp_path, [fast, slow], engine=engine, jobs=jobs)
+
+        start = _time.monotonic()
+        results = guard.run(files, analysis_type="full", time_budget=0.5)
+        elapsed = _time.monotonic() - start
+
+        # 4 archivos x 0.4s de Lento no caben en 0.5s
+        assert elapsed < 1.0
+        assert [r.check_name for r in results if r.check_name == "Rapido"] == ["Rapido"] * 4
+        assert guard.skipped
+        assert all(name == "Lento" for _, name in guard.skipped)
+        completed = {(r.file_path, r.check_name) for r in results}
+        assert not {(str(f), name) for f, name in guard.skipped} & completed
+
+    @pytest.mark.parametrize("engine,jobs", [("threads", 1), ("threads", 2), ("asyncio", 2)])
+    def test_no_espera_a_un_check_que_no_se_puede_interrumpir(self, tmp_path, files, engine, jobs):
+        import time as _time
+
+        guard = self._guard(tmp_path, [self._slow_check("Lento", 1, 2.0)], engine=engine, jobs=jobs)
+
+        start = _time.monotonic()
+        guard.run(files[:1], analysis_type="full", time_budget=0.2)
+
+        assert _time.monotonic() - start < 1.0
+        assert guard.skipped == [(files[0], "Lento")]
+
+    def test_omitidos_en_orden_archivo_prioridad(self, tmp_path, files):
+        slow_a = self._slow_check("A", 1, 0.3)
+        slow_b = self._slow_check("B", 2, 0.3)
+        guard = self._guard(tmp_path, [slow_a, slow_b])
+
+        guard.run(files, analysis_type="full", time_budget=0.1)
+
+        order = [(f, name) for f in files for name in ("A", "B")]
+        assert guard.skipped == [pair for pair in order if pair in guard.skipped]
+
+    def test_sin_presupuesto_no_omite(self, tmp_path, files):
+        guard = self._guard(tmp_path, [self._slow_check("Lento", 1, 0.01)])
+
+        results = guard.run(files, analysis_type="full")
+
+        assert len(results) == 4
+        assert guard.skipped == []
+
+    def test_precommit_usa_presupuesto_default(self):
+        import time as _time
+
+        from quality_agents.codeguard.orchestrator import PRECOMMIT_TIME_BUDGET
+
+        deadline = CodeGuard._deadline("pre-commit", None)
+
+        assert deadline - _time.monotonic() == pytest.approx(PRECOMMIT_TIME_BUDGET, abs=0.5)
+        assert CodeGuard._deadline("full", None) is None
+        assert CodeGuard._deadline("full", 3.0) is not None
+
+    def test_contexto_recibe_deadline(self, tmp_path, files):
+        seen = []
+
+        def select(context):
+            seen.append(context.deadline)
+            return []
+
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = select
+
+        guard.run(files, analysis_type="full", time_budget=2.0)
+
+        assert len(set(seen)) == 1 and seen[0] is not None
+
+
+class TestCodeGuardScheduling:
+    """Tests del orden de despacho LPT (la unidad más cara primero)."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i, lines in enumerate((10, 500, 50, 5000)):
+            path = tmp_path / f"m{i}.py"
+            path.write_text("x = 1\n" * lines)
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        guard.config.execution.cache = False
+        return guard
+
+    def test_sin_historia_primero_los_archivos_grandes(self, tmp_path, files):
+        check = _FakeCheck("A", 1, False)
+        guard = self._guard(tmp_path, [check])
+
+        scheduled = guard._schedule([(check, [f]) for f in files])
+
+        assert [item[1][0] for item in scheduled] == [files[3], files[1], files[2], files[0]]
+
+    def test_con_historia_ordena_por_costo_predicho(self, tmp_path, files):
+        fast = _FakeCheck("Rapido", 1, False)
+        slow = _FakeCheck("Lento", 2, False)
+        guard = self._guard(tmp_path, [fast, slow])
+        for lines in (10, 100, 1000):
+            guard.durations.record("Rapido", lines, 0.001 * lines)
+            guard.durations.record("Lento", lines, 1.0 + 0.001 * lines)
+
+        scheduled = guard._schedule([(fast, [files[3]]), (slow, [files[0]])])
+
+        # Rapido sobre 5000 líneas (~5.0s) cuesta más que Lento sobre 10 (~1.0s)
+        assert [check.name for check, _ in scheduled] == ["Rapido", "Lento"]
+        assert guard._predicted_cost((fast, [files[3]])) == pytest.approx(5.0)
+        assert guard._predicted_cost((slow, [files[0]])) == pytest.approx(1.01)
+
+    def test_pool_despacha_en_orden_lpt(self, tmp_path, files):
+        check = _FakeCheck("A", 1, False)
+        guard = self._guard(tmp_path, [check])
+        guard.config.execution.engine = "asyncio"
+        guard.config.execution.async_limit = 1
+
+        results = guard.run(files, analysis_type="full")
+
+        assert check.execute_calls == [files[3], files[1], files[2], files[0]]
+        # Los resultados siguen en orden de plan
+        assert [r.file_path for r in results] == [str(f) for f in files]
+
+    def test_secuencial_conserva_orden_del_plan(self, tmp_path, files):
+        check = _FakeCheck("A", 1, False)
+
+        self._guard(tmp_path, [check]).run(files, analysis_type="full", jobs=1)
+
+        assert check.execute_calls == files
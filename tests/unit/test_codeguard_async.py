@@ -0,0 +1,174 @@
+"""Tests para la ejecución async de herramientas (motor asyncio de CodeGuard)."""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quality_agents.codeguard.agent import Severity
+from quality_agents.codeguard.checks.complexity_check import ComplexityCheck
+from quality_agents.codeguard.checks.pep8_check import PEP8Check
+from quality_agents.codeguard.checks.type_check import TypeCheck
+from quality_agents.codeguard.config import CodeGuardConfig, ExecutionConfig
+from quality_agents.codeguard.tool_pool import run_tool, run_tool_async
+from quality_agents.shared.verifiable import ExecutionContext
+
+
+def _context(in_process=False):
+    config = CodeGuardConfig(execution=ExecutionConfig(in_process=in_process))
+    return ExecutionContext(file_path=Path("test.py"), config=config)
+
+
+class TestRunToolAsync:
+    def test_misma_salida_que_subprocess(self):
+        code = "import sys; print('a\\r\\nb'); sys.stderr.write('e'); sys.exit(3)"
+        cmd = [sys.executable, "-c", code]
+
+        result = asyncio.run(run_tool_async(cmd, timeout=30))
+        expected = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+
+        assert result.args == cmd
+        assert result.returncode == expected.returncode == 3
+        assert result.stdout == expected.stdout
+        assert result.stderr == expected.stderr
+
+    def test_timeout_lanza_timeout_expired(self):
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            asyncio.run(run_tool_async(cmd, timeout=0.5))
+
+        assert exc_info.value.timeout == 0.5
+        assert time.monotonic() - start < 10
+
+    def test_herramienta_inexistente(self):
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(run_tool_async(["codeguard-herramienta-inexistente"], timeout=5))
+
+    def test_invocaciones_concurrentes(self):
+        cmd = [sys.executable, "-c", "import time; time.sleep(0.5)"]
+
+        async def run_all():
+            return await asyncio.gather(*(run_tool_async(cmd, timeout=30) for _ in range(4)))
+
+        start = time.monotonic()
+        results = asyncio.run(run_all())
+
+        assert [r.returncode for r in results] == [0] * 4
+        # Las esperas se solapan: bastante menos que 4 x 0.5s secuenciales
+        assert time.monotonic() - start < 1.8
+
+
+class TestChecksAsync:
+    @pytest.fixture
+    def files(self, tmp_path):
+        bad = tmp_path / "bad.py"
+        bad.write_text("import os\nx=1\n")
+        ok = tmp_path / "ok.py"
+        ok.write_text("VALUE = 1\n")
+        return [bad, ok]
+
+    def test_pep8_async_igual_que_batch(self, files):
+        check = PEP8Check()
+        check._context = _context()
+
+        expected = check.execute_batch(files)
+        result = asyncio.run(check.execute_batch_async(files))
+
+        assert result == expected
+        assert len(result[files[0]]) == 2
+
+    def test_complexity_async_igual_que_batch(self, files):
+        check = ComplexityCheck()
+        check._context = _context()
+
+        assert asyncio.run(check.execute_batch_async(files)) == check.execute_batch(files)
+
+    def test_herramienta_inexistente_reporta_error_por_archivo(self, files):
+        check = PEP8Check()
+        check._context = _context()
+
+        with patch(
+            "quality_agents.codeguard.checks._batch.run_tool_async",
+            side_effect=FileNotFoundError(),
+        ):
+            result = asyncio.run(check.execute_batch_async(files))
+
+        for f in files:
+            assert len(result[f]) == 1
+            assert result[f][0].severity == Severity.ERROR
+            assert result[f][0].message == "flake8 not installed. Run: pip install flake8"
+
+    def test_timeout_reporta_mismo_mensaje(self, files):
+        check = ComplexityCheck()
+        check._context = _context()
+
+        with patch(
+            "quality_agents.codeguard.checks._batch.run_tool_async",
+            side_effect=subprocess.TimeoutExpired("radon", 10),
+        ):
+            result = asyncio.run(check.execute_batch_async(files))
+
+        assert result[files[0]][0].message == "radon execution timed out (>10s)"
+
+    def test_in_process_usa_variante_default(self, files):
+        check = PEP8Check()
+        check._context = _context(in_process=True)
+
+        with patch("quality_agents.codeguard.checks._batch.run_tool_async") as run_async:
+            result = asyncio.run(check.execute_batch_async(files))
+
+        run_async.assert_not_called()
+        assert result == check.execute_batch(files)
+
+    def test_type_check_exit_2_reintenta_por_archivo(self, files):
+        check = TypeCheck()
+        check._context = _context()
+        calls = []
+
+        async def fake_run(cmd, timeout, context=None):
+            calls.append(cmd)
+            n_files = len([a for a in cmd if a.endswith(".py")])
+            if n_files > 1:
+                return subprocess.CompletedProcess(cmd, 2, "error: Duplicate module named", "")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch("quality_agents.codeguard.checks._batch.run_tool_async", fake_run):
+            result = asyncio.run(check.execute_batch_async(files))
+
+        assert len(calls) == 3
+        assert all(r.severity == Severity.INFO for f in files for r in result[f])
+
+
+class TestDeadlineDeHerramientas:
+    def _context_con_deadline(self, seconds):
+        context = _context()
+        context.deadline = time.monotonic() + seconds
+        return context
+
+    @patch("subprocess.run")
+    def test_run_tool_recorta_timeout(self, mock_run):
+        run_tool(["flake8", "x.py"], timeout=10, context=self._context_con_deadline(1.0))
+
+        assert mock_run.call_args.kwargs["timeout"] <= 1.0
+
+    @patch("subprocess.run")
+    def test_run_tool_deadline_vencido_no_lanza_herramienta(self, mock_run):
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_tool(["flake8", "x.py"], timeout=10, context=self._context_con_deadline(-1.0))
+
+        mock_run.assert_not_called()
+
+    def test_run_tool_async_mata_la_herramienta_al_vencer(self):
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(run_tool_async(cmd, timeout=30, context=self._context_con_deadline(0.5)))
+
+        assert time.monotonic() - start < 10
@@ -0,0 +1,207 @@
+"""
+Tests unitarios para el análisis en segundo plano de CodeGuard (execution.background).
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from quality_agents.codeguard.agent import CheckResult, CodeGuard, Severity, main
+from quality_agents.codeguard.background import run_job, spawn_background
+
+
+class _FakeCheck:
+    """Check mínimo con prioridad, duración y huella de caché configurables."""
+
+    def __init__(self, name, priority, duration, fingerprint="v1"):
+        self.name = name
+        self.priority = priority
+        self.estimated_duration = duration
+        self.supports_batch = False
+        self.fingerprint = fingerprint
+        self.calls = 0
+
+    def should_run(self, context):
+        return True
+
+    def cache_key(self, config):
+        return self.fingerprint
+
+    def execute(self, file_path):
+        self.calls += 1
+        return [CheckResult(self.name, Severity.WARNING, "hallazgo", str(file_path), 1)]
+
+
+@pytest.fixture
+def module(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text("x = 1\n")
+    return path
+
+
+@pytest.fixture
+def guard(tmp_path):
+    guard = CodeGuard(project_root=tmp_path)
+    guard.config.execution.background = True
+    guard.config.execution.learn_durations = False
+    guard.orchestrator.checks = [
+        _FakeCheck("Rapido", priority=1, duration=0.1),
+        _FakeCheck("Lento", priority=5, duration=3.0),
+        _FakeCheck("Tipos", priority=5, duration=3.0, fingerprint=None),
+    ]
+    return guard
+
+
+def _names(pairs):
+    return [name for _, name in pairs]
+
+
+class TestDeferredChecks:
+
+    def test_checks_no_seleccionados(self, guard, module):
+        rapido, lento, tipos = guard.orchestrator.checks
+        deferred = guard.orchestrator.deferred_checks(None, [rapido])
+        assert deferred == [lento, tipos]
+
+
+class TestCodeGuardBackground:
+
+    def test_precommit_deja_pendientes_los_checks_descartados(self, guard, module):
+        results = guard.run([module], analysis_type="pre-commit", jobs=1)
+
+        assert [r.check_name for r in results] == ["Rapido"]
+        assert _names(guard.pending_background) == ["Lento", "Tipos"]
+        assert guard.from_background == []
+
+    def test_resultados_en_segundo_plano_se_muestran_en_la_proxima_corrida(
+        self, guard, module
+    ):
+        guard.run([module], analysis_type="pre-commit", jobs=1)
+        # Lo que hace el proceso en segundo plano
+        guard.run([module], analysis_type="full", jobs=1, only=set(guard.pending_background))
+
+        results = guard.run([module], analysis_type="pre-commit", jobs=1)
+
+        assert [r.check_name for r in results] == ["Rapido", "Lento", "Tipos"]
+        assert _names(guard.from_background) == ["Lento", "Tipos"]
+        assert guard.pending_background == []
+        lento, tipos = guard.orchestrator.checks[1:]
+        assert (lento.calls, tipos.calls) == (1, 1)
+
+    def test_contenido_modificado_vuelve_a_quedar_pendiente(self, guard, module):
+        guard.run([module], analysis_type="pre-commit", jobs=1)
+        guard.run([module], analysis_type="full", jobs=1, only=set(guard.pending_background))
+        module.write_text("x = 2\n")
+
+        guard.run([module], analysis_type="pre-commit", jobs=1)
+
+        assert guard.from_background == []
+        assert _names(guard.pending_background) == ["Lento", "Tipos"]
+
+    def test_check_no_cacheable_seleccionado_se_vuelve_a_ejecutar(self, guard, module):
+        tipos = guard.orchestrator.checks[2]
+        guard.run([module], analysis_type="full", jobs=1)
+        guard.run([module], analysis_type="full", jobs=1)
+
+        # La entrada en segundo plano solo se usa cuando el pre-commit descarta el check
+        assert tipos.calls == 2
+
+    def test_omitidos_por_deadline_quedan_pendientes(self, guard, module):
+        guard.run([module], analysis_type="full", time_budget=0.0, jobs=1)
+
+        assert _names(guard.skipped) == ["Rapido", "Lento", "Tipos"]
+        assert guard.pending_background == guard.skipped
+
+    def test_deshabilitado_no_deja_pendientes(self, guard, module):
+        guard.config.execution.background = False
+        guard.run([module], analysis_type="pre-commit", jobs=1)
+        assert guard.pending_background == []
+
+    def test_sin_cache_no_deja_pendientes(self, guard, module):
+        guard.config.execution.cache = False
+        guard.run([module], analysis_type="pre-commit", jobs=1)
+        assert guard.pending_background == []
+        assert guard.start_background() is False
+
+    def test_start_background_lanza_proceso_desacoplado(self, guard, module, tmp_path):
+        guard.run([module], analysis_type="pre-commit", jobs=1)
+
+        with patch("quality_agents.codeguard.background.subprocess.Popen") as popen:
+            assert guard.start_background() is True
+
+        kwargs = popen.call_args.kwargs
+        assert kwargs["start_new_session"] is True
+        # Mismo directorio actual que la corrida: las claves de caché coinciden
+        assert kwargs["cwd"] == Path.cwd()
+        job_path = Path(popen.call_args.args[0][-1])
+        job = json.loads(job_path.read_text())
+        assert [name for _, name in job["pairs"]] == ["Lento", "Tipos"]
+        assert job_path.parent == tmp_path / ".quality_control" / "background"
+
+
+class TestRunJob:
+
+    def test_ejecuta_checks_y_elimina_trabajo_y_directorio(self, tmp_path, module):
+        cleanup = tmp_path / "copia"
+        cleanup.mkdir()
+        with patch("quality_agents.codeguard.background.subprocess.Popen"):
+            job_path = spawn_background(tmp_path, [(module, "Complexity")], cleanup=cleanup)
+
+        assert run_job(job_path) == 1
+        assert not job_path.exists()
+        assert not cleanup.exists()
+        assert (tmp_path / ".quality_control" / "cache" / "codeguard").exists()
+
+    def test_copia_staged_disponible_durante_el_trabajo(self, tmp_path):
+        from quality_agents.codeguard.staged import StagedSnapshot
+
+        repo = tmp_path / "repo"
+        (repo / "pkg").mkdir(parents=True)
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run([*git, "init", "-q"], cwd=repo, check=True)
+        (repo / "pkg" / "a.py").write_text("from pkg.b import f\n")
+        (repo / "pkg" / "b.py").write_text("def f():\n    return 1\n")
+        subprocess.run([*git, "add", "."], cwd=repo, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "inicial"], cwd=repo, check=True)
+        (repo / "pkg" / "a.py").write_text("from pkg.b import f\n\nf()\n")
+        subprocess.run([*git, "add", "pkg/a.py"], cwd=repo, check=True)
+
+        snapshot = StagedSnapshot.create(cwd=repo)
+        with patch("quality_agents.codeguard.background.subprocess.Popen") as popen:
+            job_path = spawn_background(
+                repo, [(f, "Pylint") for f in snapshot.files], cleanup=snapshot.directory
+            )
+        seen = {}
+
+        def fake_run(self, files, **kwargs):
+            seen["vecino"] = (files[0].parent / "b.py").read_text()
+            return []
+
+        with patch("quality_agents.codeguard.agent.CodeGuard.run", fake_run):
+            run_job(job_path)
+
+        assert popen.call_args.kwargs["cwd"] == Path.cwd()
+        assert seen["vecino"] == "def f():\n    return 1\n"
+        assert not snapshot.directory.exists()
+
+
+class TestBackgroundCLI:
+
+    def test_flag_lanza_analisis_en_segundo_plano(self, tmp_path, module):
+        with patch("quality_agents.codeguard.agent.spawn_background") as spawn:
+            result = CliRunner().invoke(main, [str(module), "--background"])
+
+        assert result.exit_code == 0, result.output
+        spawn.assert_called_once()
+        assert "segundo plano" in result.output
+
+    def test_por_defecto_no_lanza(self, tmp_path, module):
+        with patch("quality_agents.codeguard.agent.spawn_background") as spawn:
+            result = CliRunner().invoke(main, [str(module)])
+
+        assert result.exit_code == 0, result.output
+        spawn.assert_not_called()
@@ -0,0 +1,136 @@
+"""
+Tests unitarios para la caché de resultados de CodeGuard.
+"""
+
+import os
+
+from quality_agents.codeguard.agent import CheckResult, Severity
+from quality_agents.codeguard.cache import ResultCache, tool_fingerprint
+from quality_agents.codeguard.checks.import_check import ImportCheck
+from quality_agents.codeguard.checks.pylint_check import PylintCheck
+from quality_agents.codeguard.config import CodeGuardConfig
+
+
+def _results(path="a.py"):
+    return [
+        CheckResult("PEP8", Severity.WARNING, "PEP8: E501 line too long", path, 3),
+        CheckResult("PEP8", Severity.INFO, "✓ ok", path),
+    ]
+
+
+class TestResultCacheKeys:
+
+    def test_content_hash_depende_del_contenido(self, tmp_path):
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("x = 1\n")
+        b.write_text("x = 1\n")
+        assert ResultCache.content_hash(a) == ResultCache.content_hash(b)
+        b.write_text("x = 2\n")
+        assert ResultCache.content_hash(a) != ResultCache.content_hash(b)
+
+    def test_content_hash_archivo_inexistente(self, tmp_path):
+        assert ResultCache.content_hash(tmp_path / "no.py") is None
+
+    def test_key_distingue_check_y_huella(self):
+        base = ResultCache.key("h", "PEP8", "flake8==7.0|{}")
+        assert base != ResultCache.key("h", "Pylint", "flake8==7.0|{}")
+        assert base != ResultCache.key("h", "PEP8", "flake8==7.1|{}")
+        assert base == ResultCache.key("h", "PEP8", "flake8==7.0|{}")
+
+
+class TestToolFingerprint:
+
+    def test_incluye_version_y_campos(self):
+        config = CodeGuardConfig(max_line_length=120)
+        fingerprint = tool_fingerprint("pytest", config, "max_line_length")
+        assert fingerprint.startswith("pytest==")
+        assert "120" in fingerprint
+        assert fingerprint != tool_fingerprint("pytest", CodeGuardConfig(), "max_line_length")
+
+    def test_herramienta_no_instalada(self):
+        assert tool_fingerprint("paquete-que-no-existe-xyz", CodeGuardConfig()) is None
+
+    def test_incluye_la_config_del_proyecto(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        def fingerprint():
+            return tool_fingerprint("pytest", None, config_files=(".flake8",))
+
+        sin_config = fingerprint()
+        (tmp_path / ".flake8").write_text("[flake8]\nextend-ignore = E302\n")
+
+        assert fingerprint() != sin_config
+        assert fingerprint() == fingerprint()
+
+    def test_solo_cuentan_las_tablas_de_la_herramienta(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pyproject = tmp_path / "pyproject.toml"
+
+        def fingerprint():
+            return tool_fingerprint("pytest", None, pyproject_tables=("codespell",))
+
+        pyproject.write_text("[tool.codespell]\nskip = 'a'\n")
+        base = fingerprint()
+        pyproject.write_text("[tool.codespell]\nskip = 'a'\n\n[tool.otra]\nx = 1\n")
+        assert fingerprint() == base
+        pyproject.write_text("[tool.codespell]\nskip = 'b'\n")
+        assert fingerprint() != base
+
+    def test_checks_que_dependen_de_otros_modulos_no_se_cachean(self):
+        assert PylintCheck().cache_key(CodeGuardConfig()) is None
+        assert ImportCheck().cache_key(CodeGuardConfig()) is None
+
+
+class TestResultCacheStorage:
+
+    def test_put_get_roundtrip_con_ruta_actual(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("ab" * 32, _results("viejo/a.py"))
+
+        cached = cache.get("ab" * 32, tmp_path / "nuevo.py")
+
+        assert [r.message for r in cached] == [r.message for r in _results()]
+        assert cached[0].severity == Severity.WARNING
+        assert cached[0].line_number == 3
+        assert all(r.file_path == str(tmp_path / "nuevo.py") for r in cached)
+
+    def test_get_sin_entrada(self, tmp_path):
+        assert ResultCache(tmp_path / "cache").get("cd" * 32, tmp_path / "a.py") is None
+
+    def test_no_guarda_fallas_de_herramienta(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        failure = [CheckResult("PEP8", Severity.ERROR, "flake8 not installed", "a.py")]
+        cache.put("ef" * 32, failure)
+        assert cache.get("ef" * 32, tmp_path / "a.py") is None
+
+    def test_entrada_corrupta_es_miss(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        key = "12" * 32
+        cache.put(key, _results())
+        (tmp_path / "cache" / key[:2] / f"{key}.json").write_text("{no es json")
+        assert cache.get(key, tmp_path / "a.py") is None
+
+    def test_prune_desaloja_lru(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, _results())
+            entry = tmp_path / "cache" / key[:2] / f"{key}.json"
+            os.utime(entry, (1000 + i, 1000 + i))
+        entry_size = (tmp_path / "cache" / keys[0][:2] / f"{keys[0]}.json").stat().st_size
+
+        # La entrada más vieja se usa ahora: pasa a ser la más reciente
+        cache.get(keys[0], tmp_path / "a.py")
+        cache.max_size_bytes = entry_size * 2
+
+        assert cache.prune() == 1
+        assert cache.get(keys[1], tmp_path / "a.py") is None
+        assert cache.get(keys[0], tmp_path / "a.py") is not None
+        assert cache.get(keys[2], tmp_path / "a.py") is not None
+
+    def test_clear(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("34" * 32, _results())
+        cache.clear()
+        assert cache.get("34" * 32, tmp_path / "a.py") is None
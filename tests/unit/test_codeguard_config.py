@@ -6,7 +6,13 @@ from pathlib import Path
 
 import pytest
 
-from quality_agents.codeguard.config import AIConfig, ChecksConfig, CodeGuardConfig, load_config
+from quality_agents.codeguard.config import (
+    AIConfig,
+    ChecksConfig,
+    CodeGuardConfig,
+    ExecutionConfig,
+    load_config,
+)
 
 
 class TestChecksConfig:
@@ -427,3 +433,62 @@ class TestLoadConfigFromProjectPyproject:
         assert config.ai.enabled is False
         assert config.ai.explain_errors is True
         assert config.ai.max_tokens == 500
+
+
+class TestExecutionConfig:
+    """Tests para ExecutionConfig ([tool.codeguard.execution])."""
+
+    def test_default_values(self):
+        assert ExecutionConfig().in_process is True
+        assert ExecutionConfig().batch is True
+        assert ExecutionConfig().max_batch_size == 200
+        assert ExecutionConfig().cache is True
+        assert ExecutionConfig().cache_max_size_mb == 50.0
+        assert ExecutionConfig().pylint_jobs == 1
+        assert ExecutionConfig().dead_code_scope == "project"
+        assert ExecutionConfig().tool_pool is False
+        assert ExecutionConfig().engine == "threads"
+        assert ExecutionConfig().async_limit == 0
+        assert ExecutionConfig().learn_durations is True
+        assert ExecutionConfig().background is False
+        assert CodeGuardConfig().execution.in_process is True
+
+    def test_from_pyproject_toml(self, tmp_path):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.codeguard.execution]
+in_process = false
+""")
+        config = CodeGuardConfig.from_pyproject_toml(pyproject)
+        assert config.execution.in_process is False
+
+    def test_from_yaml(self, tmp_path):
+        yml = tmp_path / "config.yml"
+        yml.write_text("""
+execution:
+  in_process: false
+""")
+        config = CodeGuardConfig.from_yaml(yml)
+        assert config.execution.in_process is False
+
+    def test_engine_from_pyproject_toml(self, tmp_path):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.codeguard.execution]
+engine = "asyncio"
+async_limit = 8
+""")
+        config = CodeGuardConfig.from_pyproject_toml(pyproject)
+        assert config.execution.engine == "asyncio"
+        assert config.execution.async_limit == 8
+
+    def test_batch_from_pyproject_toml(self, tmp_path):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.codeguard.execution]
+batch = false
+max_batch_size = 50
+""")
+        config = CodeGuardConfig.from_pyproject_toml(pyproject)
+        assert config.execution.batch is False
+        assert config.execution.max_batch_size == 50
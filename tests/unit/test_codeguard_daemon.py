@@ -0,0 +1,189 @@
+"""
+Tests unitarios para el daemon de CodeGuard y su cliente liviano.
+"""
+
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quality_agents.codeguard import client
+from quality_agents.codeguard.daemon import CodeGuardDaemon
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="socket Unix")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Repositorio con un módulo; los sockets van a un directorio del test."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    (root / "pkg").mkdir()
+    (root / "pkg" / "mod.py").write_text("import os\n")
+    return root
+
+
+def _replies(channel):
+    return [json.loads(line) for line in channel.getvalue().splitlines()]
+
+
+def _output(replies, stream="out"):
+    return "".join(r["data"] for r in replies if r.get("stream") == stream)
+
+
+class TestClientHelpers:
+
+    def test_find_root_sube_hasta_git(self, repo):
+        assert client.find_root(str(repo / "pkg")) == str(repo)
+
+    def test_find_root_fuera_de_repositorio(self, tmp_path):
+        assert client.find_root(str(tmp_path)) == str(tmp_path)
+
+    def test_socket_path_unico_por_raiz(self, repo, tmp_path):
+        path = client.socket_path(str(repo))
+        assert path == client.socket_path(str(repo / "."))
+        assert path != client.socket_path(str(tmp_path))
+        assert os.path.dirname(path) == str(tmp_path)
+
+    def test_rechaza_socket_accesible_para_otros(self, repo, capsys):
+        path = client.socket_path(str(repo))
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+        try:
+            os.chmod(path, 0o666)
+            assert client.connect(str(repo)) is None
+            assert "ignoring daemon socket" in capsys.readouterr().err
+
+            os.chmod(path, 0o600)
+            connection = client.connect(str(repo))
+            assert connection is not None
+            connection.close()
+        finally:
+            server.close()
+
+    def test_rechaza_archivo_que_no_es_socket(self, repo):
+        Path(client.socket_path(str(repo))).write_text("")
+        assert client.connect(str(repo)) is None
+
+    def test_rechaza_socket_de_otro_usuario(self, repo):
+        path = client.socket_path(str(repo))
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        os.chmod(path, 0o600)
+        try:
+            with patch("quality_agents.codeguard.client.os.getuid", return_value=os.getuid() + 1):
+                assert client.connect(str(repo)) is None
+        finally:
+            server.close()
+
+    def test_sin_daemon_forward_retorna_none(self, repo):
+        assert client.forward(["--help"], cwd=str(repo)) is None
+
+    def test_cliente_no_importa_el_agente(self):
+        code = (
+            "import sys; import quality_agents.codeguard.client; "
+            "print(any(m in sys.modules for m in "
+            "('click', 'rich', 'yaml', 'quality_agents.codeguard.agent')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "False"
+
+
+class TestCodeGuardDaemon:
+
+    def test_reutiliza_la_instancia(self, repo):
+        daemon = CodeGuardDaemon(repo)
+        assert daemon.guard(None, repo) is daemon.guard(None, repo)
+
+    def test_opciones_del_cli_no_se_arrastran(self, repo):
+        daemon = CodeGuardDaemon(repo)
+        daemon.guard(None, repo).config.execution.cache = False
+        assert daemon.guard(None, repo).config.execution.cache is True
+
+    def test_cambio_de_configuracion_crea_otra_instancia(self, repo):
+        daemon = CodeGuardDaemon(repo)
+        first = daemon.guard(None, repo)
+        (repo / "pyproject.toml").write_text("[tool.codeguard]\nmax_line_length = 80\n")
+
+        second = daemon.guard(None, repo)
+        assert second is not first
+        assert second.config.max_line_length == 80
+
+    def test_handle_ejecuta_el_cli_en_el_directorio_del_cliente(self, repo):
+        daemon = CodeGuardDaemon(repo)
+        channel = io.BytesIO()
+        message = {"argv": ["pkg", "--format", "json"], "cwd": str(repo), "env": {}}
+        cwd = os.getcwd()
+
+        code = daemon.handle(message, channel)
+
+        assert code == 0
+        assert os.getcwd() == cwd
+        data = json.loads(_output(_replies(channel)))
+        assert {r["file"] for r in data["results"]} == {str(Path("pkg/mod.py"))}
+
+    def test_handle_descarta_el_memo_de_pylint(self, repo):
+        message = {"argv": ["--help"], "cwd": str(repo), "env": {}}
+
+        with patch(
+            "quality_agents.codeguard.daemon.PylintEngine.forget_shared"
+        ) as forget:
+            CodeGuardDaemon(repo).handle(message, io.BytesIO())
+            CodeGuardDaemon(repo).handle(message, io.BytesIO())
+
+        assert forget.call_count == 2
+
+    def test_handle_error_de_uso(self, repo):
+        channel = io.BytesIO()
+        message = {"argv": ["--no-existe"], "cwd": str(repo), "env": {}}
+
+        assert CodeGuardDaemon(repo).handle(message, channel) == 2
+        assert "No such option" in _output(_replies(channel), "err")
+
+    def test_status(self, repo):
+        channel = io.BytesIO()
+        assert CodeGuardDaemon(repo).handle({"command": "status"}, channel) == 0
+        assert str(os.getpid()) in _output(_replies(channel))
+
+
+class TestDaemonProcess:
+
+    @pytest.fixture
+    def daemon_process(self, repo):
+        code = "from quality_agents.codeguard.daemon import daemon; daemon.main()"
+        process = subprocess.Popen(
+            [sys.executable, "-c", code, "--root", str(repo)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while (connection := client.connect(str(repo))) is None:
+            assert process.poll() is None, "el daemon terminó al arrancar"
+            assert time.monotonic() < deadline, "el daemon no abrió el socket"
+            time.sleep(0.05)
+        connection.close()
+        yield process
+        if process.poll() is None:
+            client.request(str(repo), {"command": "stop"})
+            process.wait(timeout=10)
+
+    def test_forward_y_stop(self, repo, daemon_process, capsys):
+        code = client.forward(["pkg", "--format", "json"], cwd=str(repo))
+
+        assert code == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data["summary"]["total_files"] == 1
+
+        assert client.request(str(repo), {"command": "stop"}) == 0
+        daemon_process.wait(timeout=10)
+        assert not os.path.exists(client.socket_path(str(repo)))
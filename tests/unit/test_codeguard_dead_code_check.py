@@ -7,7 +7,8 @@ import pytest
 
 from quality_agents.codeguard.agent import Severity
 from quality_agents.codeguard.checks.dead_code_check import DeadCodeCheck
-from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig
+from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig, ExecutionConfig
+from quality_agents.codeguard.engines.vulture_engine import VultureEngine
 from quality_agents.shared.verifiable import ExecutionContext
 
 
@@ -165,3 +166,136 @@ class TestDeadCodeCheckExecute:
             mock_run.return_value = MagicMock(stdout=output, returncode=1)
             results = DeadCodeCheck().execute(f)
         assert results[0].severity == Severity.ERROR
+
+
+class TestDeadCodeCheckExecuteBatch:
+    """Tests para execute_batch() (vulture sobre todo el changeset)."""
+
+    @patch("subprocess.run")
+    def test_reparte_hallazgos_por_archivo(self, mock_run, tmp_path):
+        file_a = tmp_path / "a.py"
+        file_b = tmp_path / "b.py"
+        mock_run.return_value = MagicMock(
+            stdout=f"{file_b}:7: unused function 'helper' (60% confidence)\n",
+            stderr="",
+        )
+
+        results = DeadCodeCheck().execute_batch([file_a, file_b])
+
+        mock_run.assert_called_once()
+        assert results[file_a][0].severity == Severity.INFO
+        assert results[file_b][0].severity == Severity.WARNING
+        assert results[file_b][0].line_number == 7
+
+
+class TestDeadCodeCheckProjectScope:
+    """Tests para el alcance de proyecto (VultureEngine)."""
+
+    def _check(self, root, scope="project", cache=True, project_root=True):
+        config = CodeGuardConfig(execution=ExecutionConfig(dead_code_scope=scope, cache=cache))
+        check = DeadCodeCheck()
+        check._context = ExecutionContext(
+            file_path=root / "x.py", config=config, project_root=root if project_root else None
+        )
+        return check
+
+    def _project(self, tmp_path):
+        (tmp_path / "lib.py").write_text(
+            "def used_elsewhere():\n    return 1\n\n\ndef orphan():\n    return 2\n"
+        )
+        (tmp_path / "app.py").write_text("from lib import used_elsewhere\n\nused_elsewhere()\n")
+        return tmp_path / "lib.py", tmp_path / "app.py"
+
+    @patch("subprocess.run")
+    def test_usos_de_otros_archivos_no_se_reportan(self, mock_run, tmp_path):
+        lib, _ = self._project(tmp_path)
+
+        results = self._check(tmp_path).execute(lib)
+
+        mock_run.assert_not_called()
+        assert [r.message for r in results] == [
+            "Dead code: function 'orphan' is never used (60% confidence)"
+        ]
+        assert results[0].line_number == 5
+        assert results[0].severity == Severity.WARNING
+
+    def test_execute_batch_reporta_por_archivo(self, tmp_path):
+        lib, app = self._project(tmp_path)
+
+        results = self._check(tmp_path).execute_batch([lib, app])
+
+        assert results[app][0].severity == Severity.INFO
+        assert results[lib][0].message.startswith("Dead code: function 'orphan'")
+
+    def test_respeta_exclude_patterns(self, tmp_path):
+        lib, _ = self._project(tmp_path)
+        check = self._check(tmp_path)
+        check._context.config.exclude_patterns = ["app.py"]
+
+        results = check.execute(lib)
+
+        names = sorted(r.message.split("'")[1] for r in results)
+        assert names == ["orphan", "used_elsewhere"]
+
+    def test_indice_persistido_evita_reescanear(self, tmp_path):
+        lib, app = self._project(tmp_path)
+        self._check(tmp_path).execute(lib)
+        assert (tmp_path / ".quality_control" / "cache" / "vulture" / "index.json").exists()
+
+        app.write_text("from lib import used_elsewhere, orphan\n\nused_elsewhere()\norphan()\n")
+        with patch.object(
+            VultureEngine, "_scan", autospec=True, side_effect=VultureEngine._scan
+        ) as spy:
+            results = self._check(tmp_path).execute(lib)
+
+        assert [call.args[1] for call in spy.call_args_list] == [str(app.resolve())]
+        assert results[0].severity == Severity.INFO
+
+    def test_sin_cache_no_escribe_indice(self, tmp_path):
+        lib, _ = self._project(tmp_path)
+
+        self._check(tmp_path, cache=False).execute(lib)
+
+        assert not (tmp_path / ".quality_control").exists()
+
+    @patch("subprocess.run")
+    def test_alcance_changeset_usa_cli(self, mock_run, tmp_path):
+        lib, _ = self._project(tmp_path)
+        mock_run.return_value = MagicMock(stdout="", returncode=0)
+
+        self._check(tmp_path, scope="changeset").execute(lib)
+
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_sin_raiz_de_proyecto_usa_cli(self, mock_run, tmp_path):
+        lib, _ = self._project(tmp_path)
+        mock_run.return_value = MagicMock(stdout="", returncode=0)
+
+        self._check(tmp_path, project_root=False).execute(lib)
+
+        mock_run.assert_called_once()
+
+    def test_respeta_ignore_names_de_pyproject(self, tmp_path):
+        lib, _ = self._project(tmp_path)
+        (tmp_path / "pyproject.toml").write_text('[tool.vulture]\nignore_names = ["orphan"]\n')
+
+        results = self._check(tmp_path).execute(lib)
+
+        assert results[0].severity == Severity.INFO
+
+    def test_recorre_el_proyecto_una_vez_por_corrida(self, tmp_path):
+        lib, app = self._project(tmp_path)
+        check = self._check(tmp_path)
+
+        with patch.object(Path, "rglob", autospec=True, side_effect=Path.rglob) as rglob:
+            check.execute_batch([lib])
+            check.execute_batch([app])
+            assert rglob.call_count == 1
+
+            # Una corrida nueva (contexto nuevo) vuelve a listar el proyecto
+            check._context = ExecutionContext(
+                file_path=lib, config=check._context.config, project_root=tmp_path
+            )
+            check.execute_batch([lib])
+            assert rglob.call_count == 2
@@ -0,0 +1,180 @@
+"""
+Tests unitarios para las duraciones aprendidas de los checks de CodeGuard.
+"""
+
+import json
+
+import pytest
+
+from quality_agents.codeguard.agent import CheckResult, CodeGuard, Severity
+from quality_agents.codeguard.durations import DurationModel, count_lines, fit_linear
+
+
+class TestCountLines:
+
+    def test_cuenta_lineas(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\ny = 2\n")
+        assert count_lines(path) == 2
+
+    def test_ultima_linea_sin_salto(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\ny = 2")
+        assert count_lines(path) == 2
+
+    def test_archivo_vacio_o_inexistente(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("")
+        assert count_lines(path) == 0
+        assert count_lines(tmp_path / "no.py") == 0
+
+
+class TestFitLinear:
+
+    def test_recupera_recta_exacta(self):
+        samples = [(x, 0.1 + 0.002 * x) for x in (100, 500, 2000)]
+        a, b = fit_linear(samples)
+        assert a == pytest.approx(0.1)
+        assert b == pytest.approx(0.002)
+
+    def test_pocas_muestras_no_ajustan(self):
+        assert fit_linear([(100, 1.0), (900, 3.0)]) is None
+
+    def test_mismas_lineas_usan_la_media(self):
+        assert fit_linear([(50, 1.0), (50, 2.0), (50, 3.0)]) == (2.0, 0.0)
+
+    def test_pendiente_negativa_se_descarta(self):
+        a, b = fit_linear([(100, 3.0), (500, 2.0), (900, 1.0)])
+        assert (a, b) == (2.0, 0.0)
+
+    def test_ordenada_negativa_pasa_por_el_origen(self):
+        a, b = fit_linear([(100, 0.0), (200, 1.0), (300, 2.0)])
+        assert a == 0.0
+        assert b > 0
+
+
+class TestDurationModel:
+
+    def test_sin_muestras_suficientes_usa_default(self):
+        model = DurationModel()
+        assert model.predict("PEP8", 1000, default=0.5) == 0.5
+
+        # Una corrida batch sobre todo el proyecto no predice un archivo suelto
+        model.record("PEP8", 7000, 10.0)
+        assert model.predict("PEP8", 100, default=0.5) == 0.5
+
+    def test_prediccion_por_lineas(self):
+        model = DurationModel()
+        for lines in (100, 1000, 4000):
+            model.record("PEP8", lines, 0.05 + 0.0001 * lines)
+
+        assert model.predict("PEP8", 2000, default=9.0) == pytest.approx(0.25)
+        assert model.predict("Pylint", 2000, default=9.0) == 9.0
+
+    def test_ventana_de_muestras(self):
+        model = DurationModel(max_samples=3)
+        for seconds in (10.0, 1.0, 1.0, 1.0):
+            model.record("PEP8", 100, seconds)
+
+        assert model.predict("PEP8", 100, default=0.0) == pytest.approx(1.0)
+
+    def test_persistencia(self, tmp_path):
+        path = tmp_path / "stats" / "durations.json"
+        model = DurationModel(path, settings="s1")
+        for _ in range(3):
+            model.record("PEP8", 100, 0.4)
+        model.save()
+
+        assert DurationModel(path, settings="s1").predict("PEP8", 100, 0.0) == pytest.approx(0.4)
+
+    def test_otra_configuracion_descarta_muestras(self, tmp_path):
+        path = tmp_path / "durations.json"
+        model = DurationModel(path, settings="s1")
+        for _ in range(3):
+            model.record("PEP8", 100, 0.4)
+        model.save()
+
+        assert DurationModel(path, settings="s2").predict("PEP8", 100, 0.5) == 0.5
+
+    def test_archivo_corrupto_se_ignora(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text("{no es json")
+
+        assert DurationModel(path).predict("PEP8", 100, 0.5) == 0.5
+
+    def test_save_sin_muestras_nuevas_no_escribe(self, tmp_path):
+        path = tmp_path / "durations.json"
+        DurationModel(path).save()
+        assert not path.exists()
+
+
+class _TimedCheck:
+    """Check mínimo (sin batch ni caché) para medir duraciones en CodeGuard.run()."""
+
+    def __init__(self, name, batch=False):
+        self.name = name
+        self.priority = 1
+        self.supports_batch = batch
+
+    def cache_key(self, config):
+        return None
+
+    def execute(self, file_path):
+        return [CheckResult(self.name, Severity.INFO, "ok", str(file_path))]
+
+    def execute_batch(self, file_paths):
+        return {f: self.execute(f) for f in file_paths}
+
+
+class TestCodeGuardDurations:
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i, lines in enumerate((10, 30)):
+            path = tmp_path / f"m{i}.py"
+            path.write_text("x = 1\n" * lines)
+            paths.append(path)
+        return paths
+
+    def _guard(self, tmp_path, checks):
+        guard = CodeGuard(project_root=tmp_path)
+        guard.orchestrator.select_checks = lambda context: list(checks)
+        return guard
+
+    def test_registra_una_muestra_por_invocacion(self, tmp_path, files):
+        guard = self._guard(tmp_path, [_TimedCheck("Single"), _TimedCheck("Batch", batch=True)])
+
+        guard.run(files, analysis_type="full", jobs=1)
+
+        assert [x for x, _ in guard.durations._samples["Single"]] == [10.0, 30.0]
+        # Una invocación batch: una muestra con las líneas de todos sus archivos
+        assert [x for x, _ in guard.durations._samples["Batch"]] == [40.0]
+
+    def test_persiste_en_quality_control_stats(self, tmp_path, files):
+        guard = self._guard(tmp_path, [_TimedCheck("Single")])
+
+        guard.run(files, analysis_type="full", jobs=1)
+
+        path = tmp_path / ".quality_control" / "stats" / "codeguard_durations.json"
+        assert len(json.loads(path.read_text())["checks"]["Single"]) == 2
+
+        guard.run(files, analysis_type="full", jobs=1)
+        assert CodeGuard(project_root=tmp_path).durations.coefficients("Single") is not None
+
+    def test_deshabilitado_no_registra(self, tmp_path, files):
+        guard = self._guard(tmp_path, [_TimedCheck("Single")])
+        guard.config.execution.learn_durations = False
+
+        guard.run(files, analysis_type="full", jobs=1)
+
+        assert guard.durations._samples == {}
+        assert not (tmp_path / ".quality_control" / "stats").exists()
+
+    def test_omitidos_por_deadline_no_registran(self, tmp_path, files):
+        guard = self._guard(tmp_path, [_TimedCheck("Single")])
+
+        guard.run(files, analysis_type="full", time_budget=0.0, jobs=1)
+
+        assert guard.skipped
+        assert guard.durations._samples == {}
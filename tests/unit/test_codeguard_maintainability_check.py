@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from radon.metrics import mi_visit
 
 from quality_agents.codeguard.agent import Severity
 from quality_agents.codeguard.checks.maintainability_check import MaintainabilityCheck
@@ -169,3 +170,38 @@ class TestMaintainabilityCheckExecute:
             mock_run.return_value = MagicMock(stdout=self._mock_output(f, 20.0, "A"), returncode=0)
             results = MaintainabilityCheck().execute(f)
         assert results[0].severity == Severity.INFO
+
+
+class TestMaintainabilityCheckInProcess:
+    def _check_with_config(self, config):
+        check = MaintainabilityCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    def test_in_process_matches_radon_mi(self, tmp_path):
+        f = tmp_path / "clean.py"
+        f.write_text('"""Modulo."""\n\n\ndef f(x):\n    return x + 1\n')
+        with patch("subprocess.run") as mock_run:
+            results = self._check_with_config(CodeGuardConfig()).execute(f)
+        mock_run.assert_not_called()
+        assert results[0].severity == Severity.INFO
+        assert f"{mi_visit(f.read_text(), True):.1f}" in results[0].message
+
+    def test_execute_batch_in_process(self, tmp_path):
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+        for f in files:
+            f.write_text("x = 1\n")
+        with patch("subprocess.run") as mock_run:
+            results = self._check_with_config(CodeGuardConfig()).execute_batch(files)
+        mock_run.assert_not_called()
+        assert all(results[f][0].severity == Severity.INFO for f in files)
+
+    def test_in_process_disabled_by_config(self, tmp_path):
+        f = tmp_path / "clean.py"
+        f.write_text("x = 1\n")
+        config = CodeGuardConfig()
+        config.execution.in_process = False
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            self._check_with_config(config).execute(f)
+        mock_run.assert_called_once()
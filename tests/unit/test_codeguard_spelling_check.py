@@ -8,7 +8,8 @@ import pytest
 
 from quality_agents.codeguard.agent import Severity
 from quality_agents.codeguard.checks.spelling_check import SpellingCheck
-from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig
+from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig, ExecutionConfig
+from quality_agents.codeguard.engines.codespell_engine import CodespellEngine
 from quality_agents.shared.verifiable import ExecutionContext
 
 
@@ -82,6 +83,18 @@ class TestSpellingCheckParseOutput:
         assert findings[0]["line"] == 42
 
 
+class TestSpellingCheckParseMultipleCorrections:
+    def test_parses_all_corrections(self):
+        output = "sample.py:3: ot ==> to, of, or, not"
+        findings = SpellingCheck()._parse_codespell_output(output)
+        assert findings[0]["correction"] == "to, of, or, not"
+
+    def test_drops_reason_suffix(self):
+        output = "sample.py:3: clas ==> class  | disabled because of name clash in c++"
+        findings = SpellingCheck()._parse_codespell_output(output)
+        assert findings[0]["correction"] == "class"
+
+
 class TestSpellingCheckExecute:
     def test_returns_info_when_no_typos(self, tmp_path):
         f = tmp_path / "clean.py"
@@ -151,3 +164,184 @@ class TestSpellingCheckExecute:
             results = SpellingCheck().execute(f)
         assert len(results) == 1
         assert results[0].severity == Severity.WARNING
+
+
+class TestSpellingCheckExecuteBatch:
+    """Tests para execute_batch() (codespell sobre todo el changeset)."""
+
+    @patch("subprocess.run")
+    def test_reparte_typos_por_archivo(self, mock_run, tmp_path):
+        file_a = tmp_path / "a.py"
+        file_b = tmp_path / "b.py"
+        mock_run.return_value = MagicMock(
+            stdout=f"{file_a}:2: calcualte ==> calculate\n",
+            stderr="",
+        )
+
+        results = SpellingCheck().execute_batch([file_a, file_b])
+
+        mock_run.assert_called_once()
+        assert results[file_a][0].line_number == 2
+        assert results[file_b][0].severity == Severity.INFO
+
+
+class TestSpellingCheckInProcess:
+    """Tests para el modo in-process (CodespellEngine)."""
+
+    def _check_with_config(self, config):
+        check = SpellingCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_in_process_does_not_spawn_codespell(self, mock_run, tmp_path):
+        f = tmp_path / "typos.py"
+        f.write_text("# calcualte the total\n\nTeh = 1\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute(f)
+
+        mock_run.assert_not_called()
+        assert [(r.line_number, r.message) for r in results] == [
+            (1, "Spelling: 'calcualte' should be 'calculate'"),
+            (3, "Spelling: 'Teh' should be 'The'"),
+        ]
+        assert all(r.severity == Severity.WARNING for r in results)
+
+    def test_ignore_words_de_config(self, tmp_path):
+        f = tmp_path / "typos.py"
+        f.write_text("# calcualte teh total\n")
+        config = CodeGuardConfig(spelling_ignore_words=["teh"])
+
+        results = self._check_with_config(config).execute(f)
+
+        assert [r.message for r in results] == ["Spelling: 'calcualte' should be 'calculate'"]
+
+    def test_respeta_codespell_ignore_inline(self, tmp_path):
+        f = tmp_path / "typos.py"
+        f.write_text("x = 'teh'  # codespell:ignore\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute(f)
+
+        assert results[0].severity == Severity.INFO
+
+    @patch("subprocess.run")
+    def test_execute_batch_in_process(self, mock_run, tmp_path):
+        clean = tmp_path / "clean.py"
+        typos = tmp_path / "typos.py"
+        clean.write_text("VALUE = 1\n")
+        typos.write_text("VALUE = 1\n# recieve\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute_batch([clean, typos])
+
+        mock_run.assert_not_called()
+        assert results[clean][0].severity == Severity.INFO
+        assert results[typos][0].line_number == 2
+        assert results[typos][0].message == "Spelling: 'recieve' should be 'receive'"
+
+    @patch("subprocess.run")
+    def test_in_process_false_uses_subprocess(self, mock_run, tmp_path):
+        f = tmp_path / "clean.py"
+        f.write_text("VALUE = 1\n")
+        mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+        config = CodeGuardConfig(execution=ExecutionConfig(in_process=False))
+
+        self._check_with_config(config).execute(f)
+
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_engine_failure_falls_back_to_subprocess(self, mock_run, tmp_path):
+        f = tmp_path / "clean.py"
+        f.write_text("VALUE = 1\n")
+        mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+
+        with patch.object(CodespellEngine, "shared", side_effect=RuntimeError("boom")):
+            self._check_with_config(CodeGuardConfig()).execute(f)
+
+        mock_run.assert_called_once()
+
+
+class TestCodespellEngine:
+    """Tests del motor compartido."""
+
+    def test_shared_carga_el_diccionario_una_vez(self):
+        assert CodespellEngine.shared() is CodespellEngine.shared()
+
+    def test_shared_relee_la_configuracion_si_cambia(self, tmp_path, monkeypatch):
+        f = tmp_path / "sample.py"
+        f.write_text("# teh\n")
+        monkeypatch.chdir(tmp_path)
+        antes = CodespellEngine.shared()
+        assert [t.typo for t in antes.check_files([f])[f]] == ["teh"]
+
+        (tmp_path / ".codespellrc").write_text("[codespell]\nignore-words-list = teh\n")
+        despues = CodespellEngine.shared()
+
+        assert despues is not antes
+        assert despues.check_files([f])[f] == []
+
+    def test_shared_por_directorio(self, tmp_path, monkeypatch):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        monkeypatch.chdir(tmp_path / "a")
+        en_a = CodespellEngine.shared()
+        monkeypatch.chdir(tmp_path / "b")
+        assert CodespellEngine.shared() is not en_a
+
+    def test_misma_salida_que_el_cli(self, tmp_path):
+        f = tmp_path / "sample.py"
+        f.write_text(
+            "# teh calcualte\n"
+            "MSG = '\\nteh'  # codespell:ignore-next-line\n"
+            "ABOUT = 'abotu'\n"
+            "print('adn')  # codespell:ignore adn\n"
+        )
+        process = subprocess.run(["codespell", str(f)], capture_output=True, text=True)
+        expected = [
+            (finding["line"], finding["typo"], finding["correction"])
+            for finding in SpellingCheck()._parse_codespell_output(process.stdout)
+        ]
+
+        typos = CodespellEngine.shared().check_files([f])[f]
+
+        assert expected
+        assert [(t.line_number, t.typo, t.correction) for t in typos] == expected
+
+    def test_misma_salida_que_el_cli_con_configuracion(self, tmp_path, monkeypatch):
+        (tmp_path / ".codespellrc").write_text("[codespell]\nignore-words-list = calcualte\n")
+        f = tmp_path / "sample.py"
+        f.write_text(
+            "# teh calcualte adn\n"
+            "# codespell:ignore-next-line\n"
+            "WHOLE = 'teh adn'\n"
+            "ESCAPED = 'line\\nteh\\tadn'\n"
+            "URL = 'https://example.com/teh'  # codespell:ignore\n"
+            "print('adn teh')  # codespell:ignore adn,teh\n"
+            "LAST = 'Teh'\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        process = subprocess.run(
+            ["codespell", f.name], capture_output=True, text=True, cwd=tmp_path
+        )
+        expected = [
+            (finding["line"], finding["typo"], finding["correction"])
+            for finding in SpellingCheck()._parse_codespell_output(process.stdout)
+        ]
+
+        typos = CodespellEngine.shared().check_files([f])[f]
+
+        assert expected
+        assert [(t.line_number, t.typo, t.correction) for t in typos] == expected
+
+    def test_versiones_soportadas(self):
+        from quality_agents.codeguard.engines import codespell_engine
+
+        assert codespell_engine._version_tuple("2.4.3") in codespell_engine.SUPPORTED_VERSIONS
+        assert codespell_engine._version_tuple("3.0") not in codespell_engine.SUPPORTED_VERSIONS
+        assert codespell_engine._version_tuple("dev") == ()
+
+    def test_binario_sin_typos(self, tmp_path):
+        f = tmp_path / "blob.py"
+        f.write_bytes(b"teh\x00\x01")
+
+        assert CodespellEngine.shared().check_files([f]) == {f: []}
@@ -0,0 +1,185 @@
+"""
+Tests unitarios para el análisis del contenido staged (codeguard --staged).
+"""
+
+import json
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from quality_agents.codeguard.agent import CheckResult, Severity, main
+from quality_agents.codeguard.staged import (
+    StagedError,
+    StagedSnapshot,
+    read_blobs,
+    repo_root,
+    staged_entries,
+)
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repositorio con un commit inicial, un archivo modificado y uno nuevo en staging."""
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    _git(root, "init", "-q")
+    (root / "pkg" / "viejo.py").write_text("x = 1\n")
+    (root / "pkg" / "intacto.py").write_text("y = 1\n")
+    (root / "borrado.py").write_text("z = 1\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "inicial")
+
+    (root / "pkg" / "viejo.py").write_text("x = 2\n")
+    (root / "nuevo.py").write_text("import os\n")
+    (root / "notas.txt").write_text("no es python\n")
+    _git(root, "add", "pkg/viejo.py", "nuevo.py", "notas.txt")
+    _git(root, "rm", "-q", "borrado.py")
+    # Cambio sin staging: no debe verse
+    (root / "pkg" / "viejo.py").write_text("x = 3  # sin git add\n")
+    return root
+
+
+class TestGitHelpers:
+
+    def test_repo_root(self, repo):
+        assert repo_root(repo / "pkg").resolve() == repo.resolve()
+
+    def test_fuera_de_repositorio(self, tmp_path):
+        with pytest.raises(StagedError):
+            repo_root(tmp_path)
+
+    def test_staged_entries_solo_python_agregado_o_modificado(self, repo):
+        paths = [path for path, _ in staged_entries(repo)]
+        assert paths == ["nuevo.py", "pkg/viejo.py"]
+
+    def test_read_blobs_lee_contenido_staged(self, repo):
+        blob_ids = [blob for _, blob in staged_entries(repo)]
+        blobs = read_blobs(repo, blob_ids)
+        assert set(blobs) == set(blob_ids)
+        assert sorted(blobs.values()) == [b"import os\n", b"x = 2\n"]
+
+    def test_read_blobs_ignora_inexistentes(self, repo):
+        assert read_blobs(repo, ["0" * 40]) == {}
+        assert read_blobs(repo, []) == {}
+
+    def test_deadline_vencido(self, repo):
+        with pytest.raises(StagedError, match="timed out"):
+            staged_entries(repo, deadline=time.monotonic() - 1)
+
+    def test_repositorio_sin_commits(self, tmp_path):
+        root = tmp_path / "vacio"
+        root.mkdir()
+        _git(root, "init", "-q")
+        (root / "a.py").write_text("a = 1\n")
+        _git(root, "add", "a.py")
+
+        assert [path for path, _ in staged_entries(root)] == ["a.py"]
+
+
+class TestStagedSnapshot:
+
+    def test_materializa_contenido_staged(self, repo):
+        with StagedSnapshot.create(cwd=repo) as snapshot:
+            contents = {
+                str(snapshot.originals[f]): f.read_text() for f in snapshot.files
+            }
+            directory = snapshot.directory
+
+        assert contents == {"nuevo.py": "import os\n", str(Path("pkg/viejo.py")): "x = 2\n"}
+        assert not directory.exists()
+
+    def test_enlaza_vecinos_desde_el_working_tree(self, repo):
+        (repo / "otro" / "profundo").mkdir(parents=True)
+        (repo / "otro" / "profundo" / "m.py").write_text("m = 1\n")
+
+        with StagedSnapshot.create(cwd=repo) as snapshot:
+            vecino = snapshot.directory / "pkg" / "intacto.py"
+            assert vecino.is_symlink()
+            assert vecino.read_text() == "y = 1\n"
+            assert vecino not in snapshot.files
+            # Solo se escriben los archivos staged; el resto se enlaza
+            assert not (snapshot.directory / "pkg" / "viejo.py").is_symlink()
+            assert (snapshot.directory / "notas.txt").exists()
+            # Los directorios sin cambios staged no se recorren
+            assert (snapshot.directory / "otro").is_symlink()
+            assert not (snapshot.directory / ".git").exists()
+
+    def test_cleanup_no_borra_el_working_tree(self, repo):
+        with StagedSnapshot.create(cwd=repo) as snapshot:
+            directory = snapshot.directory
+
+        assert not directory.exists()
+        assert (repo / "pkg" / "intacto.py").read_text() == "y = 1\n"
+        assert (repo / "notas.txt").exists()
+
+    def test_paths_restringen_archivos(self, repo):
+        with StagedSnapshot.create([Path("pkg")], cwd=repo) as snapshot:
+            assert [str(p) for p in snapshot.originals.values()] == [str(Path("pkg/viejo.py"))]
+
+    def test_exclude_patterns(self, repo):
+        with StagedSnapshot.create(cwd=repo, exclude_patterns=["pkg"]) as snapshot:
+            assert [str(p) for p in snapshot.originals.values()] == ["nuevo.py"]
+
+    def test_rutas_relativas_al_directorio_actual(self, repo):
+        with StagedSnapshot.create(cwd=repo / "pkg") as snapshot:
+            assert sorted(str(p) for p in snapshot.originals.values()) == [
+                str(Path("../nuevo.py")), "viejo.py",
+            ]
+
+    def test_restore_reescribe_rutas(self, repo):
+        with StagedSnapshot.create(cwd=repo) as snapshot:
+            temp = next(f for f in snapshot.files if f.name == "nuevo.py")
+            results = snapshot.restore([
+                CheckResult("PEP8", Severity.WARNING, f"{temp}:1: F401 unused", str(temp), 1),
+                CheckResult("PEP8", Severity.INFO, "ok", None),
+            ])
+            skipped = snapshot.restore_skipped([(temp, "Pylint")])
+
+        assert results[0].file_path == "nuevo.py"
+        assert results[0].message == "nuevo.py:1: F401 unused"
+        assert results[1].file_path is None
+        assert skipped == [(Path("nuevo.py"), "Pylint")]
+
+
+class TestStagedCLI:
+
+    def test_analiza_solo_lo_staged(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        seen = {}
+
+        def fake_run(self, files, **kwargs):
+            seen["files"] = list(files)
+            seen["contents"] = sorted(f.read_text() for f in files)
+            seen["project_root"] = self.project_root
+            seen["deadline"] = kwargs["deadline"]
+            return [CheckResult("PEP8", Severity.WARNING, "F401", str(f), 1) for f in files]
+
+        with patch("quality_agents.codeguard.agent.CodeGuard.run", fake_run):
+            result = CliRunner().invoke(main, ["--staged", "--format", "json"])
+
+        assert result.exit_code == 0, result.output
+        assert seen["contents"] == ["import os\n", "x = 2\n"]
+        assert Path(seen["project_root"]).resolve() == repo.resolve()
+        # El deadline del pre-commit empieza antes de leer el índice
+        assert seen["deadline"] is not None
+        reported = {r["file"] for r in json.loads(result.output)["results"]}
+        assert reported == {"nuevo.py", str(Path("pkg/viejo.py"))}
+        # El directorio temporal se elimina al terminar
+        assert not any(f.exists() for f in seen["files"])
+
+    def test_fuera_de_repositorio_falla(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(main, ["--staged"])
+        assert result.exit_code != 0
+        assert "--staged" in result.output
@@ -0,0 +1,133 @@
+"""Tests para el pool de workers pre-cargados (tool_pool)."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from quality_agents.codeguard.checks.pep8_check import PEP8Check
+from quality_agents.codeguard.config import CodeGuardConfig, ExecutionConfig
+from quality_agents.codeguard.tool_pool import ToolWorkerPool, run_tool
+from quality_agents.shared.verifiable import ExecutionContext
+
+pytestmark = pytest.mark.skipif(
+    not ToolWorkerPool.is_available(), reason="requiere fork y sockets Unix"
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ToolWorkerPool()
+    yield pool
+    pool.close()
+
+
+def _context(tool_pool=True, in_process=False):
+    config = CodeGuardConfig(
+        execution=ExecutionConfig(tool_pool=tool_pool, in_process=in_process)
+    )
+    return ExecutionContext(file_path=Path("test.py"), config=config)
+
+
+class TestToolWorkerPool:
+    def test_misma_salida_y_codigo_que_subprocess(self, pool, tmp_path):
+        f = tmp_path / "bad.py"
+        f.write_text("import os\nx=1\n")
+        cmd = ["flake8", str(f)]
+
+        result = pool.run(cmd, timeout=30)
+        expected = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+
+        assert result.args == cmd
+        assert result.returncode == expected.returncode == 1
+        assert result.stdout == expected.stdout
+        assert result.stderr == expected.stderr
+
+    def test_salida_limpia_retorna_cero(self, pool, tmp_path):
+        f = tmp_path / "ok.py"
+        f.write_text("VALUE = 1\n")
+
+        result = pool.run(["flake8", str(f)], timeout=30)
+
+        assert result.returncode == 0
+        assert result.stdout == ""
+
+    def test_timeout_mata_el_worker(self, pool):
+        pool._entry_points["codeguard-test-pause"] = "signal:pause"
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run(["codeguard-test-pause"], timeout=0.5)
+
+    def test_herramienta_sin_entry_point(self, pool):
+        assert pool.supports("flake8")
+        assert not pool.supports("no-such-tool-codeguard")
+        with pytest.raises(FileNotFoundError):
+            pool.run(["no-such-tool-codeguard"], timeout=5)
+
+    def test_usa_el_directorio_actual_del_cliente(self, pool, tmp_path, monkeypatch):
+        (tmp_path / "rel.py").write_text("import os\n")
+        monkeypatch.chdir(tmp_path)
+
+        result = pool.run(["flake8", "rel.py"], timeout=30)
+
+        assert result.stdout.startswith("rel.py:1:1: F401")
+
+
+class TestRunTool:
+    @patch("subprocess.run")
+    def test_sin_contexto_usa_subprocess(self, mock_run):
+        run_tool(["flake8", "x.py"], timeout=5)
+
+        mock_run.assert_called_once_with(
+            ["flake8", "x.py"], capture_output=True, text=True, timeout=5
+        )
+
+    @patch("subprocess.run")
+    def test_pool_deshabilitado_usa_subprocess(self, mock_run):
+        run_tool(["flake8", "x.py"], timeout=5, context=_context(tool_pool=False))
+
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_pool_habilitado_no_lanza_subprocess(self, mock_run):
+        pool = MagicMock(spec=ToolWorkerPool)
+        pool.supports.return_value = True
+        with patch.object(ToolWorkerPool, "shared", return_value=pool):
+            run_tool(["flake8", "x.py"], timeout=5, context=_context())
+
+        mock_run.assert_not_called()
+        pool.run.assert_called_once_with(["flake8", "x.py"], 5)
+
+    @patch("subprocess.run")
+    def test_dmypy_siempre_por_subprocess(self, mock_run):
+        with patch.object(ToolWorkerPool, "shared") as shared:
+            run_tool(["dmypy", "status"], timeout=5, context=_context())
+
+        shared.assert_not_called()
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_falla_del_pool_vuelve_a_subprocess(self, mock_run):
+        with patch.object(ToolWorkerPool, "shared", side_effect=RuntimeError("boom")):
+            run_tool(["flake8", "x.py"], timeout=5, context=_context())
+
+        mock_run.assert_called_once()
+
+
+class TestCheckConPool:
+    def test_pep8_por_pool_igual_que_por_subprocess(self, pool, tmp_path):
+        f = tmp_path / "sample.py"
+        f.write_text("import os\nx=1\n")
+
+        def run(context):
+            check = PEP8Check()
+            check._context = context
+            return [(r.severity, r.message, r.line_number) for r in check.execute(f)]
+
+        with patch.object(ToolWorkerPool, "shared", return_value=pool):
+            pooled = run(_context(tool_pool=True))
+        direct = run(_context(tool_pool=False))
+
+        assert pooled == direct
+        assert len(pooled) == 2
@@ -258,6 +258,59 @@ class TestComplexityCheckExecute:
         assert "Unexpected error" in results[0].message
 
 
+class TestComplexityCheckInProcess:
+    """Tests para el modo in-process (RadonMetricsProvider compartido)."""
+
+    SOURCE = (
+        "def ramificada(x):\n"
+        + "".join(f"    if x == {i}:\n        return {i}\n" for i in range(12))
+        + "    return -1\n"
+    )
+
+    def _check_with_config(self, config):
+        check = ComplexityCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_in_process_does_not_spawn_radon(self, mock_run, tmp_path):
+        sample = tmp_path / "complex.py"
+        sample.write_text(self.SOURCE)
+
+        results = self._check_with_config(CodeGuardConfig()).execute(sample)
+
+        mock_run.assert_not_called()
+        assert len(results) == 1
+        assert results[0].severity == Severity.WARNING
+        assert "ramificada has cyclomatic complexity 13 (grade C)" in results[0].message
+        assert results[0].line_number == 1
+
+    @patch("subprocess.run")
+    def test_execute_batch_in_process(self, mock_run, tmp_path):
+        complex_file = tmp_path / "complex.py"
+        simple_file = tmp_path / "simple.py"
+        complex_file.write_text(self.SOURCE)
+        simple_file.write_text("def f():\n    return 1\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute_batch(
+            [complex_file, simple_file]
+        )
+
+        mock_run.assert_not_called()
+        assert results[complex_file][0].severity == Severity.WARNING
+        assert results[simple_file][0].severity == Severity.INFO
+
+    @patch("subprocess.run")
+    def test_in_process_disabled_by_config(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        config = CodeGuardConfig()
+        config.execution.in_process = False
+        self._check_with_config(config).execute(Path("test.py"))
+
+        mock_run.assert_called_once()
+
+
 class TestComplexityCheckParseRadonOutput:
     """Tests para el método _parse_radon_output()."""
 
@@ -52,6 +52,17 @@ class TestDesignReviewer:
 
         assert isinstance(results, list)
 
+    def test_analyze_isolated_omite_analyzers_cross_file(self, tmp_path):
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("import b\n")
+        b.write_text("import a\n")
+        reviewer = DesignReviewer(path=tmp_path)
+
+        assert any(r.analyzer_name == "CircularImportsAnalyzer" for r in reviewer.run([a, b]))
+        results = reviewer.analyze_isolated([a, b])
+        assert not any(r.analyzer_name == "CircularImportsAnalyzer" for r in results)
+
     def test_should_block_no_criticals(self):
         """should_block() debe retornar False sin resultados CRITICAL."""
         reviewer = DesignReviewer()
@@ -8,9 +8,12 @@ from pathlib import Path
 from typing import Any, List
 from unittest.mock import patch
 
+from quality_agents.designreviewer import orchestrator
 from quality_agents.designreviewer.config import DesignReviewerConfig
 from quality_agents.designreviewer.models import ReviewResult, ReviewSeverity
 from quality_agents.designreviewer.orchestrator import AnalyzerOrchestrator
+from quality_agents.shared.parsed_modules import ModuleStore
+from quality_agents.shared.plugins import PluginSpec
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 # ========== Analyzers mock para tests ==========
@@ -124,66 +127,52 @@ class TestAnalyzerOrchestratorInit:
         assert orch.config.max_cbo == 3
 
 
-# ========== Tests de auto-discovery con mocks ==========
+# ========== Tests del registro de analyzers ==========
 
 
-class TestAnalyzerOrchestratorDiscovery:
-    """Tests para el auto-discovery de analyzers."""
-
-    @patch("quality_agents.designreviewer.orchestrator.importlib.import_module")
-    def test_discovery_encuentra_subclases_de_verifiable(self, mock_import, monkeypatch):
-        """Debe descubrir y instanciar todas las subclases de Verifiable."""
-        from unittest.mock import Mock
-
-        mock_module = Mock()
-        mock_module.MockAnalyzerSinResultados = MockAnalyzerSinResultados
-        mock_module.MockConViolacion = MockAnalyzerConViolacion
-        mock_module.Verifiable = Verifiable  # Clase base — debe ser excluida
-
-        with patch("quality_agents.designreviewer.orchestrator.dir") as mock_dir:
-            mock_dir.return_value = [
-                "MockAnalyzerSinResultados",
-                "MockConViolacion",
-                "Verifiable",
-                "alguna_funcion",
-            ]
-            mock_import.return_value = mock_module
+class AnalyzerQueNoInstancia(Verifiable):
+    """Analyzer cuyo constructor falla."""
 
-            orch = AnalyzerOrchestrator(config=None)
+    def __init__(self):
+        raise ValueError("No se puede instanciar")
 
-        assert len(orch.analyzers) == 2
-        nombres = {a.name for a in orch.analyzers}
-        assert "MockSinResultados" in nombres
-        assert "MockConViolacion" in nombres
+    @property
+    def name(self) -> str:
+        return "X"
 
-    @patch("quality_agents.designreviewer.orchestrator.importlib.import_module")
-    def test_discovery_maneja_error_instanciacion(self, mock_import):
-        """Si un analyzer no puede instanciarse, debe loguear y continuar."""
-        from unittest.mock import Mock
+    @property
+    def category(self) -> str:
+        return "X"
+
+    def execute(self, file_path: Path) -> List[Any]:
+        return []
 
-        class AnalyzerQueNoInstancia(Verifiable):
-            def __init__(self):
-                raise ValueError("No se puede instanciar")
 
-            @property
-            def name(self) -> str:
-                return "X"
+def _spec(nombre: str, clase: str, toggle=None) -> PluginSpec:
+    return PluginSpec(nombre, f"{__name__}:{clase}", "coupling", toggle=toggle)
 
-            @property
-            def category(self) -> str:
-                return "X"
 
-            def execute(self, file_path: Path) -> List[Any]:
-                return []
+class TestAnalyzerOrchestratorDiscovery:
+    """Tests para la carga de analyzers desde el registro."""
 
-        mock_module = Mock()
-        mock_module.AnalyzerQueNoInstancia = AnalyzerQueNoInstancia
-        mock_module.MockAnalyzerSinResultados = MockAnalyzerSinResultados
+    def test_discovery_instancia_los_analyzers_registrados(self):
+        """Debe instanciar los analyzers del registro, en orden."""
+        registro = (
+            _spec("MockSinResultados", "MockAnalyzerSinResultados"),
+            _spec("MockConViolacion", "MockAnalyzerConViolacion"),
+        )
+        with patch("quality_agents.designreviewer.orchestrator.BUILTIN_ANALYZERS", registro):
+            orch = AnalyzerOrchestrator(config=None)
 
-        with patch("quality_agents.designreviewer.orchestrator.dir") as mock_dir:
-            mock_dir.return_value = ["AnalyzerQueNoInstancia", "MockAnalyzerSinResultados"]
-            mock_import.return_value = mock_module
+        assert [a.name for a in orch.analyzers] == ["MockSinResultados", "MockConViolacion"]
 
+    def test_discovery_maneja_error_instanciacion(self):
+        """Si un analyzer no puede instanciarse, debe loguear y continuar."""
+        registro = (
+            _spec("X", "AnalyzerQueNoInstancia"),
+            _spec("MockSinResultados", "MockAnalyzerSinResultados"),
+        )
+        with patch("quality_agents.designreviewer.orchestrator.BUILTIN_ANALYZERS", registro):
             # No debe lanzar excepción
             orch = AnalyzerOrchestrator(config=None)
 
@@ -191,6 +180,20 @@ class TestAnalyzerOrchestratorDiscovery:
         assert len(orch.analyzers) == 1
         assert orch.analyzers[0].name == "MockSinResultados"
 
+    def test_run_no_instancia_analyzers_desactivados(self, tmp_path):
+        """Un analyzer apagado en la config no se importa ni se instancia."""
+        config = DesignReviewerConfig()
+        config.checks.cbo = False
+        registro = (
+            _spec("X", "AnalyzerQueNoInstancia", toggle="cbo"),
+            _spec("MockSinResultados", "MockAnalyzerSinResultados"),
+        )
+        with patch("quality_agents.designreviewer.orchestrator.BUILTIN_ANALYZERS", registro):
+            orch = AnalyzerOrchestrator(config=config)
+
+        assert orch.run([tmp_path / "m.py"]) == []
+        assert len(orch.plugins) == 2  # el analyzer roto nunca se cargó
+
 
 # ========== Tests de run() ==========
 
@@ -313,3 +316,95 @@ class TestAnalyzerOrchestratorRun:
         assert error_result.analyzer_name == "MockFalla"
         assert error_result.severity == ReviewSeverity.INFO
         assert "Error simulado" in error_result.message
+
+
+# ========== Tests de ejecución en paralelo (--jobs) ==========
+
+
+class TestAnalyzerOrchestratorParallel:
+    """Tests para run() con un pool de procesos."""
+
+    def _archivos(self, tmp_path: Path, n: int = 4) -> List[Path]:
+        files = []
+        for i in range(n):
+            path = tmp_path / f"m{i}.py"
+            # Tamaños distintos: el despacho LPT no sigue el orden de entrada
+            path.write_text("x = 1\n" * (i + 1))
+            files.append(path)
+        return files
+
+    def _orch(self, *analyzers: Verifiable) -> AnalyzerOrchestrator:
+        orch = AnalyzerOrchestrator(config=DesignReviewerConfig())
+        orch.analyzers = list(analyzers)
+        return orch
+
+    def test_mismos_resultados_y_orden_que_secuencial(self, tmp_path):
+        files = self._archivos(tmp_path)
+        (tmp_path / "clase.py").write_text("class A(B, C, D):\n    pass\n")
+        files.append(tmp_path / "clase.py")
+        orch = AnalyzerOrchestrator(config=DesignReviewerConfig())
+
+        secuencial = orch.run(files, jobs=1)
+        paralelo = orch.run(files, jobs=2)
+
+        assert paralelo == secuencial
+        assert any(r.analyzer_name == "NOPAnalyzer" for r in paralelo)
+
+    def test_analyzer_que_falla_produce_info(self, tmp_path):
+        files = self._archivos(tmp_path, n=2)
+        orch = self._orch(MockAnalyzerFalla(), MockAnalyzerConViolacion())
+
+        results = orch.run(files, jobs=2)
+
+        assert [(r.file_path, r.severity) for r in results] == [
+            (files[0], ReviewSeverity.INFO),
+            (files[0], ReviewSeverity.CRITICAL),
+            (files[1], ReviewSeverity.INFO),
+            (files[1], ReviewSeverity.CRITICAL),
+        ]
+        assert "Error simulado" in results[0].message
+
+    def test_worker_que_falla_se_analiza_en_el_proceso(self, tmp_path):
+        files = self._archivos(tmp_path, n=2)
+        orch = self._orch(MockAnalyzerConViolacion())
+
+        # Un mock no se puede enviar al pool: cada unidad de trabajo falla
+        with patch(
+            "quality_agents.designreviewer.orchestrator._review_file",
+            side_effect=RuntimeError("worker caído"),
+        ):
+            results = orch.run(files, jobs=2)
+
+        assert [r.file_path for r in results] == files
+
+    def test_worker_descarta_los_modulos_de_cada_archivo(self, tmp_path):
+        [py_file] = self._archivos(tmp_path, n=1)
+        orchestrator._init_worker(DesignReviewerConfig(), [MockAnalyzerConViolacion()])
+
+        with patch.object(ModuleStore, "clear") as clear:
+            results = orchestrator._review_file(py_file)
+
+        clear.assert_called_once()
+        assert [r.file_path for r in results] == [py_file]
+
+    def test_jobs_de_config(self, tmp_path):
+        files = self._archivos(tmp_path, n=3)
+        config = DesignReviewerConfig()
+        config.jobs = 8
+        orch = AnalyzerOrchestrator(config=config)
+        orch.analyzers = [MockAnalyzerConViolacion()]
+
+        with patch.object(AnalyzerOrchestrator, "_run_processes", return_value=[]) as pool:
+            orch.run(files)
+
+        assert pool.call_args.args[2] == 3  # no más procesos que archivos
+
+    def test_un_job_no_crea_pool(self, tmp_path):
+        files = self._archivos(tmp_path, n=2)
+        orch = self._orch(MockAnalyzerConViolacion())
+
+        with patch.object(AnalyzerOrchestrator, "_run_processes") as pool:
+            results = orch.run(files)
+
+        pool.assert_not_called()
+        assert len(results) == 2
@@ -7,6 +7,7 @@ Ticket: 4.2 - Agregar modo JSON
 """
 
 import json
+from pathlib import Path
 
 from rich.console import Console
 
@@ -527,3 +528,38 @@ class TestFormatResultsByModule:
         out = capsys.readouterr().out
         assert "paquete_a/x.py" in out
         assert "paquete_b/y.py" in out
+
+
+class TestFormatSkipped:
+    """Tests del reporte parcial de pares (archivo, check) omitidos por presupuesto."""
+
+    SKIPPED = [
+        (Path("pkg/a.py"), "Pylint"),
+        (Path("pkg/a.py"), "Types"),
+        (Path("pkg/b.py"), "Pylint"),
+    ]
+
+    def test_text_lista_omitidos_por_modulo(self, capsys):
+        format_results([], elapsed=5.0, total_files=2, checks_executed=3, skipped=self.SKIPPED)
+
+        out = capsys.readouterr().out
+        assert "3 verificaciones omitidas" in out
+        assert "pkg/a.py: Pylint, Types" in out
+        assert "pkg/b.py: Pylint" in out
+
+    def test_text_sin_omitidos_no_muestra_panel(self, capsys):
+        format_results([], elapsed=1.0, total_files=1, checks_executed=3)
+
+        assert "omitidas" not in capsys.readouterr().out
+
+    def test_json_incluye_omitidos(self):
+        data = json.loads(format_json([], skipped=self.SKIPPED))
+
+        assert data["summary"]["skipped"] == 3
+        assert data["skipped"][0] == {"file": "pkg/a.py", "check": "Pylint"}
+
+    def test_json_sin_omitidos_no_agrega_claves(self):
+        data = json.loads(format_json([]))
+
+        assert "skipped" not in data
+        assert "skipped" not in data["summary"]
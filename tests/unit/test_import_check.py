@@ -11,7 +11,9 @@ from unittest.mock import MagicMock, patch
 
 from quality_agents.codeguard.agent import Severity
 from quality_agents.codeguard.checks.import_check import ImportCheck
+from quality_agents.codeguard.checks.pylint_check import PylintCheck
 from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig
+from quality_agents.codeguard.engines.pylint_engine import PylintEngine
 from quality_agents.shared.verifiable import ExecutionContext
 
 
@@ -229,6 +231,57 @@ test.py:15:0: W0611: Unused json imported from json (unused-import)"""
         assert "test.py" in args[-1]
 
 
+class TestImportCheckInProcess:
+    """Tests para el modo in-process (PylintEngine compartido con PylintCheck)."""
+
+    def _check_with_config(self, config):
+        check = ImportCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_in_process_reports_unused_imports(self, mock_run, tmp_path):
+        sample = tmp_path / "sample.py"
+        sample.write_text("import os\nfrom pathlib import Path\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute(sample)
+
+        mock_run.assert_not_called()
+        modules = sorted(r.message for r in results)
+        assert len(results) == 2
+        assert all(r.severity == Severity.WARNING for r in results)
+        assert any("'os'" in m for m in modules)
+        assert any("'Path'" in m for m in modules)
+
+    def test_shares_pylint_run_with_pylint_check(self, tmp_path):
+        sample = tmp_path / "shared.py"
+        sample.write_text("import os\n")
+        context = ExecutionContext(file_path=sample, config=CodeGuardConfig())
+
+        engine = PylintEngine()
+        with patch.object(PylintEngine, "shared", return_value=engine), patch.object(
+            engine, "_run", wraps=engine._run
+        ) as spy:
+            pylint_check = PylintCheck()
+            pylint_check._context = context
+            import_check = ImportCheck()
+            import_check._context = context
+            pylint_check.execute_batch([sample])
+            import_check.execute_batch([sample])
+
+        assert spy.call_count == 1
+
+    @patch("subprocess.run")
+    def test_in_process_disabled_by_config(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        config = CodeGuardConfig()
+        config.execution.in_process = False
+        self._check_with_config(config).execute(Path("test.py"))
+
+        mock_run.assert_called_once()
+
+
 class TestImportCheckParsePylintOutput:
     """Tests para el método _parse_pylint_output()."""
 
@@ -0,0 +1,283 @@
+"""
+Tests unitarios para el servidor LSP (quality-agents-lsp).
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quality_agents.lsp.diagnostics import ERROR, WARNING, BufferAnalyzer
+from quality_agents.lsp.protocol import (
+    INTERNAL_ERROR,
+    METHOD_NOT_FOUND,
+    SERVER_NOT_INITIALIZED,
+    MessageWriter,
+    ProtocolError,
+    read_message,
+)
+from quality_agents.lsp.server import QualityLanguageServer, uri_to_path
+
+LONG_PARAMS = (
+    "class Servicio:\n"
+    "    x = 1\n"
+    "\n"
+    "    def procesar(self, a, b, c, d, e, f, g):\n"
+    "        return a\n"
+)
+
+
+def _frame(message):
+    body = json.dumps(message).encode("utf-8")
+    return f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+
+def _messages(output):
+    stream = io.BytesIO(output.getvalue())
+    messages = []
+    while (message := read_message(stream)) is not None:
+        messages.append(message)
+    return messages
+
+
+class TestProtocol:
+
+    def test_ida_y_vuelta(self):
+        output = io.BytesIO()
+        MessageWriter(output).notify("window/logMessage", {"message": "ñandú"})
+
+        message = read_message(io.BytesIO(output.getvalue()))
+
+        assert message == {
+            "jsonrpc": "2.0", "method": "window/logMessage", "params": {"message": "ñandú"}
+        }
+
+    def test_fin_del_stream(self):
+        assert read_message(io.BytesIO(b"")) is None
+
+    def test_sin_content_length(self):
+        with pytest.raises(ProtocolError):
+            read_message(io.BytesIO(b"Content-Type: x\r\n\r\n{}"))
+
+    def test_uri_to_path(self, tmp_path):
+        assert uri_to_path("file:///tmp/a%20b.py", tmp_path) == Path("/tmp/a b.py")
+        assert uri_to_path("untitled:Untitled-1", tmp_path) == tmp_path / "Untitled-1.py"
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = BufferAnalyzer(tmp_path)
+    yield analyzer
+    analyzer.close()
+
+
+class TestBufferAnalyzer:
+
+    def test_diagnostico_de_codeguard_en_su_linea(self, analyzer, tmp_path):
+        diagnostics = analyzer.analyze("file:///m", tmp_path / "m.py", "x = 1\nimport os\n")
+
+        pep8 = [d for d in diagnostics if d["code"] == "PEP8"]
+        assert pep8 and all(d["source"] == "codeguard" for d in pep8)
+        assert any("F401" in d["message"] and d["range"]["start"]["line"] == 1 for d in pep8)
+
+    def test_diagnostico_de_designreviewer_en_el_metodo(self, analyzer, tmp_path):
+        diagnostics = analyzer.analyze("file:///m", tmp_path / "m.py", LONG_PARAMS)
+
+        long_params = [d for d in diagnostics if d["code"] == "LongParameterListAnalyzer"]
+        assert len(long_params) == 1
+        assert long_params[0]["severity"] == WARNING
+        assert long_params[0]["range"]["start"] == {"line": 3, "character": 4}
+
+    def test_error_de_sintaxis_no_ejecuta_los_analyzers(self, analyzer, tmp_path):
+        with patch.object(analyzer.guard, "run") as run:
+            diagnostics = analyzer.analyze("file:///m", tmp_path / "m.py", "def f(:\n")
+
+        run.assert_not_called()
+        assert [d["code"] for d in diagnostics] == ["SyntaxError"]
+        assert diagnostics[0]["severity"] == ERROR
+
+    def test_contenido_ya_analizado_usa_la_cache(self, analyzer, tmp_path):
+        path = tmp_path / "m.py"
+        with patch.object(analyzer.guard, "run", return_value=[]) as run:
+            analyzer.analyze("file:///m", path, "x = 1\n")
+            analyzer.analyze("file:///m", path, "x = 2\n")
+            analyzer.analyze("file:///m", path, "x = 1\n")  # deshacer
+
+        assert run.call_count == 2
+
+    def test_analisis_obsoleto_se_abandona(self, analyzer, tmp_path):
+        with patch.object(analyzer.guard, "run") as run:
+            result = analyzer.analyze("file:///m", tmp_path / "m.py", "x = 1\n", lambda: True)
+
+        assert result is None
+        run.assert_not_called()
+
+    def test_archivo_excluido(self, analyzer, tmp_path):
+        path = tmp_path / "migrations" / "0001.py"
+        assert analyzer.analyze("file:///m", path, "import os\n") == []
+
+
+class _FakeAnalyzer:
+
+    def __init__(self, root):
+        self.root = root
+        self.calls = []
+        self.on_analyze = None
+
+    def analyze(self, uri, path, text, is_stale=lambda: False):
+        self.calls.append(text)
+        if self.on_analyze:
+            self.on_analyze()
+        return [{"message": text}]
+
+    def forget(self, uri):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    output = io.BytesIO()
+    server = QualityLanguageServer(io.BytesIO(), output, analyzer_factory=_FakeAnalyzer)
+    server.output = output
+    server.handle({"id": 1, "method": "initialize", "params": {"rootUri": tmp_path.as_uri()}})
+    server._stop_worker()  # los tests ejecutan run_pending explícitamente
+    return server
+
+
+def _open(server, uri="file:///m.py", text="x = 1\n"):
+    server.handle({
+        "method": "textDocument/didOpen",
+        "params": {"textDocument": {
+            "uri": uri, "languageId": "python", "version": 1, "text": text,
+        }},
+    })
+
+
+def _change(server, version, text, uri="file:///m.py"):
+    server.handle({
+        "method": "textDocument/didChange",
+        "params": {
+            "textDocument": {"uri": uri, "version": version},
+            "contentChanges": [{"text": text}],
+        },
+    })
+
+
+def _published(server):
+    return [
+        m["params"] for m in _messages(server.output)
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+
+
+class TestLanguageServer:
+
+    def test_initialize(self, server, tmp_path):
+        response = _messages(server.output)[0]
+        assert response["id"] == 1
+        assert response["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+        assert server.analyzer.root == tmp_path
+
+    def test_request_antes_de_initialize(self):
+        output = io.BytesIO()
+        server = QualityLanguageServer(io.BytesIO(), output, analyzer_factory=_FakeAnalyzer)
+        server.handle({"id": 7, "method": "shutdown"})
+        assert _messages(output)[0]["error"]["code"] == SERVER_NOT_INITIALIZED
+
+    def test_metodo_desconocido(self, server):
+        server.handle({"id": 2, "method": "textDocument/hover", "params": {}})
+        assert _messages(server.output)[-1]["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_falla_del_handler_es_internal_error(self, server):
+        with patch.object(server, "_on_shutdown", side_effect=RuntimeError("boom")):
+            server.handle({"id": 3, "method": "shutdown"})
+        error = _messages(server.output)[-1]["error"]
+        assert error["code"] == INTERNAL_ERROR
+        assert error["message"] == "boom"
+
+    def test_didopen_publica_diagnosticos(self, server):
+        _open(server)
+
+        assert server.run_pending() == 1
+        assert _published(server) == [
+            {"uri": "file:///m.py", "version": 1, "diagnostics": [{"message": "x = 1\n"}]}
+        ]
+
+    def test_rafaga_de_cambios_se_analiza_una_vez(self, server):
+        _open(server)
+        server.run_pending()
+        for version in range(2, 6):
+            _change(server, version, f"x = {version}\n")
+
+        assert server.run_pending() == 0  # debounce pendiente
+        assert server.run_pending(now=float("inf")) == 1
+        assert server.analyzer.calls == ["x = 1\n", "x = 5\n"]
+        assert _published(server)[-1]["version"] == 5
+
+    def test_resultado_obsoleto_no_se_publica(self, server):
+        _open(server)
+        server.analyzer.on_analyze = lambda: _change(server, 2, "x = 2\n")
+
+        assert server.run_pending() == 0
+        assert _published(server) == []
+
+    def test_didclose_limpia_diagnosticos(self, server):
+        _open(server)
+        server.handle({
+            "method": "textDocument/didClose", "params": {"textDocument": {"uri": "file:///m.py"}}
+        })
+
+        assert server.run_pending(now=float("inf")) == 0
+        assert _published(server) == [{"uri": "file:///m.py", "diagnostics": []}]
+
+    def test_serve_shutdown_y_exit(self, tmp_path):
+        messages = [
+            {"id": 1, "method": "initialize", "params": {"rootUri": tmp_path.as_uri()}},
+            {"id": 2, "method": "shutdown"},
+            {"method": "exit"},
+        ]
+        reader = io.BytesIO(b"".join(_frame(m) for m in messages))
+        server = QualityLanguageServer(reader, io.BytesIO(), analyzer_factory=_FakeAnalyzer)
+
+        assert server.serve() == 0
+
+
+class TestServerProcess:
+
+    def test_sesion_completa(self, tmp_path):
+        uri = (tmp_path / "m.py").as_uri()
+        messages = [
+            {"id": 1, "method": "initialize", "params": {"rootUri": tmp_path.as_uri()}},
+            {"method": "initialized", "params": {}},
+            {"method": "textDocument/didOpen", "params": {"textDocument": {
+                "uri": uri, "languageId": "python", "version": 1, "text": "import os\n",
+            }}},
+        ]
+        code = "from quality_agents.lsp.server import main; main()"
+        process = subprocess.Popen(
+            [sys.executable, "-c", code],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        try:
+            process.stdin.write(b"".join(_frame(m) for m in messages))
+            process.stdin.flush()
+            while (message := read_message(process.stdout)) is not None:
+                if message.get("method") == "textDocument/publishDiagnostics":
+                    break
+            assert message["params"]["uri"] == uri
+            assert any("F401" in d["message"] for d in message["params"]["diagnostics"])
+
+            process.stdin.write(_frame({"id": 2, "method": "shutdown"}))
+            process.stdin.write(_frame({"method": "exit"}))
+            process.stdin.close()
+            assert process.wait(timeout=30) == 0
+        finally:
+            if process.poll() is None:
+                process.kill()
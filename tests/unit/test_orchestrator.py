@@ -2,7 +2,7 @@
 Tests unitarios para CheckOrchestrator.
 
 Verifica el funcionamiento de:
-- Auto-discovery de checks
+- Registro de checks
 - Selección contextual de checks
 - Estrategias (pre-commit, pr-review, ai-guided)
 - Ordenamiento por prioridad
@@ -13,10 +13,14 @@ Ticket: 1.5.2
 
 from pathlib import Path
 from typing import Any, List
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+
+import pytest
 
 from quality_agents.codeguard.config import CodeGuardConfig
+from quality_agents.codeguard.durations import DurationModel
 from quality_agents.codeguard.orchestrator import CheckOrchestrator
+from quality_agents.shared.plugins import PluginSpec
 from quality_agents.shared.verifiable import ExecutionContext, Verifiable
 
 # ========== Mock Checks para Tests ==========
@@ -142,43 +146,61 @@ def test_orchestrator_discover_checks_module_not_found():
     assert any(c.name == "PEP8" for c in orchestrator.checks)
 
 
-# ========== Tests de Auto-Discovery con Mocks ==========
+# ========== Tests del Registro de Checks ==========
+
 
+def _spec(check_class, **metadata) -> PluginSpec:
+    """Spec con la metadata de un check mock (sin instanciarlo)."""
+    check = check_class()
+    return PluginSpec(
+        name=check.name,
+        target=f"{__name__}:{check_class.__name__}",
+        category=check.category,
+        priority=check.priority,
+        estimated_duration=check.estimated_duration,
+        **metadata,
+    )
 
-@patch("quality_agents.codeguard.orchestrator.importlib.import_module")
-def test_discover_checks_with_mock_module(mock_import):
-    """Verifica que auto-discovery encuentra y instancia checks correctamente."""
-    # Crear mock del módulo checks
-    mock_module = Mock()
-    mock_module.__name__ = "quality_agents.codeguard.checks"
 
-    # Configurar qué clases están en el módulo
-    mock_module.FastCriticalCheck = FastCriticalCheck
-    mock_module.MediumHighPriorityCheck = MediumHighPriorityCheck
-    mock_module.SlowLowPriorityCheck = SlowLowPriorityCheck
-    mock_module.Verifiable = Verifiable  # La clase base debe ser excluida
+def test_discover_checks_from_registry():
+    """Verifica que se instancian los checks del registro."""
+    registry = (
+        _spec(FastCriticalCheck),
+        _spec(MediumHighPriorityCheck),
+        _spec(SlowLowPriorityCheck),
+    )
+    with patch("quality_agents.codeguard.orchestrator.BUILTIN_CHECKS", registry):
+        orchestrator = CheckOrchestrator(CodeGuardConfig())
 
-    # Configurar dir() para que retorne los nombres
-    with patch("quality_agents.codeguard.orchestrator.dir") as mock_dir:
-        mock_dir.return_value = [
-            "FastCriticalCheck",
-            "MediumHighPriorityCheck",
-            "SlowLowPriorityCheck",
-            "Verifiable",
-            "some_function",  # Esto debe ser ignorado
-            "_private",  # Esto debe ser ignorado
-        ]
+    assert [c.name for c in orchestrator.checks] == ["FastCritical", "MediumHigh", "SlowLow"]
 
-        mock_import.return_value = mock_module
 
-        config = CodeGuardConfig()
+def test_precommit_does_not_load_checks_out_of_budget():
+    """Verifica que pre-commit descarta por metadata sin importar el check."""
+    registry = (_spec(FastCriticalCheck), _spec(SlowLowPriorityCheck))
+    with patch("quality_agents.codeguard.orchestrator.BUILTIN_CHECKS", registry):
+        orchestrator = CheckOrchestrator(CodeGuardConfig())
+    context = ExecutionContext(file_path=Path("test.py"), analysis_type="pre-commit")
+
+    selected = orchestrator.select_checks(context)
+
+    assert [c.name for c in selected] == ["FastCritical"]
+    assert isinstance(orchestrator.plugins.entries()[1], PluginSpec)  # SlowLow sin cargar
+
+
+def test_disabled_check_is_not_loaded():
+    """Verifica que un check apagado en config no se instancia."""
+    config = CodeGuardConfig()
+    config.checks.security = False
+    registry = (_spec(FastCriticalCheck, toggle="security"), _spec(MediumHighPriorityCheck))
+    with patch("quality_agents.codeguard.orchestrator.BUILTIN_CHECKS", registry):
         orchestrator = CheckOrchestrator(config)
+    context = ExecutionContext(file_path=Path("test.py"), config=config, analysis_type="full")
+
+    selected = orchestrator.select_checks(context)
 
-        # Verificar que se descubrieron 3 checks (excluyendo Verifiable)
-        assert len(orchestrator.checks) == 3
-        assert any(c.name == "FastCritical" for c in orchestrator.checks)
-        assert any(c.name == "MediumHigh" for c in orchestrator.checks)
-        assert any(c.name == "SlowLow" for c in orchestrator.checks)
+    assert [c.name for c in selected] == ["MediumHigh"]
+    assert isinstance(orchestrator.plugins.entries()[0], PluginSpec)
 
 
 # ========== Tests de Selección de Checks ==========
@@ -328,6 +350,109 @@ def test_select_for_precommit_default_time_budget():
     assert len(selected) == 2
 
 
+def test_select_for_precommit_excludes_fast_low_priority_check():
+    """Un check de prioridad baja no entra en pre-commit solo por ser rápido."""
+
+    class InstantLowPriorityCheck(SlowLowPriorityCheck):
+        @property
+        def name(self) -> str:
+            return "InstantLow"
+
+        @property
+        def estimated_duration(self) -> float:
+            return 0.2
+
+    config = CodeGuardConfig()
+    orchestrator = CheckOrchestrator(config)
+    orchestrator.checks = [FastCriticalCheck(), SlowLowPriorityCheck(), InstantLowPriorityCheck()]
+
+    context = ExecutionContext(file_path=Path("test.py"), analysis_type="pre-commit")
+    selected = orchestrator.select_checks(context)
+
+    assert [c.name for c in selected] == ["FastCritical"]
+
+
+def test_select_for_precommit_uses_learned_durations(tmp_path):
+    """Con duraciones medidas, el presupuesto usa el costo predicho para el archivo."""
+    big_file = tmp_path / "big.py"
+    big_file.write_text("x = 1\n" * 2000)
+
+    durations = DurationModel()
+    for lines, seconds in [(100, 0.2), (1000, 2.0), (3000, 6.0)]:
+        durations.record("FastCritical", lines, seconds)
+
+    orchestrator = CheckOrchestrator(CodeGuardConfig(), durations=durations)
+    orchestrator.checks = [FastCriticalCheck(), MediumHighPriorityCheck()]
+
+    context = ExecutionContext(file_path=big_file, analysis_type="pre-commit", time_budget=5.0)
+
+    # FastCritical estima 0.5s, pero sobre 2000 líneas se midió ~4s
+    assert orchestrator.estimated_duration(FastCriticalCheck(), context) == pytest.approx(4.0)
+    assert [c.name for c in orchestrator.select_checks(context)] == ["FastCritical"]
+
+
+def test_select_for_precommit_dynamic_duration_ignores_learned(tmp_path):
+    """Un check con duración dinámica (ej: daemon de mypy) usa su propia estimación."""
+
+    class WarmDaemonCheck(SlowLowPriorityCheck):
+        @property
+        def name(self) -> str:
+            return "WarmDaemon"
+
+        @property
+        def estimated_duration(self) -> float:
+            return 0.2
+
+        @property
+        def dynamic_duration(self) -> bool:
+            return True
+
+    durations = DurationModel()
+    for lines, seconds in [(1, 1.2), (2, 1.2), (3, 1.3)]:
+        durations.record("WarmDaemon", lines, seconds)
+
+    orchestrator = CheckOrchestrator(CodeGuardConfig(), durations=durations)
+    orchestrator.checks = [FastCriticalCheck(), WarmDaemonCheck()]
+
+    context = ExecutionContext(file_path=tmp_path / "a.py", analysis_type="pre-commit")
+
+    assert orchestrator.estimated_duration(WarmDaemonCheck(), context) == 0.2
+    assert [c.name for c in orchestrator.select_checks(context)] == ["FastCritical", "WarmDaemon"]
+
+
+def test_select_for_precommit_counts_lines_once(tmp_path):
+    """Las líneas del archivo se cuentan una vez, no una por check candidato."""
+    durations = DurationModel()
+    orchestrator = CheckOrchestrator(CodeGuardConfig(), durations=durations)
+    orchestrator.checks = [FastCriticalCheck(), MediumHighPriorityCheck(), SlowLowPriorityCheck()]
+    path = tmp_path / "a.py"
+    path.write_text("x = 1\n")
+
+    with patch(
+        "quality_agents.codeguard.orchestrator.count_lines", return_value=1
+    ) as count_lines:
+        orchestrator.select_checks(ExecutionContext(file_path=path, analysis_type="pre-commit"))
+        assert count_lines.call_count == 1
+
+        orchestrator.select_checks(ExecutionContext(file_path=path, analysis_type="pre-commit"))
+        assert count_lines.call_count == 2
+
+
+def test_select_for_precommit_learned_durations_disabled(tmp_path):
+    """Con `learn_durations = false` se usa `estimated_duration`."""
+    durations = DurationModel()
+    for _ in range(3):
+        durations.record("FastCritical", 10, 9.0)
+
+    config = CodeGuardConfig()
+    config.execution.learn_durations = False
+    orchestrator = CheckOrchestrator(config, durations=durations)
+
+    context = ExecutionContext(file_path=tmp_path / "a.py", analysis_type="pre-commit")
+
+    assert orchestrator.estimated_duration(FastCriticalCheck(), context) == 0.5
+
+
 # ========== Tests de Estrategia PR-Review ==========
 
 
@@ -186,3 +186,111 @@ class TestPEP8CheckExecute:
         assert args[0] == "flake8"
         assert "--max-line-length=100" in args
         assert "/tmp/test.py" in args
+
+    @patch("subprocess.run")
+    def test_execute_uses_configured_max_line_length(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        check = PEP8Check()
+        config = CodeGuardConfig(max_line_length=120)
+        config.execution.in_process = False
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        check.execute(Path("test.py"))
+
+        args = mock_run.call_args[0][0]
+        assert "--max-line-length=120" in args
+
+
+class TestPEP8CheckInProcess:
+    """Tests para el modo in-process (Flake8Engine)."""
+
+    def _check_with_config(self, config):
+        check = PEP8Check()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_in_process_does_not_spawn_flake8(self, mock_run, tmp_path):
+        sample = tmp_path / "sample.py"
+        sample.write_text("import os\n")
+
+        check = self._check_with_config(CodeGuardConfig())
+        results = check.execute(sample)
+
+        mock_run.assert_not_called()
+        assert len(results) == 1
+        assert results[0].severity == Severity.WARNING
+        assert results[0].message.startswith("PEP8: F401")
+        assert results[0].line_number == 1
+        assert results[0].file_path == str(sample)
+
+    def test_in_process_clean_file(self, tmp_path):
+        sample = tmp_path / "clean.py"
+        sample.write_text('"""Modulo limpio."""\n\nVALUE = 1\n')
+
+        check = self._check_with_config(CodeGuardConfig())
+        results = check.execute(sample)
+
+        assert len(results) == 1
+        assert results[0].severity == Severity.INFO
+        assert "PEP8 compliant" in results[0].message
+
+    def test_in_process_honors_max_line_length(self, tmp_path):
+        sample = tmp_path / "long.py"
+        sample.write_text(f'VALUE = "{"x" * 100}"\n')  # 111 caracteres
+
+        default = self._check_with_config(CodeGuardConfig()).execute(sample)
+        relaxed = self._check_with_config(CodeGuardConfig(max_line_length=120)).execute(sample)
+
+        assert any("E501" in r.message for r in default)
+        assert relaxed[0].severity == Severity.INFO
+
+    def test_engine_is_reused_across_files(self, tmp_path):
+        first = tmp_path / "a.py"
+        second = tmp_path / "b.py"
+        first.write_text("A = 1\n")
+        second.write_text("B = 2\n")
+
+        check = self._check_with_config(CodeGuardConfig())
+        check.execute(first)
+        engine = check._engine
+        check.execute(second)
+
+        assert engine is not None
+        assert check._engine is engine
+
+    @patch("subprocess.run")
+    def test_falls_back_to_subprocess_when_engine_unavailable(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        check = self._check_with_config(CodeGuardConfig())
+        with patch(
+            "quality_agents.codeguard.checks.pep8_check.Flake8Engine.is_available",
+            return_value=False,
+        ):
+            results = check.execute(Path("test.py"))
+
+        mock_run.assert_called_once()
+        assert results[0].severity == Severity.INFO
+
+    @patch("subprocess.run")
+    def test_in_process_disabled_by_config(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        config = CodeGuardConfig()
+        config.execution.in_process = False
+        self._check_with_config(config).execute(Path("test.py"))
+
+        mock_run.assert_called_once()
+
+
+class TestPEP8CheckCacheKey:
+    """Tests para cache_key() (huella para la caché de resultados)."""
+
+    def test_cambia_con_max_line_length(self):
+        check = PEP8Check()
+        key_100 = check.cache_key(CodeGuardConfig(max_line_length=100))
+        key_120 = check.cache_key(CodeGuardConfig(max_line_length=120))
+        assert key_100 is not None
+        assert key_100.startswith("flake8==")
+        assert key_100 != key_120
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 from quality_agents.codeguard.agent import Severity
 from quality_agents.codeguard.checks.pylint_check import PylintCheck
 from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig
+from quality_agents.codeguard.engines.pylint_engine import PylintEngine
 from quality_agents.shared.verifiable import ExecutionContext
 
 
@@ -282,3 +283,141 @@ class TestPylintCheckExtractScore:
         check = PylintCheck()
         score = check._extract_score("")
         assert score is None
+
+
+class TestPylintCheckInProcess:
+    """Tests para el modo in-process (PylintEngine compartido)."""
+
+    def _check_with_config(self, config):
+        check = PylintCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_in_process_does_not_spawn_pylint(self, mock_run, tmp_path):
+        sample = tmp_path / "sample.py"
+        sample.write_text('"""Modulo limpio."""\n\nVALUE = 1\n')
+
+        results = self._check_with_config(CodeGuardConfig()).execute(sample)
+
+        mock_run.assert_not_called()
+        assert len(results) == 1
+        assert results[0].severity == Severity.INFO
+        assert "10.00/10" in results[0].message
+
+    @patch("subprocess.run")
+    def test_execute_batch_scores_each_file(self, mock_run, tmp_path):
+        clean = tmp_path / "clean.py"
+        dirty = tmp_path / "dirty.py"
+        clean.write_text('"""Modulo limpio."""\n\nVALUE = 1\n')
+        dirty.write_text("import os\nimport sys\nx=1\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute_batch([clean, dirty])
+
+        mock_run.assert_not_called()
+        assert results[clean][0].severity == Severity.INFO
+        assert results[dirty][0].severity == Severity.WARNING
+
+    @patch("subprocess.run")
+    def test_falls_back_to_subprocess_when_engine_unavailable(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="Your code has been rated at 9.00/10", stderr=""
+        )
+
+        check = self._check_with_config(CodeGuardConfig())
+        with patch(
+            "quality_agents.codeguard.checks.pylint_check.PylintEngine.is_available",
+            return_value=False,
+        ):
+            results = check.execute(Path("test.py"))
+
+        mock_run.assert_called_once()
+        assert "9.00/10" in results[0].message
+
+    @patch("subprocess.run")
+    def test_in_process_disabled_by_config(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="Your code has been rated at 9.00/10", stderr=""
+        )
+
+        config = CodeGuardConfig()
+        config.execution.in_process = False
+        self._check_with_config(config).execute(Path("test.py"))
+
+        mock_run.assert_called_once()
+
+
+class TestPylintEngine:
+    """Tests para PylintEngine (reporte por archivo y memo)."""
+
+    def test_score_matches_single_file_run(self, tmp_path):
+        first = tmp_path / "first.py"
+        second = tmp_path / "second.py"
+        first.write_text('"""Modulo limpio."""\n\nVALUE = 1\n')
+        second.write_text("import os\nx=1\n")
+
+        engine = PylintEngine()
+        together = engine.check_files([first, second])
+        alone = PylintEngine().check_files([second])
+
+        assert together[first].score == 10.0
+        assert together[second].score == alone[second].score
+        assert together[second].by_symbol("unused-import")
+
+    def test_unchanged_files_are_not_reanalyzed(self, tmp_path):
+        sample = tmp_path / "sample.py"
+        sample.write_text("VALUE = 1\n")
+
+        engine = PylintEngine()
+        with patch.object(engine, "_run", wraps=engine._run) as spy:
+            engine.check_files([sample])
+            engine.check_files([sample])
+
+        assert spy.call_count == 1
+
+    def test_shadowed_module_does_not_hide_package(self, tmp_path):
+        # shadowed_pkg.py junto al paquete shadowed_pkg/: Python importa el paquete
+        (tmp_path / "shadowed_pkg").mkdir()
+        (tmp_path / "shadowed_pkg" / "__init__.py").write_text("")
+        (tmp_path / "shadowed_pkg" / "helpers.py").write_text('"""Helpers."""\n\nVALUE = 1\n')
+        (tmp_path / "shadowed_pkg.py").write_text('"""Modulo tapado."""\n')
+        user = tmp_path / "user.py"
+        user.write_text(
+            '"""Usa el paquete."""\n\nfrom shadowed_pkg.helpers import VALUE\n\nprint(VALUE)\n'
+        )
+
+        reports = PylintEngine().check_files(
+            [tmp_path / "shadowed_pkg.py", tmp_path / "shadowed_pkg" / "helpers.py", user]
+        )
+
+        assert not reports[user].by_symbol("no-name-in-module")
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        sample = tmp_path / "edited_module.py"
+        sample.write_text('"""Modulo."""\n\nVALUE = 1\n')
+
+        engine = PylintEngine()
+        before = engine.check_files([sample])[sample]
+        sample.write_text('"""Modulo."""\n\nimport os\n\nVALUE = 1\n')
+        after = engine.check_files([sample])[sample]
+
+        assert not before.by_symbol("unused-import")
+        assert after.by_symbol("unused-import")
+
+    def test_forget_shared_discards_memo(self, tmp_path, monkeypatch):
+        sample = tmp_path / "sample.py"
+        sample.write_text("VALUE = 1\n")
+        engine = PylintEngine()
+        monkeypatch.setattr(PylintEngine, "_shared", engine)
+
+        with patch.object(engine, "_run", wraps=engine._run) as spy:
+            engine.check_files([sample])
+            PylintEngine.forget_shared()
+            engine.check_files([sample])
+
+        assert spy.call_count == 2
+
+    def test_forget_shared_without_instance(self, monkeypatch):
+        monkeypatch.setattr(PylintEngine, "_shared", None)
+        PylintEngine.forget_shared()
+        assert PylintEngine._shared is None
@@ -332,3 +332,110 @@ class TestSecurityCheckMapSeverity:
         check = SecurityCheck()
         assert check._map_severity("UNKNOWN") == Severity.INFO
         assert check._map_severity("") == Severity.INFO
+
+
+class TestSecurityCheckExecuteBatch:
+    """Tests para execute_batch() (una invocación de bandit por changeset)."""
+
+    def test_supports_batch(self):
+        assert SecurityCheck().supports_batch is True
+
+    @patch("subprocess.run")
+    def test_reparte_issues_por_filename(self, mock_run, tmp_path):
+        file_a = tmp_path / "a.py"
+        file_b = tmp_path / "b.py"
+        bandit_output = {
+            "results": [
+                {
+                    "filename": str(file_b),
+                    "issue_severity": "HIGH",
+                    "issue_text": "Use of exec detected",
+                    "line_number": 3,
+                    "test_id": "B102",
+                }
+            ],
+        }
+        mock_run.return_value = MagicMock(returncode=1, stdout=json.dumps(bandit_output), stderr="")
+
+        results = SecurityCheck().execute_batch([file_a, file_b])
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][-2:] == [str(file_a), str(file_b)]
+        assert results[file_a][0].severity == Severity.INFO
+        assert results[file_b][0].severity == Severity.ERROR
+        assert results[file_b][0].line_number == 3
+
+    @patch("subprocess.run")
+    def test_bandit_no_instalado_error_por_archivo(self, mock_run):
+        mock_run.side_effect = FileNotFoundError()
+        files = [Path("a.py"), Path("b.py")]
+
+        results = SecurityCheck().execute_batch(files)
+
+        assert all(results[f][0].severity == Severity.ERROR for f in files)
+        assert "not installed" in results[files[0]][0].message
+
+    @patch("subprocess.run")
+    def test_subprocess_batch_sin_barra_de_progreso(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout='{"results": []}', stderr="")
+
+        SecurityCheck().execute_batch([Path("a.py"), Path("b.py")])
+
+        assert "-q" in mock_run.call_args[0][0]
+
+
+class TestSecurityCheckInProcess:
+    """Tests para el modo in-process (BanditEngine)."""
+
+    def _check_with_config(self, config):
+        check = SecurityCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_in_process_does_not_spawn_bandit(self, mock_run, tmp_path):
+        sample = tmp_path / "insecure.py"
+        sample.write_text("def run(code):\n    exec(code)\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute(sample)
+
+        mock_run.assert_not_called()
+        assert len(results) == 1
+        assert results[0].message.startswith("Security [B102]")
+        assert results[0].severity == Severity.WARNING
+        assert results[0].line_number == 2
+
+    @patch("subprocess.run")
+    def test_execute_batch_in_process(self, mock_run, tmp_path):
+        clean = tmp_path / "clean.py"
+        insecure = tmp_path / "insecure.py"
+        clean.write_text("VALUE = 1\n")
+        insecure.write_text("import pickle\n\n\ndef load(data):\n    return pickle.loads(data)\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute_batch([clean, insecure])
+
+        mock_run.assert_not_called()
+        assert results[clean][0].severity == Severity.INFO
+        assert {r.message.split("]")[0] for r in results[insecure]} == {
+            "Security [B403",
+            "Security [B301",
+        }
+
+    @patch("subprocess.run")
+    def test_respeta_nosec(self, mock_run, tmp_path):
+        sample = tmp_path / "nosec.py"
+        sample.write_text("def run(code):\n    exec(code)  # nosec B102\n")
+
+        results = self._check_with_config(CodeGuardConfig()).execute(sample)
+
+        assert results[0].severity == Severity.INFO
+
+    @patch("subprocess.run")
+    def test_in_process_disabled_by_config(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout='{"results": []}', stderr="")
+
+        config = CodeGuardConfig()
+        config.execution.in_process = False
+        self._check_with_config(config).execute(Path("test.py"))
+
+        mock_run.assert_called_once()
@@ -0,0 +1,149 @@
+"""
+Tests unitarios para quality_agents.shared.ast_dispatch.
+"""
+
+import ast
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quality_agents.designreviewer.analyzers.cbo_analyzer import CBOAnalyzer
+from quality_agents.designreviewer.analyzers.feature_envy_analyzer import FeatureEnvyAnalyzer
+from quality_agents.designreviewer.analyzers.lcom_analyzer import LCOMAnalyzer
+from quality_agents.designreviewer.config import DesignReviewerConfig
+from quality_agents.designreviewer.models import ReviewSeverity
+from quality_agents.designreviewer.orchestrator import AnalyzerOrchestrator
+from quality_agents.shared.ast_dispatch import TreeListener, dispatch
+
+SOURCE = """
+import os
+
+class A:
+    def f(self, x):
+        def g():
+            return x.y
+        return self.z
+
+async def h():
+    from os import path
+"""
+
+
+class Recorder(TreeListener):
+    """Registra los nodos (y sus scopes) de los tipos pedidos."""
+
+    def __init__(self, node_types=ast.AST):
+        self.node_types = node_types
+
+    def begin_module(self, file_path):
+        self.seen = []
+        return {self.node_types: self._on_node}
+
+    def _on_node(self, node, scopes):
+        self.seen.append((node, scopes))
+
+    def end_module(self):
+        return self.seen
+
+
+class ExplotaEnClase(TreeListener):
+
+    def begin_module(self, file_path):
+        return {ast.ClassDef: self._on_class}
+
+    def _on_class(self, node, scopes):
+        raise ValueError("boom")
+
+    def end_module(self):
+        return []
+
+
+def _todos_los_tipos(tree):
+    return tuple({type(n) for n in ast.walk(tree)})
+
+
+@pytest.fixture
+def tree():
+    return ast.parse(SOURCE)
+
+
+class TestDispatch:
+
+    def test_mismo_orden_que_ast_walk(self, tree):
+        recorder = Recorder(_todos_los_tipos(tree))
+
+        [seen] = dispatch(tree, Path("m.py"), [recorder])
+
+        assert [node for node, _ in seen] == list(ast.walk(tree))
+
+    def test_scopes_de_externo_a_interno(self, tree):
+        [seen] = dispatch(tree, Path("m.py"), [Recorder(ast.Attribute)])
+
+        scopes = {node.attr: [s.name for s in scopes] for node, scopes in seen}
+        assert scopes == {"y": ["A", "f", "g"], "z": ["A", "f"]}
+
+    def test_clave_con_tupla_de_tipos(self, tree):
+        [seen] = dispatch(tree, Path("m.py"), [Recorder((ast.Import, ast.ImportFrom))])
+
+        assert [type(node) for node, _ in seen] == [ast.Import, ast.ImportFrom]
+        assert [s.name for s in seen[1][1]] == ["h"]
+
+    def test_listener_que_falla_no_afecta_a_los_demas(self, tree):
+        recorder = Recorder(ast.FunctionDef)
+
+        failed, seen = dispatch(tree, Path("m.py"), [ExplotaEnClase(), recorder])
+
+        assert isinstance(failed, ValueError)
+        assert [node.name for node, _ in seen] == ["f", "g"]
+
+    def test_analyze_tree_relanza_el_error(self, tree):
+        with pytest.raises(ValueError, match="boom"):
+            ExplotaEnClase().analyze_tree(tree, Path("m.py"))
+
+
+class TestOrchestratorRecorreUnaVez:
+
+    @pytest.fixture
+    def module_file(self, tmp_path):
+        path = tmp_path / "m.py"
+        path.write_text(SOURCE)
+        return path
+
+    def _orchestrator(self, *analyzers):
+        orchestrator = AnalyzerOrchestrator(DesignReviewerConfig())
+        orchestrator.analyzers = list(analyzers)
+        return orchestrator
+
+    def test_un_recorrido_por_archivo(self, module_file):
+        orchestrator = self._orchestrator(CBOAnalyzer(), LCOMAnalyzer(), FeatureEnvyAnalyzer())
+        n_nodos = sum(1 for _ in ast.walk(ast.parse(SOURCE)))
+
+        with patch("ast.iter_child_nodes", side_effect=ast.iter_child_nodes) as children:
+            orchestrator.run([module_file])
+
+        assert children.call_count == n_nodos
+
+    def test_mismos_resultados_que_execute(self, tmp_path):
+        path = tmp_path / "envidia.py"
+        path.write_text(
+            "class A:\n"
+            "    def f(self, o):\n"
+            "        return o.a + o.b + o.c + o.d + o.e + o.f\n"
+        )
+        analyzers = [CBOAnalyzer(), LCOMAnalyzer(), FeatureEnvyAnalyzer()]
+
+        fused = self._orchestrator(*analyzers).run([path])
+
+        assert fused
+        assert fused == [r for a in analyzers for r in a.execute(path)]
+
+    def test_listener_que_falla_reporta_info(self, module_file):
+        orchestrator = self._orchestrator(CBOAnalyzer(), LCOMAnalyzer())
+
+        with patch.object(LCOMAnalyzer, "_on_class", side_effect=ValueError("boom")):
+            results = orchestrator.run([module_file])
+
+        [info] = [r for r in results if r.severity == ReviewSeverity.INFO]
+        assert info.analyzer_name == "LCOMAnalyzer"
+        assert info.message == "Analyzer falló con error: boom"
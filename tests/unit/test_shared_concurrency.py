@@ -0,0 +1,73 @@
+"""
+Tests unitarios para quality_agents.shared.concurrency.
+"""
+
+import heapq
+from typing import Iterable
+from unittest.mock import patch
+
+from quality_agents.shared.concurrency import (
+    available_cpus,
+    lpt_order,
+    resolve_jobs,
+)
+
+
+def makespan(costs: Iterable[float], workers: int) -> float:
+    """Simula la cola compartida de un pool y devuelve cuándo termina la última unidad."""
+    finish = [0.0] * max(workers, 1)
+    for item_cost in costs:
+        heapq.heapreplace(finish, finish[0] + item_cost)
+    return max(finish)
+
+
+class TestAvailableCpus:
+
+    def test_respeta_afinidad(self):
+        with patch("os.sched_getaffinity", return_value={0, 1, 2}, create=True):
+            assert available_cpus() == 3
+
+    def test_sin_afinidad_usa_cpu_count(self):
+        with patch("quality_agents.shared.concurrency.os") as mock_os:
+            del mock_os.sched_getaffinity
+            mock_os.cpu_count.return_value = 8
+            assert available_cpus() == 8
+
+
+class TestResolveJobs:
+
+    def test_none_y_cero_usan_cpus(self):
+        with patch("quality_agents.shared.concurrency.available_cpus", return_value=16):
+            assert resolve_jobs(None) == 16
+            assert resolve_jobs(0) == 16
+
+    def test_valor_explicito(self):
+        assert resolve_jobs(4) == 4
+        assert resolve_jobs(-2) == 1
+
+
+class TestLptOrder:
+
+    def test_costo_descendente(self):
+        assert lpt_order([1.0, 5.0, 3.0], cost=lambda c: c) == [5.0, 3.0, 1.0]
+
+    def test_empates_conservan_orden(self):
+        items = [("a", 1.0), ("b", 2.0), ("c", 1.0)]
+        assert lpt_order(items, cost=lambda i: i[1]) == [("b", 2.0), ("a", 1.0), ("c", 1.0)]
+
+    def test_desempate_por_tamanio(self):
+        items = [("a", 1.0, 10), ("b", 1.0, 99), ("c", 1.0, 50)]
+        ordered = lpt_order(items, cost=lambda i: i[1], size=lambda i: i[2])
+        assert [i[0] for i in ordered] == ["b", "c", "a"]
+
+
+class TestMakespan:
+
+    def test_un_worker_suma_los_costos(self):
+        assert makespan([1.0, 2.0, 3.0], workers=1) == 6.0
+
+    def test_unidad_grande_al_final_alarga_la_corrida(self):
+        costs = [1.0] * 6 + [6.0]
+        # En orden de plan la unidad de 6s arranca cuando los demás ya terminaron
+        assert makespan(costs, workers=2) == 9.0
+        assert makespan(lpt_order(costs, cost=lambda c: c), workers=2) == 6.0
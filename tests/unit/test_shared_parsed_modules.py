@@ -0,0 +1,117 @@
+"""
+Tests unitarios para quality_agents.shared.parsed_modules.
+"""
+
+import ast
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quality_agents.designreviewer.analyzers.cbo_analyzer import CBOAnalyzer
+from quality_agents.designreviewer.analyzers.wmc_analyzer import WMCAnalyzer
+from quality_agents.designreviewer.config import DesignReviewerConfig
+from quality_agents.designreviewer.orchestrator import AnalyzerOrchestrator
+from quality_agents.shared.parsed_modules import ModuleStore, ParsedModule, parsed_module
+from quality_agents.shared.radon_metrics import RadonMetricsProvider
+
+SOURCE = "class A:\r\n    def f(self):\r\n        return 1\r\n"
+
+
+@pytest.fixture
+def module_file(tmp_path):
+    path = tmp_path / "m.py"
+    path.write_bytes(SOURCE.encode("utf-8"))
+    return path
+
+
+def _counting_parse():
+    return patch("ast.parse", side_effect=ast.parse)
+
+
+class TestParsedModule:
+
+    def test_artefactos(self, module_file):
+        module = ParsedModule(module_file)
+
+        assert module.source_bytes == SOURCE.encode("utf-8")
+        assert module.text == module_file.read_text(encoding="utf-8")
+        assert module.lines == ["class A:", "    def f(self):", "        return 1"]
+        assert isinstance(module.tree.body[0], ast.ClassDef)
+
+    def test_se_parsea_una_vez(self, module_file):
+        module = ParsedModule(module_file)
+
+        with _counting_parse() as parse:
+            assert module.tree is module.tree
+
+        assert parse.call_count == 1
+
+    def test_error_de_sintaxis_memorizado(self, tmp_path):
+        path = tmp_path / "roto.py"
+        path.write_text("def f(:\n")
+        module = ParsedModule(path)
+
+        with _counting_parse() as parse:
+            for _ in range(3):
+                with pytest.raises(SyntaxError):
+                    _ = module.tree
+
+        assert parse.call_count == 1
+
+    def test_archivo_inexistente(self, tmp_path):
+        with pytest.raises(OSError):
+            _ = ParsedModule(tmp_path / "no.py").tree
+
+    def test_radon_reutiliza_el_ast(self, tmp_path):
+        path = tmp_path / "unico.py"
+        path.write_text(f"def unica_{id(path)}(x):\n    return x if x else 0\n")
+        module = ParsedModule(path)
+        _ = module.tree  # el AST ya parseado es el que reutiliza radon
+
+        with _counting_parse() as parse:
+            metrics = module.radon
+
+        assert parse.call_count == 0
+        assert metrics == RadonMetricsProvider.shared().for_file(path)
+
+
+class TestModuleStore:
+
+    def test_mismo_modulo_por_ruta(self, module_file):
+        store = ModuleStore()
+
+        assert store.get(module_file) is store.get(module_file)
+        assert parsed_module(module_file, store) is store.get(module_file)
+        assert parsed_module(module_file) is not store.get(module_file)
+
+    def test_desalojo_lru(self, tmp_path):
+        store = ModuleStore(max_modules=2)
+        a, b, c = (tmp_path / f"{n}.py" for n in "abc")
+        first = store.get(a)
+        store.get(b)
+        store.get(a)  # a pasa a ser el más reciente
+        store.get(c)
+
+        assert len(store) == 2
+        assert store.get(a) is first
+
+
+class TestOrchestratorComparteElParse:
+
+    def test_un_parse_por_archivo(self, tmp_path):
+        files = []
+        for n in range(3):
+            path = tmp_path / f"m{n}.py"
+            path.write_text(SOURCE)
+            files.append(path)
+        orchestrator = AnalyzerOrchestrator(DesignReviewerConfig())
+        orchestrator.analyzers = [CBOAnalyzer(), WMCAnalyzer()]
+
+        with _counting_parse() as parse:
+            orchestrator.run(files)
+
+        assert parse.call_count == len(files)
+
+    def test_analyzer_fuera_del_orquestador(self, module_file):
+        assert CBOAnalyzer().execute(Path(module_file)) == []
@@ -0,0 +1,149 @@
+"""
+Tests unitarios para quality_agents.shared.plugins.
+"""
+
+import sys
+import textwrap
+
+import pytest
+
+from quality_agents.architectanalyst.registry import BUILTIN_METRICS
+from quality_agents.codeguard.config import CodeGuardConfig
+from quality_agents.codeguard.registry import BUILTIN_CHECKS
+from quality_agents.designreviewer.config import DesignReviewerConfig
+from quality_agents.designreviewer.registry import BUILTIN_ANALYZERS
+from quality_agents.shared.plugins import PluginSet, PluginSpec, discover_plugins
+
+GROUP = "quality_agents.test_plugins"
+
+
+class Plugin:
+
+    name = "Local"
+    category = "test"
+
+
+def _spec(name="Local", target=f"{__name__}:Plugin", **metadata):
+    return PluginSpec(name, target, "test", **metadata)
+
+
+@pytest.fixture
+def distribution(tmp_path, monkeypatch):
+    """Instala en sys.path una distribución falsa con entry points en GROUP."""
+
+    def install(entry_points, module_source):
+        module = f"plugins_{len(list(tmp_path.iterdir()))}"
+        (tmp_path / f"{module}.py").write_text(textwrap.dedent(module_source))
+        dist_info = tmp_path / f"{module}-0.1.dist-info"
+        dist_info.mkdir()
+        metadata = f"Metadata-Version: 2.1\nName: {module}\nVersion: 0.1\n"
+        (dist_info / "METADATA").write_text(metadata)
+        lines = [f"{name} = {module}:{attr}" for name, attr in entry_points.items()]
+        (dist_info / "entry_points.txt").write_text(f"[{GROUP}]\n" + "\n".join(lines) + "\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        return module
+
+    yield install
+    for name in [m for m in sys.modules if m.startswith("plugins_")]:
+        del sys.modules[name]
+
+
+PLUGIN_MODULE = '''
+    from quality_agents.shared.plugins import PluginSpec
+
+    class Externo:
+        name = "Externo"
+        category = "test"
+
+    SPECS = [PluginSpec("Externo", __name__ + ":Externo", "test")]
+    SPEC = SPECS[0]
+    NO_SPEC = "Externo"
+    DUPLICADO = PluginSpec("Local", __name__ + ":Externo", "test")
+'''
+
+
+class TestBuiltinRegistries:
+
+    @pytest.mark.parametrize("registry", [BUILTIN_CHECKS, BUILTIN_ANALYZERS, BUILTIN_METRICS])
+    def test_metadata_coincide_con_las_clases(self, registry):
+        for spec in registry:
+            plugin = spec.load()()
+            assert (spec.name, spec.category) == (plugin.name, plugin.category)
+            assert spec.priority == plugin.priority
+            assert spec.estimated_duration == plugin.estimated_duration
+
+    @pytest.mark.parametrize(
+        "registry, config",
+        [
+            (BUILTIN_CHECKS, CodeGuardConfig()),
+            (BUILTIN_ANALYZERS, DesignReviewerConfig()),
+        ],
+    )
+    def test_toggles_existen_en_la_config(self, registry, config):
+        for spec in registry:
+            assert hasattr(config.checks, spec.toggle), spec.name
+
+
+class TestPluginSpec:
+
+    def test_load_importa_la_clase(self):
+        assert _spec().load() is Plugin
+
+    def test_toggle_apagado(self):
+        config = CodeGuardConfig()
+        config.checks.pep8 = False
+
+        assert not _spec(toggle="pep8").is_enabled(config)
+        assert _spec(toggle="security").is_enabled(config)
+        assert _spec(toggle="pep8").is_enabled(None)
+
+
+class TestDiscoverPlugins:
+
+    def test_sin_entry_points_devuelve_los_propios(self):
+        assert discover_plugins(GROUP, [_spec()]) == [_spec()]
+
+    def test_entry_point_con_lista_y_con_spec(self, distribution):
+        module = distribution({"lista": "SPECS", "uno": "SPEC"}, PLUGIN_MODULE)
+
+        specs = discover_plugins(GROUP, [_spec()])
+
+        assert [s.name for s in specs] == ["Local", "Externo"]  # el duplicado se descarta
+        assert specs[1].load().__module__ == module
+
+    def test_entry_points_invalidos_se_ignoran(self, distribution, caplog):
+        distribution(
+            {"roto": "NO_EXISTE", "texto": "NO_SPEC", "pisa": "DUPLICADO"}, PLUGIN_MODULE
+        )
+
+        specs = discover_plugins(GROUP, [_spec()])
+
+        assert specs == [_spec()]  # el propio gana al externo con el mismo nombre
+        assert len([r for r in caplog.records if r.levelname == "WARNING"]) == 3
+
+
+class TestPluginSet:
+
+    def test_carga_perezosa_y_cacheada(self):
+        plugins = PluginSet(GROUP, [_spec(), _spec("Otro", priority=9)])
+
+        first = plugins.load(where=lambda p: p.priority <= 5)
+
+        assert [type(p) for p in first] == [Plugin]
+        assert isinstance(plugins.entries()[1], PluginSpec)
+        assert plugins.load()[0] is first[0]
+
+    def test_plugin_que_no_carga_se_descarta(self):
+        plugins = PluginSet(GROUP, [_spec(target=f"{__name__}:NoExiste"), _spec("Otro")])
+
+        assert len(plugins.load()) == 1
+        assert len(plugins) == 1
+
+    def test_replace(self):
+        plugins = PluginSet(GROUP, [_spec("Otro")])
+        instance = Plugin()
+
+        plugins.replace([instance])
+
+        assert plugins.load() == [instance]
+        assert plugins.specs == [_spec()]
@@ -0,0 +1,125 @@
+"""
+Tests unitarios para quality_agents.shared.radon_metrics.
+"""
+
+from unittest.mock import patch
+
+from radon.complexity import cc_visit
+from radon.metrics import mi_visit
+
+from quality_agents.codeguard.checks.complexity_check import ComplexityCheck
+from quality_agents.codeguard.checks.maintainability_check import MaintainabilityCheck
+from quality_agents.codeguard.config import CodeGuardConfig
+from quality_agents.designreviewer.analyzers.wmc_analyzer import WMCAnalyzer
+from quality_agents.designreviewer.config import DesignReviewerConfig
+from quality_agents.shared.radon_metrics import RadonMetricsProvider, complexity_rank
+from quality_agents.shared.verifiable import ExecutionContext
+
+SOURCE = '''"""Modulo de ejemplo."""
+
+
+def ramas(x):
+    # comentario
+    if x > 0:
+        return 1
+    elif x < 0:
+        return -1
+    return 0
+
+
+class Servicio:
+    def procesar(self, items):
+        for item in items:
+            if item:
+                yield item
+'''
+
+
+class TestRadonMetrics:
+
+    def test_coincide_con_radon(self):
+        metrics = RadonMetricsProvider().for_source(SOURCE)
+
+        esperados = {(b.fullname, b.complexity) for b in cc_visit(SOURCE)}
+        assert {(b.fullname, b.complexity) for b in metrics.blocks} == esperados
+        assert metrics.mi == mi_visit(SOURCE, True)
+        assert metrics.raw.comments == 1
+        assert metrics.error is None
+
+    def test_bloques_ordenados_por_complejidad(self):
+        metrics = RadonMetricsProvider().for_source(SOURCE)
+        complejidades = [b.complexity for b in metrics.sorted_blocks()]
+        assert complejidades == sorted(complejidades, reverse=True)
+
+    def test_codigo_invalido_sin_metricas(self):
+        metrics = RadonMetricsProvider().for_source("def roto(:\n")
+        assert metrics.blocks == []
+        assert metrics.mi is None
+        assert metrics.error
+
+    def test_complexity_rank(self):
+        assert complexity_rank(1) == "A"
+        assert complexity_rank(11) == "C"
+
+
+class TestRadonMetricsProviderMemo:
+
+    def test_mismo_contenido_se_calcula_una_vez(self, tmp_path):
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text(SOURCE)
+        b.write_text(SOURCE)
+
+        provider = RadonMetricsProvider()
+        with patch.object(provider, "_compute", wraps=provider._compute) as spy:
+            primero = provider.for_file(a)
+            segundo = provider.for_file(b)
+
+        assert spy.call_count == 1
+        assert primero is segundo
+
+    def test_contenido_modificado_se_recalcula(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("def f():\n    return 1\n")
+        provider = RadonMetricsProvider()
+        antes = provider.for_file(f)
+
+        f.write_text("def f(x):\n    if x:\n        return 1\n    return 2\n")
+        despues = provider.for_file(f)
+
+        assert antes.blocks[0].complexity == 1
+        assert despues.blocks[0].complexity == 2
+
+    def test_desaloja_los_menos_usados(self):
+        provider = RadonMetricsProvider(max_entries=2)
+        provider.for_source("A = 1\n")
+        provider.for_source("B = 2\n")
+        provider.for_source("A = 1\n")  # A pasa a ser el más reciente
+        provider.for_source("C = 3\n")
+
+        with patch.object(provider, "_compute", wraps=provider._compute) as spy:
+            provider.for_source("A = 1\n")
+            provider.for_source("B = 2\n")
+
+        assert spy.call_count == 1  # solo B fue desalojado
+
+    def test_compartido_entre_checks_y_wmc(self, tmp_path):
+        f = tmp_path / "servicio.py"
+        f.write_text(SOURCE)
+
+        consumidores = [
+            (ComplexityCheck(), CodeGuardConfig()),
+            (MaintainabilityCheck(), CodeGuardConfig()),
+            (WMCAnalyzer(), DesignReviewerConfig()),
+        ]
+        provider = RadonMetricsProvider()
+        with patch.object(RadonMetricsProvider, "shared", return_value=provider), patch.object(
+            provider, "_compute", wraps=provider._compute
+        ) as spy:
+            for consumidor, config in consumidores:
+                context = ExecutionContext(file_path=f, config=config)
+                assert consumidor.should_run(context)
+                consumidor._context = context
+                consumidor.execute(f)
+
+        assert spy.call_count == 1
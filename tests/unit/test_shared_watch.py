@@ -0,0 +1,233 @@
+"""
+Tests unitarios para el modo --watch (shared/watch.py y los CLIs de los agentes).
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from quality_agents.architectanalyst.agent import main as architect_main
+from quality_agents.codeguard.agent import main as codeguard_main
+from quality_agents.designreviewer.agent import DesignReviewer
+from quality_agents.designreviewer.agent import main as designreviewer_main
+from quality_agents.shared.watch import (
+    ChangeSet,
+    FileWatcher,
+    IncrementalResults,
+    format_update,
+    group_by_file,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("x = 1\n")
+    return tmp_path
+
+
+def _watcher(tree, **kwargs):
+    kwargs.setdefault("use_inotify", False)
+    return FileWatcher(
+        [tree], collect=lambda: sorted(tree.rglob("*.py")),
+        debounce=0.05, poll_interval=0.05, **kwargs,
+    )
+
+
+class TestChangeSet:
+
+    def test_vacio_es_falso(self):
+        assert not ChangeSet()
+        assert ChangeSet(modified={Path("a.py")})
+
+    def test_merge_gana_el_ultimo_estado(self):
+        changes = ChangeSet(modified={Path("a.py")}, deleted={Path("b.py")})
+        changes.merge(ChangeSet(modified={Path("b.py")}, deleted={Path("a.py")}))
+
+        assert changes.modified == {Path("b.py")}
+        assert changes.deleted == {Path("a.py")}
+
+
+class TestFileWatcher:
+
+    def test_detecta_modificados_nuevos_y_eliminados(self, tree):
+        watcher = _watcher(tree)
+        (tree / "pkg" / "a.py").write_text("x = 22\n")
+        (tree / "pkg" / "b.py").write_text("y = 1\n")
+
+        changes = watcher.wait(timeout=5)
+        assert changes.modified == {tree / "pkg" / "a.py", tree / "pkg" / "b.py"}
+
+        (tree / "pkg" / "b.py").unlink()
+        assert watcher.wait(timeout=5).deleted == {tree / "pkg" / "b.py"}
+
+    def test_timeout_sin_cambios(self, tree):
+        watcher = _watcher(tree)
+        assert not watcher.wait(timeout=0.1)
+
+    def test_ignora_archivos_fuera_de_collect(self, tree):
+        watcher = _watcher(tree)
+        (tree / "pkg" / "notas.txt").write_text("texto\n")
+        assert not watcher.wait(timeout=0.2)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+    def test_inotify(self, tree):
+        watcher = _watcher(tree, use_inotify=True)
+        try:
+            assert watcher.mode == "inotify"
+            (tree / "pkg" / "sub").mkdir()
+            (tree / "pkg" / "sub" / "c.py").write_text("z = 1\n")
+            assert watcher.wait(timeout=5).modified == {tree / "pkg" / "sub" / "c.py"}
+        finally:
+            watcher.close()
+        assert watcher.mode == "polling"
+
+
+class TestIncrementalResults:
+
+    def _state(self):
+        state = IncrementalResults(key=lambda r: r)
+        state.update({Path("a.py"): ["a1", "a2"], Path("b.py"): ["b1"]})
+        return state
+
+    def test_update_retorna_nuevos_y_resueltos(self):
+        state = self._state()
+
+        added, removed = state.update({Path("a.py"): ["a2", "a3"]})
+
+        assert (added, removed) == (["a3"], ["a1"])
+        assert state.results == ["a2", "a3", "b1"]
+
+    def test_archivo_sin_resultados_y_eliminado(self):
+        state = self._state()
+
+        added, removed = state.update({Path("a.py"): []}, deleted=[Path("b.py")])
+
+        assert (added, sorted(removed)) == ([], ["a1", "a2", "b1"])
+        assert state.files() == []
+
+    def test_duplicados_se_cuentan(self):
+        state = IncrementalResults(key=lambda r: r)
+        state.update({Path("a.py"): ["x", "x"]})
+        assert state.update({Path("a.py"): ["x"]}) == ([], ["x"])
+
+    def test_group_by_file_incluye_archivos_sin_resultados(self):
+        grouped = group_by_file(["a:1", "b:1"], lambda r: Path(r[0] + ".py"), [Path("c.py")])
+        assert grouped == {Path("c.py"): [], Path("a.py"): ["a:1"], Path("b.py"): ["b:1"]}
+
+    def test_format_update(self):
+        lines = format_update(
+            ChangeSet(modified={Path("a.py")}), ["nuevo"], ["viejo"], 0.5, str.upper
+        )
+        assert "1 modificados" in lines[0] and "+1 nuevos, -1 resueltos" in lines[0]
+        assert lines[1:] == ["  + NUEVO", "  - VIEJO"]
+
+
+class TestDesignReviewerChanges:
+
+    def test_ciclo_roto_desaparece_de_ambos_extremos(self, tmp_path):
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("import b\n")
+        b.write_text("import a\n")
+        reviewer = DesignReviewer(path=tmp_path)
+        state = IncrementalResults(key=lambda r: (str(r.file_path), r.analyzer_name, r.message))
+        state.update(group_by_file(reviewer.run([a, b]), lambda r: r.file_path, [a, b]))
+        cycles = [r for r in state.results if r.analyzer_name == "CircularImportsAnalyzer"]
+        assert {r.file_path for r in cycles} == {a, b}
+
+        a.write_text("x = 1\n")
+        _, removed = state.update(reviewer.review_changes([a], state))
+
+        assert {r.file_path for r in removed if r.analyzer_name == "CircularImportsAnalyzer"} == {
+            a, b
+        }
+
+
+class _FakeWatcher:
+    """Entrega un ChangeSet y luego simula Ctrl+C."""
+
+    changes = ChangeSet()
+
+    def __init__(self, targets, collect, **kwargs):
+        self.mode = "polling"
+        self._pending = [self.changes]
+
+    def wait(self, timeout=None):
+        if not self._pending:
+            raise KeyboardInterrupt
+        return self._pending.pop()
+
+    def close(self):
+        pass
+
+
+class TestWatchCLI:
+
+    def _invoke(self, module, main, args, changes):
+        _FakeWatcher.changes = changes
+        with patch(f"quality_agents.{module}.agent.FileWatcher", _FakeWatcher):
+            return CliRunner().invoke(main, args)
+
+    def test_codeguard_muestra_solo_la_diferencia(self, tree):
+        module = tree / "pkg" / "a.py"
+        module.write_text("import os\n")
+        args = [str(module), "--watch", "--no-cache"]
+
+        def fix_on_wait(self, timeout=None):
+            if not self._pending:
+                raise KeyboardInterrupt
+            module.write_text("x = 1\n")
+            return self._pending.pop()
+
+        with patch.object(_FakeWatcher, "wait", fix_on_wait):
+            result = self._invoke("codeguard", codeguard_main, args, ChangeSet({module}))
+
+        assert result.exit_code == 0, result.output
+        assert "Observando cambios (polling)" in result.output
+        assert "- WARNING  PEP8" in result.output
+        assert "Watch detenido" in result.output
+
+    def test_codeguard_watch_incompatible_con_staged(self, tree):
+        result = CliRunner().invoke(codeguard_main, [str(tree), "--watch", "--staged"])
+        assert result.exit_code != 0
+        assert "--staged" in result.output
+
+    def test_codeguard_watch_requiere_texto(self, tree):
+        result = CliRunner().invoke(codeguard_main, [str(tree), "--watch", "-f", "json"])
+        assert result.exit_code != 0
+
+    def test_designreviewer(self, tree):
+        module = tree / "pkg" / "a.py"
+        result = self._invoke(
+            "designreviewer", designreviewer_main, [str(tree), "--watch"], ChangeSet({module})
+        )
+        assert result.exit_code == 0, result.output
+        assert "1 modificados" in result.output
+
+    def test_architectanalyst_no_guarda_snapshot_en_cada_cambio(self, tree):
+        module = tree / "pkg" / "a.py"
+        with patch(
+            "quality_agents.architectanalyst.agent.SnapshotStore.save"
+        ) as save:
+            result = self._invoke(
+                "architectanalyst", architect_main, [str(tree), "--watch"], ChangeSet({module})
+            )
+        assert result.exit_code == 0, result.output
+        assert "1 modificados" in result.output
+        assert save.call_count == 1
+
+
+class TestClientWatch:
+
+    def test_watch_no_se_reenvia_al_daemon(self, monkeypatch):
+        from quality_agents.codeguard import client
+
+        monkeypatch.setattr(sys, "argv", ["codeguard", "--watch"])
+        monkeypatch.setattr(client, "forward", lambda argv: pytest.fail("reenviado"))
+        with patch("quality_agents.codeguard.agent.main") as cli:
+            client.main()
+        cli.assert_called_once()
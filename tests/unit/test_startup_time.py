@@ -0,0 +1,89 @@
+"""
+Tests del presupuesto de arranque de los CLIs (importaciones diferidas).
+
+Miden con `python -X importtime` lo que importa cada invocación, descontando
+lo que el intérprete importa de por sí (`python -c pass`).
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Presupuesto de importación de una invocación que no analiza nada (µs)
+IMPORT_BUDGET_US = 150_000
+
+# Módulos que solo deben cargarse cuando se usan
+HEAVY_MODULES = (
+    "rich", "yaml", "radon", "anthropic", "plotly", "pylint", "astroid",
+    "bandit", "flake8", "vulture", "codespell_lib", "asyncio",
+)
+
+
+def _importtime(code, cwd):
+    """Módulos importados por `code` → (profundidad, µs acumulados)."""
+    env = {**os.environ, "CODEGUARD_NO_DAEMON": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (depth, int(cumulative))
+    return modules
+
+
+def _cli(module, *args):
+    return (
+        f"import sys; sys.argv = ['cli', {', '.join(repr(a) for a in args)}]; "
+        f"from {module} import main\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass"
+    )
+
+
+@pytest.fixture(scope="module")
+def baseline(tmp_path_factory):
+    return set(_importtime("pass", tmp_path_factory.mktemp("baseline")))
+
+
+@pytest.fixture
+def empty_repo(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    return tmp_path
+
+
+def _cost(modules, baseline):
+    """µs de importación propios de la invocación (módulos de primer nivel)."""
+    return sum(
+        cumulative for name, (depth, cumulative) in modules.items()
+        if depth == 0 and name not in baseline
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "quality_agents.codeguard.client",
+        "quality_agents.designreviewer.agent",
+        "quality_agents.architectanalyst.agent",
+    ],
+)
+def test_version_no_importa_modulos_pesados(module, baseline, tmp_path):
+    modules = _importtime(_cli(module, "--version"), tmp_path)
+
+    assert not [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+    assert _cost(modules, baseline) < IMPORT_BUDGET_US
+
+
+def test_precommit_sin_archivos_no_carga_herramientas(baseline, empty_repo):
+    modules = _importtime(_cli("quality_agents.codeguard.client", "--staged"), empty_repo)
+
+    # El registro describe los checks sin importarlos: sin archivos no se carga ninguno
+    assert not [m for m in modules if m.startswith("quality_agents.codeguard.checks.")]
+    assert not [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+    assert _cost(modules, baseline) < IMPORT_BUDGET_US
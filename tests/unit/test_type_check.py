@@ -14,6 +14,8 @@ from quality_agents.codeguard.checks.type_check import TypeCheck
 from quality_agents.codeguard.config import ChecksConfig, CodeGuardConfig
 from quality_agents.shared.verifiable import ExecutionContext
 
+DAEMON_RUNNING = "quality_agents.codeguard.checks.type_check.is_daemon_running"
+
 
 class TestTypeCheckProperties:
     """Tests para las propiedades de TypeCheck."""
@@ -411,3 +413,153 @@ test.py:25:5: error: Another error"""
         assert errors[0]["line"] == 10
         assert errors[1]["line"] == 20
         assert errors[2]["line"] == 25
+
+
+class TestTypeCheckExecuteBatch:
+    """Tests para execute_batch() (una invocación de mypy por changeset)."""
+
+    def test_supports_batch(self):
+        assert TypeCheck().supports_batch is True
+
+    @patch("subprocess.run")
+    def test_reparte_errores_por_archivo(self, mock_run, tmp_path):
+        file_a = tmp_path / "a.py"
+        file_b = tmp_path / "b.py"
+        mock_run.return_value = MagicMock(
+            returncode=1,
+            stdout=f"{file_a}:4:5: error: Incompatible return value\n",
+            stderr="",
+        )
+
+        results = TypeCheck().execute_batch([file_a, file_b])
+
+        mock_run.assert_called_once()
+        assert results[file_a][0].severity == Severity.WARNING
+        assert results[file_a][0].line_number == 4
+        assert results[file_b][0].severity == Severity.INFO
+        assert "No type errors" in results[file_b][0].message
+
+    @patch("subprocess.run")
+    def test_error_de_invocacion_vuelve_a_modo_archivo(self, mock_run):
+        batch = MagicMock(returncode=2, stdout="", stderr="Duplicate module named 'a'")
+        single = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.side_effect = [batch, single, single]
+        files = [Path("pkg1/a.py"), Path("pkg2/a.py")]
+
+        results = TypeCheck().execute_batch(files)
+
+        assert mock_run.call_count == 3
+        assert all(results[f][0].severity == Severity.INFO for f in files)
+
+
+class TestTypeCheckCacheKey:
+
+    def test_no_cacheable(self):
+        # Los errores de mypy dependen de los módulos importados, no solo del archivo
+        assert TypeCheck().cache_key(CodeGuardConfig()) is None
+
+
+class TestTypeCheckDaemon:
+    """Tests del modo daemon (dmypy) de TypeCheck."""
+
+    def _check(self, daemon=True):
+        config = CodeGuardConfig()
+        config.execution.mypy_daemon = daemon
+        check = TypeCheck()
+        check._context = ExecutionContext(file_path=Path("test.py"), config=config)
+        return check
+
+    @patch("subprocess.run")
+    def test_usa_dmypy_con_cache_dir(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        results = self._check().execute(Path("test.py"))
+
+        args = mock_run.call_args[0][0]
+        assert args[0] == "dmypy"
+        assert "run" in args
+        assert "--cache-dir" in args
+        assert args[-1] == "test.py"
+        assert results[0].severity == Severity.INFO
+
+    @patch("subprocess.run")
+    def test_sin_daemon_usa_mypy(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        self._check(daemon=False).execute(Path("test.py"))
+
+        assert mock_run.call_args[0][0][0] == "mypy"
+
+    @patch("subprocess.run")
+    def test_falla_del_daemon_vuelve_a_mypy(self, mock_run):
+        mock_run.side_effect = [
+            MagicMock(returncode=2, stdout="", stderr="Daemon crashed!"),
+            MagicMock(returncode=1, stdout="test.py:3:1: error: Bad type\n", stderr=""),
+        ]
+
+        results = self._check().execute(Path("test.py"))
+
+        assert [c[0][0][0] for c in mock_run.call_args_list] == ["dmypy", "mypy"]
+        assert results[0].severity == Severity.WARNING
+
+    @patch("subprocess.run")
+    def test_dmypy_no_instalado_vuelve_a_mypy(self, mock_run):
+        mock_run.side_effect = [
+            FileNotFoundError(),
+            MagicMock(returncode=0, stdout="", stderr=""),
+        ]
+
+        results = self._check().execute(Path("test.py"))
+
+        assert mock_run.call_count == 2
+        assert results[0].severity == Severity.INFO
+
+    def test_estimated_duration_refleja_daemon_caliente(self):
+        check = self._check()
+        with patch(DAEMON_RUNNING, return_value=True):
+            assert check.estimated_duration < 0.25
+        with patch(DAEMON_RUNNING, return_value=False):
+            assert check.estimated_duration == 3.0
+
+    def test_estimated_duration_sin_modo_daemon(self):
+        with patch(DAEMON_RUNNING, return_value=True):
+            assert self._check(daemon=False).estimated_duration == 3.0
+
+    def test_is_daemon_running(self, tmp_path):
+        import json
+        import os
+
+        from quality_agents.codeguard.checks.type_check import is_daemon_running
+
+        status = tmp_path / "dmypy.json"
+        assert is_daemon_running(status) is False
+        status.write_text(json.dumps({"pid": os.getpid()}))
+        assert is_daemon_running(status) is True
+        status.write_text("{roto")
+        assert is_daemon_running(status) is False
+
+    @patch("subprocess.run")
+    def test_rutas_relativas_a_la_raiz_del_proyecto(self, mock_run, tmp_path):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        check = self._check()
+        check._context.project_root = tmp_path
+
+        check.execute(Path("test.py"))
+
+        args = mock_run.call_args[0][0]
+        status_file = args[args.index("--status-file") + 1]
+        cache_dir = args[args.index("--cache-dir") + 1]
+        assert status_file == str(tmp_path.resolve() / ".quality_control" / "dmypy.json")
+        assert cache_dir == str(tmp_path.resolve() / ".quality_control" / "mypy_cache")
+
+    @patch("subprocess.run")
+    def test_dmypy_respeta_el_deadline_de_la_corrida(self, mock_run):
+        import time
+
+        check = self._check()
+        check._context.deadline = time.monotonic() - 1
+
+        results = check.execute(Path("test.py"))
+
+        mock_run.assert_not_called()
+        assert results[0].severity == Severity.ERROR